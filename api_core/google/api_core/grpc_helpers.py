@@ -15,6 +15,8 @@
 """Helpers for :mod:`grpc`."""
 
 import collections
+import itertools
+import threading
 
 import grpc
 import six
@@ -36,6 +38,10 @@ except ImportError:
 # The list of gRPC Callable interfaces that return iterators.
 _STREAM_WRAP_CLASSES = (grpc.UnaryStreamMultiCallable, grpc.StreamStreamMultiCallable)
 
+# Channel selection policies for :class:`ChannelPool`.
+ROUND_ROBIN = "round_robin"
+LEAST_LOADED = "least_loaded"
+
 
 def _patch_callable_name(callable_):
     """Fix-up gRPC callable attributes.
@@ -153,10 +159,20 @@ def wrap_errors(callable_):
 
 
 def create_channel(
-    target, credentials=None, scopes=None, ssl_credentials=None, **kwargs
+    target,
+    credentials=None,
+    scopes=None,
+    ssl_credentials=None,
+    pool_size=None,
+    pool_selection=ROUND_ROBIN,
+    **kwargs
 ):
     """Create a secure channel with credentials.
 
+    A single HTTP/2 connection limits the number of concurrent streams, so
+    high-throughput clients can spread their calls over a
+    :class:`ChannelPool` of several connections by passing ``pool_size``.
+
     Args:
         target (str): The target service address in the format 'hostname:port'.
         credentials (google.auth.credentials.Credentials): The credentials. If
@@ -167,6 +183,11 @@ def create_channel(
             are passed to :func:`google.auth.default`.
         ssl_credentials (grpc.ChannelCredentials): Optional SSL channel
             credentials. This can be used to specify different certificates.
+        pool_size (int): Optional number of channels, each with its own
+            connection, to spread calls over. If greater than one, a
+            :class:`ChannelPool` is returned.
+        pool_selection (str): How the pool picks a channel for each call:
+            :data:`ROUND_ROBIN` (the default) or :data:`LEAST_LOADED`.
         kwargs: Additional key-word args passed to
             :func:`grpc_gcp.secure_channel` or :func:`grpc.secure_channel`.
 
@@ -201,9 +222,238 @@ def create_channel(
     if HAS_GRPC_GCP:
         # If grpc_gcp module is available use grpc_gcp.secure_channel,
         # otherwise, use grpc.secure_channel to create grpc channel.
-        return grpc_gcp.secure_channel(target, composite_credentials, **kwargs)
+        secure_channel = grpc_gcp.secure_channel
     else:
-        return grpc.secure_channel(target, composite_credentials, **kwargs)
+        secure_channel = grpc.secure_channel
+
+    if pool_size is None or pool_size <= 1:
+        return secure_channel(target, composite_credentials, **kwargs)
+
+    # Channels with identical arguments share connections through gRPC's
+    # global subchannel pool: give each channel a pool of its own.
+    options = list(kwargs.pop("options", None) or ())
+    options.append(("grpc.use_local_subchannel_pool", 1))
+    channels = [
+        secure_channel(target, composite_credentials, options=options, **kwargs)
+        for _ in range(pool_size)
+    ]
+    return ChannelPool(channels, selection=pool_selection)
+
+
+class ChannelPool(grpc.Channel):
+    """A :class:`grpc.Channel` spreading calls over several channels.
+
+    Each call is sent on one channel of the pool, chosen when the call
+    starts: either in turn (:data:`ROUND_ROBIN`), or the channel with the
+    fewest calls in flight (:data:`LEAST_LOADED`). Streaming calls count
+    as in flight until they terminate.
+
+    A pool can be passed wherever a channel is accepted, for instance as
+    the ``channel`` of a generated client or its transport.
+
+    Args:
+        channels (Sequence[grpc.Channel]): The channels to pool.
+        selection (str): The selection policy, :data:`ROUND_ROBIN` or
+            :data:`LEAST_LOADED`.
+
+    Raises:
+        ValueError: If ``channels`` is empty or ``selection`` is unknown.
+    """
+
+    def __init__(self, channels, selection=ROUND_ROBIN):
+        if not channels:
+            raise ValueError("A channel pool needs at least one channel.")
+        if selection not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError("Unknown channel selection: {}".format(selection))
+        self._channels = list(channels)
+        self._selection = selection
+        self._lock = threading.Lock()
+        self._next_index = itertools.cycle(range(len(self._channels)))
+        self._in_flight = [0] * len(self._channels)
+
+    @property
+    def channels(self):
+        """Sequence[grpc.Channel]: The pooled channels."""
+        return tuple(self._channels)
+
+    @property
+    def in_flight(self):
+        """Sequence[int]: The number of calls in flight on each channel."""
+        with self._lock:
+            return tuple(self._in_flight)
+
+    def _acquire(self):
+        """Choose the channel for a new call and count the call.
+
+        Returns:
+            int: The index of the chosen channel.
+        """
+        with self._lock:
+            index = next(self._next_index)
+            if self._selection == LEAST_LOADED:
+                # Start from the round-robin choice, so that ties rotate.
+                count = len(self._in_flight)
+                index = min(
+                    ((index + offset) % count for offset in range(count)),
+                    key=self._in_flight.__getitem__,
+                )
+            self._in_flight[index] += 1
+            return index
+
+    def _release(self, index):
+        with self._lock:
+            self._in_flight[index] -= 1
+
+    def _multi_callable(self, kind, method, request_serializer, response_deserializer):
+        callables = [
+            getattr(channel, kind)(
+                method,
+                request_serializer=request_serializer,
+                response_deserializer=response_deserializer,
+            )
+            for channel in self._channels
+        ]
+        return _POOLED_CALLABLE_CLASSES[kind](self, callables)
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None):
+        """grpc.Channel.unary_unary implementation."""
+        return self._multi_callable(
+            "unary_unary", method, request_serializer, response_deserializer
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None):
+        """grpc.Channel.unary_stream implementation."""
+        return self._multi_callable(
+            "unary_stream", method, request_serializer, response_deserializer
+        )
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None):
+        """grpc.Channel.stream_unary implementation."""
+        return self._multi_callable(
+            "stream_unary", method, request_serializer, response_deserializer
+        )
+
+    def stream_stream(
+        self, method, request_serializer=None, response_deserializer=None
+    ):
+        """grpc.Channel.stream_stream implementation."""
+        return self._multi_callable(
+            "stream_stream", method, request_serializer, response_deserializer
+        )
+
+    def subscribe(self, callback, try_to_connect=False):
+        """grpc.Channel.subscribe implementation.
+
+        The callback is subscribed to every channel of the pool.
+        """
+        for channel in self._channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        """grpc.Channel.unsubscribe implementation."""
+        for channel in self._channels:
+            channel.unsubscribe(callback)
+
+    def close(self):
+        """grpc.Channel.close implementation."""
+        for channel in self._channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class _PooledCallable(object):
+    """Base for the multi-callables returned by :class:`ChannelPool`.
+
+    Args:
+        pool (ChannelPool): The pool choosing the channel for each call.
+        callables (Sequence): The channels' multi-callables for the method.
+    """
+
+    def __init__(self, pool, callables):
+        self._pool = pool
+        self._callables = callables
+
+    def _blocking(self, attr, request, kwargs):
+        index = self._pool._acquire()
+        try:
+            return getattr(self._callables[index], attr)(request, **kwargs)
+        finally:
+            self._pool._release(index)
+
+    def _until_done(self, attr, request, kwargs, add_callback):
+        """Start a call, counting it in flight until it terminates."""
+        index = self._pool._acquire()
+        try:
+            call = getattr(self._callables[index], attr)(request, **kwargs)
+        except Exception:
+            self._pool._release(index)
+            raise
+        release = _ReleaseOnce(self._pool, index)
+        # ``add_callback`` returns False, without ever running the callback,
+        # if the RPC has already terminated.
+        if getattr(call, add_callback)(release) is False:
+            release()
+        return call
+
+
+class _ReleaseOnce(object):
+    """Callback releasing a pooled channel's in-flight count once."""
+
+    def __init__(self, pool, index):
+        self._pool = pool
+        self._index = index
+        self._released = False
+
+    def __call__(self, *args):
+        if not self._released:
+            self._released = True
+            self._pool._release(self._index)
+
+
+class _PooledUnaryUnary(_PooledCallable, grpc.UnaryUnaryMultiCallable):
+    def __call__(self, request, **kwargs):
+        return self._blocking("__call__", request, kwargs)
+
+    def with_call(self, request, **kwargs):
+        return self._blocking("with_call", request, kwargs)
+
+    def future(self, request, **kwargs):
+        return self._until_done("future", request, kwargs, "add_done_callback")
+
+
+class _PooledUnaryStream(_PooledCallable, grpc.UnaryStreamMultiCallable):
+    def __call__(self, request, **kwargs):
+        return self._until_done("__call__", request, kwargs, "add_callback")
+
+
+class _PooledStreamUnary(_PooledCallable, grpc.StreamUnaryMultiCallable):
+    def __call__(self, request_iterator, **kwargs):
+        return self._blocking("__call__", request_iterator, kwargs)
+
+    def with_call(self, request_iterator, **kwargs):
+        return self._blocking("with_call", request_iterator, kwargs)
+
+    def future(self, request_iterator, **kwargs):
+        return self._until_done("future", request_iterator, kwargs, "add_done_callback")
+
+
+class _PooledStreamStream(_PooledCallable, grpc.StreamStreamMultiCallable):
+    def __call__(self, request_iterator, **kwargs):
+        return self._until_done("__call__", request_iterator, kwargs, "add_callback")
+
+
+_POOLED_CALLABLE_CLASSES = {
+    "unary_unary": _PooledUnaryUnary,
+    "unary_stream": _PooledUnaryStream,
+    "stream_unary": _PooledStreamUnary,
+    "stream_stream": _PooledStreamStream,
+}
 
 
 _MethodCall = collections.namedtuple(
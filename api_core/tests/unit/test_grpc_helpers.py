@@ -458,3 +458,159 @@ class TestChannelStub(object):
     def test_close(self):
         channel = grpc_helpers.ChannelStub()
         assert channel.close() is None
+
+
+@mock.patch("grpc.composite_channel_credentials")
+@mock.patch("google.auth.credentials.with_scopes_if_required")
+@mock.patch("grpc.secure_channel")
+def test_create_channel_w_pool_size(
+    grpc_secure_channel, auth_creds, composite_creds_call
+):
+    target = "example.com:443"
+    composite_creds = composite_creds_call.return_value
+    channels = [mock.Mock(name="channel{}".format(i)) for i in range(3)]
+    grpc_secure_channel.side_effect = channels
+    options = {"grpc.max_send_message_length": -1}.items()
+
+    pool = grpc_helpers.create_channel(
+        target,
+        credentials=mock.sentinel.credentials,
+        pool_size=3,
+        pool_selection=grpc_helpers.LEAST_LOADED,
+        options=options,
+    )
+
+    assert isinstance(pool, grpc_helpers.ChannelPool)
+    assert pool.channels == tuple(channels)
+    expected_options = [
+        ("grpc.max_send_message_length", -1),
+        ("grpc.use_local_subchannel_pool", 1),
+    ]
+    assert grpc_secure_channel.call_count == 3
+    for args, kwargs in grpc_secure_channel.call_args_list:
+        # grpc_gcp passes the options on positionally.
+        assert args[:2] == (target, composite_creds)
+        assert kwargs.get("options", args[2:3] and args[2]) == expected_options
+
+
+def _make_pool(count, selection=grpc_helpers.ROUND_ROBIN):
+    channels = []
+    for index in range(count):
+        channel = mock.Mock(spec=grpc.Channel)
+        for kind in ("unary_unary", "unary_stream", "stream_unary", "stream_stream"):
+            getattr(channel, kind).return_value = mock.Mock(
+                return_value=mock.Mock(name="call{}".format(index))
+            )
+        channels.append(channel)
+    return grpc_helpers.ChannelPool(channels, selection=selection), channels
+
+
+class TestChannelPool(object):
+    def test_constructor_wo_channels(self):
+        with pytest.raises(ValueError):
+            grpc_helpers.ChannelPool([])
+
+    def test_constructor_w_unknown_selection(self):
+        with pytest.raises(ValueError):
+            grpc_helpers.ChannelPool([mock.Mock()], selection="random")
+
+    def test_multi_callable_types(self):
+        pool, channels = _make_pool(2)
+
+        assert isinstance(pool.unary_unary("/m"), grpc.UnaryUnaryMultiCallable)
+        assert isinstance(pool.unary_stream("/m"), grpc.UnaryStreamMultiCallable)
+        assert isinstance(pool.stream_unary("/m"), grpc.StreamUnaryMultiCallable)
+        assert isinstance(pool.stream_stream("/m"), grpc.StreamStreamMultiCallable)
+        channels[0].unary_unary.assert_called_once_with(
+            "/m", request_serializer=None, response_deserializer=None
+        )
+
+    def test_round_robin(self):
+        pool, channels = _make_pool(3)
+        callable_ = pool.unary_unary("/m")
+
+        for _ in range(4):
+            callable_(mock.sentinel.request, timeout=5)
+
+        counts = [channel.unary_unary.return_value.call_count for channel in channels]
+        assert counts == [2, 1, 1]
+        channels[0].unary_unary.return_value.assert_called_with(
+            mock.sentinel.request, timeout=5
+        )
+        assert pool.in_flight == (0, 0, 0)
+
+    def test_least_loaded_w_streams(self):
+        pool, channels = _make_pool(3, selection=grpc_helpers.LEAST_LOADED)
+        callable_ = pool.unary_stream("/m")
+
+        calls = [callable_(mock.sentinel.request) for _ in range(3)]
+        assert pool.in_flight == (1, 1, 1)
+
+        # Terminate the stream on the second channel.
+        (release,), _ = calls[1].add_callback.call_args
+        release()
+        release()
+        assert pool.in_flight == (1, 0, 1)
+
+        callable_(mock.sentinel.request)
+        assert pool.in_flight == (1, 1, 1)
+        assert channels[1].unary_stream.return_value.call_count == 2
+
+    def test_stream_released_when_already_terminated(self):
+        pool, channels = _make_pool(1)
+        call = channels[0].unary_stream.return_value.return_value
+        call.add_callback.return_value = False
+
+        result = pool.unary_stream("/m")(mock.sentinel.request)
+
+        assert result is call
+        assert pool.in_flight == (0,)
+
+        # A late invocation of the callback must not release twice.
+        (release,), _ = call.add_callback.call_args
+        release()
+        assert pool.in_flight == (0,)
+
+    def test_future_released_when_done(self):
+        pool, channels = _make_pool(1)
+
+        future = pool.unary_unary("/m").future(mock.sentinel.request)
+
+        assert pool.in_flight == (1,)
+        (release,), _ = future.add_done_callback.call_args
+        release(future)
+        assert pool.in_flight == (0,)
+
+    def test_error_releases_channel(self):
+        pool, channels = _make_pool(1)
+        error = RpcErrorImpl(grpc.StatusCode.UNAVAILABLE)
+        channels[0].unary_unary.return_value.side_effect = error
+        channels[0].stream_stream.return_value.side_effect = error
+
+        with pytest.raises(grpc.RpcError):
+            pool.unary_unary("/m")(mock.sentinel.request)
+        with pytest.raises(grpc.RpcError):
+            pool.stream_stream("/m")(iter([]))
+
+        assert pool.in_flight == (0,)
+
+    def test_wrap_errors_w_pooled_stream(self):
+        pool, channels = _make_pool(1)
+        wrapped = grpc_helpers.wrap_errors(pool.unary_stream("/m"))
+
+        result = wrapped(mock.sentinel.request)
+
+        assert isinstance(result, grpc_helpers._StreamingResponseIterator)
+
+    def test_subscribe_unsubscribe_close(self):
+        pool, channels = _make_pool(2)
+        callback = mock.Mock()
+
+        with pool:
+            pool.subscribe(callback, try_to_connect=True)
+            pool.unsubscribe(callback)
+
+        for channel in channels:
+            channel.subscribe.assert_called_once_with(callback, try_to_connect=True)
+            channel.unsubscribe.assert_called_once_with(callback)
+            channel.close.assert_called_once_with()
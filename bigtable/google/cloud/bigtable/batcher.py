@@ -14,23 +14,136 @@
 
 """User friendly container for Google Cloud Bigtable MutationBatcher."""
 
+import collections
+import threading
+import time
+import weakref
+
+from concurrent import futures
+
 
 FLUSH_COUNT = 1000
 MAX_MUTATIONS = 100000
 MAX_ROW_BYTES = 5242880  # 5MB
+MAX_OUTSTANDING_REQUESTS = 10
+MAX_OUTSTANDING_MUTATIONS = 10 * MAX_MUTATIONS
+MAX_OUTSTANDING_BYTES = 20 * MAX_ROW_BYTES
+# Seconds a producer blocked by flow control waits before sending the rows
+# buffered again.
+_FLOW_CONTROL_RETRY = 0.5
 
 
 class MaxMutationsError(ValueError):
     """The number of mutations for bulk request is too big."""
 
 
+class MutationsBatchError(Exception):
+    """One or more batches sent by a :class:`MutationsBatcher` failed.
+
+    :type message: str
+    :param message: the error message.
+
+    :type exceptions: list
+    :param exceptions: the exceptions raised by the failed
+                       ``mutate_rows`` calls.
+    """
+
+    def __init__(self, message, exceptions):
+        super(MutationsBatchError, self).__init__(message)
+        self.exceptions = exceptions
+
+
+class _FlowControl(object):
+    """Bound the mutations and bytes a batcher holds in memory.
+
+    A reservation which would exceed either limit blocks until enough
+    earlier batches complete, unless nothing is outstanding, so that a
+    single oversized row can always make progress.
+    """
+
+    def __init__(self, max_mutations, max_bytes):
+        self.max_mutations = max_mutations
+        self.max_bytes = max_bytes
+        self.mutations = 0
+        self.bytes = 0
+        self._condition = threading.Condition()
+
+    def _fits(self, mutations, size):
+        if not self.mutations and not self.bytes:
+            return True
+        return (
+            self.mutations + mutations <= self.max_mutations
+            and self.bytes + size <= self.max_bytes
+        )
+
+    def try_acquire(self, mutations, size):
+        """Reserve capacity if available, without blocking.
+
+        :rtype: bool
+        :returns: True if the capacity was reserved.
+        """
+        with self._condition:
+            if not self._fits(mutations, size):
+                return False
+            self.mutations += mutations
+            self.bytes += size
+            return True
+
+    def acquire(self, mutations, size, timeout=None):
+        """Reserve capacity, blocking until it is available.
+
+        :type timeout: float
+        :param timeout: (Optional) Seconds after which to stop waiting.
+                        Default is None, which waits as long as needed.
+
+        :rtype: bool
+        :returns: True if the capacity was reserved, False if the timeout
+                  elapsed first.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._condition:
+            while not self._fits(mutations, size):
+                if deadline is None:
+                    self._condition.wait()
+                    continue
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            self.mutations += mutations
+            self.bytes += size
+            return True
+
+    def release(self, mutations, size):
+        """Return capacity reserved by :meth:`acquire`."""
+        with self._condition:
+            self.mutations -= mutations
+            self.bytes -= size
+            self._condition.notify_all()
+
+
 class MutationsBatcher(object):
     """ A MutationsBatcher is used in batch cases where the number of mutations
     is large or unknown. It will store DirectRows in memory until one of the
-    size limits is reached, or an explicit call to flush() is performed. When
-    a flush event occurs, the DirectRows in memory will be sent to Cloud
-    Bigtable. Batching mutations is more efficient than sending individual
-    request.
+    size limits is reached, the flush interval elapses, or an explicit call to
+    flush() is performed. When a flush event occurs, the DirectRows in memory
+    are sent to Cloud Bigtable in the background, with up to
+    ``max_outstanding_requests`` ``MutateRows`` calls in flight at once.
+    Batching mutations is more efficient than sending individual request.
+
+    Producers only block in :meth:`mutate` when the rows buffered or in
+    flight exceed ``max_outstanding_mutations`` or
+    ``max_outstanding_bytes``.  Each call to :meth:`mutate` returns a future
+    for the row's status;  errors raised by a whole ``MutateRows`` call are
+    also collected and re-raised from :meth:`flush`.
+
+    Mutations of the same row key are applied in the order they were added:
+    a batch holding a row key which is still being sent waits for that batch
+    to complete, while other batches are sent concurrently.
+
+    Use the batcher as a context manager, or call :meth:`close`, to send the
+    remaining rows and stop its threads.  Rows still buffered when an
+    unclosed batcher is garbage collected are not sent.
 
     This class is not suited for usage in systems where each mutation
     needs to guaranteed to be sent, since calling mutate may only result in an
@@ -38,9 +151,6 @@ class MutationsBatcher(object):
     memory will not necessarily be sent to the service, even after the
     completion of the mutate() method.
 
-    TODO: Performance would dramatically improve if this class had the
-    capability of asynchronous, parallel RPCs.
-
     :type table: class
     :param table: class:`~google.cloud.bigtable.table.Table`.
 
@@ -54,19 +164,82 @@ class MutationsBatcher(object):
     flush. If it reaches the max number of row mutations size it calls
     finish_batch() to mutate the current row batch. Default is MAX_ROW_BYTES
     (5 MB).
+
+    :type flush_interval: float
+    :param flush_interval: (Optional) Seconds after which buffered rows are
+    sent even if no size limit was reached. Default is None, which only
+    sends rows when a limit is reached or flush() is called.
+
+    :type max_outstanding_requests: int
+    :param max_outstanding_requests: (Optional) Max number of concurrent
+    ``MutateRows`` calls. Default is MAX_OUTSTANDING_REQUESTS (10).
+
+    :type max_outstanding_mutations: int
+    :param max_outstanding_mutations: (Optional) Max number of mutations
+    buffered or in flight before mutate() blocks. Default is
+    MAX_OUTSTANDING_MUTATIONS (1000000).
+
+    :type max_outstanding_bytes: int
+    :param max_outstanding_bytes: (Optional) Max size of the mutations
+    buffered or in flight before mutate() blocks. Default is
+    MAX_OUTSTANDING_BYTES (100 MB).
     """
 
-    def __init__(self, table, flush_count=FLUSH_COUNT, max_row_bytes=MAX_ROW_BYTES):
+    def __init__(
+        self,
+        table,
+        flush_count=FLUSH_COUNT,
+        max_row_bytes=MAX_ROW_BYTES,
+        flush_interval=None,
+        max_outstanding_requests=MAX_OUTSTANDING_REQUESTS,
+        max_outstanding_mutations=MAX_OUTSTANDING_MUTATIONS,
+        max_outstanding_bytes=MAX_OUTSTANDING_BYTES,
+    ):
         self.rows = []
         self.total_mutation_count = 0
         self.total_size = 0
         self.table = table
         self.flush_count = flush_count
         self.max_row_bytes = max_row_bytes
+        self.flush_interval = flush_interval
+        self._futures = []
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        # Batches waiting for the batches before them with the same row keys,
+        # in order, with their row keys;  and the row keys being sent.
+        self._held = collections.deque()
+        self._keys_in_flight = set()
+        self._exceptions = []
+        self._closed = False
+        self._flow_control = _FlowControl(
+            max_outstanding_mutations, max_outstanding_bytes
+        )
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_outstanding_requests
+        )
+        self._stopped = threading.Event()
+        self._flush_thread = None
+        if flush_interval is not None:
+            # The thread only holds a weak reference, so that it does not keep
+            # an unclosed batcher alive.
+            self._flush_thread = threading.Thread(
+                name="MutationsBatcher-flush",
+                target=_flush_periodically,
+                args=(weakref.ref(self), self._stopped, flush_interval),
+            )
+            self._flush_thread.daemon = True
+            self._flush_thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def mutate(self, row):
         """ Add a row to the batch. If the current batch meets one of the size
-        limits, the batch is sent synchronously.
+        limits, the batch is sent in the background.
 
         Example:
             >>> # Batcher for max row bytes
@@ -83,14 +256,22 @@ class MutationsBatcher(object):
         :type row: class
         :param row: class:`~google.cloud.bigtable.row.DirectRow`.
 
+        Mutations added for the same row key are applied in order, even
+        when their batches are sent separately.
+
+        :rtype: :class:`concurrent.futures.Future`
+        :returns: a future resolving to the row's
+                  ``google.rpc.status_pb2.Status`` once its batch is sent,
+                  or to the exception raised by the ``MutateRows`` call.
+
         :raises: One of the following:
-                 * :exc:`~.table._BigtableRetryableError` if any
-                   row returned a transient error.
-                 * :exc:`RuntimeError` if the number of responses doesn't
-                   match the number of rows that were retried
                  * :exc:`.batcher.MaxMutationsError` if any row exceeds max
                    mutations count.
+                 * :exc:`RuntimeError` if the batcher has been closed.
         """
+        if self._closed:
+            raise RuntimeError("The batcher has been closed.")
+
         mutation_count = len(row._get_mutations())
         if mutation_count > MAX_MUTATIONS:
             raise MaxMutationsError(
@@ -98,20 +279,42 @@ class MutationsBatcher(object):
                     row.row_key, mutation_count
                 )
             )
+        row_size = row.get_mutations_size()
 
-        if (self.total_mutation_count + mutation_count) >= MAX_MUTATIONS:
-            self.flush()
+        if not self._flow_control.try_acquire(mutation_count, row_size):
+            # Send what is buffered, so that the capacity it holds frees up.
+            # Other producers may buffer rows while this one waits, which
+            # nothing else sends without a flush interval:  send them too.
+            self._send_buffered()
+            while not self._flow_control.acquire(
+                mutation_count, row_size, timeout=_FLOW_CONTROL_RETRY
+            ):
+                self._send_buffered()
 
-        self.rows.append(row)
-        self.total_mutation_count += mutation_count
-        self.total_size += row.get_mutations_size()
+        future = futures.Future()
+        batches = []
+        with self._lock:
+            if (self.total_mutation_count + mutation_count) >= MAX_MUTATIONS:
+                batches.append(self._take_batch())
 
-        if self.total_size >= self.max_row_bytes or len(self.rows) >= self.flush_count:
-            self.flush()
+            self.rows.append(row)
+            self._futures.append(future)
+            self.total_mutation_count += mutation_count
+            self.total_size += row_size
+
+            if (
+                self.total_size >= self.max_row_bytes
+                or len(self.rows) >= self.flush_count
+            ):
+                batches.append(self._take_batch())
+
+        for batch in batches:
+            self._submit(batch)
+        return future
 
     def mutate_rows(self, rows):
         """ Add a row to the batch. If the current batch meets one of the size
-        limits, the batch is sent synchronously.
+        limits, the batch is sent in the background.
 
         Example:
             >>> # Batcher for flush count
@@ -131,21 +334,137 @@ class MutationsBatcher(object):
         :type rows: list:[`~google.cloud.bigtable.row.DirectRow`]
         :param rows: list:[`~google.cloud.bigtable.row.DirectRow`].
 
+        :rtype: list
+        :returns: a future per row, as returned by :meth:`mutate`.
+
         :raises: One of the following:
-                 * :exc:`~.table._BigtableRetryableError` if any
-                   row returned a transient error.
-                 * :exc:`RuntimeError` if the number of responses doesn't
-                   match the number of rows that were retried
                  * :exc:`.batcher.MaxMutationsError` if any row exceeds max
                    mutations count.
+                 * :exc:`RuntimeError` if the batcher has been closed.
         """
-        for row in rows:
-            self.mutate(row)
+        return [self.mutate(row) for row in rows]
 
     def flush(self):
-        """ Sends the current. batch to Cloud Bigtable. """
-        if len(self.rows) is not 0:
-            self.table.mutate_rows(self.rows)
-            self.total_mutation_count = 0
-            self.total_size = 0
-            self.rows = []
+        """ Sends the current batch to Cloud Bigtable and waits for all
+        batches in flight to complete.
+
+        :raises: :exc:`.batcher.MutationsBatchError` if any ``MutateRows``
+                 call failed since the last flush.  Per-row error statuses
+                 are reported only through the futures returned by
+                 :meth:`mutate`.
+        """
+        self._send_buffered()
+        with self._idle:
+            while self._pending:
+                self._idle.wait()
+            exceptions, self._exceptions = self._exceptions, []
+        if exceptions:
+            raise MutationsBatchError(
+                "{} batch(es) failed to be sent.".format(len(exceptions)), exceptions
+            )
+
+    def close(self):
+        """ Flushes the batcher and releases its background threads.
+
+        :raises: :exc:`.batcher.MutationsBatchError` if any ``MutateRows``
+                 call failed since the last flush.
+        """
+        if self._closed:
+            return
+        self._stopped.set()
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._executor.shutdown()
+            if self._flush_thread is not None:
+                self._flush_thread.join()
+
+    def _take_batch(self):
+        """Detach the buffered rows.  Must be called holding ``_lock``."""
+        batch = (self.rows, self._futures, self.total_mutation_count, self.total_size)
+        self.rows = []
+        self._futures = []
+        self.total_mutation_count = 0
+        self.total_size = 0
+        if batch[0]:
+            self._pending += 1
+        return batch
+
+    def _send_buffered(self):
+        with self._lock:
+            batch = self._take_batch()
+        self._submit(batch)
+
+    def _submit(self, batch):
+        if not batch[0]:
+            return
+        with self._lock:
+            self._held.append((set(row.row_key for row in batch[0]), batch))
+            ready = self._take_ready()
+        for keys, ready_batch in ready:
+            self._executor.submit(self._send, keys, ready_batch)
+
+    def _take_ready(self):
+        """Detach the held batches which may be sent, marking their row keys
+        in flight.  Must be called holding ``_lock``.
+
+        A batch is held while one of its row keys is being sent, or belongs
+        to an earlier held batch, so that each row's mutations are applied in
+        the order they were added.
+        """
+        ready = []
+        still_held = collections.deque()
+        blocked = set()
+        for keys, batch in self._held:
+            if keys.isdisjoint(self._keys_in_flight) and keys.isdisjoint(blocked):
+                self._keys_in_flight.update(keys)
+                ready.append((keys, batch))
+            else:
+                blocked.update(keys)
+                still_held.append((keys, batch))
+        self._held = still_held
+        return ready
+
+    def _send(self, keys, batch):
+        rows, row_futures, mutation_count, size = batch
+        try:
+            statuses = self.table.mutate_rows(rows)
+        except Exception as exc:
+            for future in row_futures:
+                future.set_exception(exc)
+            with self._lock:
+                self._exceptions.append(exc)
+        else:
+            for future, status in zip(row_futures, statuses):
+                future.set_result(status)
+        finally:
+            self._flow_control.release(mutation_count, size)
+            with self._idle:
+                self._keys_in_flight.difference_update(keys)
+                ready = self._take_ready()
+                self._pending -= 1
+                self._idle.notify_all()
+            for ready_keys, ready_batch in ready:
+                self._executor.submit(self._send, ready_keys, ready_batch)
+
+
+def _flush_periodically(batcher_ref, stopped, interval):
+    """Send a batcher's buffered rows every ``interval`` seconds, until it is
+    closed or garbage collected.
+
+    :type batcher_ref: :class:`weakref.ref`
+    :param batcher_ref: a weak reference to the :class:`MutationsBatcher`.
+
+    :type stopped: :class:`threading.Event`
+    :param stopped: set when the batcher is closed.
+
+    :type interval: float
+    :param interval: the batcher's ``flush_interval``.
+    """
+    while not stopped.wait(interval):
+        batcher = batcher_ref()
+        if batcher is None:
+            return
+        batcher._send_buffered()
+        del batcher
@@ -553,7 +553,7 @@ class Instance(object):
         clusters = [Cluster.from_pb(cluster, self) for cluster in resp.clusters]
         return clusters, resp.failed_locations
 
-    def table(self, table_id, app_profile_id=None):
+    def table(self, table_id, app_profile_id=None, row_cache=None):
         """Factory to create a table associated with this instance.
 
         For example:
@@ -568,10 +568,13 @@ class Instance(object):
         :type app_profile_id: str
         :param app_profile_id: (Optional) The unique name of the AppProfile.
 
+        :type row_cache: :class:`~google.cloud.bigtable.row_cache.RowCache`
+        :param row_cache: (Optional) A cache of rows read by the table.
+
         :rtype: :class:`Table <google.cloud.bigtable.table.Table>`
         :returns: The table owned by this instance.
         """
-        return Table(table_id, self, app_profile_id=app_profile_id)
+        return Table(table_id, self, app_profile_id=app_profile_id, row_cache=row_cache)
 
     def list_tables(self):
         """List the tables in this instance.
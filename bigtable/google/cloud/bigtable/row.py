@@ -136,25 +136,9 @@ class _SetDeleteRow(Row):
         :param state: (Optional) The state that is passed along to
                       :meth:`_get_mutations`.
         """
-        column = _to_bytes(column)
-        if isinstance(value, six.integer_types):
-            value = _PACK_I64(value)
-        value = _to_bytes(value)
-        if timestamp is None:
-            # Use -1 for current Bigtable server time.
-            timestamp_micros = -1
-        else:
-            timestamp_micros = _microseconds_from_datetime(timestamp)
-            # Truncate to millisecond granularity.
-            timestamp_micros -= timestamp_micros % 1000
-
-        mutation_val = data_v2_pb2.Mutation.SetCell(
-            family_name=column_family_id,
-            column_qualifier=column,
-            timestamp_micros=timestamp_micros,
-            value=value,
+        mutation_pb = _set_cell_mutation(
+            column_family_id, column, value, _timestamp_micros(timestamp)
         )
-        mutation_pb = data_v2_pb2.Mutation(set_cell=mutation_val)
         self._get_mutations(state).append(mutation_pb)
 
     def _delete(self, state=None):
@@ -322,6 +306,64 @@ class DirectRow(_SetDeleteRow):
         """
         self._set_cell(column_family_id, column, value, timestamp=timestamp, state=None)
 
+    def set_cells(self, cells, timestamp=None):
+        """Sets many values in this row at once.
+
+        Equivalent to calling :meth:`set_cell` for each cell, but builds the
+        mutations in a single pass. If any cell is invalid, no mutation is
+        added.
+
+        .. note::
+
+            This method adds mutations to the accumulated mutations on this
+            row, but does not make an API request. To actually
+            send an API request (with the mutations) to the Google Cloud
+            Bigtable API, call :meth:`commit`.
+
+        :type cells: dict or list
+        :param cells: Either a dictionary mapping column family IDs to
+                      dictionaries of column to value, or an iterable of
+                      ``(column_family_id, column, value)`` or
+                      ``(column_family_id, column, value, timestamp)``
+                      tuples. Values are as for :meth:`set_cell`.
+
+        :type timestamp: :class:`datetime.datetime`
+        :param timestamp: (Optional) The timestamp of the cells which do not
+                          carry their own.
+
+        :raises: :class:`ValueError <exceptions.ValueError>` if a tuple does
+                 not have three or four items.
+        """
+        if isinstance(cells, dict):
+            cells = (
+                (column_family_id, column, value)
+                for column_family_id, columns in six.iteritems(cells)
+                for column, value in six.iteritems(columns)
+            )
+
+        default_micros = _timestamp_micros(timestamp)
+        mutation_pbs = []
+        for cell in cells:
+            if len(cell) == 3:
+                column_family_id, column, value = cell
+                timestamp_micros = default_micros
+            elif len(cell) == 4:
+                column_family_id, column, value, cell_timestamp = cell
+                if cell_timestamp is None:
+                    timestamp_micros = default_micros
+                else:
+                    timestamp_micros = _timestamp_micros(cell_timestamp)
+            else:
+                raise ValueError(
+                    "Cells must be (column_family_id, column, value"
+                    "[, timestamp]) tuples, got %r" % (cell,)
+                )
+            mutation_pbs.append(
+                _set_cell_mutation(column_family_id, column, value, timestamp_micros)
+            )
+
+        self._pb_mutations.extend(mutation_pbs)
+
     def delete(self):
         """Deletes this row from the table.
 
@@ -513,13 +555,16 @@ class ConditionalRow(_SetDeleteRow):
             )
 
         data_client = self._table._instance._client.table_data_client
-        resp = data_client.check_and_mutate_row(
-            table_name=self._table.name,
-            row_key=self._row_key,
-            predicate_filter=self._filter.to_pb(),
-            true_mutations=true_mutations,
-            false_mutations=false_mutations,
-        )
+        try:
+            resp = data_client.check_and_mutate_row(
+                table_name=self._table.name,
+                row_key=self._row_key,
+                predicate_filter=self._filter.to_pb(),
+                true_mutations=true_mutations,
+                false_mutations=false_mutations,
+            )
+        finally:
+            self._table._invalidate_cached_rows([self._row_key])
         self.clear()
         return resp.predicate_matched
 
@@ -804,9 +849,14 @@ class AppendRow(Row):
             )
 
         data_client = self._table._instance._client.table_data_client
-        row_response = data_client.read_modify_write_row(
-            table_name=self._table.name, row_key=self._row_key, rules=self._rule_pb_list
-        )
+        try:
+            row_response = data_client.read_modify_write_row(
+                table_name=self._table.name,
+                row_key=self._row_key,
+                rules=self._rule_pb_list,
+            )
+        finally:
+            self._table._invalidate_cached_rows([self._row_key])
 
         # Reset modifications after commit-ing request.
         self.clear()
@@ -815,6 +865,47 @@ class AppendRow(Row):
         return _parse_rmw_row_response(row_response)
 
 
+def _timestamp_micros(timestamp):
+    """Convert a cell timestamp for a ``SetCell`` mutation.
+
+    :type timestamp: :class:`datetime.datetime`
+    :param timestamp: The timestamp, or :data:`None` for the server time.
+
+    :rtype: int
+    :returns: The timestamp in microseconds, truncated to millisecond
+              granularity, or ``-1`` for the server time.
+    """
+    if timestamp is None:
+        # Use -1 for current Bigtable server time.
+        return -1
+    timestamp_micros = _microseconds_from_datetime(timestamp)
+    # Truncate to millisecond granularity.
+    return timestamp_micros - timestamp_micros % 1000
+
+
+def _set_cell_mutation(column_family_id, column, value, timestamp_micros):
+    """Build a ``SetCell`` mutation.
+
+    The fields are assigned in place, rather than building and copying a
+    separate ``SetCell`` message.
+
+    :rtype: :class:`.data_v2_pb2.Mutation`
+    :returns: The mutation.
+    """
+    column = _to_bytes(column)
+    if isinstance(value, six.integer_types):
+        value = _PACK_I64(value)
+    value = _to_bytes(value)
+
+    mutation_pb = data_v2_pb2.Mutation()
+    set_cell = mutation_pb.set_cell
+    set_cell.family_name = column_family_id
+    set_cell.column_qualifier = column
+    set_cell.timestamp_micros = timestamp_micros
+    set_cell.value = value
+    return mutation_pb
+
+
 def _parse_rmw_row_response(row_response):
     """Parses the response to a ``ReadModifyWriteRow`` request.
 
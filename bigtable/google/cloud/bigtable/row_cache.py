@@ -0,0 +1,308 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Read-through cache of Google Cloud Bigtable rows."""
+
+import collections
+import threading
+import time
+
+from google.cloud._helpers import _to_bytes
+from google.cloud.bigtable.row_data import PartialRowData
+from google.cloud.bigtable.row_data import _row_cells
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+"""Default bound on the estimated size of the cached rows."""
+DEFAULT_TTL = 60.0
+"""Default number of seconds a cached row is served for."""
+
+# Estimated per-entry and per-cell bookkeeping, in bytes.
+_ENTRY_OVERHEAD = 128
+_CELL_OVERHEAD = 64
+
+
+class RowCache(object):
+    """Bounded LRU cache of rows read by :meth:`.Table.read_row`.
+
+    Rows are cached per ``(row key, filter)``, including rows which do not
+    exist. A filtered read can also be answered from the cached unfiltered
+    row, by applying the filter in-process with
+    :meth:`.RowFilter.filter_row`. Reads with a :class:`.RowSampleFilter`
+    return random rows, and are never cached. Each read is given its own
+    copy of the cached row, which it may modify.
+
+    Rows written through the owning :class:`.Table` are invalidated when
+    the write completes; writes made by other processes are only seen once
+    the entry expires.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) The bound on the estimated size of the
+                      cached rows. The least recently used rows are evicted
+                      to stay within it.
+
+    :type ttl: float
+    :param ttl: (Optional) The number of seconds a cached row is served for.
+
+    :type clock: callable
+    :param clock: (Optional) Returns the current time, in seconds.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, ttl=DEFAULT_TTL, clock=time.time):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # ``(row key, filter key)`` -> ``(row, size, expires at)``.
+        self._entries = collections.OrderedDict()
+        # ``row key`` -> set of the filter keys it is cached with.
+        self._filter_keys = {}
+        self._bytes = 0
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """The estimated size of the cached rows, in bytes.
+
+        :rtype: int
+        :returns: The sum of the cached rows' estimated sizes.
+        """
+        return self._bytes
+
+    @property
+    def stats(self):
+        """Counters describing the cache's effectiveness.
+
+        :rtype: dict
+        :returns: The ``hits``, ``misses``, ``evictions``, ``expirations``
+                  and ``invalidations`` so far, and the current number of
+                  ``entries`` and their estimated ``bytes``.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    @property
+    def generation(self):
+        """A token to pass to :meth:`put` for a read about to start.
+
+        :rtype: int
+        :returns: The number of invalidations so far.
+        """
+        return self._generation
+
+    def get(self, row_key, filter_=None):
+        """Look up a cached row.
+
+        :type row_key: bytes
+        :param row_key: The key of the row.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter the row is read with.
+
+        :rtype: tuple
+        :returns: A flag telling whether the lookup hit, and a copy of the
+                  cached :class:`.PartialRowData`, or :data:`None` if the
+                  row does not exist or was not cached.
+        """
+        row_key = _to_bytes(row_key)
+        filter_key = _filter_key(filter_)
+        if filter_key is None:
+            return False, None
+        with self._lock:
+            found, row = self._lookup((row_key, filter_key))
+            unfiltered = not found and bool(filter_key)
+            if unfiltered:
+                found, row = self._lookup((row_key, b""))
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        # Cached rows are never modified, so they are copied without the lock.
+        if row is None:
+            return found, None
+        if unfiltered:
+            return found, filter_.filter_row(row)
+        return found, _copy_row(row)
+
+    def put(self, row_key, filter_, row, generation):
+        """Cache the result of a read.
+
+        :type row_key: bytes
+        :param row_key: The key of the row.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: The filter the row was read with, or :data:`None`.
+
+        :type row: :class:`.PartialRowData`
+        :param row: The row read, or :data:`None` if it does not exist.
+
+        :type generation: int
+        :param generation: The value of :attr:`generation` before the read
+                           started. If rows were invalidated since, the
+                           result may be stale and is not cached.
+        """
+        key = (_to_bytes(row_key), _filter_key(filter_))
+        if key[1] is None:
+            return
+        if row is not None:
+            row = _copy_row(row)
+        size = _entry_size(key, row)
+        with self._lock:
+            if generation != self._generation or size > self.max_bytes:
+                return
+            self._discard(key)
+            self._entries[key] = (row, size, self._clock() + self.ttl)
+            self._filter_keys.setdefault(key[0], set()).add(key[1])
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, row_keys):
+        """Drop the cached reads of some rows, with any filter.
+
+        :type row_keys: list
+        :param row_keys: The keys of the rows written.
+        """
+        row_keys = set(_to_bytes(row_key) for row_key in row_keys)
+        with self._lock:
+            self._generation += 1
+            for row_key in row_keys:
+                for filter_key in list(self._filter_keys.get(row_key, ())):
+                    self._discard((row_key, filter_key))
+                    self.invalidations += 1
+
+    def clear(self):
+        """Drop every cached row."""
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._filter_keys.clear()
+            self._bytes = 0
+
+    def _lookup(self, key):
+        """Find an unexpired entry, marking it recently used.
+
+        :rtype: tuple
+        :returns: A flag telling whether the entry was found, and its row.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        row, _, expires_at = entry
+        if self._clock() >= expires_at:
+            self._discard(key)
+            self.expirations += 1
+            return False, None
+        # Move to the most recently used end.
+        del self._entries[key]
+        self._entries[key] = entry
+        return True, row
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+            filter_keys = self._filter_keys[key[0]]
+            filter_keys.discard(key[1])
+            if not filter_keys:
+                del self._filter_keys[key[0]]
+
+
+def _filter_key(filter_):
+    """Serialize a filter, which is not hashable, for use in a cache key.
+
+    :rtype: bytes
+    :returns: The serialized filter protobuf, empty if there is none, or
+              :data:`None` if the filter samples rows, so that its results
+              must not be cached.
+    """
+    if filter_ is None:
+        return b""
+    filter_pb = filter_.to_pb()
+    if _samples_rows(filter_pb):
+        return None
+    return filter_pb.SerializeToString()
+
+
+def _samples_rows(filter_pb):
+    """Check whether a filter, or one it combines, is a row sample filter.
+
+    :type filter_pb: :class:`.data_v2_pb2.RowFilter`
+    :param filter_pb: The filter.
+
+    :rtype: bool
+    :returns: Whether reading with the filter returns random rows.
+    """
+    kind = filter_pb.WhichOneof("filter")
+    if kind == "row_sample_filter":
+        return True
+    if kind in ("chain", "interleave"):
+        return any(_samples_rows(sub_pb) for sub_pb in getattr(filter_pb, kind).filters)
+    if kind == "condition":
+        condition = filter_pb.condition
+        return any(
+            _samples_rows(sub_pb)
+            for sub_pb in (
+                condition.predicate_filter,
+                condition.true_filter,
+                condition.false_filter,
+            )
+        )
+    return False
+
+
+def _copy_row(row):
+    """Copy a row, so that changes to either do not affect the other.
+
+    :type row: :class:`.PartialRowData`
+    :param row: The row to copy.
+
+    :rtype: :class:`.PartialRowData`
+    :returns: A row holding the same cells. The cell tuples are immutable,
+              and shared.
+    """
+    copy = PartialRowData(row.row_key)
+    copy._raw_cells = _row_cells(row)
+    return copy
+
+
+def _entry_size(key, row):
+    """Estimate the memory held by a cache entry.
+
+    :rtype: int
+    :returns: The estimated size, in bytes.
+    """
+    size = _ENTRY_OVERHEAD + len(key[0]) + len(key[1])
+    if row is not None:
+        for family, qualifier, value, _, _ in _row_cells(row):
+            size += _CELL_OVERHEAD + len(family) + len(qualifier) + len(value)
+    return size
@@ -16,12 +16,31 @@
 
 
 import copy
+import struct
+import warnings
+
 import six
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 import grpc
 
 from google.api_core import exceptions
 from google.api_core import retry
+from google.cloud._helpers import _bytes_to_unicode
 from google.cloud._helpers import _datetime_from_microseconds
 from google.cloud._helpers import _to_bytes
 from google.cloud.bigtable_v2.proto import bigtable_pb2 as data_messages_v2_pb2
@@ -35,6 +54,18 @@ _MISSING_INDEX = (
     "Index {!r} is not valid for the cells stored in this row for column {} "
     "in the column family {}. There are {} such cells."
 )
+_NO_PANDAS_ERROR = (
+    "The pandas library is not installed, please install "
+    "pandas to use the to_dataframe() function."
+)
+_NO_PYARROW_ERROR = (
+    "The pyarrow library is not installed, please install "
+    "pyarrow to use the to_arrow() function."
+)
+DEFAULT_CHUNK_SIZE = 10000
+"""Default number of rows decoded at once by the columnar conversions."""
+DEFAULT_ROW_KEY_COLUMN = "row_key"
+"""Default name of the row key column in the columnar conversions."""
 
 
 class Cell(object):
@@ -50,10 +81,13 @@ class Cell(object):
     :param labels: (Optional) List of strings. Labels applied to the cell.
     """
 
+    __slots__ = ("value", "timestamp_micros", "_labels")
+
     def __init__(self, value, timestamp_micros, labels=None):
         self.value = value
         self.timestamp_micros = timestamp_micros
-        self.labels = list(labels) if labels is not None else []
+        # Most cells carry no labels: the list is only created on demand.
+        self._labels = list(labels) if labels else None
 
     @classmethod
     def from_pb(cls, cell_pb):
@@ -70,6 +104,21 @@ class Cell(object):
         else:
             return cls(cell_pb.value, cell_pb.timestamp_micros)
 
+    @property
+    def labels(self):
+        """Labels applied to the cell.
+
+        :rtype: list
+        :returns: List of strings.
+        """
+        if self._labels is None:
+            self._labels = []
+        return self._labels
+
+    @labels.setter
+    def labels(self, value):
+        self._labels = value
+
     @property
     def timestamp(self):
         return _datetime_from_microseconds(self.timestamp_micros)
@@ -80,7 +129,7 @@ class Cell(object):
         return (
             other.value == self.value
             and other.timestamp_micros == self.timestamp_micros
-            and other.labels == self.labels
+            and (other._labels or []) == (self._labels or [])
         )
 
     def __ne__(self, other):
@@ -93,6 +142,11 @@ class PartialCellData(object):
     These are expected to be updated directly from a
     :class:`._generated.bigtable_service_messages_pb2.ReadRowsResponse`
 
+    .. deprecated::
+        :class:`PartialRowsData` no longer uses this class, and keeps the
+        state of the cell being read in its own fields. It will be removed
+        in a future release.
+
     :type row_key: bytes
     :param row_key: The key for the row holding the (partial) cell.
 
@@ -116,6 +170,11 @@ class PartialCellData(object):
     def __init__(
         self, row_key, family_name, qualifier, timestamp_micros, labels=(), value=b""
     ):
+        warnings.warn(
+            "PartialCellData is deprecated and no longer used.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         self.row_key = row_key
         self.family_name = family_name
         self.qualifier = qualifier
@@ -144,7 +203,35 @@ class PartialRowData(object):
 
     def __init__(self, row_key):
         self._row_key = row_key
-        self._cells = {}
+        # Cells as parsed, in order: ``(family, qualifier, value,
+        # timestamp_micros, labels)`` tuples.  The nested dictionary of
+        # :class:`Cell` objects is only built if :attr:`cells` is used;  it
+        # then replaces the tuples, so that changes made through
+        # :attr:`cells` are not lost.  Use :func:`_row_cells` to read them.
+        self._raw_cells = []
+        self._cells_by_family = None
+
+    @property
+    def _cells(self):
+        """Helper for :attr:`cells`:  build the nested dictionary once."""
+        if self._cells_by_family is None:
+            cells = {}
+            for family, qualifier, value, timestamp_micros, labels in self._raw_cells:
+                columns = cells.get(family)
+                if columns is None:
+                    columns = cells[family] = {}
+                column = columns.get(qualifier)
+                if column is None:
+                    column = columns[qualifier] = []
+                column.append(Cell(value, timestamp_micros, labels))
+            self._cells_by_family = cells
+            self._raw_cells = []
+        return self._cells_by_family
+
+    @_cells.setter
+    def _cells(self, value):
+        self._cells_by_family = value
+        self._raw_cells = []
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -361,10 +448,16 @@ class PartialRowsData(object):
         self._row = None
         # Last complete row, unset until first commit
         self._previous_row = None
-        # In-progress cell, unset until first response, after completion
-        self._cell = None
-        # Last complete cell, unset until first completion, after new row
-        self._previous_cell = None
+        # Key, family and qualifier of the in-progress cell, or else of the
+        # last complete cell in the current row: later cells may omit them.
+        # Unset until first response, after commit/reset.
+        self._cell_row_key = None
+        self._cell_family = None
+        self._cell_qualifier = None
+        # Timestamp, labels and value chunks of the in-progress cell.
+        self._cell_timestamp_micros = 0
+        self._cell_labels = None
+        self._cell_value = []
 
         # May be cached from previous response
         self.last_scanned_row_key = None
@@ -405,6 +498,243 @@ class PartialRowsData(object):
         for row in self:
             self.rows[row.row_key] = row
 
+    def _iter_column_chunks(self, columns, latest_only, chunk_size):
+        """Consume the rows, gathering the mapped cell values in chunks.
+
+        :rtype: iterator
+        :returns: ``(row_keys, columns)`` pairs covering at most
+                  ``chunk_size`` rows each, where ``columns`` holds a
+                  ``(name, decoder, values)`` triple per mapped column.
+                  ``values`` holds, per row, the raw bytes of the latest
+                  cell, or the list of all cells' bytes (newest first) if
+                  not ``latest_only``, or None if the row has no such cell.
+        """
+        specs = _column_specs(columns)
+        indexes = {
+            (family, qualifier): index
+            for index, (family, qualifier, _, _) in enumerate(specs)
+        }
+
+        def new_chunk():
+            return [], [[] for _ in specs]
+
+        def finish_chunk(row_keys, values):
+            return (
+                row_keys,
+                [
+                    (name, decoder, column_values)
+                    for (_, _, name, decoder), column_values in zip(specs, values)
+                ],
+            )
+
+        row_keys, values = new_chunk()
+        for row in self:
+            row_values = [None] * len(specs)
+            for family, qualifier, value, _, _ in _row_cells(row):
+                index = indexes.get((family, qualifier))
+                if index is None:
+                    continue
+                if latest_only:
+                    if row_values[index] is None:
+                        row_values[index] = value
+                elif row_values[index] is None:
+                    row_values[index] = [value]
+                else:
+                    row_values[index].append(value)
+
+            row_keys.append(row._row_key)
+            for column_values, value in zip(values, row_values):
+                column_values.append(value)
+
+            if len(row_keys) == chunk_size:
+                yield finish_chunk(row_keys, values)
+                row_keys, values = new_chunk()
+
+        if row_keys:
+            yield finish_chunk(row_keys, values)
+
+    def to_arrow_iterable(
+        self,
+        columns,
+        latest_only=True,
+        row_key_column=DEFAULT_ROW_KEY_COLUMN,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+    ):
+        """Consume the rows as a stream of :class:`pyarrow.RecordBatch`.
+
+        :type columns: dict
+        :param columns: Maps ``"family:qualifier"`` (str or bytes) to the
+                        output column name, or to a ``(name, decoder)``
+                        pair. ``decoder`` is one of ``"bytes"`` (the
+                        default), ``"string"`` (UTF-8), ``"int64"`` or
+                        ``"float64"`` (big-endian, as written by
+                        :meth:`.AppendRow.increment_cell_value`), or a
+                        callable converting the cell's bytes. A list of
+                        ``(key, spec)`` pairs fixes the column order.
+
+        :type latest_only: bool
+        :param latest_only: (Optional) If true (the default), each column
+                            holds the value of the latest cell. Otherwise,
+                            each holds a list of all the cells' values,
+                            newest first.
+
+        :type row_key_column: str
+        :param row_key_column: (Optional) Name of the leading column holding
+                               the row keys, or None to omit it.
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) Maximum number of rows per batch.
+
+        :rtype: iterator
+        :returns: a :class:`pyarrow.RecordBatch` per chunk of rows. Cells
+                  missing from a row are null.
+        :raises: :exc:`ValueError`: If the :mod:`pyarrow` library cannot be
+            imported.
+        """
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+
+        known_types = {}
+        for row_keys, chunk in self._iter_column_chunks(
+            columns, latest_only, chunk_size
+        ):
+            names, arrays = [], []
+            if row_key_column is not None:
+                names.append(row_key_column)
+                arrays.append(pyarrow.array(row_keys, type=pyarrow.binary()))
+            for name, decoder, values in chunk:
+                array = _arrow_array(
+                    values, decoder, latest_only, known_types.get(name)
+                )
+                if array.type != pyarrow.null():
+                    known_types.setdefault(name, array.type)
+                names.append(name)
+                arrays.append(array)
+            yield pyarrow.RecordBatch.from_arrays(arrays, names)
+
+    def to_arrow(
+        self,
+        columns,
+        latest_only=True,
+        row_key_column=DEFAULT_ROW_KEY_COLUMN,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+    ):
+        """Consume the rows into a :class:`pyarrow.Table`.
+
+        See :meth:`to_arrow_iterable` for the arguments.
+
+        :rtype: :class:`pyarrow.Table`
+        :returns: a table holding all rows.
+        :raises: :exc:`ValueError`: If the :mod:`pyarrow` library cannot be
+            imported.
+        """
+        batches = list(
+            self.to_arrow_iterable(
+                columns,
+                latest_only=latest_only,
+                row_key_column=row_key_column,
+                chunk_size=chunk_size,
+            )
+        )
+        if not batches:
+            return pyarrow.Table.from_batches(
+                [],
+                schema=pyarrow.schema(
+                    _empty_arrow_fields(columns, latest_only, row_key_column)
+                ),
+            )
+
+        # Types inferred from callable decoders stay null in chunks where
+        # every value is missing.
+        schema = batches[-1].schema
+        for batch in batches[:-1]:
+            fields = [
+                field if field.type != pyarrow.null() else schema.field(index)
+                for index, field in enumerate(batch.schema)
+            ]
+            schema = pyarrow.schema(fields)
+        batches = [
+            batch
+            if batch.schema.equals(schema)
+            else pyarrow.RecordBatch.from_arrays(
+                [
+                    column
+                    if column.type == field.type
+                    else pyarrow.nulls(len(column), type=field.type)
+                    for column, field in zip(batch.columns, schema)
+                ],
+                schema.names,
+            )
+            for batch in batches
+        ]
+        return pyarrow.Table.from_batches(batches, schema=schema)
+
+    def to_dataframe_iterable(
+        self,
+        columns,
+        latest_only=True,
+        row_key_column=DEFAULT_ROW_KEY_COLUMN,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+    ):
+        """Consume the rows as a stream of :class:`pandas.DataFrame`.
+
+        See :meth:`to_arrow_iterable` for the arguments. ``int64`` and
+        ``float64`` columns with no missing cells are decoded in bulk into
+        NumPy arrays; other columns have the ``object`` dtype.
+
+        :rtype: iterator
+        :returns: a :class:`pandas.DataFrame` per chunk of rows. Cells
+                  missing from a row are None.
+        :raises: :exc:`ValueError`: If the :mod:`pandas` library cannot be
+            imported.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+
+        for row_keys, chunk in self._iter_column_chunks(
+            columns, latest_only, chunk_size
+        ):
+            data = [
+                (name, _pandas_series(_decode_values(values, decoder, latest_only)))
+                for name, decoder, values in chunk
+            ]
+            if row_key_column is not None:
+                data.insert(0, (row_key_column, _pandas_series(row_keys)))
+            yield pandas.DataFrame(dict(data), columns=[name for name, _ in data])
+
+    def to_dataframe(
+        self,
+        columns,
+        latest_only=True,
+        row_key_column=DEFAULT_ROW_KEY_COLUMN,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+    ):
+        """Consume the rows into a :class:`pandas.DataFrame`.
+
+        See :meth:`to_arrow_iterable` for the arguments.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: a frame holding all rows.
+        :raises: :exc:`ValueError`: If the :mod:`pandas` library cannot be
+            imported.
+        """
+        frames = list(
+            self.to_dataframe_iterable(
+                columns,
+                latest_only=latest_only,
+                row_key_column=row_key_column,
+                chunk_size=chunk_size,
+            )
+        )
+        if not frames:
+            names = [name for _, _, name, _ in _column_specs(columns)]
+            if row_key_column is not None:
+                names.insert(0, row_key_column)
+            return pandas.DataFrame(columns=names)
+        if len(frames) == 1:
+            return frames[0]
+        return pandas.concat(frames, ignore_index=True)
+
     def _create_retry_request(self):
         """Helper for :meth:`__iter__`."""
         req_manager = _ReadRowsRequestManager(
@@ -444,34 +774,35 @@ class PartialRowsData(object):
                     raise ValueError("The row remains partial / is not committed.")
                 break
 
+            process_chunk = self._process_chunk
             for chunk in response.chunks:
-                self._process_chunk(chunk)
-                if chunk.commit_row:
-                    self.last_scanned_row_key = self._previous_row.row_key
+                row = process_chunk(chunk)
+                if row is not None:
+                    self.last_scanned_row_key = row._row_key
                     self._counter += 1
-                    yield self._previous_row
+                    yield row
 
             resp_last_key = response.last_scanned_row_key
             if resp_last_key and resp_last_key > self.last_scanned_row_key:
                 self.last_scanned_row_key = resp_last_key
 
     def _process_chunk(self, chunk):
+        """Apply a chunk to the in-progress row.
+
+        :rtype: :class:`PartialRowData`
+        :returns: The row, if the chunk commits it, else None.
+        """
         if chunk.reset_row:
             self._validate_chunk_reset_row(chunk)
             self._row = None
-            self._cell = self._previous_cell = None
+            self._reset_cell()
             self._state = self.STATE_NEW_ROW
-            return
+            return None
 
-        self._update_cell(chunk)
-
-        if self._row is None:
-            if (
-                self._previous_row is not None
-                and self._cell.row_key <= self._previous_row.row_key
-            ):
-                raise InvalidChunk()
-            self._row = PartialRowData(self._cell.row_key)
+        if self._state == self.STATE_CELL_IN_PROGRESS:
+            self._cell_value.append(chunk.value)
+        else:
+            self._update_cell(chunk)
 
         if chunk.value_size == 0:
             self._state = self.STATE_ROW_IN_PROGRESS
@@ -483,42 +814,65 @@ class PartialRowsData(object):
             if chunk.value_size > 0:
                 raise InvalidChunk()
 
-            self._previous_row = self._row
+            row = self._previous_row = self._row
             self._row = None
-            self._previous_cell = None
+            self._reset_cell()
             self._state = self.STATE_NEW_ROW
+            return row
+        return None
+
+    def _reset_cell(self):
+        """Forget the cells of the current row."""
+        self._cell_row_key = self._cell_family = self._cell_qualifier = None
+        self._cell_labels = None
+        self._cell_value = []
 
     def _update_cell(self, chunk):
-        if self._cell is None:
-            qualifier = None
-            if chunk.HasField("qualifier"):
-                qualifier = chunk.qualifier.value
-            family = None
-            if chunk.HasField("family_name"):
-                family = chunk.family_name.value
-
-            self._cell = PartialCellData(
-                chunk.row_key,
-                family,
-                qualifier,
-                chunk.timestamp_micros,
-                chunk.labels,
-                chunk.value,
-            )
-            self._copy_from_previous(self._cell)
-            self._validate_cell_data_new_cell()
-        else:
-            self._cell.append_value(chunk.value)
+        """Start a new cell from the first chunk holding it.
 
-    def _validate_cell_data_new_cell(self):
-        cell = self._cell
-        if not cell.row_key or not cell.family_name or cell.qualifier is None:
-            raise InvalidChunk()
+        The row key, family and qualifier may be omitted from a chunk, in
+        which case they carry over from the previous cell in the row:  the
+        family only if the row key is omitted, and the qualifier only if the
+        family is omitted too.
+        """
+        row_key = chunk.row_key
+        # Reading an unset wrapper field would allocate a default message.
+        family = None
+        if chunk.HasField("family_name"):
+            family = chunk.family_name.value
+        # NOTE: ``qualifier`` **can** be empty string.
+        qualifier = None
+        if chunk.HasField("qualifier"):
+            qualifier = chunk.qualifier.value
+
+        previous_row_key = self._cell_row_key
+        if previous_row_key is not None:
+            if not row_key:
+                row_key = previous_row_key
+                if not family:
+                    family = self._cell_family
+                    if qualifier is None:
+                        qualifier = self._cell_qualifier
+            elif row_key != previous_row_key:
+                raise InvalidChunk()
 
-        prev = self._previous_cell
-        if prev and prev.row_key != cell.row_key:
+        if not row_key or not family or qualifier is None:
             raise InvalidChunk()
 
+        if self._row is None:
+            previous_row = self._previous_row
+            if previous_row is not None and row_key <= previous_row._row_key:
+                raise InvalidChunk()
+            self._row = PartialRowData(row_key)
+
+        self._cell_row_key = row_key
+        self._cell_family = family
+        self._cell_qualifier = qualifier
+        self._cell_timestamp_micros = chunk.timestamp_micros
+        labels = chunk.labels
+        self._cell_labels = list(labels) if labels else None
+        self._cell_value = [chunk.value]
+
     def _validate_chunk_reset_row(self, chunk):
         # No reset for new row
         _raise_if(self._state == self.STATE_NEW_ROW)
@@ -534,25 +888,146 @@ class PartialRowsData(object):
         _raise_if(chunk.commit_row)
 
     def _save_current_cell(self):
-        """Helper for :meth:`consume_next`."""
-        row, cell = self._row, self._cell
-        family = row._cells.setdefault(cell.family_name, {})
-        qualified = family.setdefault(cell.qualifier, [])
-        complete = Cell.from_pb(cell)
-        qualified.append(complete)
-        self._cell, self._previous_cell = None, cell
-
-    def _copy_from_previous(self, cell):
-        """Helper for :meth:`consume_next`."""
-        previous = self._previous_cell
-        if previous is not None:
-            if not cell.row_key:
-                cell.row_key = previous.row_key
-                if not cell.family_name:
-                    cell.family_name = previous.family_name
-                    # NOTE: ``cell.qualifier`` **can** be empty string.
-                    if cell.qualifier is None:
-                        cell.qualifier = previous.qualifier
+        """Helper for :meth:`_process_chunk`."""
+        value = self._cell_value
+        self._row._raw_cells.append(
+            (
+                self._cell_family,
+                self._cell_qualifier,
+                value[0] if len(value) == 1 else b"".join(value),
+                self._cell_timestamp_micros,
+                self._cell_labels,
+            )
+        )
+
+
+def _decode_int64(value):
+    return struct.unpack(">q", value)[0]
+
+
+def _decode_float64(value):
+    return struct.unpack(">d", value)[0]
+
+
+def _decode_string(value):
+    return value.decode("utf-8")
+
+
+# Named decoders:  per-value function, big-endian NumPy dtype for bulk
+# decoding (or None), and the function returning the Arrow type.
+_DECODERS = {
+    "bytes": (None, None, "binary"),
+    "string": (_decode_string, None, "string"),
+    "int64": (_decode_int64, ">i8", "int64"),
+    "float64": (_decode_float64, ">f8", "float64"),
+}
+
+
+def _column_specs(columns):
+    """Helper for :meth:`PartialRowsData._iter_column_chunks`.
+
+    :rtype: list
+    :returns: ``(family, qualifier, name, decoder)`` tuples.
+    :raises: :exc:`ValueError` if a key has no ``:`` separator or a named
+             decoder is unknown.
+    """
+    items = columns.items() if hasattr(columns, "items") else columns
+    specs = []
+    for key, spec in items:
+        family, separator, qualifier = _to_bytes(key).partition(b":")
+        if not separator:
+            raise ValueError("Column {!r} is not 'family:qualifier'.".format(key))
+        if isinstance(spec, six.string_types):
+            name, decoder = spec, "bytes"
+        else:
+            name, decoder = spec
+        if not callable(decoder) and decoder not in _DECODERS:
+            raise ValueError("Unknown decoder {!r}.".format(decoder))
+        specs.append((_bytes_to_unicode(family), qualifier, name, decoder))
+    return specs
+
+
+def _row_cells(row):
+    """Get the cells of a row as ``PartialRowData._raw_cells`` tuples.
+
+    :type row: :class:`PartialRowData`
+    :param row: A row read from the service or assembled by hand.
+
+    :rtype: list
+    :returns: The cells, in row order.
+    """
+    if row._cells_by_family is None:
+        return list(row._raw_cells)
+    return [
+        (family, qualifier, cell.value, cell.timestamp_micros, cell._labels)
+        for family, columns in row._cells_by_family.items()
+        for qualifier, column_cells in columns.items()
+        for cell in column_cells
+    ]
+
+
+def _decode_values(values, decoder, latest_only):
+    """Decode one chunk of a column.
+
+    :rtype: list or :class:`numpy.ndarray`
+    :returns: the decoded values, with None for missing cells.
+    """
+    if callable(decoder):
+        decode = decoder
+    else:
+        decode, dtype, _ = _DECODERS[decoder]
+        if latest_only and dtype is not None and numpy is not None:
+            if values and all(
+                value is not None and len(value) == 8 for value in values
+            ):
+                return numpy.frombuffer(b"".join(values), dtype=dtype).astype(dtype[1:])
+    if decode is None:
+        return values
+    if latest_only:
+        return [None if value is None else decode(value) for value in values]
+    return [
+        None if cells is None else [decode(value) for value in cells]
+        for cells in values
+    ]
+
+
+def _pandas_series(values):
+    """Helper for :meth:`PartialRowsData.to_dataframe_iterable`.
+
+    Lists are kept as ``object`` columns, so that pandas neither infers a
+    string dtype nor turns missing cells into NaN.
+    """
+    if isinstance(values, list):
+        return pandas.Series(values, dtype=object)
+    return pandas.Series(values)
+
+
+def _arrow_type(decoder, latest_only):
+    """Arrow type for a decoder, or None if it must be inferred."""
+    if callable(decoder):
+        return None
+    arrow_type = getattr(pyarrow, _DECODERS[decoder][2])()
+    if not latest_only:
+        arrow_type = pyarrow.list_(arrow_type)
+    return arrow_type
+
+
+def _arrow_array(values, decoder, latest_only, known_type=None):
+    """Helper for :meth:`PartialRowsData.to_arrow_iterable`."""
+    arrow_type = _arrow_type(decoder, latest_only) or known_type
+    return pyarrow.array(_decode_values(values, decoder, latest_only), type=arrow_type)
+
+
+def _empty_arrow_fields(columns, latest_only, row_key_column):
+    """Helper for :meth:`PartialRowsData.to_arrow`, when there are no rows."""
+    fields = []
+    if row_key_column is not None:
+        fields.append(pyarrow.field(row_key_column, pyarrow.binary()))
+    for _, _, name, decoder in _column_specs(columns):
+        fields.append(
+            pyarrow.field(name, _arrow_type(decoder, latest_only) or pyarrow.null())
+        )
+    return fields
 
 
 class _ReadRowsRequestManager(object):
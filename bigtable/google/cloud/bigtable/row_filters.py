@@ -15,8 +15,13 @@
 """Filters for Google Cloud Bigtable Row classes."""
 
 
+import random
+import re
+
 from google.cloud._helpers import _microseconds_from_datetime
 from google.cloud._helpers import _to_bytes
+from google.cloud.bigtable.row_data import PartialRowData
+from google.cloud.bigtable.row_data import _row_cells
 from google.cloud.bigtable_v2.proto import data_pb2 as data_v2_pb2
 
 
@@ -31,6 +36,58 @@ class RowFilter(object):
         This class is a do-nothing base class for all row filters.
     """
 
+    def filter_row(self, row):
+        """Apply this filter to a row in-process, without a round trip.
+
+        The result matches what the service would return for the same
+        filter, so that cached or locally built rows can answer filtered
+        reads and filters can be tested offline.
+
+        .. note::
+
+            Regular expressions are evaluated with Python's :mod:`re`
+            module, which accepts most of the RE2 syntax used by the
+            service, including the ``\\C`` escape. Patterns relying on
+            RE2-only constructs may behave differently.
+
+        :type row: :class:`.PartialRowData`
+        :param row: The row to filter. It is not modified.
+
+        :rtype: :class:`.PartialRowData`
+        :returns: A new row holding the matching cells, or :data:`None` if
+                  no cells match, in which case the service omits the row.
+        """
+        cells = _row_cells(row)
+        sunk = []
+        result = self._filter_cells(row.row_key, cells, sunk)
+        if sunk:
+            result = _merge_cells([result, sunk], _column_order(cells))
+        if not result:
+            return None
+        filtered = PartialRowData(row.row_key)
+        filtered._raw_cells = result
+        return filtered
+
+    def _filter_cells(self, row_key, cells, sunk):
+        """Apply this filter to the cells of a single row.
+
+        :type row_key: bytes
+        :param row_key: The key of the row.
+
+        :type cells: list
+        :param cells: ``(family, qualifier, value, timestamp_micros, labels)``
+                      tuples, as held by :class:`.PartialRowData`, in the
+                      order the service returns them.
+
+        :type sunk: list
+        :param sunk: Cells emitted by a :class:`SinkFilter`, which bypass
+                     any enclosing filters.
+
+        :rtype: list
+        :returns: The cells passing the filter.
+        """
+        raise NotImplementedError
+
 
 class _BoolFilter(RowFilter):
     """Row filter that uses a boolean flag.
@@ -70,6 +127,12 @@ class SinkFilter(_BoolFilter):
         """
         return data_v2_pb2.RowFilter(sink=self.flag)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        if not self.flag:
+            return cells
+        sunk.extend(cells)
+        return []
+
 
 class PassAllFilter(_BoolFilter):
     """Row filter equivalent to not filtering at all.
@@ -88,6 +151,9 @@ class PassAllFilter(_BoolFilter):
         """
         return data_v2_pb2.RowFilter(pass_all_filter=self.flag)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        return cells if self.flag else []
+
 
 class BlockAllFilter(_BoolFilter):
     """Row filter that doesn't match any cells.
@@ -105,6 +171,9 @@ class BlockAllFilter(_BoolFilter):
         """
         return data_v2_pb2.RowFilter(block_all_filter=self.flag)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        return [] if self.flag else cells
+
 
 class _RegexFilter(RowFilter):
     """Row filter that uses a regular expression.
@@ -118,6 +187,9 @@ class _RegexFilter(RowFilter):
     :param regex: A regular expression (RE2) for some row filter.
     """
 
+    # ``(regex, compiled pattern)`` for the last regex matched against.
+    _compiled = None
+
     def __init__(self, regex):
         self.regex = _to_bytes(regex)
 
@@ -129,6 +201,20 @@ class _RegexFilter(RowFilter):
     def __ne__(self, other):
         return not self == other
 
+    def _matches(self, value):
+        """Check whether the regex matches all of ``value``.
+
+        :type value: bytes
+        :param value: The row key, family name, qualifier or value to check.
+
+        :rtype: bool
+        :returns: True if the whole of ``value`` matches.
+        """
+        compiled = self._compiled
+        if compiled is None or compiled[0] != self.regex:
+            compiled = self._compiled = (self.regex, _compile_regex(self.regex))
+        return compiled[1].match(value) is not None
+
 
 class RowKeyRegexFilter(_RegexFilter):
     """Row filter for a row key regular expression.
@@ -161,6 +247,9 @@ class RowKeyRegexFilter(_RegexFilter):
         """
         return data_v2_pb2.RowFilter(row_key_regex_filter=self.regex)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        return cells if self._matches(_to_bytes(row_key)) else []
+
 
 class RowSampleFilter(RowFilter):
     """Matches all cells from a row with probability p.
@@ -189,6 +278,9 @@ class RowSampleFilter(RowFilter):
         """
         return data_v2_pb2.RowFilter(row_sample_filter=self.sample)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        return cells if random.random() < self.sample else []
+
 
 class FamilyNameRegexFilter(_RegexFilter):
     """Row filter for a family name regular expression.
@@ -213,6 +305,9 @@ class FamilyNameRegexFilter(_RegexFilter):
         """
         return data_v2_pb2.RowFilter(family_name_regex_filter=self.regex)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        return [cell for cell in cells if self._matches(_to_bytes(cell[0]))]
+
 
 class ColumnQualifierRegexFilter(_RegexFilter):
     """Row filter for a column qualifier regular expression.
@@ -243,6 +338,9 @@ class ColumnQualifierRegexFilter(_RegexFilter):
         """
         return data_v2_pb2.RowFilter(column_qualifier_regex_filter=self.regex)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        return [cell for cell in cells if self._matches(cell[1])]
+
 
 class TimestampRange(object):
     """Range of time with inclusive lower and exclusive upper bounds.
@@ -294,6 +392,9 @@ class TimestampRangeFilter(RowFilter):
     :param range_: Range of time that cells should match against.
     """
 
+    # ``((start, end), bounds)`` for the last range filtered with.
+    _cached_bounds = None
+
     def __init__(self, range_):
         self.range_ = range_
 
@@ -316,6 +417,26 @@ class TimestampRangeFilter(RowFilter):
         """
         return data_v2_pb2.RowFilter(timestamp_range_filter=self.range_.to_pb())
 
+    def _bounds(self):
+        """Microsecond bounds of ``range_``, as the service applies them.
+
+        :rtype: tuple
+        :returns: The inclusive start and exclusive end, or None if the
+                  range is unbounded at that end.
+        """
+        key = (self.range_.start, self.range_.end)
+        cached = self._cached_bounds
+        if cached is None or cached[0] != key:
+            range_pb = self.range_.to_pb()
+            start = range_pb.start_timestamp_micros or None
+            end = range_pb.end_timestamp_micros or None
+            cached = self._cached_bounds = (key, (start, end))
+        return cached[1]
+
+    def _filter_cells(self, row_key, cells, sunk):
+        start, end = self._bounds()
+        return [cell for cell in cells if _in_range(cell[3], start, end, True, False)]
+
 
 class ColumnRangeFilter(RowFilter):
     """A row filter to restrict to a range of columns.
@@ -354,6 +475,9 @@ class ColumnRangeFilter(RowFilter):
              is set but no ``end_column`` is given
     """
 
+    # ``((start_column, end_column), bounds)`` for the last range used.
+    _cached_bounds = None
+
     def __init__(
         self,
         column_family_id,
@@ -422,6 +546,20 @@ class ColumnRangeFilter(RowFilter):
         column_range = data_v2_pb2.ColumnRange(**column_range_kwargs)
         return data_v2_pb2.RowFilter(column_range_filter=column_range)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        key = (self.start_column, self.end_column)
+        cached = self._cached_bounds
+        if cached is None or cached[0] != key:
+            cached = self._cached_bounds = (key, _range_bounds(*key))
+        start, end = cached[1]
+        family = self.column_family_id
+        return [
+            cell
+            for cell in cells
+            if cell[0] == family
+            and _in_range(cell[1], start, end, self.inclusive_start, self.inclusive_end)
+        ]
+
 
 class ValueRegexFilter(_RegexFilter):
     """Row filter for a value regular expression.
@@ -452,6 +590,9 @@ class ValueRegexFilter(_RegexFilter):
         """
         return data_v2_pb2.RowFilter(value_regex_filter=self.regex)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        return [cell for cell in cells if self._matches(cell[2])]
+
 
 class ValueRangeFilter(RowFilter):
     """A range of values to restrict to in a row filter.
@@ -487,6 +628,9 @@ class ValueRangeFilter(RowFilter):
              is set but no ``end_value`` is given
     """
 
+    # ``((start_value, end_value), bounds)`` for the last range used.
+    _cached_bounds = None
+
     def __init__(
         self, start_value=None, end_value=None, inclusive_start=None, inclusive_end=None
     ):
@@ -547,6 +691,18 @@ class ValueRangeFilter(RowFilter):
         value_range = data_v2_pb2.ValueRange(**value_range_kwargs)
         return data_v2_pb2.RowFilter(value_range_filter=value_range)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        key = (self.start_value, self.end_value)
+        cached = self._cached_bounds
+        if cached is None or cached[0] != key:
+            cached = self._cached_bounds = (key, _range_bounds(*key))
+        start, end = cached[1]
+        return [
+            cell
+            for cell in cells
+            if _in_range(cell[2], start, end, self.inclusive_start, self.inclusive_end)
+        ]
+
 
 class _CellCountFilter(RowFilter):
     """Row filter that uses an integer count of cells.
@@ -585,6 +741,9 @@ class CellsRowOffsetFilter(_CellCountFilter):
         """
         return data_v2_pb2.RowFilter(cells_per_row_offset_filter=self.num_cells)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        return cells[self.num_cells :]
+
 
 class CellsRowLimitFilter(_CellCountFilter):
     """Row filter to limit cells in a row.
@@ -601,6 +760,9 @@ class CellsRowLimitFilter(_CellCountFilter):
         """
         return data_v2_pb2.RowFilter(cells_per_row_limit_filter=self.num_cells)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        return cells[: self.num_cells]
+
 
 class CellsColumnLimitFilter(_CellCountFilter):
     """Row filter to limit cells in a column.
@@ -619,6 +781,17 @@ class CellsColumnLimitFilter(_CellCountFilter):
         """
         return data_v2_pb2.RowFilter(cells_per_column_limit_filter=self.num_cells)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        counts = {}
+        result = []
+        for cell in cells:
+            column = (cell[0], cell[1])
+            count = counts.get(column, 0)
+            if count < self.num_cells:
+                result.append(cell)
+            counts[column] = count + 1
+        return result
+
 
 class StripValueTransformerFilter(_BoolFilter):
     """Row filter that transforms cells into empty string (0 bytes).
@@ -637,6 +810,14 @@ class StripValueTransformerFilter(_BoolFilter):
         """
         return data_v2_pb2.RowFilter(strip_value_transformer=self.flag)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        if not self.flag:
+            return cells
+        return [
+            (family, qualifier, b"", timestamp_micros, labels)
+            for family, qualifier, _, timestamp_micros, labels in cells
+        ]
+
 
 class ApplyLabelFilter(RowFilter):
     """Filter to apply labels to cells.
@@ -676,6 +857,12 @@ class ApplyLabelFilter(RowFilter):
         """
         return data_v2_pb2.RowFilter(apply_label_transformer=self.label)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        return [
+            (family, qualifier, value, timestamp_micros, (labels or []) + [self.label])
+            for family, qualifier, value, timestamp_micros, labels in cells
+        ]
+
 
 class _FilterCombination(RowFilter):
     """Chain of row filters.
@@ -724,6 +911,13 @@ class RowFilterChain(_FilterCombination):
         )
         return data_v2_pb2.RowFilter(chain=chain)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        for row_filter in self.filters:
+            if not cells:
+                break
+            cells = row_filter._filter_cells(row_key, cells, sunk)
+        return cells
+
 
 class RowFilterUnion(_FilterCombination):
     """Union of row filters.
@@ -749,6 +943,15 @@ class RowFilterUnion(_FilterCombination):
         )
         return data_v2_pb2.RowFilter(interleave=interleave)
 
+    def _filter_cells(self, row_key, cells, sunk):
+        return _merge_cells(
+            [
+                row_filter._filter_cells(row_key, cells, sunk)
+                for row_filter in self.filters
+            ],
+            _column_order(cells),
+        )
+
 
 class ConditionalRowFilter(RowFilter):
     """Conditional row filter which exhibits ternary behavior.
@@ -810,3 +1013,99 @@ class ConditionalRowFilter(RowFilter):
             condition_kwargs["false_filter"] = self.false_filter.to_pb()
         condition = data_v2_pb2.RowFilter.Condition(**condition_kwargs)
         return data_v2_pb2.RowFilter(condition=condition)
+
+    def _filter_cells(self, row_key, cells, sunk):
+        # Sinks are not allowed within the predicate, so its output is
+        # only inspected.
+        if self.base_filter._filter_cells(row_key, cells, []):
+            branch = self.true_filter
+        else:
+            branch = self.false_filter
+        if branch is None:
+            return []
+        return branch._filter_cells(row_key, cells, sunk)
+
+
+def _compile_regex(regex):
+    """Compile an RE2 pattern, anchored to match a whole value.
+
+    RE2's ``\\C`` (any byte) escape is translated for Python's :mod:`re`.
+
+    :type regex: bytes
+    :param regex: The RE2 pattern.
+
+    :rtype: :class:`re.RegexObject`
+    :returns: The compiled pattern. Use ``match`` to test a whole value.
+    """
+    parts = []
+    index = 0
+    while index < len(regex):
+        char = regex[index : index + 1]
+        if char == b"\\":
+            escaped = regex[index : index + 2]
+            parts.append(b"[\\x00-\\xff]" if escaped == b"\\C" else escaped)
+            index += 2
+        else:
+            parts.append(char)
+            index += 1
+    return re.compile(b"(?:" + b"".join(parts) + b")\\Z")
+
+
+def _range_bounds(start, end):
+    """Convert the ends of a column or value range to bytes.
+
+    :rtype: tuple
+    :returns: The start and end, as bytes, or None if unbounded.
+    """
+    if start is not None:
+        start = _to_bytes(start)
+    if end is not None:
+        end = _to_bytes(end)
+    return start, end
+
+
+def _in_range(value, start, end, inclusive_start, inclusive_end):
+    """Check ``value`` against a range with optional, open or closed ends.
+
+    :rtype: bool
+    :returns: True if ``value`` is within the range.
+    """
+    if start is not None and (
+        value < start or (value == start and not inclusive_start)
+    ):
+        return False
+    if end is not None and (value > end or (value == end and not inclusive_end)):
+        return False
+    return True
+
+
+def _column_order(cells):
+    """Map each ``(family, qualifier)`` to its first position in ``cells``.
+
+    :rtype: dict
+    :returns: The column ranks, used to restore row order after a merge.
+    """
+    order = {}
+    for cell in cells:
+        order.setdefault((cell[0], cell[1]), len(order))
+    return order
+
+
+def _merge_cells(cell_lists, column_order):
+    """Interleave filtered cells back into row order.
+
+    Cells are ordered by column, in ``column_order``, and then by
+    decreasing timestamp. Duplicates are kept.
+
+    :type cell_lists: list
+    :param cell_lists: Lists of cells derived from the same row.
+
+    :type column_order: dict
+    :param column_order: The rank of each ``(family, qualifier)``.
+
+    :rtype: list
+    :returns: The merged cells.
+    """
+    cells = [cell for cells in cell_lists for cell in cells]
+    cells.sort(key=lambda cell: (column_order[(cell[0], cell[1])], -cell[3]))
+    return cells
@@ -15,7 +15,13 @@
 """User-friendly container for Google Cloud Bigtable Table."""
 
 
+import bisect
+import threading
+
+from concurrent import futures
+
 from grpc import StatusCode
+from six.moves import queue
 
 from google.api_core.exceptions import RetryError
 from google.api_core.exceptions import NotFound
@@ -27,6 +33,11 @@ from google.cloud.bigtable.column_family import _gc_rule_from_pb
 from google.cloud.bigtable.column_family import ColumnFamily
 from google.cloud.bigtable.batcher import MutationsBatcher
 from google.cloud.bigtable.batcher import FLUSH_COUNT, MAX_ROW_BYTES
+from google.cloud.bigtable.batcher import (
+    MAX_OUTSTANDING_BYTES,
+    MAX_OUTSTANDING_MUTATIONS,
+    MAX_OUTSTANDING_REQUESTS,
+)
 from google.cloud.bigtable.row import AppendRow
 from google.cloud.bigtable.row import ConditionalRow
 from google.cloud.bigtable.row import DirectRow
@@ -48,6 +59,14 @@ from google.cloud.bigtable_admin_v2.proto import (
 _MAX_BULK_MUTATIONS = 100000
 VIEW_NAME_ONLY = enums.Table.View.NAME_ONLY
 
+# Defaults for :meth:`Table.read_rows_parallel`.
+MAX_READ_ROWS_WORKERS = 8
+MAX_BUFFERED_ROWS = 1000
+
+# Default number of row keys per ``ReadRows`` request sent by
+# :meth:`Table.read_rows_by_keys`.
+MAX_KEYS_PER_REQUEST = 1000
+
 
 class _BigtableRetryableError(Exception):
     """Retry-able error expected by the default retry strategy."""
@@ -98,12 +117,18 @@ class Table(object):
 
     :type app_profile_id: str
     :param app_profile_id: (Optional) The unique name of the AppProfile.
+
+    :type row_cache: :class:`~google.cloud.bigtable.row_cache.RowCache`
+    :param row_cache: (Optional) A cache consulted by :meth:`read_row`.
+                      Rows written through this table are invalidated in
+                      it.
     """
 
-    def __init__(self, table_id, instance, app_profile_id=None):
+    def __init__(self, table_id, instance, app_profile_id=None, row_cache=None):
         self.table_id = table_id
         self._instance = instance
         self._app_profile_id = app_profile_id
+        self._row_cache = row_cache
 
     @property
     def name(self):
@@ -333,6 +358,9 @@ class Table(object):
     def read_row(self, row_key, filter_=None):
         """Read a single row from this table.
 
+        If the table has a ``row_cache``, the row is served from it when
+        possible, and cached once read.
+
         For example:
 
         .. literalinclude:: snippets_table.py
@@ -352,12 +380,22 @@ class Table(object):
         :raises: :class:`ValueError <exceptions.ValueError>` if a commit row
                  chunk is never encountered.
         """
+        row_cache = self._row_cache
+        if row_cache is not None:
+            found, row = row_cache.get(row_key, filter_)
+            if found:
+                return row
+            generation = row_cache.generation
+
         row_set = RowSet()
         row_set.add_row_key(row_key)
         result_iter = iter(self.read_rows(filter_=filter_, row_set=row_set))
         row = next(result_iter, None)
         if next(result_iter, None) is not None:
             raise ValueError("More than one row was returned.")
+
+        if row_cache is not None:
+            row_cache.put(row_key, filter_, row, generation)
         return row
 
     def read_rows(
@@ -467,6 +505,167 @@ class Table(object):
         """
         return self.read_rows(**kwargs)
 
+    def read_rows_parallel(
+        self,
+        start_key=None,
+        end_key=None,
+        filter_=None,
+        end_inclusive=False,
+        row_set=None,
+        retry=DEFAULT_RETRY_READ_ROWS,
+        max_workers=None,
+        ordered=False,
+        max_buffered_rows=MAX_BUFFERED_ROWS,
+    ):
+        """Read rows from this table over concurrent ``ReadRows`` streams.
+
+        The requested keys and ranges are split at the boundaries returned
+        by :meth:`sample_row_keys`, and each shard is read by its own
+        :class:`.PartialRowsData`, so that transient errors are retried per
+        shard, resuming after the last row that shard returned.
+
+        :type start_key: bytes
+        :param start_key: (Optional) The beginning of a range of row keys to
+                          read from. The range will include ``start_key``. If
+                          left empty, will be interpreted as the empty string.
+
+        :type end_key: bytes
+        :param end_key: (Optional) The end of a range of row keys to read from.
+                        The range will not include ``end_key``. If left empty,
+                        will be interpreted as an infinite string.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter to apply to the contents of the
+                        specified row(s). If unset, reads every column in
+                        each row.
+
+        :type end_inclusive: bool
+        :param end_inclusive: (Optional) Whether the ``end_key`` should be
+                      considered inclusive. The default is False (exclusive).
+
+        :type row_set: :class:`row_set.RowSet`
+        :param row_set: (Optional) The row set containing multiple row keys and
+                        row_ranges.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry:
+            (Optional) Retry delay and deadline arguments, applied to each
+            shard's stream. See :meth:`read_rows`.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of concurrent
+                            streams. Defaults to the number of shards, up to
+                            :data:`MAX_READ_ROWS_WORKERS`.
+
+        :type ordered: bool
+        :param ordered: (Optional) If true, rows are returned in key order,
+                        buffering later shards while earlier ones are
+                        consumed. The default is to return rows as they
+                        arrive.
+
+        :type max_buffered_rows: int
+        :param max_buffered_rows: (Optional) The maximum number of rows read
+                                  ahead of the consumer, per shard if
+                                  ``ordered`` is set.
+
+        :rtype: iterator
+        :returns: A generator of :class:`.PartialRowData`. Closing it cancels
+                  the outstanding streams.
+        :raises: :class:`ValueError <exceptions.ValueError>` if both
+                 ``row_set`` and one of ``start_key`` or ``end_key`` are set
+        """
+        if (start_key is not None or end_key is not None) and row_set is not None:
+            raise ValueError("Row range and row set cannot be set simultaneously")
+
+        if row_set is None:
+            row_set = RowSet()
+            if start_key is not None or end_key is not None:
+                row_set.add_row_range(
+                    RowRange(start_key, end_key, end_inclusive=end_inclusive)
+                )
+
+        split_keys = [
+            sample.row_key for sample in self.sample_row_keys() if sample.row_key
+        ]
+        shards = _shard_row_set(row_set, split_keys)
+        if max_workers is None:
+            max_workers = min(len(shards), MAX_READ_ROWS_WORKERS)
+
+        def read_shard(shard):
+            return self.read_rows(filter_=filter_, row_set=shard, retry=retry)
+
+        return _read_shards(
+            read_shard, shards, max(max_workers, 1), ordered, max_buffered_rows
+        )
+
+    def read_rows_by_keys(
+        self,
+        row_keys,
+        filter_=None,
+        retry=DEFAULT_RETRY_READ_ROWS,
+        max_keys_per_request=MAX_KEYS_PER_REQUEST,
+        max_workers=None,
+    ):
+        """Look up many rows by key over concurrent ``ReadRows`` streams.
+
+        The keys are sorted and deduplicated, then split into requests of
+        at most ``max_keys_per_request`` keys which never cross the tablet
+        boundaries returned by :meth:`sample_row_keys`.
+
+        :type row_keys: list
+        :param row_keys: The keys of the rows to read, in any order.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter to apply to the contents of the
+                        rows. A row whose cells are all filtered out is
+                        reported as missing.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry:
+            (Optional) Retry delay and deadline arguments, applied to each
+            request's stream. See :meth:`read_rows`.
+
+        :type max_keys_per_request: int
+        :param max_keys_per_request: (Optional) The maximum number of row
+                                     keys sent in a single request.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of concurrent
+                            streams. Defaults to the number of requests, up
+                            to :data:`MAX_READ_ROWS_WORKERS`.
+
+        :rtype: tuple
+        :returns: A dict mapping each row key found, as bytes, to its
+                  :class:`.PartialRowData`, and the sorted list of
+                  requested keys which were not found.
+        :raises: :class:`ValueError <exceptions.ValueError>` if
+                 ``max_keys_per_request`` is not positive.
+        """
+        if max_keys_per_request < 1:
+            raise ValueError("max_keys_per_request must be positive")
+
+        row_keys = sorted(set(_to_bytes(row_key) for row_key in row_keys))
+        if not row_keys:
+            return {}, []
+
+        split_keys = [
+            sample.row_key for sample in self.sample_row_keys() if sample.row_key
+        ]
+        shards = _batch_row_keys(row_keys, split_keys, max_keys_per_request)
+        if max_workers is None:
+            max_workers = min(len(shards), MAX_READ_ROWS_WORKERS)
+
+        def read_shard(shard):
+            return self.read_rows(filter_=filter_, row_set=shard, retry=retry)
+
+        rows = {}
+        for row in _read_shards(
+            read_shard, shards, max(max_workers, 1), False, MAX_BUFFERED_ROWS
+        ):
+            rows[row.row_key] = row
+        missing_keys = [row_key for row_key in row_keys if row_key not in rows]
+        return rows, missing_keys
+
     def mutate_rows(self, rows, retry=DEFAULT_RETRY):
         """Mutates multiple rows in bulk.
 
@@ -505,7 +704,70 @@ class Table(object):
         retryable_mutate_rows = _RetryableMutateRowsWorker(
             self._instance._client, self.name, rows, app_profile_id=self._app_profile_id
         )
-        return retryable_mutate_rows(retry=retry)
+        try:
+            return retryable_mutate_rows(retry=retry)
+        finally:
+            self._invalidate_cached_rows(rows)
+
+    def mutate_rows_streaming(
+        self,
+        rows,
+        retry=DEFAULT_RETRY,
+        max_rows_per_request=FLUSH_COUNT,
+        max_mutations_per_request=_MAX_BULK_MUTATIONS,
+    ):
+        """Mutates rows from an iterable in bounded windows.
+
+        Unlike :meth:`mutate_rows`, ``rows`` is consumed lazily: it is split
+        into windows of at most ``max_rows_per_request`` rows and
+        ``max_mutations_per_request`` mutations, and each window is sent
+        as its own ``MutateRows`` request. Rows of a window that return
+        transient errors are retried in follow-up requests holding just
+        those rows, until they succeed or the ``retry`` deadline, which
+        applies to each window separately, is reached.
+
+        Only the window in flight is held in memory; its results are
+        yielded before the next window is read from ``rows``.
+
+        :type rows: iterable
+        :param rows: An iterable of :class:`.DirectRow` instances.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry:
+            (Optional) Retry delay and deadline arguments for each window.
+            See :meth:`mutate_rows`.
+
+        :type max_rows_per_request: int
+        :param max_rows_per_request: (Optional) The maximum number of rows
+                                     in each window.
+
+        :type max_mutations_per_request: int
+        :param max_mutations_per_request: (Optional) The maximum number of
+                                          mutations in each window. A row
+                                          with more mutations is sent alone.
+
+        :rtype: iterator
+        :returns: A generator of ``(row, status)`` pairs, one per row, in the
+                  order of ``rows``, where ``status`` is the final
+                  :class:`~google.rpc.status_pb2.Status` of the row's
+                  mutation. As with :meth:`mutate_rows`, mutations of rows
+                  which succeeded are cleared.
+        """
+        for window in _mutate_rows_windows(
+            rows, max_rows_per_request, max_mutations_per_request
+        ):
+            worker = _RetryableMutateRowsWorker(
+                self._instance._client,
+                self.name,
+                window,
+                app_profile_id=self._app_profile_id,
+            )
+            try:
+                statuses = worker(retry=retry)
+            finally:
+                self._invalidate_cached_rows(window)
+            for row, status in zip(window, statuses):
+                yield row, status
 
     def sample_row_keys(self):
         """Read a sample of row keys in the table.
@@ -580,6 +842,8 @@ class Table(object):
             table_admin_client.drop_row_range(
                 self.name, delete_all_data_from_table=True
             )
+        if self._row_cache is not None:
+            self._row_cache.clear()
 
     def drop_by_prefix(self, row_key_prefix, timeout=None):
         """
@@ -614,8 +878,27 @@ class Table(object):
             table_admin_client.drop_row_range(
                 self.name, row_key_prefix=_to_bytes(row_key_prefix)
             )
+        if self._row_cache is not None:
+            self._row_cache.clear()
 
-    def mutations_batcher(self, flush_count=FLUSH_COUNT, max_row_bytes=MAX_ROW_BYTES):
+    def _invalidate_cached_rows(self, rows):
+        """Drop written rows from the ``row_cache``, if there is one.
+
+        :type rows: list
+        :param rows: The rows written, or their keys.
+        """
+        if self._row_cache is not None:
+            self._row_cache.invalidate([getattr(row, "row_key", row) for row in rows])
+
+    def mutations_batcher(
+        self,
+        flush_count=FLUSH_COUNT,
+        max_row_bytes=MAX_ROW_BYTES,
+        flush_interval=None,
+        max_outstanding_requests=MAX_OUTSTANDING_REQUESTS,
+        max_outstanding_mutations=MAX_OUTSTANDING_MUTATIONS,
+        max_outstanding_bytes=MAX_OUTSTANDING_BYTES,
+    ):
         """Factory to create a mutation batcher associated with this instance.
 
         For example:
@@ -638,8 +921,39 @@ class Table(object):
                 flush. If it reaches the max number of row mutations size it
                 calls finish_batch() to mutate the current row batch.
                 Default is MAX_ROW_BYTES (5 MB).
+
+        :type flush_interval: float
+        :param flush_interval: (Optional) Seconds after which buffered rows
+                are sent even if no size limit was reached. Default is None,
+                which disables time-based flushing.
+
+        :type max_outstanding_requests: int
+        :param max_outstanding_requests: (Optional) Max number of concurrent
+                ``MutateRows`` calls. Default is MAX_OUTSTANDING_REQUESTS
+                (10).
+
+        :type max_outstanding_mutations: int
+        :param max_outstanding_mutations: (Optional) Max number of mutations
+                buffered or in flight before ``mutate`` blocks. Default is
+                MAX_OUTSTANDING_MUTATIONS (1000000).
+
+        :type max_outstanding_bytes: int
+        :param max_outstanding_bytes: (Optional) Max size of the mutations
+                buffered or in flight before ``mutate`` blocks. Default is
+                MAX_OUTSTANDING_BYTES (100 MB).
+
+        :rtype: :class:`~google.cloud.bigtable.batcher.MutationsBatcher`
+        :returns: A batcher sending mutations to this table.
         """
-        return MutationsBatcher(self, flush_count, max_row_bytes)
+        return MutationsBatcher(
+            self,
+            flush_count,
+            max_row_bytes,
+            flush_interval=flush_interval,
+            max_outstanding_requests=max_outstanding_requests,
+            max_outstanding_mutations=max_outstanding_mutations,
+            max_outstanding_bytes=max_outstanding_bytes,
+        )
 
 
 class _RetryableMutateRowsWorker(object):
@@ -915,6 +1229,191 @@ def _create_row_request(
     return message
 
 
+def _shard_row_set(row_set, split_keys):
+    """Split a row set at the given keys.
+
+    :type row_set: :class:`row_set.RowSet`
+    :param row_set: The row keys and ranges to split. An empty row set
+                    stands for the whole table.
+
+    :type split_keys: list
+    :param split_keys: Sorted, non-empty row keys. Each key starts a new
+                       shard.
+
+    :rtype: list
+    :returns: Non-empty :class:`row_set.RowSet` instances covering the
+              requested rows, one per shard which intersects them, in key
+              order.
+    """
+    row_ranges = list(row_set.row_ranges)
+    if not row_ranges and not row_set.row_keys:
+        row_ranges = [RowRange()]
+
+    bounds = [None] + list(split_keys) + [None]
+    shards = [RowSet() for _ in range(len(bounds) - 1)]
+
+    for row_key in row_set.row_keys:
+        index = bisect.bisect_right(split_keys, _to_bytes(row_key))
+        shards[index].add_row_key(row_key)
+
+    for row_range in row_ranges:
+        for index, shard in enumerate(shards):
+            clipped = _clip_row_range(row_range, bounds[index], bounds[index + 1])
+            if clipped is not None:
+                shard.add_row_range(clipped)
+
+    return [shard for shard in shards if shard.row_keys or shard.row_ranges]
+
+
+def _batch_row_keys(row_keys, split_keys, max_keys):
+    """Group sorted row keys into bounded row sets within each shard.
+
+    :type row_keys: list
+    :param row_keys: Sorted, distinct row keys, as bytes.
+
+    :type split_keys: list
+    :param split_keys: Sorted, non-empty row keys. Each key starts a new
+                       shard, and no batch spans two shards.
+
+    :type max_keys: int
+    :param max_keys: The maximum number of keys in each batch.
+
+    :rtype: list
+    :returns: :class:`row_set.RowSet` instances holding only row keys, in
+              key order.
+    """
+    batches = []
+    start = 0
+    for split_key in list(split_keys) + [None]:
+        if split_key is None:
+            end = len(row_keys)
+        else:
+            end = bisect.bisect_left(row_keys, split_key, start)
+        for batch_start in range(start, end, max_keys):
+            row_set = RowSet()
+            for row_key in row_keys[batch_start : min(batch_start + max_keys, end)]:
+                row_set.add_row_key(row_key)
+            batches.append(row_set)
+        start = end
+    return batches
+
+
+def _clip_row_range(row_range, lower, upper):
+    """Intersect a row range with the shard ``[lower, upper)``.
+
+    :type row_range: :class:`row_set.RowRange`
+    :param row_range: The range to clip.
+
+    :type lower: bytes
+    :param lower: The inclusive start of the shard, or None if unbounded.
+
+    :type upper: bytes
+    :param upper: The exclusive end of the shard, or None if unbounded.
+
+    :rtype: :class:`row_set.RowRange`
+    :returns: The intersection, or None if it is empty.
+    """
+    start_key = _to_bytes(row_range.start_key) if row_range.start_key else None
+    start_inclusive = row_range.start_inclusive
+    if lower is not None and (start_key is None or lower > start_key):
+        start_key, start_inclusive = lower, True
+
+    end_key = _to_bytes(row_range.end_key) if row_range.end_key else None
+    end_inclusive = row_range.end_inclusive
+    if upper is not None and (end_key is None or upper <= end_key):
+        end_key, end_inclusive = upper, False
+
+    if start_key is not None and end_key is not None:
+        if start_key > end_key:
+            return None
+        if start_key == end_key and not (start_inclusive and end_inclusive):
+            return None
+
+    return RowRange(start_key, end_key, start_inclusive, end_inclusive)
+
+
+class _ShardError(object):
+    """Wraps an exception raised while reading a shard."""
+
+    def __init__(self, exception):
+        self.exception = exception
+
+
+_SHARD_DONE = object()
+
+
+def _put_until_stopped(rows_queue, item, stopped):
+    """Put ``item`` into a bounded queue, unless ``stopped`` is set first.
+
+    :rtype: bool
+    :returns: True if the item was queued.
+    """
+    while not stopped.is_set():
+        try:
+            rows_queue.put(item, timeout=0.1)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _read_shard_into(read_shard, shard, rows_queue, stopped):
+    """Stream one shard's rows into ``rows_queue``, then a done marker."""
+    try:
+        rows_data = read_shard(shard)
+        for row in rows_data:
+            if not _put_until_stopped(rows_queue, row, stopped):
+                rows_data.cancel()
+                return
+    except Exception as exc:
+        _put_until_stopped(rows_queue, _ShardError(exc), stopped)
+    else:
+        _put_until_stopped(rows_queue, _SHARD_DONE, stopped)
+
+
+def _drain(rows_queue, shard_count):
+    """Yield rows from ``rows_queue`` until ``shard_count`` shards finish."""
+    done = 0
+    while done < shard_count:
+        item = rows_queue.get()
+        if item is _SHARD_DONE:
+            done += 1
+        elif isinstance(item, _ShardError):
+            raise item.exception
+        else:
+            yield item
+
+
+def _read_shards(read_shard, shards, max_workers, ordered, max_buffered_rows):
+    """Read shards concurrently.  Helper for :meth:`Table.read_rows_parallel`.
+
+    Shards are submitted in key order, so with ``ordered`` set the shard
+    being consumed is always running or finished, and later shards only
+    read ahead into their own bounded queues.
+    """
+    stopped = threading.Event()
+    if ordered:
+        queues = [queue.Queue(max_buffered_rows) for _ in shards]
+    else:
+        queues = [queue.Queue(max_buffered_rows)] * len(shards)
+
+    executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for shard, rows_queue in zip(shards, queues):
+            executor.submit(_read_shard_into, read_shard, shard, rows_queue, stopped)
+
+        if ordered:
+            for rows_queue in queues:
+                for row in _drain(rows_queue, 1):
+                    yield row
+        elif shards:
+            for row in _drain(queues[0], len(shards)):
+                yield row
+    finally:
+        stopped.set()
+        executor.shutdown(wait=True)
+
+
 def _mutate_rows_request(table_name, rows, app_profile_id=None):
     """Creates a request to mutate rows in a table.
 
@@ -949,6 +1448,45 @@ def _mutate_rows_request(table_name, rows, app_profile_id=None):
     return request_pb
 
 
+def _mutate_rows_windows(rows, max_rows, max_mutations):
+    """Split an iterable of rows into bounded lists.
+
+    Helper for :meth:`Table.mutate_rows_streaming`.
+
+    :type rows: iterable
+    :param rows: An iterable of :class:`.DirectRow` instances.
+
+    :type max_rows: int
+    :param max_rows: The maximum number of rows in each window.
+
+    :type max_mutations: int
+    :param max_mutations: The maximum number of mutations in each window,
+                          unless a single row has more.
+
+    :rtype: iterator
+    :returns: A generator of non-empty lists of rows, in input order.
+    :raises: :class:`TypeError <exceptions.TypeError>` if a row is not an
+             instance of DirectRow.
+    """
+    window = []
+    window_mutations = 0
+    for row in rows:
+        _check_row_type(row)
+        mutations = len(row._get_mutations())
+        if window and window_mutations + mutations > max_mutations:
+            yield window
+            window = []
+            window_mutations = 0
+        window.append(row)
+        window_mutations += mutations
+        if len(window) >= max_rows:
+            yield window
+            window = []
+            window_mutations = 0
+    if window:
+        yield window
+
+
 def _check_row_table_name(table_name, row):
     """Checks that a row belongs to a table.
 
@@ -67,7 +67,7 @@ def default(session):
     session.install("mock", "pytest", "pytest-cov")
     for local_dep in LOCAL_DEPS:
         session.install("-e", local_dep)
-    session.install("-e", ".")
+    session.install("-e", ".[pandas, pyarrow]")
 
     # Run py.test against the unit tests.
     session.run(
@@ -34,6 +34,8 @@ dependencies = [
     'grpc-google-iam-v1 >= 0.11.4, < 0.12dev',
 ]
 extras = {
+    'pandas': 'pandas >= 0.17.1',
+    'pyarrow': 'pyarrow >= 0.4.1',
 }
 
 
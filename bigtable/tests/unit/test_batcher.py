@@ -113,6 +113,8 @@ class TestMutationsBatcher(unittest.TestCase):
         mutation_batcher.mutate(row_2)
         mutation_batcher.mutate(row_3)
 
+        self.assertEqual(mutation_batcher.rows, [])
+        mutation_batcher.flush()
         self.assertEqual(table.mutation_calls, 1)
 
     @mock.patch("google.cloud.bigtable.batcher.MAX_MUTATIONS", new=3)
@@ -160,8 +162,272 @@ class TestMutationsBatcher(unittest.TestCase):
 
         mutation_batcher.mutate(row)
 
+        self.assertEqual(mutation_batcher.rows, [])
+        mutation_batcher.flush()
         self.assertEqual(table.mutation_calls, 1)
 
+    def test_mutate_returns_future_w_row_status(self):
+        table = _Table(self.TABLE_NAME)
+        mutation_batcher = MutationsBatcher(table=table, flush_count=2)
+
+        futures = mutation_batcher.mutate_rows(
+            [DirectRow(row_key=b"row_key_1"), DirectRow(row_key=b"row_key_2")]
+        )
+
+        statuses = [future.result(timeout=5) for future in futures]
+        self.assertEqual([status.code for status in statuses], [self.SUCCESS] * 2)
+        self.assertEqual(table.batches, [[b"row_key_1", b"row_key_2"]])
+
+    def test_flush_w_failed_batch(self):
+        from google.api_core.exceptions import ServiceUnavailable
+        from google.cloud.bigtable.batcher import MutationsBatchError
+
+        error = ServiceUnavailable("testing")
+        table = _Table(self.TABLE_NAME, error=error)
+        mutation_batcher = MutationsBatcher(table=table)
+
+        future = mutation_batcher.mutate(DirectRow(row_key=b"row_key"))
+
+        with self.assertRaises(MutationsBatchError) as exc_info:
+            mutation_batcher.flush()
+
+        self.assertEqual(exc_info.exception.exceptions, [error])
+        self.assertIs(future.exception(timeout=5), error)
+
+        # Errors are reported once.
+        mutation_batcher.flush()
+
+    def test_concurrent_batches_in_flight(self):
+        import threading
+
+        gate = threading.Event()
+        table = _Table(self.TABLE_NAME, gate=gate)
+        mutation_batcher = MutationsBatcher(
+            table=table, flush_count=1, max_outstanding_requests=3
+        )
+
+        futures = mutation_batcher.mutate_rows(
+            [DirectRow(row_key=b"row_key_%d" % index) for index in range(3)]
+        )
+
+        _wait_for(lambda: table.max_in_flight == 3)
+        self.assertFalse(any(future.done() for future in futures))
+
+        gate.set()
+        mutation_batcher.flush()
+
+        self.assertEqual(table.mutation_calls, 3)
+        self.assertTrue(all(future.done() for future in futures))
+
+    def test_batches_w_same_row_key_sent_in_order(self):
+        import threading
+
+        gate = threading.Event()
+        table = _Table(self.TABLE_NAME, gate=gate)
+        mutation_batcher = MutationsBatcher(
+            table=table, flush_count=1, max_outstanding_requests=4
+        )
+
+        set_cell = DirectRow(row_key=b"row_key_a")
+        set_cell.set_cell("cf1", b"c1", b"value")
+        delete = DirectRow(row_key=b"row_key_a")
+        delete.delete_cells("cf1", [b"c1"])
+        mutation_batcher.mutate_rows(
+            [set_cell, DirectRow(row_key=b"row_key_b"), delete]
+        )
+        mutation_batcher.mutate(DirectRow(row_key=b"row_key_c"))
+
+        # The delete waits for the batch setting the cell; other rows do not.
+        _wait_for(lambda: table.max_in_flight == 3)
+        self.assertEqual(
+            sorted(table.batches), [[b"row_key_a"], [b"row_key_b"], [b"row_key_c"]]
+        )
+
+        gate.set()
+        mutation_batcher.flush()
+
+        self.assertEqual(table.mutation_calls, 4)
+        self.assertEqual(table.batches[-1], [b"row_key_a"])
+        self.assertEqual(mutation_batcher._keys_in_flight, set())
+        self.assertEqual(len(mutation_batcher._held), 0)
+
+    def test_mutate_blocks_when_outstanding_limit_reached(self):
+        import threading
+
+        gate = threading.Event()
+        table = _Table(self.TABLE_NAME, gate=gate)
+        mutation_batcher = MutationsBatcher(table=table, max_outstanding_mutations=2)
+
+        rows = []
+        for index in range(3):
+            row = DirectRow(row_key=b"row_key_%d" % index)
+            row.set_cell("cf1", b"c1", b"value")
+            rows.append(row)
+
+        mutation_batcher.mutate(rows[0])
+        mutation_batcher.mutate(rows[1])
+        self.assertEqual(table.mutation_calls, 0)
+
+        producer = threading.Thread(target=mutation_batcher.mutate, args=(rows[2],))
+        producer.start()
+
+        # The blocked producer sends the buffered rows to free capacity.
+        _wait_for(lambda: table.batches == [[b"row_key_0", b"row_key_1"]])
+        producer.join(0.05)
+        self.assertTrue(producer.is_alive())
+
+        gate.set()
+        producer.join(5)
+        self.assertFalse(producer.is_alive())
+
+        mutation_batcher.flush()
+        self.assertEqual(table.batches[-1], [b"row_key_2"])
+
+    def test_mutate_blocked_sends_rows_buffered_by_other_producer(self):
+        import threading
+
+        table = _Table(self.TABLE_NAME)
+        mutation_batcher = MutationsBatcher(table=table, max_outstanding_mutations=1)
+        flow_control = mutation_batcher._flow_control
+
+        rows = []
+        for row_key in (b"row_key_a", b"row_key_b", b"row_key_c"):
+            row = DirectRow(row_key=row_key)
+            row.set_cell("cf1", b"c1", b"value")
+            rows.append(row)
+
+        # When the first batch completes, another producer (the sending
+        # thread here) reserves the capacity it frees before the blocked
+        # producer wakes up, and leaves its row buffered.
+        release = flow_control.release
+        other_rows = [rows[2]]
+
+        def release_to_other_producer(mutations, size):
+            with flow_control._condition:
+                release(mutations, size)
+                if other_rows:
+                    mutation_batcher.mutate(other_rows.pop())
+
+        flow_control.release = release_to_other_producer
+
+        mutation_batcher.mutate(rows[0])
+        producer = threading.Thread(target=mutation_batcher.mutate, args=(rows[1],))
+        producer.daemon = True
+        patch = mock.patch("google.cloud.bigtable.batcher._FLOW_CONTROL_RETRY", 0.01)
+        with patch:
+            producer.start()
+            producer.join(5)
+        self.assertFalse(producer.is_alive())
+
+        mutation_batcher.flush()
+        self.assertEqual(
+            table.batches, [[b"row_key_a"], [b"row_key_c"], [b"row_key_b"]]
+        )
+
+    def test_mutate_w_flush_interval(self):
+        table = _Table(self.TABLE_NAME)
+        mutation_batcher = MutationsBatcher(table=table, flush_interval=0.01)
+
+        future = mutation_batcher.mutate(DirectRow(row_key=b"row_key"))
+
+        self.assertEqual(future.result(timeout=5).code, self.SUCCESS)
+        self.assertEqual(table.batches, [[b"row_key"]])
+        mutation_batcher.close()
+
+    def test_flush_thread_stops_when_collected(self):
+        import gc
+
+        table = _Table(self.TABLE_NAME)
+        mutation_batcher = MutationsBatcher(table=table, flush_interval=0.01)
+        flush_thread = mutation_batcher._flush_thread
+
+        # The thread does not keep an unclosed batcher alive.
+        del mutation_batcher
+        gc.collect()
+
+        flush_thread.join(5)
+        self.assertFalse(flush_thread.is_alive())
+
+    def test_context_manager(self):
+        table = _Table(self.TABLE_NAME)
+
+        with MutationsBatcher(table=table) as mutation_batcher:
+            mutation_batcher.mutate(DirectRow(row_key=b"row_key"))
+
+        self.assertEqual(table.mutation_calls, 1)
+        with self.assertRaises(RuntimeError):
+            mutation_batcher.mutate(DirectRow(row_key=b"row_key_2"))
+
+        # Closing again is a no-op.
+        mutation_batcher.close()
+
+
+class Test_FlowControl(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.batcher import _FlowControl
+
+        return _FlowControl
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def test_try_acquire(self):
+        flow_control = self._make_one(max_mutations=10, max_bytes=100)
+
+        self.assertTrue(flow_control.try_acquire(5, 50))
+        self.assertTrue(flow_control.try_acquire(5, 50))
+        self.assertFalse(flow_control.try_acquire(1, 0))
+        self.assertEqual((flow_control.mutations, flow_control.bytes), (10, 100))
+
+        flow_control.release(5, 50)
+        self.assertFalse(flow_control.try_acquire(1, 51))
+        self.assertTrue(flow_control.try_acquire(1, 50))
+
+    def test_acquire_oversized_when_empty(self):
+        flow_control = self._make_one(max_mutations=10, max_bytes=100)
+
+        flow_control.acquire(20, 200)
+
+        self.assertEqual((flow_control.mutations, flow_control.bytes), (20, 200))
+        self.assertFalse(flow_control.try_acquire(1, 1))
+
+    def test_acquire_w_timeout(self):
+        flow_control = self._make_one(max_mutations=1, max_bytes=100)
+        flow_control.acquire(1, 10)
+
+        self.assertFalse(flow_control.acquire(1, 10, timeout=0.01))
+        self.assertEqual((flow_control.mutations, flow_control.bytes), (1, 10))
+
+        flow_control.release(1, 10)
+        self.assertTrue(flow_control.acquire(1, 10, timeout=0.01))
+
+    def test_acquire_waits_for_release(self):
+        import threading
+
+        flow_control = self._make_one(max_mutations=1, max_bytes=100)
+        flow_control.acquire(1, 10)
+
+        waiter = threading.Thread(target=flow_control.acquire, args=(1, 10))
+        waiter.start()
+        waiter.join(0.05)
+        self.assertTrue(waiter.is_alive())
+
+        flow_control.release(1, 10)
+        waiter.join(5)
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual((flow_control.mutations, flow_control.bytes), (1, 10))
+
+
+def _wait_for(predicate, timeout=5.0):
+    import time
+
+    deadline = time.time() + timeout
+    while not predicate():
+        if time.time() > deadline:
+            raise AssertionError("Timed out waiting for condition.")
+        time.sleep(0.001)
+
 
 class _Instance(object):
     def __init__(self, client=None):
@@ -169,11 +435,33 @@ class _Instance(object):
 
 
 class _Table(object):
-    def __init__(self, name, client=None):
+    def __init__(self, name, client=None, error=None, gate=None):
+        import threading
+
         self.name = name
         self._instance = _Instance(client)
         self.mutation_calls = 0
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._error = error
+        self._gate = gate
+        self._lock = threading.Lock()
 
     def mutate_rows(self, rows):
-        self.mutation_calls += 1
-        return rows
+        from google.rpc import status_pb2
+
+        with self._lock:
+            self.mutation_calls += 1
+            self.batches.append([row.row_key for row in rows])
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self._gate is not None:
+                self._gate.wait(5)
+            if self._error is not None:
+                raise self._error
+            return [status_pb2.Status(code=0) for _ in rows]
+        finally:
+            with self._lock:
+                self.in_flight -= 1
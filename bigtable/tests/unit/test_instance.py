@@ -782,12 +782,16 @@ class TestInstance(unittest.TestCase):
 
         app_profile_id = "appProfileId1262094415"
         instance = self._make_one(self.INSTANCE_ID, None)
+        row_cache = object()
 
-        table = instance.table(self.TABLE_ID, app_profile_id=app_profile_id)
+        table = instance.table(
+            self.TABLE_ID, app_profile_id=app_profile_id, row_cache=row_cache
+        )
         self.assertIsInstance(table, Table)
         self.assertEqual(table.table_id, self.TABLE_ID)
         self.assertEqual(table._instance, instance)
         self.assertEqual(table._app_profile_id, app_profile_id)
+        self.assertIs(table._row_cache, row_cache)
 
     def _list_tables_helper(self, table_name=None):
         from google.cloud.bigtable_admin_v2.proto import table_pb2 as table_data_v2_pb2
@@ -124,6 +124,54 @@ class TestDirectRow(unittest.TestCase):
 
         self.assertEqual(row.get_mutations_size(), total_mutations_size)
 
+    def test_set_cells_w_dict(self):
+        row = self._make_one(b"row_key", None)
+
+        row.set_cells({u"cf1": {b"col1": b"value1", u"col2": 1}, u"cf2": {}})
+
+        expected = self._make_one(b"row_key", None)
+        expected.set_cell(u"cf1", b"col1", b"value1")
+        expected.set_cell(u"cf1", b"col2", 1)
+        self.assertEqual(
+            sorted(pb.SerializeToString() for pb in row._pb_mutations),
+            sorted(pb.SerializeToString() for pb in expected._pb_mutations),
+        )
+        self.assertEqual(row.get_mutations_size(), expected.get_mutations_size())
+
+    def test_set_cells_w_tuples(self):
+        import datetime
+        from google.cloud._helpers import _EPOCH
+
+        timestamp = _EPOCH + datetime.timedelta(milliseconds=5)
+        cell_timestamp = _EPOCH + datetime.timedelta(milliseconds=7)
+        row = self._make_one(b"row_key", None)
+
+        row.set_cells(
+            [
+                (u"cf", b"col1", b"value1"),
+                (u"cf", b"col2", b"value2", cell_timestamp),
+                (u"cf", b"col3", b"value3", None),
+            ],
+            timestamp=timestamp,
+        )
+
+        expected = self._make_one(b"row_key", None)
+        expected.set_cell(u"cf", b"col1", b"value1", timestamp=timestamp)
+        expected.set_cell(u"cf", b"col2", b"value2", timestamp=cell_timestamp)
+        expected.set_cell(u"cf", b"col3", b"value3", timestamp=timestamp)
+        self.assertEqual(row._pb_mutations, expected._pb_mutations)
+
+    def test_set_cells_w_invalid_cell(self):
+        row = self._make_one(b"row_key", None)
+
+        with self.assertRaises(ValueError):
+            row.set_cells([(u"cf", b"col1", b"value1"), (u"cf", b"col2")])
+        with self.assertRaises(TypeError):
+            row.set_cells([(u"cf", b"col1", b"value1"), (u"cf", b"col2", object())])
+
+        self.assertEqual(row._pb_mutations, [])
+        self.assertEqual(row.get_mutations_size(), 0)
+
     def _set_cell_helper(
         self,
         column=None,
@@ -447,6 +495,7 @@ class TestConditionalRow(unittest.TestCase):
         self.assertEqual(result, expected_result)
         self.assertEqual(row._true_pb_mutations, [])
         self.assertEqual(row._false_pb_mutations, [])
+        self.assertEqual(table.invalidated_row_keys, [row_key])
 
     def test_commit_too_many_mutations(self):
         from google.cloud._testing import _Monkey
@@ -595,6 +644,7 @@ class TestAppendRow(unittest.TestCase):
             result = row.commit()
 
         self.assertEqual(result, expected_result)
+        self.assertEqual(table.invalidated_row_keys, [row_key])
         self.assertEqual(row._rule_pb_list, [])
 
     def test_commit_no_rules(self):
@@ -824,6 +874,10 @@ class _Table(object):
         self._instance = _Instance(client)
         self.client = client
         self.mutated_rows = []
+        self.invalidated_row_keys = []
 
     def mutate_rows(self, rows):
         self.mutated_rows.extend(rows)
+
+    def _invalidate_cached_rows(self, row_keys):
+        self.invalidated_row_keys.extend(row_keys)
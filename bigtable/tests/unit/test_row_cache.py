@@ -0,0 +1,246 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import collections
+import unittest
+
+
+class TestRowCache(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.row_cache import RowCache
+
+        return RowCache
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    @staticmethod
+    def _make_row(row_key, *cells):
+        from google.cloud.bigtable.row_data import PartialRowData
+
+        row = PartialRowData(row_key)
+        for family, qualifier, value in cells:
+            row._raw_cells.append((family, qualifier, value, 1000, None))
+        return row
+
+    def test_constructor_defaults(self):
+        from google.cloud.bigtable.row_cache import DEFAULT_MAX_BYTES
+        from google.cloud.bigtable.row_cache import DEFAULT_TTL
+
+        cache = self._make_one()
+
+        self.assertEqual(cache.max_bytes, DEFAULT_MAX_BYTES)
+        self.assertEqual(cache.ttl, DEFAULT_TTL)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+
+    def test_get_miss_then_hit(self):
+        cache = self._make_one()
+        row = self._make_row(b"key", ("cf", b"col", b"value"))
+
+        self.assertEqual(cache.get(b"key"), (False, None))
+        cache.put(b"key", None, row, cache.generation)
+
+        self.assertEqual(cache.get("key"), (True, row))
+        stats = cache.stats
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(stats["bytes"], cache.size)
+
+    def test_get_returns_copies(self):
+        from google.cloud.bigtable.row_data import Cell
+
+        cache = self._make_one()
+        row = self._make_row(b"key", ("cf", b"col", b"value"))
+        cache.put(b"key", None, row, cache.generation)
+
+        # Changing the row read, or a row served, does not change the cache.
+        row.cells["cf"][b"col"].append(Cell(b"read", 2000))
+        _, first = cache.get(b"key")
+        first.cells["cf"][b"col"][0].value = b"changed"
+        del first.cells["cf"]
+        _, second = cache.get(b"key")
+
+        self.assertIsNot(second, first)
+        self.assertEqual(second.cells["cf"][b"col"], [Cell(b"value", 1000)])
+
+    def test_sampled_reads_not_cached(self):
+        from google.cloud.bigtable.row_filters import CellsColumnLimitFilter
+        from google.cloud.bigtable.row_filters import ConditionalRowFilter
+        from google.cloud.bigtable.row_filters import RowFilterChain
+        from google.cloud.bigtable.row_filters import RowSampleFilter
+
+        cache = self._make_one()
+        row = self._make_row(b"key", ("cf", b"col", b"value"))
+        cache.put(b"key", None, row, cache.generation)
+        filters = [
+            RowSampleFilter(0.5),
+            RowFilterChain([CellsColumnLimitFilter(1), RowSampleFilter(0.5)]),
+            ConditionalRowFilter(
+                CellsColumnLimitFilter(1), false_filter=RowSampleFilter(0.5)
+            ),
+        ]
+
+        for filter_ in filters:
+            cache.put(b"key", filter_, row, cache.generation)
+            # Not answered from the unfiltered row either.
+            self.assertEqual(cache.get(b"key", filter_), (False, None))
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.stats["misses"], 0)
+
+    def test_caches_missing_rows(self):
+        cache = self._make_one()
+
+        cache.put(b"key", None, None, cache.generation)
+
+        self.assertEqual(cache.get(b"key"), (True, None))
+
+    def test_keyed_by_filter(self):
+        from google.cloud.bigtable.row_filters import CellsColumnLimitFilter
+
+        cache = self._make_one()
+        row = self._make_row(b"key", ("cf", b"col", b"value"))
+        filter_ = CellsColumnLimitFilter(1)
+
+        cache.put(b"key", filter_, row, cache.generation)
+
+        self.assertEqual(cache.get(b"key"), (False, None))
+        self.assertEqual(cache.get(b"key", CellsColumnLimitFilter(1)), (True, row))
+        self.assertEqual(cache.get(b"key", CellsColumnLimitFilter(2)), (False, None))
+
+    def test_filtered_read_from_unfiltered_row(self):
+        from google.cloud.bigtable.row_filters import ColumnQualifierRegexFilter
+
+        cache = self._make_one()
+        row = self._make_row(b"key", ("cf", b"a", b"v1"), ("cf", b"b", b"v2"))
+        cache.put(b"key", None, row, cache.generation)
+
+        found, filtered = cache.get(b"key", ColumnQualifierRegexFilter(b"b"))
+
+        self.assertTrue(found)
+        self.assertEqual(list(filtered.cells["cf"]), [b"b"])
+        found, filtered = cache.get(b"key", ColumnQualifierRegexFilter(b"c"))
+        self.assertEqual((found, filtered), (True, None))
+
+    def test_ttl(self):
+        now = [100.0]
+        cache = self._make_one(ttl=10.0, clock=lambda: now[0])
+        cache.put(b"key", None, None, cache.generation)
+
+        now[0] = 109.0
+        self.assertTrue(cache.get(b"key")[0])
+        now[0] = 110.0
+        self.assertFalse(cache.get(b"key")[0])
+        self.assertEqual(cache.stats["expirations"], 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        from google.cloud.bigtable.row_cache import _entry_size
+
+        rows = [self._make_row(b"key%d" % i, ("cf", b"c", b"v")) for i in range(3)]
+        entry_size = _entry_size((b"key0", b""), rows[0])
+        cache = self._make_one(max_bytes=2 * entry_size)
+
+        cache.put(b"key0", None, rows[0], cache.generation)
+        cache.put(b"key1", None, rows[1], cache.generation)
+        cache.get(b"key0")
+        cache.put(b"key2", None, rows[2], cache.generation)
+
+        self.assertTrue(cache.get(b"key0")[0])
+        self.assertFalse(cache.get(b"key1")[0])
+        self.assertTrue(cache.get(b"key2")[0])
+        self.assertEqual(cache.stats["evictions"], 1)
+        self.assertEqual(cache.size, 2 * entry_size)
+        self.assertEqual(sorted(cache._filter_keys), [b"key0", b"key2"])
+
+    def test_row_w_cells_added_after_parsing(self):
+        from google.cloud.bigtable.row_cache import _entry_size
+        from google.cloud.bigtable.row_data import Cell
+
+        row = self._make_row(b"key0", ("cf", b"c", b"v"))
+        parsed_size = _entry_size((b"key0", b""), row)
+        row.cells["cf"][b"d"] = [Cell(b"w", 1000)]
+        cache = self._make_one()
+
+        cache.put(b"key0", None, row, cache.generation)
+
+        self.assertGreater(cache.size, parsed_size)
+        self.assertEqual(cache.get(b"key0")[1].cells, row.cells)
+
+    def test_put_larger_than_max_bytes(self):
+        cache = self._make_one(max_bytes=10)
+
+        cache.put(b"key", None, self._make_row(b"key"), cache.generation)
+
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate(self):
+        from google.cloud.bigtable.row_filters import CellsColumnLimitFilter
+
+        cache = self._make_one()
+        filter_ = CellsColumnLimitFilter(1)
+        cache.put(b"key", None, None, cache.generation)
+        cache.put(b"key", filter_, None, cache.generation)
+        cache.put(b"other", None, None, cache.generation)
+
+        cache.invalidate(["key"])
+
+        self.assertFalse(cache.get(b"key")[0])
+        self.assertFalse(cache.get(b"key", filter_)[0])
+        self.assertTrue(cache.get(b"other")[0])
+        self.assertEqual(cache.stats["invalidations"], 2)
+        self.assertEqual(cache._filter_keys, {b"other": set([b""])})
+
+    def test_invalidate_visits_only_written_rows(self):
+        cache = self._make_one()
+        for index in range(100):
+            cache.put(b"key%d" % index, None, None, cache.generation)
+        cache._entries = _NoIterDict(cache._entries)
+
+        cache.invalidate([b"key1", b"missing"])
+
+        self.assertEqual(len(cache), 99)
+        self.assertFalse(cache.get(b"key1")[0])
+        self.assertEqual(cache.stats["invalidations"], 1)
+
+    def test_put_after_invalidation_is_dropped(self):
+        cache = self._make_one()
+        generation = cache.generation
+
+        cache.invalidate([b"key"])
+        cache.put(b"key", None, None, generation)
+
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = self._make_one()
+        cache.put(b"key", None, None, cache.generation)
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+        self.assertEqual(cache._filter_keys, {})
+        self.assertEqual(cache.stats["invalidations"], 1)
+
+
+class _NoIterDict(collections.OrderedDict):
+    """Fails if the cache scans its entries instead of using its index."""
+
+    def __iter__(self):
+        raise AssertionError("Entries should not be scanned.")
@@ -13,9 +13,21 @@
 # limitations under the License.
 
 
+import struct
 import unittest
+
 import mock
 
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 from google.api_core.exceptions import DeadlineExceeded
 from ._testing import _make_credentials
 from google.cloud.bigtable.row_set import RowRange
@@ -61,6 +73,19 @@ class TestCell(unittest.TestCase):
     def _make_one(self, *args, **kwargs):
         return self._get_target_class()(*args, **kwargs)
 
+    def test_constructor_wo_labels(self):
+        cell = self._make_one(b"value", self.timestamp_micros)
+
+        self.assertEqual(cell.labels, [])
+        cell.labels.append(u"label")
+        self.assertEqual(cell.labels, [u"label"])
+        self.assertFalse(hasattr(cell, "__dict__"))
+
+    def test___eq__labels_unset_and_empty(self):
+        cell1 = self._make_one(b"value", self.timestamp_micros)
+        cell2 = self._make_one(b"value", self.timestamp_micros, labels=[])
+        self.assertEqual(cell1, cell2)
+
     def _from_pb_test_helper(self, labels=None):
         import datetime
         from google.cloud._helpers import _EPOCH
@@ -122,6 +147,27 @@ class TestCell(unittest.TestCase):
         self.assertNotEqual(cell1, cell2)
 
 
+class TestPartialCellData(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.row_data import PartialCellData
+
+        return PartialCellData
+
+    def test_constructor_is_deprecated(self):
+        import warnings
+
+        with warnings.catch_warnings(record=True) as warned:
+            warnings.simplefilter("always")
+            cell = self._get_target_class()(b"row", u"cf", b"col", 1000)
+
+        self.assertEqual(len(warned), 1)
+        self.assertIs(warned[0].category, DeprecationWarning)
+        cell.append_value(b"a")
+        cell.append_value(b"b")
+        self.assertEqual(cell.value, b"ab")
+
+
 class TestPartialRowData(unittest.TestCase):
     @staticmethod
     def _get_target_class():
@@ -281,6 +327,52 @@ class TestPartialRowData(unittest.TestCase):
         partial_row_data = self._make_one(row_key)
         self.assertIs(partial_row_data.row_key, row_key)
 
+    def test_cells_built_from_raw_cells(self):
+        partial_row_data = self._make_one(b"row-key")
+        partial_row_data._raw_cells = [
+            (u"cf1", b"col1", b"v1", 20, None),
+            (u"cf1", b"col1", b"v2", 10, ["label"]),
+            (u"cf2", b"", b"v3", 30, None),
+        ]
+
+        cells = partial_row_data.cells
+
+        self.assertEqual(
+            cells,
+            {
+                u"cf1": {
+                    b"col1": [_make_cell(b"v1", 20), _make_cell(b"v2", 10, ["label"])]
+                },
+                u"cf2": {b"": [_make_cell(b"v3", 30)]},
+            },
+        )
+        self.assertIs(partial_row_data.cells, cells)
+
+    def test_cells_setter_replaces_raw_cells(self):
+        from google.cloud.bigtable.row_data import _row_cells
+
+        partial_row_data = self._make_one(b"row-key")
+        partial_row_data._raw_cells = [(u"cf1", b"col1", b"v1", 20, None)]
+
+        partial_row_data._cells = {u"cf2": {b"col2": [_make_cell(b"v2", 10)]}}
+
+        self.assertEqual(
+            _row_cells(partial_row_data), [(u"cf2", b"col2", b"v2", 10, None)]
+        )
+
+    def test_cells_appended_after_parsing(self):
+        from google.cloud.bigtable.row_data import _row_cells
+
+        partial_row_data = self._make_one(b"row-key")
+        partial_row_data._raw_cells = [(u"cf1", b"col1", b"v1", 20, None)]
+
+        partial_row_data.cells[u"cf1"][b"col1"].append(_make_cell(b"v2", 10))
+
+        self.assertEqual(
+            _row_cells(partial_row_data),
+            [(u"cf1", b"col1", b"v1", 20, None), (u"cf1", b"col1", b"v2", 10, None)],
+        )
+
 
 class _Client(object):
 
@@ -532,68 +624,86 @@ class TestPartialRowsData(unittest.TestCase):
 
     # 'consume_next' tested via 'TestPartialRowsData_JSON_acceptance_tests'
 
-    def test__copy_from_previous_unset(self):
-        client = _Client()
-        client._data_stub = mock.MagicMock()
-        request = object()
-        yrd = self._make_one(client._data_stub.ReadRows, request)
-        cell = _PartialCellData()
-        yrd._copy_from_previous(cell)
-        self.assertEqual(cell.row_key, b"")
-        self.assertEqual(cell.family_name, u"")
-        self.assertIsNone(cell.qualifier)
-        self.assertEqual(cell.timestamp_micros, 0)
-        self.assertEqual(cell.labels, [])
-
-    def test__copy_from_previous_blank(self):
-        ROW_KEY = "RK"
-        FAMILY_NAME = u"A"
-        QUALIFIER = b"C"
-        TIMESTAMP_MICROS = 100
+    def test__update_cell_new_row(self):
         LABELS = ["L1", "L2"]
-        client = _Client()
-        client._data_stub = mock.MagicMock()
-        request = object()
-        yrd = self._make_one(client._data_stub.ReadRows, request)
-        cell = _PartialCellData(
-            row_key=ROW_KEY,
-            family_name=FAMILY_NAME,
-            qualifier=QUALIFIER,
-            timestamp_micros=TIMESTAMP_MICROS,
+        yrd = self._make_one(mock.MagicMock(), object())
+        chunk = _ReadRowsResponseCellChunkPB(
+            row_key=self.ROW_KEY,
+            family_name=self.FAMILY_NAME,
+            qualifier=self.QUALIFIER,
+            timestamp_micros=self.TIMESTAMP_MICROS,
+            value=self.VALUE,
             labels=LABELS,
         )
-        yrd._previous_cell = _PartialCellData()
-        yrd._copy_from_previous(cell)
-        self.assertEqual(cell.row_key, ROW_KEY)
-        self.assertEqual(cell.family_name, FAMILY_NAME)
-        self.assertEqual(cell.qualifier, QUALIFIER)
-        self.assertEqual(cell.timestamp_micros, TIMESTAMP_MICROS)
-        self.assertEqual(cell.labels, LABELS)
 
-    def test__copy_from_previous_filled(self):
-        ROW_KEY = "RK"
-        FAMILY_NAME = u"A"
-        QUALIFIER = b"C"
-        TIMESTAMP_MICROS = 100
-        LABELS = ["L1", "L2"]
-        client = _Client()
-        client._data_stub = mock.MagicMock()
-        request = object()
-        yrd = self._make_one(client._data_stub.ReadRows, request)
-        yrd._previous_cell = _PartialCellData(
-            row_key=ROW_KEY,
-            family_name=FAMILY_NAME,
-            qualifier=QUALIFIER,
-            timestamp_micros=TIMESTAMP_MICROS,
-            labels=LABELS,
+        yrd._update_cell(chunk)
+
+        self.assertEqual(yrd._row.row_key, self.ROW_KEY)
+        self.assertEqual(yrd._cell_row_key, self.ROW_KEY)
+        self.assertEqual(yrd._cell_family, self.FAMILY_NAME)
+        self.assertEqual(yrd._cell_qualifier, self.QUALIFIER)
+        self.assertEqual(yrd._cell_timestamp_micros, self.TIMESTAMP_MICROS)
+        self.assertEqual(yrd._cell_labels, LABELS)
+        self.assertEqual(yrd._cell_value, [self.VALUE])
+
+    def test__update_cell_unset_wo_previous(self):
+        from google.cloud.bigtable.row_data import InvalidChunk
+
+        yrd = self._make_one(mock.MagicMock(), object())
+        chunk = _ReadRowsResponseCellChunkPB(
+            family_name=self.FAMILY_NAME, qualifier=self.QUALIFIER
         )
-        cell = _PartialCellData()
-        yrd._copy_from_previous(cell)
-        self.assertEqual(cell.row_key, ROW_KEY)
-        self.assertEqual(cell.family_name, FAMILY_NAME)
-        self.assertEqual(cell.qualifier, QUALIFIER)
-        self.assertEqual(cell.timestamp_micros, 0)
-        self.assertEqual(cell.labels, [])
+
+        with self.assertRaises(InvalidChunk):
+            yrd._update_cell(chunk)
+
+    def test__update_cell_blank_copies_from_previous(self):
+        yrd = self._make_one(mock.MagicMock(), object())
+        yrd._update_cell(
+            _ReadRowsResponseCellChunkPB(
+                row_key=self.ROW_KEY,
+                family_name=self.FAMILY_NAME,
+                qualifier=self.QUALIFIER,
+                timestamp_micros=self.TIMESTAMP_MICROS,
+                labels=["L1"],
+            )
+        )
+        yrd._save_current_cell()
+
+        yrd._update_cell(_ReadRowsResponseCellChunkPB(value=self.VALUE))
+
+        self.assertEqual(yrd._cell_row_key, self.ROW_KEY)
+        self.assertEqual(yrd._cell_family, self.FAMILY_NAME)
+        self.assertEqual(yrd._cell_qualifier, self.QUALIFIER)
+        self.assertEqual(yrd._cell_timestamp_micros, 0)
+        self.assertIsNone(yrd._cell_labels)
+
+    def test__update_cell_new_family_requires_qualifier(self):
+        from google.cloud.bigtable.row_data import InvalidChunk
+
+        yrd = self._make_one(mock.MagicMock(), object())
+        yrd._update_cell(
+            _ReadRowsResponseCellChunkPB(
+                row_key=self.ROW_KEY,
+                family_name=self.FAMILY_NAME,
+                qualifier=self.QUALIFIER,
+            )
+        )
+        yrd._save_current_cell()
+
+        with self.assertRaises(InvalidChunk):
+            yrd._update_cell(_ReadRowsResponseCellChunkPB(family_name=u"B"))
+
+    def test__update_cell_empty_qualifier(self):
+        yrd = self._make_one(mock.MagicMock(), object())
+        chunk = _ReadRowsResponseCellChunkPB(
+            row_key=self.ROW_KEY, family_name=self.FAMILY_NAME
+        )
+        chunk.qualifier.SetInParent()
+
+        yrd._update_cell(chunk)
+
+        self.assertEqual(yrd._cell_qualifier, b"")
 
     def test_valid_last_scanned_row_key_on_start(self):
         client = _Client()
@@ -634,19 +744,33 @@ class TestPartialRowsData(unittest.TestCase):
             qualifier=self.QUALIFIER,
             timestamp_micros=self.TIMESTAMP_MICROS,
             value=self.VALUE,
+            value_size=2 * len(self.VALUE),
             labels=LABELS,
         )
-        yrd._update_cell(chunk)
+        yrd._process_chunk(chunk)
+        self.assertEqual(yrd.state, yrd.CELL_IN_PROGRESS)
 
         more_cell_data = _ReadRowsResponseCellChunkPB(value=self.VALUE)
-        yrd._update_cell(more_cell_data)
+        row = yrd._process_chunk(more_cell_data)
 
-        self.assertEqual(yrd._cell.row_key, self.ROW_KEY)
-        self.assertEqual(yrd._cell.family_name, self.FAMILY_NAME)
-        self.assertEqual(yrd._cell.qualifier, self.QUALIFIER)
-        self.assertEqual(yrd._cell.timestamp_micros, self.TIMESTAMP_MICROS)
-        self.assertEqual(yrd._cell.labels, LABELS)
-        self.assertEqual(yrd._cell.value, self.VALUE + self.VALUE)
+        self.assertIsNone(row)
+        self.assertEqual(yrd.state, yrd.ROW_IN_PROGRESS)
+        self.assertEqual(
+            yrd._row._raw_cells,
+            [
+                (
+                    self.FAMILY_NAME,
+                    self.QUALIFIER,
+                    self.VALUE + self.VALUE,
+                    self.TIMESTAMP_MICROS,
+                    LABELS,
+                )
+            ],
+        )
+        cell = yrd._row.cells[self.FAMILY_NAME][self.QUALIFIER][0]
+        self.assertEqual(cell.value, self.VALUE + self.VALUE)
+        self.assertEqual(cell.timestamp_micros, self.TIMESTAMP_MICROS)
+        self.assertEqual(cell.labels, LABELS)
 
     def test_yield_rows_data(self):
         client = _Client()
@@ -709,6 +833,226 @@ class TestPartialRowsData(unittest.TestCase):
         return [row.row_key for row in yrd]
 
 
+class TestPartialRowsData_columnar(unittest.TestCase):
+    COLUMNS = {
+        "cf:name": ("name", "string"),
+        "cf:count": ("count", "int64"),
+        b"cf:score": ("score", "float64"),
+        "cf:raw": "raw",
+    }
+
+    @staticmethod
+    def _make_rows_data(rows, chunks_per_response=3):
+        from google.cloud.bigtable.row_data import PartialRowsData
+
+        chunks = []
+        for row_key, cells in rows:
+            for index, (family, qualifier, value) in enumerate(cells):
+                kwargs = {"qualifier": qualifier, "value": value}
+                if index == 0:
+                    kwargs.update(row_key=row_key, family_name=family)
+                elif family != cells[index - 1][0]:
+                    kwargs["family_name"] = family
+                chunks.append(_ReadRowsResponseCellChunkPB(**kwargs))
+            chunks[-1].commit_row = True
+
+        responses = [
+            _ReadRowsResponseV2(chunks[index : index + chunks_per_response])
+            for index in range(0, len(chunks), chunks_per_response)
+        ]
+        iterator = _MockCancellableIterator(*responses)
+        return PartialRowsData(mock.Mock(return_value=iterator), object())
+
+    def _rows(self):
+        return [
+            (
+                b"row-1",
+                [
+                    ("cf", b"name", u"\u00e9t\u00e9".encode("utf-8")),
+                    ("cf", b"count", struct.pack(">q", 7)),
+                    ("cf", b"count", struct.pack(">q", 6)),
+                    ("cf", b"score", struct.pack(">d", 1.5)),
+                    ("cf", b"raw", b"\x00\x01"),
+                    ("other", b"name", b"ignored"),
+                ],
+            ),
+            (
+                b"row-2",
+                [
+                    ("cf", b"count", struct.pack(">q", -1)),
+                    ("cf", b"score", struct.pack(">d", 2.5)),
+                ],
+            ),
+            (
+                b"row-3",
+                [
+                    ("cf", b"name", b"x"),
+                    ("cf", b"count", struct.pack(">q", 2 ** 40)),
+                    ("cf", b"score", struct.pack(">d", -0.5)),
+                ],
+            ),
+        ]
+
+    def test__column_specs_invalid_key(self):
+        from google.cloud.bigtable.row_data import _column_specs
+
+        with self.assertRaises(ValueError):
+            _column_specs({"no-separator": "name"})
+
+    def test__column_specs_invalid_decoder(self):
+        from google.cloud.bigtable.row_data import _column_specs
+
+        with self.assertRaises(ValueError):
+            _column_specs({"cf:col": ("name", "int32")})
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        frame = rows_data.to_dataframe(self.COLUMNS)
+
+        self.assertEqual(
+            list(frame.columns), ["row_key", "name", "count", "score", "raw"]
+        )
+        self.assertEqual(list(frame["row_key"]), [b"row-1", b"row-2", b"row-3"])
+        self.assertEqual(list(frame["name"]), [u"\u00e9t\u00e9", None, u"x"])
+        self.assertEqual(str(frame["name"].dtype), "object")
+        self.assertEqual(str(frame["count"].dtype), "int64")
+        self.assertEqual(list(frame["count"]), [7, -1, 2 ** 40])
+        self.assertEqual(str(frame["score"].dtype), "float64")
+        self.assertEqual(list(frame["score"]), [1.5, 2.5, -0.5])
+        self.assertEqual(list(frame["raw"]), [b"\x00\x01", None, None])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_string_inference(self):
+        rows_data = self._make_rows_data(self._rows())
+        try:
+            # Default from pandas 3.0 on.
+            pandas.get_option("future.infer_string")
+        except (KeyError, pandas.errors.OptionError):  # pragma: NO COVER
+            self.skipTest("Requires `future.infer_string`")
+
+        with pandas.option_context("future.infer_string", True):
+            frame = rows_data.to_dataframe(self.COLUMNS)
+
+        self.assertEqual(str(frame["name"].dtype), "object")
+        self.assertEqual(list(frame["name"]), [u"\u00e9t\u00e9", None, u"x"])
+        self.assertEqual(list(frame["raw"]), [b"\x00\x01", None, None])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_all_cells_wo_row_key(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        frame = rows_data.to_dataframe(
+            [("cf:count", ("count", "int64")), ("cf:name", ("name", len))],
+            latest_only=False,
+            row_key_column=None,
+        )
+
+        self.assertEqual(list(frame.columns), ["count", "name"])
+        self.assertEqual(list(frame["count"]), [[7, 6], [-1], [2 ** 40]])
+        self.assertEqual(list(frame["name"]), [[5], None, [1]])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_iterable(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        frames = list(rows_data.to_dataframe_iterable(self.COLUMNS, chunk_size=2))
+
+        self.assertEqual([len(frame) for frame in frames], [2, 1])
+        self.assertEqual(list(frames[1]["row_key"]), [b"row-3"])
+        self.assertEqual(list(frames[0]["count"]), [7, -1])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_empty(self):
+        rows_data = self._make_rows_data([])
+
+        frame = rows_data.to_dataframe(self.COLUMNS)
+
+        self.assertEqual(len(frame), 0)
+        self.assertEqual(
+            list(frame.columns), ["row_key", "name", "count", "score", "raw"]
+        )
+
+    def test_to_dataframe_wo_pandas(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        with mock.patch("google.cloud.bigtable.row_data.pandas", new=None):
+            with self.assertRaises(ValueError):
+                rows_data.to_dataframe(self.COLUMNS)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        table = rows_data.to_arrow(self.COLUMNS, chunk_size=2)
+
+        self.assertEqual(
+            table.schema,
+            pyarrow.schema(
+                [
+                    ("row_key", pyarrow.binary()),
+                    ("name", pyarrow.string()),
+                    ("count", pyarrow.int64()),
+                    ("score", pyarrow.float64()),
+                    ("raw", pyarrow.binary()),
+                ]
+            ),
+        )
+        self.assertEqual(
+            table.to_pydict(),
+            {
+                "row_key": [b"row-1", b"row-2", b"row-3"],
+                "name": [u"\u00e9t\u00e9", None, u"x"],
+                "count": [7, -1, 2 ** 40],
+                "score": [1.5, 2.5, -0.5],
+                "raw": [b"\x00\x01", None, None],
+            },
+        )
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_w_callable_decoder_missing_in_first_chunk(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        table = rows_data.to_arrow(
+            {"cf:raw": ("raw", len), "cf:count": ("counts", "int64")},
+            latest_only=False,
+            chunk_size=1,
+        )
+
+        self.assertEqual(table.schema.field("raw").type, pyarrow.list_(pyarrow.int64()))
+        self.assertEqual(
+            table.schema.field("counts").type, pyarrow.list_(pyarrow.int64())
+        )
+        self.assertEqual(table.column("raw").to_pylist(), [[2], None, None])
+        self.assertEqual(table.column("counts").to_pylist(), [[7, 6], [-1], [2 ** 40]])
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_iterable(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        batches = list(rows_data.to_arrow_iterable(self.COLUMNS, chunk_size=2))
+
+        self.assertEqual([batch.num_rows for batch in batches], [2, 1])
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_empty(self):
+        rows_data = self._make_rows_data([])
+
+        table = rows_data.to_arrow({"cf:count": ("count", "int64")})
+
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema.names, ["row_key", "count"])
+        self.assertEqual(table.schema.field("count").type, pyarrow.int64())
+
+    def test_to_arrow_wo_pyarrow(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        with mock.patch("google.cloud.bigtable.row_data.pyarrow", new=None):
+            with self.assertRaises(ValueError):
+                rows_data.to_arrow(self.COLUMNS)
+
+
 class Test_ReadRowsRequestManager(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -1225,18 +1569,6 @@ class _MockFailureIterator_1(object):
     __next__ = next
 
 
-class _PartialCellData(object):
-
-    row_key = b""
-    family_name = u""
-    qualifier = None
-    timestamp_micros = 0
-
-    def __init__(self, **kw):
-        self.labels = kw.pop("labels", [])
-        self.__dict__.update(kw)
-
-
 class _ReadRowsResponseV2(object):
     def __init__(self, chunks, last_scanned_row_key=""):
         self.chunks = chunks
@@ -1292,10 +1624,10 @@ def _ReadRowsResponseCellChunkPB(*args, **kw):
     return message
 
 
-def _make_cell(value):
+def _make_cell(value, timestamp_micros=TestCell.timestamp_micros, labels=None):
     from google.cloud.bigtable import row_data
 
-    return row_data.Cell(value, TestCell.timestamp_micros)
+    return row_data.Cell(value, timestamp_micros, labels)
 
 
 def _ReadRowsRequestPB(*args, **kw):
@@ -15,6 +15,8 @@
 
 import unittest
 
+import mock
+
 
 class Test_BoolFilter(unittest.TestCase):
     @staticmethod
@@ -1031,3 +1033,250 @@ def _ValueRangePB(*args, **kw):
     from google.cloud.bigtable_v2.proto import data_pb2 as data_v2_pb2
 
     return data_v2_pb2.ValueRange(*args, **kw)
+
+
+class TestRowFilter_filter_row(unittest.TestCase):
+    ROW_KEY = b"row-key"
+
+    def _make_row(self, *cells):
+        from google.cloud.bigtable.row_data import PartialRowData
+
+        row = PartialRowData(self.ROW_KEY)
+        for family, qualifier, value, timestamp_micros in cells:
+            row._raw_cells.append((family, qualifier, value, timestamp_micros, None))
+        return row
+
+    def _sample_row(self):
+        return self._make_row(
+            ("cf1", b"a", b"v1", 3000),
+            ("cf1", b"a", b"v2", 2000),
+            ("cf1", b"b", b"v3", 1000),
+            ("cf2", b"a", b"v4", 1000),
+        )
+
+    @staticmethod
+    def _cells(row):
+        if row is None:
+            return None
+        return [cell[:4] for cell in row._raw_cells]
+
+    def _filter(self, row_filter, row=None):
+        if row is None:
+            row = self._sample_row()
+        return self._cells(row_filter.filter_row(row))
+
+    def test_base_class(self):
+        from google.cloud.bigtable.row_filters import RowFilter
+
+        with self.assertRaises(NotImplementedError):
+            RowFilter().filter_row(self._sample_row())
+
+    def test_bool_filters(self):
+        from google.cloud.bigtable.row_filters import BlockAllFilter
+        from google.cloud.bigtable.row_filters import PassAllFilter
+
+        all_cells = self._cells(self._sample_row())
+        self.assertEqual(self._filter(PassAllFilter(True)), all_cells)
+        self.assertIsNone(self._filter(BlockAllFilter(True)))
+        self.assertEqual(self._filter(BlockAllFilter(False)), all_cells)
+
+    def test_row_key_regex(self):
+        from google.cloud.bigtable.row_filters import RowKeyRegexFilter
+
+        self.assertIsNone(self._filter(RowKeyRegexFilter(b"row")))
+        self.assertIsNotNone(self._filter(RowKeyRegexFilter(b"row-.*")))
+        self.assertIsNotNone(self._filter(RowKeyRegexFilter(b"\\C*key")))
+
+    def test_regex_cached_per_instance(self):
+        from google.cloud.bigtable.row_filters import ValueRegexFilter
+
+        row_filter = ValueRegexFilter(b"v[12]")
+        self.assertEqual(len(self._filter(row_filter)), 2)
+        compiled = row_filter._compiled
+        self.assertEqual(len(self._filter(row_filter)), 2)
+        self.assertIs(row_filter._compiled, compiled)
+
+        row_filter.regex = b"v4"
+        self.assertEqual(self._filter(row_filter), [("cf2", b"a", b"v4", 1000)])
+
+    def test_family_and_qualifier_regex(self):
+        from google.cloud.bigtable.row_filters import ColumnQualifierRegexFilter
+        from google.cloud.bigtable.row_filters import FamilyNameRegexFilter
+
+        self.assertEqual(
+            [cell[3] for cell in self._filter(FamilyNameRegexFilter("cf1"))],
+            [3000, 2000, 1000],
+        )
+        self.assertEqual(
+            self._filter(ColumnQualifierRegexFilter(b"b")), [("cf1", b"b", b"v3", 1000)]
+        )
+
+    def test_row_sample(self):
+        from google.cloud.bigtable.row_filters import RowSampleFilter
+
+        with mock.patch("random.random", return_value=0.4):
+            self.assertIsNotNone(self._filter(RowSampleFilter(0.5)))
+            self.assertIsNone(self._filter(RowSampleFilter(0.25)))
+
+    def test_timestamp_range(self):
+        import datetime
+        from google.cloud._helpers import _EPOCH
+        from google.cloud.bigtable.row_filters import TimestampRange
+        from google.cloud.bigtable.row_filters import TimestampRangeFilter
+
+        start = _EPOCH + datetime.timedelta(microseconds=2000)
+        end = _EPOCH + datetime.timedelta(microseconds=3000)
+
+        self.assertEqual(
+            self._filter(TimestampRangeFilter(TimestampRange(start=start, end=end))),
+            [("cf1", b"a", b"v2", 2000)],
+        )
+        self.assertEqual(
+            [cell[3] for cell in self._filter(TimestampRangeFilter(TimestampRange()))],
+            [3000, 2000, 1000, 1000],
+        )
+
+    def test_column_range(self):
+        from google.cloud.bigtable.row_filters import ColumnRangeFilter
+
+        self.assertEqual(
+            self._filter(ColumnRangeFilter("cf1", b"a", b"b", inclusive_start=False)),
+            [("cf1", b"b", b"v3", 1000)],
+        )
+        self.assertEqual(
+            [cell[2] for cell in self._filter(ColumnRangeFilter("cf2"))], [b"v4"]
+        )
+
+    def test_value_range(self):
+        from google.cloud.bigtable.row_filters import ValueRangeFilter
+
+        self.assertEqual(
+            [
+                cell[2]
+                for cell in self._filter(
+                    ValueRangeFilter(b"v2", b"v4", inclusive_end=False)
+                )
+            ],
+            [b"v2", b"v3"],
+        )
+
+    def test_cell_count_filters(self):
+        from google.cloud.bigtable.row_filters import CellsColumnLimitFilter
+        from google.cloud.bigtable.row_filters import CellsRowLimitFilter
+        from google.cloud.bigtable.row_filters import CellsRowOffsetFilter
+
+        def values(row_filter):
+            return [cell[2] for cell in self._filter(row_filter)]
+
+        self.assertEqual(values(CellsRowOffsetFilter(3)), [b"v4"])
+        self.assertEqual(values(CellsRowLimitFilter(1)), [b"v1"])
+        self.assertEqual(values(CellsColumnLimitFilter(1)), [b"v1", b"v3", b"v4"])
+
+    def test_transformers(self):
+        from google.cloud.bigtable.row_filters import ApplyLabelFilter
+        from google.cloud.bigtable.row_filters import StripValueTransformerFilter
+
+        row = StripValueTransformerFilter(True).filter_row(self._sample_row())
+        self.assertEqual(row.cell_value("cf1", b"a"), b"")
+
+        row = ApplyLabelFilter("label").filter_row(self._sample_row())
+        self.assertEqual(row.cells["cf2"][b"a"][0].labels, ["label"])
+
+    def test_chain(self):
+        from google.cloud.bigtable.row_filters import CellsColumnLimitFilter
+        from google.cloud.bigtable.row_filters import FamilyNameRegexFilter
+        from google.cloud.bigtable.row_filters import RowFilterChain
+
+        chain = RowFilterChain(
+            [FamilyNameRegexFilter("cf1"), CellsColumnLimitFilter(1)]
+        )
+
+        self.assertEqual([cell[2] for cell in self._filter(chain)], [b"v1", b"v3"])
+        self.assertEqual(
+            len(self._filter(RowFilterChain())), len(self._sample_row()._raw_cells)
+        )
+
+    def test_union_restores_row_order(self):
+        from google.cloud.bigtable.row_filters import ColumnQualifierRegexFilter
+        from google.cloud.bigtable.row_filters import RowFilterUnion
+        from google.cloud.bigtable.row_filters import ValueRegexFilter
+
+        union = RowFilterUnion(
+            [ValueRegexFilter(b"v4"), ColumnQualifierRegexFilter(b"a")]
+        )
+
+        self.assertEqual(
+            [cell[2] for cell in self._filter(union)], [b"v1", b"v2", b"v4", b"v4"]
+        )
+        self.assertIsNone(self._filter(RowFilterUnion()))
+
+    def test_conditional(self):
+        from google.cloud.bigtable.row_filters import ConditionalRowFilter
+        from google.cloud.bigtable.row_filters import PassAllFilter
+        from google.cloud.bigtable.row_filters import ValueRegexFilter
+
+        true_filter = ValueRegexFilter(b"v1")
+        false_filter = ValueRegexFilter(b"v2")
+
+        matched = ConditionalRowFilter(
+            ValueRegexFilter(b"v3"), true_filter, false_filter
+        )
+        unmatched = ConditionalRowFilter(
+            ValueRegexFilter(b"nope"), true_filter, false_filter
+        )
+
+        self.assertEqual([cell[2] for cell in self._filter(matched)], [b"v1"])
+        self.assertEqual([cell[2] for cell in self._filter(unmatched)], [b"v2"])
+        self.assertIsNone(self._filter(ConditionalRowFilter(PassAllFilter(True))))
+
+    def test_sink(self):
+        from google.cloud.bigtable.row_filters import ApplyLabelFilter
+        from google.cloud.bigtable.row_filters import FamilyNameRegexFilter
+        from google.cloud.bigtable.row_filters import RowFilterChain
+        from google.cloud.bigtable.row_filters import RowFilterUnion
+        from google.cloud.bigtable.row_filters import SinkFilter
+        from google.cloud.bigtable.row_filters import StripValueTransformerFilter
+
+        row_filter = RowFilterChain(
+            [
+                FamilyNameRegexFilter("cf2"),
+                RowFilterUnion(
+                    [
+                        RowFilterChain([ApplyLabelFilter("raw"), SinkFilter(True)]),
+                        StripValueTransformerFilter(True),
+                    ]
+                ),
+                ApplyLabelFilter("stripped"),
+            ]
+        )
+
+        row = row_filter.filter_row(self._sample_row())
+
+        self.assertEqual(
+            [(cell[2], cell[4]) for cell in row._raw_cells],
+            [(b"", ["stripped"]), (b"v4", ["raw"])],
+        )
+
+    def test_row_built_from_cells_dict(self):
+        from google.cloud.bigtable.row_data import Cell
+        from google.cloud.bigtable.row_data import PartialRowData
+        from google.cloud.bigtable.row_filters import ColumnQualifierRegexFilter
+
+        row = PartialRowData(self.ROW_KEY)
+        row._cells = {"cf": {b"a": [Cell(b"v1", 1000)], b"b": [Cell(b"v2", 1000)]}}
+
+        filtered = ColumnQualifierRegexFilter(b"b").filter_row(row)
+
+        self.assertEqual(filtered.cells, {"cf": {b"b": [Cell(b"v2", 1000)]}})
+        self.assertEqual(filtered.row_key, self.ROW_KEY)
+
+    def test_row_w_cells_added_after_parsing(self):
+        from google.cloud.bigtable.row_data import Cell
+        from google.cloud.bigtable.row_filters import ColumnQualifierRegexFilter
+
+        row = self._sample_row()
+        row.cells.setdefault("cf", {})[b"added"] = [Cell(b"v9", 1000)]
+
+        filtered = ColumnQualifierRegexFilter(b"added").filter_row(row)
+
+        self.assertEqual(filtered.cells, {"cf": {b"added": [Cell(b"v9", 1000)]}})
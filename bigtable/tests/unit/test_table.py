@@ -627,6 +627,134 @@ class TestTable(unittest.TestCase):
 
         self.assertEqual(result, expected_result)
 
+    def _make_cached_table(self, rows):
+        from google.cloud.bigtable.row_cache import RowCache
+
+        table = self._make_one(self.TABLE_ID, mock.Mock(), row_cache=RowCache())
+        table.read_rows = mock.Mock(side_effect=lambda **kwargs: iter(rows))
+        return table
+
+    def test_read_row_w_row_cache(self):
+        from google.cloud.bigtable.row_data import PartialRowData
+
+        row = PartialRowData(self.ROW_KEY)
+        table = self._make_cached_table([row])
+
+        self.assertIs(table.read_row(self.ROW_KEY), row)
+        self.assertEqual(table.read_row(self.ROW_KEY), row)
+
+        self.assertEqual(table.read_rows.call_count, 1)
+        self.assertEqual(table._row_cache.stats["hits"], 1)
+
+    def test_read_row_w_row_cache_missing_row(self):
+        table = self._make_cached_table([])
+
+        self.assertIsNone(table.read_row(self.ROW_KEY))
+        self.assertIsNone(table.read_row(self.ROW_KEY))
+
+        self.assertEqual(table.read_rows.call_count, 1)
+
+    def test_mutate_rows_invalidates_row_cache(self):
+        from google.rpc.status_pb2 import Status
+        from google.cloud.bigtable.row import DirectRow
+
+        table = self._make_cached_table([])
+        table.read_row(self.ROW_KEY)
+        row = DirectRow(self.ROW_KEY, table)
+
+        mock_worker = mock.Mock(return_value=[Status(code=0)])
+        with mock.patch(
+            "google.cloud.bigtable.table._RetryableMutateRowsWorker",
+            new=mock.MagicMock(return_value=mock_worker),
+        ):
+            table.mutate_rows([row])
+        table.read_row(self.ROW_KEY)
+
+        self.assertEqual(table.read_rows.call_count, 2)
+        self.assertEqual(table._row_cache.stats["invalidations"], 1)
+
+    def test_truncate_clears_row_cache(self):
+        from google.cloud.bigtable.row_cache import RowCache
+
+        instance = mock.Mock()
+        table = self._make_one(self.TABLE_ID, instance, row_cache=RowCache())
+        table._row_cache.put(self.ROW_KEY, None, None, 0)
+
+        table.truncate()
+
+        self.assertEqual(len(table._row_cache), 0)
+
+    def test_mutate_rows_streaming(self):
+        from grpc import StatusCode
+        from google.cloud.bigtable.row import DirectRow
+        from google.cloud.bigtable.table import DEFAULT_RETRY
+        from google.cloud.bigtable_v2.gapic import bigtable_client
+        from google.cloud.bigtable_v2.proto.bigtable_pb2 import MutateRowsResponse
+        from google.rpc.status_pb2 import Status
+
+        success = StatusCode.OK.value[0]
+        retryable = StatusCode.UNAVAILABLE.value[0]
+        non_retryable = StatusCode.CANCELLED.value[0]
+
+        def response(codes):
+            return [
+                MutateRowsResponse(
+                    entries=[
+                        MutateRowsResponse.Entry(index=index, status=Status(code=code))
+                        for index, code in enumerate(codes)
+                    ]
+                )
+            ]
+
+        credentials = _make_credentials()
+        client = self._make_client(
+            project="project-id", credentials=credentials, admin=True
+        )
+        client._table_data_client = bigtable_client.BigtableClient(mock.Mock())
+        instance = client.instance(instance_id=self.INSTANCE_ID)
+        table = self._make_one(self.TABLE_ID, instance)
+        mutate_rows = mock.Mock(
+            side_effect=[
+                response([success, retryable]),
+                response([success]),
+                response([non_retryable]),
+            ]
+        )
+        client._table_data_client._inner_api_calls["mutate_rows"] = mutate_rows
+
+        consumed = []
+
+        def rows():
+            for index in range(3):
+                row = DirectRow(row_key=b"row_key_%d" % index, table=table)
+                row.set_cell("cf", b"col", b"value")
+                consumed.append(row)
+                yield row
+
+        results = table.mutate_rows_streaming(
+            rows(),
+            retry=DEFAULT_RETRY.with_delay(initial=0.01, multiplier=1.0),
+            max_rows_per_request=2,
+        )
+
+        first = next(results)
+        self.assertEqual(first[0].row_key, b"row_key_0")
+        self.assertEqual(first[1].code, success)
+        self.assertEqual(len(consumed), 2)
+        rest = list(results)
+
+        self.assertEqual(
+            [(row.row_key, status.code) for row, status in rest],
+            [(b"row_key_1", success), (b"row_key_2", non_retryable)],
+        )
+        requests = [call[0][0] for call in mutate_rows.call_args_list]
+        self.assertEqual(
+            [[entry.row_key for entry in request.entries] for request in requests],
+            [[b"row_key_0", b"row_key_1"], [b"row_key_1"], [b"row_key_2"]],
+        )
+        self.assertEqual(consumed[0]._get_mutations(), [])
+        self.assertEqual(len(consumed[2]._get_mutations()), 1)
+
     def test_read_rows(self):
         from google.cloud._testing import _Monkey
         from google.cloud.bigtable.row_data import PartialRowsData
@@ -873,6 +1001,194 @@ class TestTable(unittest.TestCase):
         self.assertEqual(rows[1].row_key, self.ROW_KEY_2)
         self.assertEqual(rows[2].row_key, self.ROW_KEY_3)
 
+    def _make_parallel_table(self, split_keys, rows_by_key):
+        from google.cloud.bigtable.row_data import PartialRowData
+
+        table = self._make_one(self.TABLE_ID, None)
+        table.sample_row_keys = mock.Mock(
+            return_value=[
+                _SampleRowKeysResponsePB(row_key=key) for key in split_keys + [b""]
+            ]
+        )
+        table.read_rows_calls = []
+
+        def read_rows(filter_=None, row_set=None, retry=None):
+            table.read_rows_calls.append((filter_, row_set, retry))
+            keys = rows_by_key[tuple(row_set.row_keys)]
+            return _MockPartialRowsData([PartialRowData(key) for key in keys])
+
+        table.read_rows = read_rows
+        return table
+
+    def test_read_rows_parallel(self):
+        from google.cloud.bigtable.row_filters import RowSampleFilter
+        from google.cloud.bigtable.row_set import RowSet
+
+        row_set = RowSet()
+        for key in (b"a", b"b", b"m", b"n", b"x"):
+            row_set.add_row_key(key)
+        rows_by_key = {
+            (b"a", b"b"): [b"a", b"b"],
+            (b"m", b"n"): [b"m", b"n"],
+            (b"x",): [b"x"],
+        }
+        table = self._make_parallel_table([b"k", b"p"], rows_by_key)
+        filter_ = RowSampleFilter(0.5)
+        retry = object()
+
+        rows = list(
+            table.read_rows_parallel(row_set=row_set, filter_=filter_, retry=retry)
+        )
+
+        self.assertEqual(
+            sorted(row.row_key for row in rows), [b"a", b"b", b"m", b"n", b"x"]
+        )
+        self.assertEqual(len(table.read_rows_calls), 3)
+        for call_filter, _, call_retry in table.read_rows_calls:
+            self.assertIs(call_filter, filter_)
+            self.assertIs(call_retry, retry)
+
+    def test_read_rows_parallel_ordered(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        row_set = RowSet()
+        keys = [b"a%d" % index for index in range(5)]
+        keys += [b"m%d" % index for index in range(5)]
+        for key in keys:
+            row_set.add_row_key(key)
+        rows_by_key = {tuple(keys[:5]): keys[:5], tuple(keys[5:]): keys[5:]}
+        table = self._make_parallel_table([b"k"], rows_by_key)
+
+        rows = table.read_rows_parallel(
+            row_set=row_set, ordered=True, max_buffered_rows=1
+        )
+
+        self.assertEqual([row.row_key for row in rows], keys)
+
+    def test_read_rows_parallel_w_range(self):
+        from google.cloud.bigtable.row_set import RowRange
+
+        table = self._make_parallel_table([b"k", b"p"], {(): []})
+
+        list(table.read_rows_parallel(start_key=b"c", end_key=b"m"))
+
+        shards = [row_set for _, row_set, _ in table.read_rows_calls]
+        self.assertEqual(
+            sorted(
+                row_range._key() for shard in shards for row_range in shard.row_ranges
+            ),
+            [
+                RowRange(b"c", b"k", True, False)._key(),
+                RowRange(b"k", b"m", True, False)._key(),
+            ],
+        )
+
+    def test_read_rows_parallel_w_error(self):
+        from google.api_core.exceptions import ServiceUnavailable
+        from google.cloud.bigtable.row_set import RowSet
+
+        row_set = RowSet()
+        row_set.add_row_key(b"a")
+        row_set.add_row_key(b"x")
+        table = self._make_parallel_table([b"k"], {})
+        error = ServiceUnavailable("testing")
+
+        def read_rows(filter_=None, row_set=None, retry=None):
+            raise error
+
+        table.read_rows = read_rows
+
+        with self.assertRaises(ServiceUnavailable):
+            list(table.read_rows_parallel(row_set=row_set))
+
+    def test_read_rows_parallel_close_cancels_streams(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        row_set = RowSet()
+        row_set.add_row_key(b"a")
+        keys = [b"a%d" % index for index in range(10)]
+        table = self._make_parallel_table([], {(b"a",): keys})
+        streams = []
+        read_rows = table.read_rows
+
+        def tracking_read_rows(**kwargs):
+            stream = read_rows(**kwargs)
+            streams.append(stream)
+            return stream
+
+        table.read_rows = tracking_read_rows
+
+        rows = table.read_rows_parallel(row_set=row_set, max_buffered_rows=1)
+        self.assertEqual(next(rows).row_key, b"a0")
+        rows.close()
+
+        self.assertEqual(len(streams), 1)
+        self.assertTrue(streams[0].cancelled)
+
+    def test_read_rows_parallel_w_row_set_and_keys(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        table = self._make_one(self.TABLE_ID, None)
+
+        with self.assertRaises(ValueError):
+            table.read_rows_parallel(start_key=b"a", row_set=RowSet())
+
+    def test_read_rows_by_keys(self):
+        from google.cloud.bigtable.row_filters import RowSampleFilter
+
+        rows_by_key = {
+            (b"a", b"b"): [b"a"],
+            (b"c",): [b"c"],
+            (b"m", b"n"): [b"m", b"n"],
+            (b"x",): [],
+        }
+        table = self._make_parallel_table([b"k", b"p"], rows_by_key)
+        filter_ = RowSampleFilter(0.5)
+        retry = object()
+
+        rows, missing_keys = table.read_rows_by_keys(
+            [b"x", "n", b"c", b"a", b"m", b"b", b"a"],
+            filter_=filter_,
+            retry=retry,
+            max_keys_per_request=2,
+        )
+
+        self.assertEqual(sorted(rows), [b"a", b"c", b"m", b"n"])
+        self.assertEqual(rows[b"m"].row_key, b"m")
+        self.assertEqual(missing_keys, [b"b", b"x"])
+        self.assertEqual(
+            sorted(tuple(row_set.row_keys) for _, row_set, _ in table.read_rows_calls),
+            sorted(rows_by_key),
+        )
+        for call_filter, _, call_retry in table.read_rows_calls:
+            self.assertIs(call_filter, filter_)
+            self.assertIs(call_retry, retry)
+
+    def test_read_rows_by_keys_empty(self):
+        table = self._make_parallel_table([b"k"], {})
+
+        self.assertEqual(table.read_rows_by_keys([]), ({}, []))
+        table.sample_row_keys.assert_not_called()
+
+    def test_read_rows_by_keys_w_error(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        table = self._make_parallel_table([b"k"], {})
+
+        def read_rows(filter_=None, row_set=None, retry=None):
+            raise ServiceUnavailable("testing")
+
+        table.read_rows = read_rows
+
+        with self.assertRaises(ServiceUnavailable):
+            table.read_rows_by_keys([b"a", b"x"])
+
+    def test_read_rows_by_keys_w_invalid_max_keys(self):
+        table = self._make_one(self.TABLE_ID, None)
+
+        with self.assertRaises(ValueError):
+            table.read_rows_by_keys([b"a"], max_keys_per_request=0)
+
     def test_sample_row_keys(self):
         from google.cloud.bigtable_v2.gapic import bigtable_client
         from google.cloud.bigtable_admin_v2.gapic import bigtable_table_admin_client
@@ -1018,6 +1334,21 @@ class TestTable(unittest.TestCase):
         self.assertEqual(mutation_batcher.flush_count, flush_count)
         self.assertEqual(mutation_batcher.max_row_bytes, max_row_bytes)
 
+    def test_mutations_batcher_factory_w_flow_control(self):
+        table = self._make_one(self.TABLE_ID, None)
+        mutation_batcher = table.mutations_batcher(
+            flush_interval=2.5,
+            max_outstanding_requests=4,
+            max_outstanding_mutations=50,
+            max_outstanding_bytes=500,
+        )
+
+        self.assertEqual(mutation_batcher.flush_interval, 2.5)
+        self.assertEqual(mutation_batcher._executor._max_workers, 4)
+        self.assertEqual(mutation_batcher._flow_control.max_mutations, 50)
+        self.assertEqual(mutation_batcher._flow_control.max_bytes, 500)
+        mutation_batcher.close()
+
 
 class Test__RetryableMutateRowsWorker(unittest.TestCase):
     from grpc import StatusCode
@@ -1566,6 +1897,151 @@ class Test__RetryableMutateRowsWorker(unittest.TestCase):
             worker._do_mutate_retryable_rows()
 
 
+class Test__shard_row_set(unittest.TestCase):
+    def _call_fut(self, row_set, split_keys):
+        from google.cloud.bigtable.table import _shard_row_set
+
+        return _shard_row_set(row_set, split_keys)
+
+    @staticmethod
+    def _ranges(shard):
+        return [row_range._key() for row_range in shard.row_ranges]
+
+    def test_whole_table(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        shards = self._call_fut(RowSet(), [b"k", b"p"])
+
+        self.assertEqual(
+            [self._ranges(shard) for shard in shards],
+            [
+                [(None, True, b"k", False)],
+                [(b"k", True, b"p", False)],
+                [(b"p", True, None, False)],
+            ],
+        )
+
+    def test_whole_table_wo_split_keys(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        shards = self._call_fut(RowSet(), [])
+
+        self.assertEqual(
+            [self._ranges(shard) for shard in shards], [[(None, True, None, False)]]
+        )
+
+    def test_row_ranges(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        row_set = RowSet()
+        row_set.add_row_range_from_keys(b"a", b"k", start_inclusive=False)
+        row_set.add_row_range_from_keys("m", "z", end_inclusive=True)
+
+        shards = self._call_fut(row_set, [b"k", b"p"])
+
+        self.assertEqual(
+            [self._ranges(shard) for shard in shards],
+            [
+                [(b"a", False, b"k", False)],
+                [(b"m", True, b"p", False)],
+                [(b"p", True, b"z", True)],
+            ],
+        )
+
+    def test_row_range_ending_at_split_key_inclusive(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        row_set = RowSet()
+        row_set.add_row_range_from_keys(b"a", b"k", end_inclusive=True)
+
+        shards = self._call_fut(row_set, [b"k"])
+
+        self.assertEqual(
+            [self._ranges(shard) for shard in shards],
+            [[(b"a", True, b"k", False)], [(b"k", True, b"k", True)]],
+        )
+
+    def test_row_keys(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        row_set = RowSet()
+        for key in (b"z", b"a", b"k", "c"):
+            row_set.add_row_key(key)
+
+        shards = self._call_fut(row_set, [b"k", b"p"])
+
+        self.assertEqual(
+            [shard.row_keys for shard in shards], [[b"a", "c"], [b"k"], [b"z"]]
+        )
+        self.assertEqual([shard.row_ranges for shard in shards], [[], [], []])
+
+
+class Test__batch_row_keys(unittest.TestCase):
+    def _call_fut(self, row_keys, split_keys, max_keys):
+        from google.cloud.bigtable.table import _batch_row_keys
+
+        return _batch_row_keys(row_keys, split_keys, max_keys)
+
+    def test_wo_split_keys(self):
+        batches = self._call_fut([b"a", b"b", b"c"], [], 2)
+
+        self.assertEqual([batch.row_keys for batch in batches], [[b"a", b"b"], [b"c"]])
+        self.assertEqual([batch.row_ranges for batch in batches], [[], []])
+
+    def test_w_split_keys(self):
+        row_keys = [b"a", b"b", b"c", b"k", b"m", b"z"]
+
+        batches = self._call_fut(row_keys, [b"k", b"p", b"q"], 2)
+
+        self.assertEqual(
+            [batch.row_keys for batch in batches],
+            [[b"a", b"b"], [b"c"], [b"k", b"m"], [b"z"]],
+        )
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut([], [b"k"], 2), [])
+
+
+class Test__mutate_rows_windows(unittest.TestCase):
+    def _call_fut(self, rows, max_rows, max_mutations):
+        from google.cloud.bigtable.table import _mutate_rows_windows
+
+        return list(_mutate_rows_windows(rows, max_rows, max_mutations))
+
+    @staticmethod
+    def _make_row(row_key, num_mutations):
+        from google.cloud.bigtable.row import DirectRow
+
+        row = DirectRow(row_key=row_key)
+        for index in range(num_mutations):
+            row.set_cell("cf", b"col%d" % index, b"value")
+        return row
+
+    def test_max_rows(self):
+        rows = [self._make_row(b"row%d" % index, 1) for index in range(5)]
+
+        windows = self._call_fut(iter(rows), 2, 100)
+
+        self.assertEqual(windows, [rows[:2], rows[2:4], rows[4:]])
+
+    def test_max_mutations(self):
+        rows = [self._make_row(b"a", 2), self._make_row(b"b", 2)]
+        rows += [self._make_row(b"c", 5), self._make_row(b"d", 1)]
+
+        windows = self._call_fut(rows, 10, 4)
+
+        self.assertEqual(windows, [rows[:2], rows[2:3], rows[3:]])
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut([], 2, 4), [])
+
+    def test_w_conditional_row(self):
+        from google.cloud.bigtable.row import ConditionalRow
+
+        with self.assertRaises(TypeError):
+            self._call_fut([ConditionalRow(b"a", None, None)], 2, 4)
+
+
 class Test__create_row_request(unittest.TestCase):
     def _call_fut(
         self,
@@ -1795,6 +2271,24 @@ def _mutate_rows_request_pb(*args, **kw):
     return data_messages_v2_pb2.MutateRowsRequest(*args, **kw)
 
 
+def _SampleRowKeysResponsePB(*args, **kw):
+    from google.cloud.bigtable_v2.proto import bigtable_pb2 as messages_v2_pb2
+
+    return messages_v2_pb2.SampleRowKeysResponse(*args, **kw)
+
+
+class _MockPartialRowsData(object):
+    def __init__(self, rows):
+        self._rows = rows
+        self.cancelled = False
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def cancel(self):
+        self.cancelled = True
+
+
 class _MockReadRowsIterator(object):
     def __init__(self, *values):
         self.iter_values = iter(values)
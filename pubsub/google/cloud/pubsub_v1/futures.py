@@ -37,7 +37,8 @@ class Future(google.api_core.future.Future):
             ``multiprocessing``) can supply an event that is compatible
             with that model. The ``wait()`` and ``set()`` methods will be
             used. If this argument is not provided, then a new
-            :class:`threading.Event` will be created and used.
+            :class:`threading.Event` will be created and used, once
+            something waits for the future.
     """
 
     # This could be a sentinel object or None, but the sentinel object's ID
@@ -49,8 +50,9 @@ class Future(google.api_core.future.Future):
         self._result = self._SENTINEL
         self._exception = self._SENTINEL
         self._callbacks = []
-        if completed is None:
-            completed = threading.Event()
+        self._callbacks_lock = threading.Lock()
+        # Most futures complete without anyone waiting for them, so the
+        # default event is only created by :meth:`exception`.
         self._completed = completed
 
     def cancel(self):
@@ -84,7 +86,9 @@ class Future(google.api_core.future.Future):
         This still returns True in failure cases; checking :meth:`result` or
         :meth:`exception` is the canonical way to assess success or failure.
         """
-        return self._exception != self._SENTINEL or self._result != self._SENTINEL
+        return (
+            self._exception is not self._SENTINEL or self._result is not self._SENTINEL
+        )
 
     def result(self, timeout=None):
         """Return the message ID, or raise an exception.
@@ -128,12 +132,23 @@ class Future(google.api_core.future.Future):
         Returns:
             Exception: The exception raised by the call, if any.
         """
+        completed = self._completed
+        if completed is None:
+            # Create the event holding the lock, so that it is set either
+            # here or by ``_trigger``.
+            with self._callbacks_lock:
+                if self._completed is None:
+                    self._completed = threading.Event()
+                    if self.done():
+                        self._completed.set()
+                completed = self._completed
+
         # Wait until the future is done.
-        if not self._completed.wait(timeout=timeout):
+        if not completed.wait(timeout=timeout):
             raise exceptions.TimeoutError("Timed out waiting for result.")
 
         # If the batch completed successfully, this should return None.
-        if self._result != self._SENTINEL:
+        if self._result is not self._SENTINEL:
             return None
 
         # Okay, this batch had an error; this should return it.
@@ -145,9 +160,13 @@ class Future(google.api_core.future.Future):
         The provided function is called, with this future as its only argument,
         when the future finishes running.
         """
-        if self.done():
-            return fn(self)
-        self._callbacks.append(fn)
+        # Hold the lock, so that the future cannot complete between checking
+        # and registering; the callback would never be called.
+        with self._callbacks_lock:
+            if not self.done():
+                self._callbacks.append(fn)
+                return
+        return fn(self)
 
     def set_result(self, result):
         """Set the result of the future to the provided result.
@@ -186,6 +205,10 @@ class Future(google.api_core.future.Future):
         Args:
             message_id (str): The message ID, as a string.
         """
-        self._completed.set()
-        for callback in self._callbacks:
+        with self._callbacks_lock:
+            completed = self._completed
+            callbacks = list(self._callbacks)
+        if completed is not None:
+            completed.set()
+        for callback in callbacks:
             callback(self)
@@ -0,0 +1,219 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Metrics hooks, to observe what the publisher and subscriber are doing.
+
+Pass a :class:`MetricsRecorder` as the ``metrics`` argument of a publisher or
+subscriber client; its methods are called as things happen. Subclass it to
+forward the measurements to a monitoring system, or use
+:class:`InMemoryMetrics` to aggregate them in the process.
+
+The methods are called from the library's background threads, and must be
+thread-safe and fast: they run on the critical path of publishing and
+receiving messages.
+"""
+
+from __future__ import absolute_import
+
+import threading
+
+
+class MetricsRecorder(object):
+    """Receives the measurements of the publisher and subscriber clients.
+
+    Every method does nothing by default; subclasses override the ones they
+    are interested in.
+    """
+
+    def record_delivery_latency(self, seconds):
+        """Record how long a message took from its publication to its
+        receipt by the subscriber.
+
+        Args:
+            seconds (float): The latency. Clock skew between the publisher
+                and the subscriber can make it inaccurate.
+        """
+
+    def record_scheduler_wait(self, seconds):
+        """Record how long received messages waited for the callback.
+
+        This includes the time spent in the scheduler's queue and, for batch
+        callbacks, the time spent filling the batch.
+
+        Args:
+            seconds (float): The time between the receipt of the message (the
+                oldest one, for a batch) and the call of the callback.
+        """
+
+    def record_ack_latency(self, seconds):
+        """Record how long a message took from its receipt to its ack.
+
+        Args:
+            seconds (int): The latency, rounded up to the second.
+        """
+
+    def record_flow_control_pause(self, load):
+        """Record that the subscriber paused its streams, because the
+        outstanding messages reached the flow control limits.
+
+        Args:
+            load (float): The load which caused the pause.
+        """
+
+    def record_flow_control_resume(self, load):
+        """Record that the subscriber resumed its streams.
+
+        Args:
+            load (float): The load which allowed the resume.
+        """
+
+    def record_lease_extension(self, count):
+        """Record a request extending the leases of outstanding messages.
+
+        Args:
+            count (int): The number of ack IDs in the request.
+        """
+
+    def record_publish_batch(self, message_count, byte_size):
+        """Record a batch of messages sent to be published.
+
+        Args:
+            message_count (int): The number of messages in the batch.
+            byte_size (int): The size of the messages, in bytes.
+        """
+
+    def record_publish_latency(self, seconds):
+        """Record how long a publish request took, whether it succeeded or
+        not.
+
+        Args:
+            seconds (float): The latency, including any retries.
+        """
+
+
+class Distribution(object):
+    """Summarizes the values of a measurement.
+
+    Attributes:
+        count (int): The number of values.
+        total (float): The sum of the values.
+        min (Optional[float]): The smallest value, if any.
+        max (Optional[float]): The largest value, if any.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    @property
+    def mean(self):
+        """Optional[float]: The mean of the values, if any."""
+        if not self.count:
+            return None
+        return float(self.total) / self.count
+
+    def add(self, value):
+        """Add a value.
+
+        Args:
+            value (float): The value.
+        """
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def __repr__(self):
+        return "Distribution(count={}, mean={}, min={}, max={})".format(
+            self.count, self.mean, self.min, self.max
+        )
+
+
+class InMemoryMetrics(MetricsRecorder):
+    """Aggregates the measurements in memory.
+
+    Read the counters and distributions from the attributes; they are
+    updated in place.
+
+    Attributes:
+        delivery_latency (Distribution): See
+            :meth:`MetricsRecorder.record_delivery_latency`.
+        scheduler_wait (Distribution): See
+            :meth:`MetricsRecorder.record_scheduler_wait`.
+        ack_latency (Distribution): See
+            :meth:`MetricsRecorder.record_ack_latency`.
+        flow_control_pauses (int): The number of times the subscriber
+            paused its streams.
+        flow_control_resumes (int): The number of times the subscriber
+            resumed its streams.
+        lease_extensions (Distribution): The number of ack IDs of each lease
+            extension request.
+        publish_batch_messages (Distribution): The number of messages of
+            each batch published.
+        publish_batch_bytes (Distribution): The size, in bytes, of each
+            batch published.
+        publish_latency (Distribution): The latency of each publish request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.delivery_latency = Distribution()
+        self.scheduler_wait = Distribution()
+        self.ack_latency = Distribution()
+        self.flow_control_pauses = 0
+        self.flow_control_resumes = 0
+        self.lease_extensions = Distribution()
+        self.publish_batch_messages = Distribution()
+        self.publish_batch_bytes = Distribution()
+        self.publish_latency = Distribution()
+
+    def record_delivery_latency(self, seconds):
+        with self._lock:
+            self.delivery_latency.add(seconds)
+
+    def record_scheduler_wait(self, seconds):
+        with self._lock:
+            self.scheduler_wait.add(seconds)
+
+    def record_ack_latency(self, seconds):
+        with self._lock:
+            self.ack_latency.add(seconds)
+
+    def record_flow_control_pause(self, load):
+        with self._lock:
+            self.flow_control_pauses += 1
+
+    def record_flow_control_resume(self, load):
+        with self._lock:
+            self.flow_control_resumes += 1
+
+    def record_lease_extension(self, count):
+        with self._lock:
+            self.lease_extensions.add(count)
+
+    def record_publish_batch(self, message_count, byte_size):
+        with self._lock:
+            self.publish_batch_messages.add(message_count)
+            self.publish_batch_bytes.add(byte_size)
+
+    def record_publish_latency(self, seconds):
+        with self._lock:
+            self.publish_latency.add(seconds)
+
+
+__all__ = ("Distribution", "InMemoryMetrics", "MetricsRecorder")
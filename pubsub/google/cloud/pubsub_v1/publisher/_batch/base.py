@@ -18,6 +18,8 @@ import abc
 
 import six
 
+from google.cloud.pubsub_v1 import types
+
 
 @six.add_metaclass(abc.ABCMeta)
 class Batch(object):
@@ -125,7 +127,7 @@ class Batch(object):
 
         # If this message will make the batch exceed the ``max_messages``
         # setting, return False.
-        if len(self.messages) >= self.settings.max_messages:
+        if len(self) >= self.settings.max_messages:
             return False
 
         # Okay, everything is good.
@@ -150,6 +152,25 @@ class Batch(object):
         """
         raise NotImplementedError
 
+    def publish_fields(self, data, attributes, size):
+        """Publish a single message, given its fields.
+
+        This is called by :meth:`~.PublisherClient.publish`, which has
+        already validated the fields. Implementations may buffer the fields
+        and build the protobuf message only when the batch is published;
+        by default, this builds it and calls :meth:`publish`.
+
+        Args:
+            data (bytes): The message body.
+            attributes (Mapping[str, str]): The message attributes, as text.
+            size (int): The serialized size of the message, in bytes.
+
+        Returns:
+            ~google.api_core.future.Future: An object conforming to the
+                :class:`concurrent.futures.Future` interface.
+        """
+        return self.publish(types.PubsubMessage(data=data, attributes=attributes))
+
 
 class BatchStatus(object):
     """An enum-like class representing valid statuses for a batch.
@@ -0,0 +1,348 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+import time
+
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch import base
+from google.cloud.pubsub_v1.publisher._batch import thread
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Sequencer(object):
+    """Publishes the batches of one ordering key, one after the other.
+
+    Messages published with the same ordering key are added to a queue of
+    batches. Only the oldest batch is published at any time, and the next
+    one only once it succeeded; the batches of other keys are published
+    independently, in parallel.
+
+    If a batch fails, the key is paused: the messages waiting in its queue
+    fail, and publishing more raises, until the key is resumed.
+
+    Args:
+        client (~.pubsub_v1.PublisherClient): The publisher client.
+        topic (str): The topic.
+        ordering_key (str): The ordering key.
+    """
+
+    def __init__(self, client, topic, ordering_key):
+        self._client = client
+        self._topic = topic
+        self._ordering_key = ordering_key
+
+        # Committing a batch while publishing into it calls back into the
+        # sequencer, so the lock must be reentrant.
+        self._lock = threading.RLock()
+        # These members are shared with the committing threads; only access
+        # them while holding the lock.
+        self._batches = collections.deque()
+        self._in_progress = False
+        self._paused = False
+        self._stopped = False
+
+    @property
+    def paused(self):
+        """bool: Whether a batch failed, and the key was not yet resumed."""
+        return self._paused
+
+    @property
+    def stopped(self):
+        """bool: Whether the sequencer was idle and discarded.
+
+        A stopped sequencer accepts no messages; a new one takes its place.
+        """
+        return self._stopped
+
+    def publish(self, data, attributes, size):
+        """Add a message to the newest batch of the key.
+
+        Args:
+            data (bytes): The message body.
+            attributes (Mapping[str, str]): The message attributes, as text.
+            size (int): The serialized size of the message, in bytes.
+
+        Returns:
+            Optional[tuple]: The batch the message was added to, and the
+            message's :class:`~google.api_core.future.Future`; or
+            :data:`None` if the sequencer is stopped.
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.PublishToPausedOrderingKeyException:
+                If the key is paused.
+        """
+        with self._lock:
+            if self._stopped:
+                return None
+            if self._paused:
+                raise exceptions.PublishToPausedOrderingKeyException(self._ordering_key)
+
+            future = None
+            if self._batches:
+                batch = self._batches[-1]
+                future = batch.publish_fields(data, attributes, size)
+            while future is None:
+                batch = Batch(
+                    client=self._client,
+                    topic=self._topic,
+                    settings=self._client.batch_settings,
+                    sequencer=self,
+                )
+                self._batches.append(batch)
+                future = batch.publish_fields(data, attributes, size)
+            return batch, future
+
+    def resume(self):
+        """Resume publishing the key after a failure.
+
+        Returns:
+            bool: Whether the sequencer is now idle, and was stopped.
+        """
+        with self._lock:
+            self._paused = False
+            return self._stop_if_idle()
+
+    def batch_ready(self, batch):
+        """Publish a batch which stopped accepting messages, once its turn
+        comes.
+
+        Args:
+            batch (Batch): The batch of this key to publish.
+        """
+        with self._lock:
+            if self._in_progress or not self._batches or self._batches[0] is not batch:
+                return
+            self._in_progress = True
+        self._dispatch(batch)
+
+    def batch_done(self, batch):
+        """Publish the next batch, or pause the key if ``batch`` failed.
+
+        Args:
+            batch (Batch): The batch of this key which was published.
+        """
+        next_batch = None
+        stopped = False
+        with self._lock:
+            if self._batches and self._batches[0] is batch:
+                self._batches.popleft()
+            self._in_progress = False
+
+            if batch.status == base.BatchStatus.ERROR:
+                self._pause()
+            elif self._batches and self._batches[0].status == base.BatchStatus.STARTING:
+                next_batch = self._batches[0]
+                self._in_progress = True
+            else:
+                stopped = self._stop_if_idle()
+
+        if next_batch is not None:
+            self._dispatch(next_batch)
+        elif stopped:
+            self._client._discard_sequencer(self._topic, self._ordering_key, self)
+
+    def discard(self, batch, future, exception):
+        """Fail a message which is not yet being published, and pause the
+        key.
+
+        The other messages of its batch, and those published after it with
+        the same key, fail too, rather than be published without it. This
+        does not wait for the locks; if another thread holds them, the
+        message is left in the batch.
+
+        Args:
+            batch (Batch): The batch of this key holding the message.
+            future (~.pubsub_v1.publisher.futures.Future): The future of the
+                message.
+            exception (Exception): The exception to fail the future with.
+
+        Returns:
+            bool: Whether the message's future failed.
+        """
+        if not self._lock.acquire(False):
+            return False
+        try:
+            # Publishing the rest of the batch without the message would
+            # break the order, so the whole batch fails at once.
+            futures = batch._take_futures(blocking=False)
+            if futures is None:
+                return False
+            error = exceptions.PublishToPausedOrderingKeyException(self._ordering_key)
+            for other in futures:
+                other.set_exception(exception if other is future else error)
+            self._pause()
+        finally:
+            self._lock.release()
+        return True
+
+    def _pause(self):
+        """Pause the key, failing the messages of the batches not yet
+        published. The caller must hold the lock.
+        """
+        _LOGGER.debug("Pausing ordering key %r.", self._ordering_key)
+        self._paused = True
+        error = exceptions.PublishToPausedOrderingKeyException(self._ordering_key)
+        # The oldest batch may be publishing, holding its lock until its
+        # futures are done, which can need the lock of the caller; its
+        # messages precede the others anyway, so it is left to complete.
+        head = None
+        if self._in_progress and self._batches:
+            head = self._batches.popleft()
+        while self._batches:
+            self._batches.popleft()._fail(error)
+        if head is not None:
+            self._batches.append(head)
+
+    def _stop_if_idle(self):
+        """Stop the sequencer if it has nothing left to publish.
+
+        Returns:
+            bool: Whether the sequencer was stopped.
+        """
+        if not self._batches and not self._paused:
+            self._stopped = True
+        return self._stopped
+
+    def _dispatch(self, batch):
+        """Publish a batch on a commit worker or a thread of its own."""
+        commit_pool = self._client._commit_pool
+        if commit_pool is not None:
+            commit_pool.submit(self._topic, batch._commit)
+        else:
+            commit_thread = threading.Thread(
+                name="Thread-CommitBatchPublisher", target=batch._commit
+            )
+            commit_thread.start()
+
+
+class Batch(thread.Batch):
+    """A batch of messages with the same ordering key.
+
+    Committing the batch only stops it from accepting messages; its
+    :class:`Sequencer` publishes it once the previous batch of the key
+    succeeded.
+
+    Args:
+        client (~.pubsub_v1.PublisherClient): The publisher client used to
+            create this batch.
+        topic (str): The topic. The format for this is
+            ``projects/{project}/topics/{topic}``.
+        settings (~.pubsub_v1.types.BatchSettings): The settings for batch
+            publishing. These should be considered immutable once the batch
+            has been opened.
+        sequencer (Sequencer): The sequencer of the batch's ordering key.
+        autocommit (bool): Whether to autocommit the batch when the time
+            has elapsed. Defaults to True unless ``settings.max_latency`` is
+            inf.
+    """
+
+    def __init__(self, client, topic, settings, sequencer, autocommit=True):
+        super(Batch, self).__init__(client, topic, settings, autocommit=False)
+        self._sequencer = sequencer
+
+        if autocommit and self._settings.max_latency < float("inf"):
+            if client._commit_pool is not None:
+                client._commit_pool.schedule_commit(self, settings.max_latency)
+            else:
+                self._thread = threading.Thread(
+                    name="Thread-MonitorBatchPublisher", target=self.monitor
+                )
+                self._thread.start()
+
+    def commit(self):
+        """Stop accepting messages, and publish the batch once its turn comes.
+
+        If the current batch is **not** accepting messages, this method
+        does nothing.
+        """
+        with self._state_lock:
+            if self._status == base.BatchStatus.ACCEPTING_MESSAGES:
+                self._status = base.BatchStatus.STARTING
+            else:
+                return
+
+        self._sequencer.batch_ready(self)
+
+    def _commit(self):
+        """Publish the batch, then let the sequencer continue.
+
+        .. note::
+
+            This method blocks.
+        """
+        try:
+            super(Batch, self)._commit()
+        finally:
+            self._sequencer.batch_done(self)
+
+    def _discard(self, future, exception):
+        """Fail a message which is not yet being published, and pause the
+        ordering key; see :meth:`Sequencer.discard`.
+
+        Returns:
+            bool: Whether the message's future failed.
+        """
+        return self._sequencer.discard(self, future, exception)
+
+    def _take_futures(self, blocking=True):
+        """Stop the batch from being published, and take its futures.
+
+        Args:
+            blocking (bool): Whether to wait for the lock of the batch.
+
+        Returns:
+            Optional[List[~.pubsub_v1.publisher.futures.Future]]: The futures
+            of the messages, to fail; or :data:`None` if the batch is being
+            or was published, or if the lock is held and ``blocking`` is
+            not set.
+        """
+        if not self._state_lock.acquire(blocking):
+            return None
+        try:
+            if self._status not in thread._CAN_COMMIT:
+                return None
+            self._status = base.BatchStatus.ERROR
+            return self._futures
+        finally:
+            self._state_lock.release()
+
+    def _fail(self, exception):
+        """Fail the messages of a batch which will not be published.
+
+        Args:
+            exception (Exception): The exception to fail the futures with.
+        """
+        for future in self._take_futures() or ():
+            future.set_exception(exception)
+
+    def monitor(self):
+        """Commit this batch after sufficient time has elapsed.
+
+        This sleeps for ``self._settings.max_latency`` seconds, and then
+        calls :meth:`commit`, since the batch may have to wait for the
+        previous one.
+        """
+        # NOTE: This blocks; it is up to the calling code to call it
+        #       in a separate thread.
+        time.sleep(self._settings.max_latency)
+
+        _LOGGER.debug("Monitor is waking up")
+        self.commit()
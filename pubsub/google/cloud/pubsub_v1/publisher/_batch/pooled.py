@@ -0,0 +1,286 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import atexit
+import collections
+import concurrent.futures
+import heapq
+import itertools
+import logging
+import sys
+import threading
+import time
+import weakref
+
+from google.cloud.pubsub_v1.publisher._batch import base
+from google.cloud.pubsub_v1.publisher._batch import thread
+
+
+_LOGGER = logging.getLogger(__name__)
+_TIMER_NAME = "Thread-BatchTimerPublisher"
+# Seconds between the checks of an idle timer for its pool being collected.
+_TIMER_IDLE_TIMEOUT = 1.0
+# The pools not yet shut down. Their threads do not keep the interpreter
+# alive, so the batches still waiting for their latency are published when
+# it exits.
+_pools = weakref.WeakSet()
+
+
+def _make_commit_executor(max_workers):
+    # Python 2.7 and 3.6+ have the thread_name_prefix argument, which is useful
+    # for debugging.
+    executor_kwargs = {}
+    if sys.version_info[:2] == (2, 7) or sys.version_info >= (3, 6):
+        executor_kwargs["thread_name_prefix"] = "ThreadPoolExecutor-CommitPublisher"
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, **executor_kwargs
+    )
+
+
+class CommitPool(object):
+    """Commits batches on a fixed number of worker threads.
+
+    A single timer thread commits each batch once its ``max_latency`` has
+    elapsed, for every topic, instead of a monitor thread per batch.
+
+    Args:
+        max_workers (int): The number of threads publishing batches.
+        max_in_flight_per_topic (Optional[int]): The number of batches of a
+            single topic which may be publishing at once. Batches committed
+            beyond it wait, in order, for one of the topic's publishes to
+            complete. If :data:`None`, only ``max_workers`` limits them.
+    """
+
+    def __init__(self, max_workers, max_in_flight_per_topic=None):
+        if max_in_flight_per_topic is not None and max_in_flight_per_topic < 1:
+            raise ValueError("max_in_flight_per_topic must be at least 1.")
+        self._executor = _make_commit_executor(max_workers)
+        self._max_in_flight = max_in_flight_per_topic
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        # These members are shared with the workers and the timer; only
+        # access them while holding the lock.
+        self._in_flight = collections.defaultdict(int)
+        self._pending = collections.defaultdict(collections.deque)
+        self._deadlines = []
+        self._sequence = itertools.count()
+        self._timer = None
+        self._stopped = False
+        _pools.add(self)
+
+    def in_flight(self, topic):
+        """Return the number of batches of a topic currently publishing.
+
+        Args:
+            topic (str): The topic.
+
+        Returns:
+            int: The number of the topic's batches running on a worker.
+        """
+        with self._lock:
+            return self._in_flight.get(topic, 0)
+
+    def pending(self, topic):
+        """Return the number of committed batches of a topic not yet started.
+
+        Args:
+            topic (str): The topic.
+
+        Returns:
+            int: The number of the topic's batches waiting for a worker.
+        """
+        with self._lock:
+            return len(self._pending.get(topic, ()))
+
+    def schedule_commit(self, batch, delay):
+        """Commit a batch after some time, unless it is committed before.
+
+        Args:
+            batch (~.pubsub_v1.publisher._batch.base.Batch): The batch.
+            delay (float): The number of seconds to wait.
+        """
+        entry = (time.time() + delay, next(self._sequence), batch)
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("The commit pool has been shut down.")
+            if self._timer is None:
+                # The timer only references the pool weakly while no batch
+                # waits, so that the pool of a dropped client is collected.
+                self._timer = threading.Thread(
+                    name=_TIMER_NAME,
+                    target=_run_timer,
+                    args=(weakref.ref(self), self._wakeup),
+                )
+                self._timer.daemon = True
+                self._timer.start()
+            heapq.heappush(self._deadlines, entry)
+            # Only wake the timer if it is now sleeping for too long.
+            if self._deadlines[0] is entry:
+                self._wakeup.notify()
+
+    def submit(self, topic, commit):
+        """Run a batch's commit on a worker, once the topic allows it.
+
+        Args:
+            topic (str): The topic of the batch.
+            commit (Callable[[], None]): Publishes the batch, blocking.
+        """
+        with self._lock:
+            if (
+                self._max_in_flight is not None
+                and self._in_flight[topic] >= self._max_in_flight
+            ):
+                self._pending[topic].append(commit)
+                return
+            self._in_flight[topic] += 1
+        try:
+            self._executor.submit(self._run, topic, commit)
+        except RuntimeError:
+            # The executor is shut down, as it is once the interpreter starts
+            # exiting; publish in this thread rather than lose the batch.
+            self._run(topic, commit)
+
+    def shutdown(self):
+        """Commit the batches still waiting for their latency, then wait for
+        every publish to complete and stop the threads.
+
+        The threads do not keep the interpreter alive, so this is called when
+        it exits. Calling it again does nothing.
+        """
+        _pools.discard(self)
+        with self._lock:
+            self._stopped = True
+            batches = [batch for _, _, batch in sorted(self._deadlines)]
+            del self._deadlines[:]
+            self._wakeup.notify()
+            timer = self._timer
+
+        if timer is not None:
+            timer.join()
+        for batch in batches:
+            batch.commit()
+        self._executor.shutdown(wait=True)
+
+    def _run(self, topic, commit):
+        """Publish a batch, then the topic's batches which waited for it."""
+        while commit is not None:
+            try:
+                commit()
+            except Exception:
+                _LOGGER.exception("Unexpected error committing a batch.")
+
+            with self._lock:
+                pending = self._pending.get(topic)
+                if pending:
+                    commit = pending.popleft()
+                    if not pending:
+                        del self._pending[topic]
+                else:
+                    commit = None
+                    self._in_flight[topic] -= 1
+                    if not self._in_flight[topic]:
+                        del self._in_flight[topic]
+
+
+class Batch(thread.Batch):
+    """A batch of messages, committed by the client's :class:`CommitPool`.
+
+    This behaves like :class:`~.pubsub_v1.publisher._batch.thread.Batch`,
+    but neither waiting for ``max_latency`` nor publishing starts a thread.
+    The publisher client uses it when
+    :attr:`~.pubsub_v1.types.PublisherOptions.max_commit_workers` is set.
+
+    Args:
+        client (~.pubsub_v1.PublisherClient): The publisher client used to
+            create this batch. Its commit pool publishes the batch.
+        topic (str): The topic. The format for this is
+            ``projects/{project}/topics/{topic}``.
+        settings (~.pubsub_v1.types.BatchSettings): The settings for batch
+            publishing. These should be considered immutable once the batch
+            has been opened.
+        autocommit (bool): Whether to autocommit the batch when the time
+            has elapsed. Defaults to True unless ``settings.max_latency`` is
+            inf.
+    """
+
+    def __init__(self, client, topic, settings, autocommit=True):
+        super(Batch, self).__init__(client, topic, settings, autocommit=False)
+        if autocommit and settings.max_latency < float("inf"):
+            client._commit_pool.schedule_commit(self, settings.max_latency)
+
+    def commit(self):
+        """Actually publish all of the messages on the active batch.
+
+        .. note::
+
+            This method is non-blocking. It hands :meth:`_commit`, which
+            does block, to the client's commit pool.
+
+        If the current batch is **not** accepting messages, this method
+        does nothing.
+        """
+        # Set the status to "starting" synchronously, to ensure that
+        # this batch will necessarily not accept new messages.
+        with self._state_lock:
+            if self._status == base.BatchStatus.ACCEPTING_MESSAGES:
+                self._status = base.BatchStatus.STARTING
+            else:
+                return
+
+        self._client._commit_pool.submit(self._topic, self._commit)
+
+
+def _run_timer(pool_ref, wakeup):
+    """Commit a pool's batches as their deadlines pass, until it is shut down
+    or garbage collected.
+
+    Args:
+        pool_ref (weakref.ref): A weak reference to the :class:`CommitPool`.
+        wakeup (threading.Condition): The pool's condition, notified when a
+            batch is scheduled or the pool is shut down.
+    """
+    while True:
+        with wakeup:
+            pool = pool_ref()
+            if pool is None or pool._stopped:
+                return
+            if not pool._deadlines:
+                del pool
+                wakeup.wait(_TIMER_IDLE_TIMEOUT)
+                continue
+            timeout = pool._deadlines[0][0] - time.time()
+            if timeout > 0:
+                wakeup.wait(timeout)
+                continue
+            _, _, batch = heapq.heappop(pool._deadlines)
+            del pool
+
+        _LOGGER.debug("Batch timer is committing a batch")
+        try:
+            batch.commit()
+        except Exception:
+            _LOGGER.exception("Unexpected error committing a batch.")
+        del batch
+
+
+def _shutdown_pools():
+    """Shut down the pools not yet shut down, when the interpreter exits."""
+    for pool in list(_pools):
+        pool.shutdown()
+
+
+atexit.register(_shutdown_pools)
@@ -75,6 +75,8 @@ class Batch(base.Batch):
         # These members are all communicated between threads; ensure that
         # any writes to them use the "state lock" to remain atomic.
         self._futures = []
+        # The messages are kept as ``(data, attributes, size)``, and only
+        # built into protobufs when the batch is published.
         self._messages = []
         self._size = 0
         self._status = base.BatchStatus.ACCEPTING_MESSAGES
@@ -88,6 +90,10 @@ class Batch(base.Batch):
             )
             self._thread.start()
 
+    def __len__(self):
+        """Return the number of messages currently in the batch."""
+        return len(self._messages)
+
     @staticmethod
     def make_lock():
         """Return a threading lock.
@@ -104,8 +110,13 @@ class Batch(base.Batch):
 
     @property
     def messages(self):
-        """Sequence: The messages currently in the batch."""
-        return self._messages
+        """Sequence: The messages currently in the batch.
+
+        The batch buffers the fields of its messages, and only builds the
+        protobufs when it is published; this builds a new list of them on
+        every access, which does not change the batch when modified.
+        """
+        return self._build_messages()
 
     @property
     def settings(self):
@@ -193,13 +204,35 @@ class Batch(base.Batch):
                 self._status = base.BatchStatus.SUCCESS
                 return
 
+            metrics = self._client.metrics
+            if metrics is not None:
+                metrics.record_publish_batch(len(self._messages), self._size)
+
             # Begin the request to publish these messages.
             # Log how long the underlying request takes.
             start = time.time()
 
+            # Compress the request if it is large enough to be worth it.
+            options = self._client.publisher_options
+            compress = (
+                options.compression is not None
+                and self._size >= options.compression_min_bytes
+            )
+
             try:
-                response = self._client.api.publish(self._topic, self._messages)
+                if compress:
+                    request = types.PublishRequest(
+                        topic=self._topic, messages=self._build_messages()
+                    )
+                    response = self._client._compressed_publish(request)
+                else:
+                    response = self._client.api.publish(
+                        self._topic, self._build_messages()
+                    )
             except google.api_core.exceptions.GoogleAPIError as exc:
+                if metrics is not None:
+                    metrics.record_publish_latency(time.time() - start)
+
                 # We failed to publish, set the exception on all futures and
                 # exit.
                 self._status = base.BatchStatus.ERROR
@@ -212,6 +245,8 @@ class Batch(base.Batch):
 
             end = time.time()
             _LOGGER.debug("gRPC Publish took %s seconds.", end - start)
+            if metrics is not None:
+                metrics.record_publish_latency(end - start)
 
             if len(response.message_ids) == len(self._futures):
                 # Iterate over the futures on the queue and return the response
@@ -238,6 +273,47 @@ class Batch(base.Batch):
                     len(self._futures),
                 )
 
+    def _build_messages(self):
+        """Build the protobufs of the messages currently in the batch."""
+        message_class = types.PubsubMessage
+        return [
+            message_class(data=data, attributes=attributes)
+            for data, attributes, _ in self._messages
+        ]
+
+    def _discard(self, future, exception):
+        """Remove a message which is not yet being published.
+
+        This does not wait for the state lock; if another thread holds it,
+        the message is left in the batch.
+
+        Args:
+            future (~.pubsub_v1.publisher.futures.Future): The future of the
+                message.
+            exception (Exception): The exception to fail the future with.
+
+        Returns:
+            bool: Whether the message was removed, and its future failed.
+        """
+        if not self._state_lock.acquire(False):
+            return False
+        try:
+            if self._status not in _CAN_COMMIT:
+                return False
+            for index, pending in enumerate(self._futures):
+                if pending is future:
+                    break
+            else:
+                return False
+            _, _, size = self._messages.pop(index)
+            del self._futures[index]
+            self._size -= size
+        finally:
+            self._state_lock.release()
+
+        future.set_exception(exception)
+        return True
+
     def monitor(self):
         """Commit this batch after sufficient time has elapsed.
 
@@ -275,28 +351,53 @@ class Batch(base.Batch):
         if not isinstance(message, types.PubsubMessage):
             message = types.PubsubMessage(**message)
 
-        future = None
+        return self.publish_fields(
+            message.data, dict(message.attributes), message.ByteSize()
+        )
+
+    def publish_fields(self, data, attributes, size):
+        """Publish a single message, given its fields.
+
+        This is the same as :meth:`publish`, without building the protobuf
+        message until the batch is published.
+
+        Args:
+            data (bytes): The message body.
+            attributes (Mapping[str, str]): The message attributes, as text.
+            size (int): The serialized size of the message, in bytes.
+
+        Returns:
+            Optional[~google.api_core.future.Future]: An object conforming to
+            the :class:`~concurrent.futures.Future` interface or :data:`None`.
+            If :data:`None` is returned, that signals that the batch cannot
+            accept a message.
+        """
+        # Make the future before taking the lock, to hold it briefly; it is
+        # dropped if the batch does not accept the message.
+        future = futures.Future()
 
         with self._state_lock:
-            if not self.will_accept(message):
-                return future
+            if self._status != base.BatchStatus.ACCEPTING_MESSAGES:
+                return None
 
-            new_size = self._size + message.ByteSize()
+            new_size = self._size + size
             new_count = len(self._messages) + 1
+            if new_count > self._settings.max_messages:
+                return None
             overflow = (
-                new_size > self.settings.max_bytes
+                new_size > self._settings.max_bytes
                 or new_count >= self._settings.max_messages
             )
 
-            if not self._messages or not overflow:
-
+            if self._messages and overflow:
+                future = None
+            else:
                 # Store the actual message in the batch's message queue.
-                self._messages.append(message)
+                self._messages.append((data, attributes, size))
                 self._size = new_size
 
                 # Track the future on this batch (so that the result of the
                 # future can be set).
-                future = futures.Future(completed=threading.Event())
                 self._futures.append(future)
 
         # Try to commit, but it must be **without** the lock held, since
@@ -14,13 +14,14 @@
 
 from __future__ import absolute_import
 
-import copy
+import functools
 import os
 import pkg_resources
 
 import grpc
 import six
 
+from google.api_core import gapic_v1
 from google.api_core import grpc_helpers
 from google.oauth2 import service_account
 
@@ -28,6 +29,10 @@ from google.cloud.pubsub_v1 import _gapic
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.gapic import publisher_client
 from google.cloud.pubsub_v1.gapic.transports import publisher_grpc_transport
+from google.cloud.pubsub_v1.publisher import flow_controller
+from google.cloud.pubsub_v1.publisher import futures
+from google.cloud.pubsub_v1.publisher._batch import ordered
+from google.cloud.pubsub_v1.publisher._batch import pooled
 from google.cloud.pubsub_v1.publisher._batch import thread
 
 
@@ -51,6 +56,22 @@ class Client(object):
     Args:
         batch_settings (~google.cloud.pubsub_v1.types.BatchSettings): The
             settings for batch publishing.
+        publisher_options (~google.cloud.pubsub_v1.types.PublisherOptions):
+            The options for committing batches. If ``max_commit_workers`` is
+            set, batches are published by that many shared threads, and a
+            single timer thread commits them once ``max_latency`` elapses,
+            instead of two new threads per batch, and at most
+            ``max_in_flight_batches`` of a topic publish at once; that limit
+            requires ``max_commit_workers``. Its ``flow_control``
+            bounds the messages published but not yet done. If its
+            ``compression`` is set, batches of at least
+            ``compression_min_bytes`` are compressed with that algorithm.
+            If ``enable_message_ordering`` is set, the messages given the
+            same ordering key by :meth:`publish_ordered` are published in
+            order.
+        metrics (~google.cloud.pubsub_v1.metrics.MetricsRecorder): An
+            optional recorder of the sizes and latencies of the batches
+            published.
         kwargs (dict): Any additional arguments provided are sent as keyword
             arguments to the underlying
             :class:`~.gapic.pubsub.v1.publisher_client.PublisherClient`.
@@ -62,7 +83,7 @@ class Client(object):
 
     _batch_class = thread.Batch
 
-    def __init__(self, batch_settings=(), **kwargs):
+    def __init__(self, batch_settings=(), publisher_options=(), metrics=None, **kwargs):
         # Sanity check: Is our goal to use the emulator?
         # If so, create a grpc insecure channel with the emulator host
         # as the target.
@@ -95,11 +116,56 @@ class Client(object):
         # client.
         self.api = publisher_client.PublisherClient(**kwargs)
         self.batch_settings = types.BatchSettings(*batch_settings)
+        self.publisher_options = types.PublisherOptions(*publisher_options)
+        self.metrics = metrics
+
+        # The large batches are published by a call compressing the request
+        # with the algorithm requested, which keeps the GAPIC retry and
+        # timeout defaults of ``Publish``.
+        self._compressed_publish = None
+        compression = self.publisher_options.compression
+        if compression is not None:
+            if not isinstance(compression, grpc.Compression):
+                raise ValueError(
+                    "Unknown compression algorithm: {!r}".format(compression)
+                )
+            method_config = self.api._method_configs["Publish"]
+            self._compressed_publish = gapic_v1.method.wrap_method(
+                functools.partial(self.api.transport.publish, compression=compression),
+                default_retry=method_config.retry,
+                default_timeout=method_config.timeout,
+                client_info=self.api._client_info,
+            )
+
+        # Optionally share a fixed number of threads between all batches.
+        self._commit_pool = None
+        if (
+            self.publisher_options.max_in_flight_batches is not None
+            and self.publisher_options.max_commit_workers is None
+        ):
+            raise ValueError(
+                "max_in_flight_batches requires max_commit_workers to be set "
+                "in the publisher options."
+            )
+        if self.publisher_options.max_commit_workers is not None:
+            self._batch_class = pooled.Batch
+            self._commit_pool = pooled.CommitPool(
+                max_workers=self.publisher_options.max_commit_workers,
+                max_in_flight_per_topic=self.publisher_options.max_in_flight_batches,
+            )
+
+        # The messages published whose futures are not yet done.
+        self.flow_controller = flow_controller.FlowController(
+            self.publisher_options.flow_control
+        )
 
         # The batches on the publisher client are responsible for holding
         # messages. One batch exists for each topic.
         self._batch_lock = self._batch_class.make_lock()
         self._batches = {}
+        # The messages with an ordering key are batched separately; one
+        # sequencer exists for each topic and ordering key.
+        self._sequencers = {}
 
     @classmethod
     def from_service_account_file(cls, filename, batch_settings=(), **kwargs):
@@ -150,6 +216,13 @@ class Client(object):
         Returns:
             ~.pubsub_v1._batch.Batch: The batch object.
         """
+        # Looking up the current batch does not need the lock; only replacing
+        # it does.
+        if not create:
+            batch = self._batches.get(topic)
+            if batch is not None:
+                return batch
+
         # If there is no matching batch yet, then potentially create one
         # and place it on the batches dictionary.
         with self._batch_lock:
@@ -169,6 +242,60 @@ class Client(object):
 
         return batch
 
+    def _sequencer(self, topic, ordering_key):
+        """Return the sequencer for the provided topic and ordering key,
+        creating one if there is none.
+
+        Args:
+            topic (str): A string representing the topic.
+            ordering_key (str): The ordering key.
+
+        Returns:
+            ~.pubsub_v1.publisher._batch.ordered.Sequencer: The sequencer.
+        """
+        key = (topic, ordering_key)
+        with self._batch_lock:
+            sequencer = self._sequencers.get(key)
+            if sequencer is None or sequencer.stopped:
+                sequencer = ordered.Sequencer(self, topic, ordering_key)
+                self._sequencers[key] = sequencer
+        return sequencer
+
+    def _discard_sequencer(self, topic, ordering_key, sequencer):
+        """Forget a sequencer which stopped, unless it was replaced."""
+        key = (topic, ordering_key)
+        with self._batch_lock:
+            if self._sequencers.get(key) is sequencer:
+                del self._sequencers[key]
+
+    def resume_publish(self, topic, ordering_key):
+        """Resume publishing with an ordering key, after a failure paused it.
+
+        When publishing a batch of messages with an ordering key fails, the
+        messages published after them with the same key fail too, and
+        :meth:`publish` raises for that key until it is resumed.
+
+        Args:
+            topic (str): The topic the messages were published to.
+            ordering_key (str): The ordering key to resume.
+        """
+        with self._batch_lock:
+            sequencer = self._sequencers.get((topic, ordering_key))
+        if sequencer is not None and sequencer.resume():
+            self._discard_sequencer(topic, ordering_key, sequencer)
+
+    def stop(self):
+        """Publish the batches still waiting for their latency, and wait for
+        every publish to complete.
+
+        This only matters if ``max_commit_workers`` is set in the publisher
+        options, and happens anyway when the interpreter exits; call it to
+        flush the messages earlier. Publishing afterwards raises
+        :exc:`RuntimeError`.
+        """
+        if self._commit_pool is not None:
+            self._commit_pool.shutdown()
+
     def publish(self, topic, data, **attrs):
         """Publish a single message.
 
@@ -206,6 +333,69 @@ class Client(object):
             ~google.api_core.future.Future: An object conforming to the
             ``concurrent.futures.Future`` interface (but not an instance
             of that class).
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.FlowControlLimitError: If the
+                message would exceed the flow control limits, and the
+                ``limit_exceeded_behavior`` does not block.
+        """
+        return self._publish(topic, data, "", attrs)
+
+    def publish_ordered(self, topic, data, ordering_key, **attrs):
+        """Publish a single message, in order with the messages published
+        before it with the same ordering key.
+
+        This works like :meth:`publish`, but the message is published only
+        after the messages published before it with the same key, and if one
+        of those fails, it fails too. Requires ``enable_message_ordering`` in
+        the publisher options. The key is not sent to Pub/Sub, and an empty
+        key publishes the message without ordering.
+
+        Example:
+            >>> from google.cloud import pubsub_v1
+            >>> client = pubsub_v1.PublisherClient(
+            ...     publisher_options=pubsub_v1.types.PublisherOptions(
+            ...         enable_message_ordering=True
+            ...     )
+            ... )
+            >>> topic = client.topic_path('[PROJECT]', '[TOPIC]')
+            >>> response = client.publish_ordered(topic, b'created', 'user-1')
+
+        Args:
+            topic (str): The topic to publish messages to.
+            data (bytes): A bytestring representing the message body. This
+                must be a bytestring.
+            ordering_key (str): The ordering key.
+            attrs (Mapping[str, str]): A dictionary of attributes to be
+                sent as metadata. (These may be text strings or byte strings.)
+
+        Returns:
+            ~google.api_core.future.Future: An object conforming to the
+            ``concurrent.futures.Future`` interface (but not an instance
+            of that class).
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.FlowControlLimitError: If the
+                message would exceed the flow control limits, and the
+                ``limit_exceeded_behavior`` does not block.
+            ~.pubsub_v1.publisher.exceptions.PublishToPausedOrderingKeyException:
+                If publishing with the ``ordering_key`` is paused.
+            ValueError: If message ordering is not enabled.
+        """
+        return self._publish(topic, data, ordering_key, attrs)
+
+    def _publish(self, topic, data, ordering_key, attrs):
+        """Publish a single message; see :meth:`publish_ordered`.
+
+        Args:
+            topic (str): The topic to publish messages to.
+            data (bytes): The message body.
+            ordering_key (str): The ordering key, or an empty string.
+            attrs (dict): The message attributes. They are coerced to text
+                strings in place.
+
+        Returns:
+            ~google.api_core.future.Future: The future of the message.
         """
         # Sanity check: Is the data being sent as a bytestring?
         # If it is literally anything else, complain loudly about it.
@@ -214,8 +404,15 @@ class Client(object):
                 "Data being published to Pub/Sub must be sent " "as a bytestring."
             )
 
-        # Coerce all attributes to text strings.
-        for k, v in copy.copy(attrs).items():
+        if ordering_key and not self.publisher_options.enable_message_ordering:
+            raise ValueError(
+                "Cannot publish a message with an ordering key when message "
+                "ordering is not enabled in the publisher options."
+            )
+
+        # Coerce all attributes to text strings. ``attrs`` is a new dict on
+        # every call to the public methods, so it can be updated in place.
+        for k, v in list(attrs.items()):
             if isinstance(v, six.text_type):
                 continue
             if isinstance(v, six.binary_type):
@@ -226,15 +423,112 @@ class Client(object):
                 "be sent as text strings."
             )
 
-        # Create the Pub/Sub message object.
-        message = types.PubsubMessage(data=data, attributes=attrs)
+        # The protobuf message is only built when the batch is published,
+        # so compute its size from the fields.
+        size = _message_size(data, attrs)
 
-        # Delegate the publishing to the batch.
-        batch = self._batch(topic)
-        future = None
-        while future is None:
-            future = batch.publish(message)
-            if future is None:
-                batch = self._batch(topic, create=True)
+        # Wait for, or make, room for the message if flow control requires it.
+        self.flow_controller.add(size)
 
+        # Delegate the publishing to the batch.
+        try:
+            if ordering_key:
+                published = None
+                while published is None:
+                    sequencer = self._sequencer(topic, ordering_key)
+                    published = sequencer.publish(data, attrs, size)
+                batch, future = published
+            else:
+                batch = self._batch(topic)
+                future = None
+                while future is None:
+                    future = batch.publish_fields(data, attrs, size)
+                    if future is None:
+                        batch = self._batch(topic, create=True)
+        except Exception:
+            self.flow_controller.release(size)
+            raise
+
+        self.flow_controller.track(batch, future, size)
         return future
+
+    def publish_async(self, topic, data, **attrs):
+        """Publish a single message from a coroutine.
+
+        This works like :meth:`publish`, but returns an :mod:`asyncio`
+        future, so that the result can be awaited without blocking a thread.
+        It must be called from the thread running the event loop. To publish
+        with an ordering key, pass the future returned by
+        :meth:`publish_ordered` to
+        :func:`~.pubsub_v1.publisher.futures.to_asyncio_future`.
+
+        .. note::
+            With the ``BLOCK`` flow control behavior, exceeding the limits
+            blocks the event loop until there is room; prefer the ``ERROR``
+            behavior, and retry later.
+
+        Example:
+            >>> from google.cloud import pubsub_v1
+            >>> client = pubsub_v1.PublisherClient()
+            >>> topic = client.topic_path('[PROJECT]', '[TOPIC]')
+            >>> message_id = await client.publish_async(topic, b'payload')
+
+        Args:
+            topic (str): The topic to publish messages to.
+            data (bytes): A bytestring representing the message body. This
+                must be a bytestring.
+            attrs (Mapping[str, str]): A dictionary of attributes to be
+                sent as metadata. (These may be text strings or byte strings.)
+
+        Returns:
+            asyncio.Future: The future to await for the message ID.
+        """
+        future = self.publish(topic, data, **attrs)
+        return futures.to_asyncio_future(future)
+
+
+def _varint_size(value):
+    """Return the size of an unsigned integer encoded as a protobuf varint."""
+    size = 1
+    while value > 0x7F:
+        value >>= 7
+        size += 1
+    return size
+
+
+def _string_size(value):
+    """Return the size of a string encoded in a protobuf message."""
+    if isinstance(value, six.text_type):
+        value = value.encode("utf-8")
+    return len(value)
+
+
+def _message_size(data, attributes):
+    """Compute the serialized size of a message without building it.
+
+    Args:
+        data (bytes): The message body.
+        attributes (Mapping[str, str]): The message attributes.
+
+    Returns:
+        int: The size of the :class:`~.pubsub_v1.types.PubsubMessage`
+        with these fields, in bytes.
+    """
+    # Each field is a one byte tag, then a varint length, then the value.
+    size = 0
+    if data:
+        size += 1 + _varint_size(len(data)) + len(data)
+    for key, value in attributes.items():
+        # A map entry is a nested message with the key and value fields,
+        # both of which are always encoded.
+        key_size = _string_size(key)
+        value_size = _string_size(value)
+        entry_size = (
+            2
+            + _varint_size(key_size)
+            + key_size
+            + _varint_size(value_size)
+            + value_size
+        )
+        size += 1 + _varint_size(entry_size) + entry_size
+    return size
@@ -22,4 +22,28 @@ class PublishError(GoogleAPICallError):
     pass
 
 
-__all__ = ("PublishError", "TimeoutError")
+class FlowControlLimitError(Exception):
+    """Publishing a message would exceed the publisher flow control limits."""
+
+
+class PublishToPausedOrderingKeyException(Exception):
+    """Publishing with an ordering key which is paused after a failure.
+
+    Call :meth:`~.pubsub_v1.publisher.client.Client.resume_publish` to
+    publish with the key again.
+    """
+
+    def __init__(self, ordering_key):
+        self.ordering_key = ordering_key
+        super(PublishToPausedOrderingKeyException, self).__init__(
+            "Publishing with ordering key {!r} is paused after a failure; "
+            "resume it to publish again.".format(ordering_key)
+        )
+
+
+__all__ = (
+    "FlowControlLimitError",
+    "PublishError",
+    "PublishToPausedOrderingKeyException",
+    "TimeoutError",
+)
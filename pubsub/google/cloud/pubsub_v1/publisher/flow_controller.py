@@ -0,0 +1,199 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch import base
+
+
+_LOGGER = logging.getLogger(__name__)
+_DROPPABLE = (base.BatchStatus.ACCEPTING_MESSAGES, base.BatchStatus.STARTING)
+
+
+class FlowController(object):
+    """Bounds the messages published but not yet done.
+
+    A message is outstanding from the moment it is published until its
+    future is done, whether it succeeded or failed. With the default
+    ``IGNORE`` behavior nothing is tracked, so that publishing without flow
+    control costs nothing; the outstanding counts then stay at zero.
+
+    Args:
+        settings (~google.cloud.pubsub_v1.types.PublishFlowControl): The
+            limits, and what to do when publishing a message would exceed
+            them.
+    """
+
+    def __init__(self, settings):
+        self._settings = settings
+        self._behavior = types.LimitExceededBehavior(settings.limit_exceeded_behavior)
+        self._enabled = self._behavior != types.LimitExceededBehavior.IGNORE
+
+        # Dropping the oldest message fails its future, which releases it on
+        # the same thread, so the lock must be reentrant.
+        self._lock = threading.RLock()
+        self._has_capacity = threading.Condition(self._lock)
+        # These members are shared with the threads completing futures; only
+        # access them while holding the lock.
+        self._messages = 0
+        self._bytes = 0
+        # Only tracked to drop the oldest messages: id(future) ->
+        # ``(batch, future)``, in publish order.
+        self._droppable = collections.OrderedDict()
+
+    @property
+    def settings(self):
+        """~google.cloud.pubsub_v1.types.PublishFlowControl: The limits."""
+        return self._settings
+
+    @property
+    def outstanding_messages(self):
+        """int: The number of messages published but not yet done."""
+        return self._messages
+
+    @property
+    def outstanding_bytes(self):
+        """int: The total size of the messages published but not yet done."""
+        return self._bytes
+
+    @property
+    def load(self):
+        """Return the current load.
+
+        The load is represented as a float, where 1.0 represents having
+        hit one of the flow control limits, and values between 0.0 and 1.0
+        represent how close we are to them. (0.5 means we have exactly half
+        of what the flow control setting allows, for example.)
+
+        There are (currently) two flow control settings; this property
+        computes how close the publisher is to each of them, and returns
+        whichever value is higher. If neither is set, this is always 0.0.
+
+        Returns:
+            float: The load value.
+        """
+        loads = [0.0]
+        if self._settings.message_limit is not None:
+            loads.append(float(self._messages) / self._settings.message_limit)
+        if self._settings.byte_limit is not None:
+            loads.append(float(self._bytes) / self._settings.byte_limit)
+        return max(loads)
+
+    def add(self, size):
+        """Account for a message about to be published.
+
+        Depending on the ``limit_exceeded_behavior``, if the message would
+        exceed the limits this blocks until enough outstanding messages are
+        done, raises, or drops the oldest messages not yet being published.
+
+        Args:
+            size (int): The size of the message, in bytes.
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.FlowControlLimitError: If the
+                message does not fit, and cannot be made to.
+        """
+        if not self._enabled:
+            return
+
+        with self._lock:
+            if self._exceeds_limits(1, size):
+                raise exceptions.FlowControlLimitError(
+                    "A message of {} bytes can never fit within the flow "
+                    "control limits.".format(size)
+                )
+
+            if self._behavior == types.LimitExceededBehavior.BLOCK:
+                while self._exceeds_limits(self._messages + 1, self._bytes + size):
+                    _LOGGER.debug("Blocking until there is room to publish.")
+                    self._has_capacity.wait()
+            elif self._exceeds_limits(self._messages + 1, self._bytes + size):
+                if self._behavior == types.LimitExceededBehavior.DROP_OLDEST:
+                    self._drop_oldest(size)
+                if self._exceeds_limits(self._messages + 1, self._bytes + size):
+                    raise exceptions.FlowControlLimitError(
+                        "Publishing the message would exceed the flow "
+                        "control limits."
+                    )
+
+            self._messages += 1
+            self._bytes += size
+
+    def release(self, size):
+        """Account for a message which was not published after all.
+
+        Args:
+            size (int): The size of the message, in bytes.
+        """
+        if not self._enabled:
+            return
+
+        with self._lock:
+            self._messages -= 1
+            self._bytes -= size
+            self._has_capacity.notify_all()
+
+    def track(self, batch, future, size):
+        """Release a published message once its future is done.
+
+        Args:
+            batch (~.pubsub_v1.publisher._batch.base.Batch): The batch the
+                message was added to.
+            future (~.pubsub_v1.publisher.futures.Future): The message's
+                future.
+            size (int): The size of the message, in bytes.
+        """
+        if not self._enabled:
+            return
+
+        key = id(future)
+
+        def on_done(unused_future):
+            with self._lock:
+                self._droppable.pop(key, None)
+                self.release(size)
+
+        if self._behavior == types.LimitExceededBehavior.DROP_OLDEST:
+            with self._lock:
+                self._droppable[key] = (batch, future)
+        future.add_done_callback(on_done)
+
+    def _exceeds_limits(self, messages, size):
+        message_limit = self._settings.message_limit
+        byte_limit = self._settings.byte_limit
+        return (message_limit is not None and messages > message_limit) or (
+            byte_limit is not None and size > byte_limit
+        )
+
+    def _drop_oldest(self, size):
+        """Drop the oldest messages not yet being published, until a message
+        of ``size`` bytes fits.
+        """
+        for key, (batch, future) in list(self._droppable.items()):
+            if not self._exceeds_limits(self._messages + 1, self._bytes + size):
+                return
+
+            error = exceptions.FlowControlLimitError(
+                "The message was dropped to make room for newer ones."
+            )
+            # Dropping fails the future, which releases the message.
+            if not batch._discard(future, error) and batch.status not in _DROPPABLE:
+                # The message is already being published.
+                self._droppable.pop(key, None)
@@ -16,6 +16,11 @@ from __future__ import absolute_import
 
 from google.cloud.pubsub_v1 import futures
 
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
+
 
 class Future(futures.Future):
     """Encapsulation of the asynchronous execution of an action.
@@ -45,4 +50,52 @@ class Future(futures.Future):
     pass
 
 
-__all__ = ("Future",)
+def to_asyncio_future(future, loop=None):
+    """Wrap a publish future in an awaitable :class:`asyncio.Future`.
+
+    The asyncio future gets the publish future's result or exception, on
+    the event loop, once it is done.
+
+    .. note::
+        This requires Python 3.
+
+    Args:
+        future (~.pubsub_v1.publisher.futures.Future): The future returned
+            by :meth:`~.pubsub_v1.publisher.client.Client.publish`.
+        loop (asyncio.AbstractEventLoop): The event loop of the asyncio
+            future. Defaults to the current event loop.
+
+    Returns:
+        asyncio.Future: The future to await for the message ID.
+
+    Raises:
+        ImportError: If :mod:`asyncio` is not available.
+    """
+    if asyncio is None:
+        raise ImportError("asyncio futures require Python 3.")
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    # ``loop.create_future()`` requires Python 3.5.2.
+    async_future = asyncio.Future(loop=loop)
+
+    def copy_state():
+        if async_future.cancelled():
+            return
+        exception = future.exception()
+        if exception is not None:
+            async_future.set_exception(exception)
+        else:
+            async_future.set_result(future.result())
+
+    def on_done(unused_future):
+        try:
+            loop.call_soon_threadsafe(copy_state)
+        except RuntimeError:
+            # The event loop was closed; nobody is waiting anymore.
+            pass
+
+    future.add_done_callback(on_done)
+    return async_future
+
+
+__all__ = ("Future", "to_asyncio_future")
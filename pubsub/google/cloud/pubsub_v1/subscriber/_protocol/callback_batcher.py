@@ -0,0 +1,153 @@
+# Copyright 2019, Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import logging
+import threading
+import time
+
+
+_LOGGER = logging.getLogger(__name__)
+_BATCHER_WORKER_NAME = "Thread-CallbackBatcher"
+
+
+class CallbackBatcher(object):
+    """Groups received messages into batches for a batch callback.
+
+    A batch is handed to ``schedule`` once it holds
+    ``settings.max_messages`` messages or ``settings.max_bytes`` bytes, or
+    ``settings.max_latency`` seconds after its first message arrived,
+    whichever comes first.
+
+    Args:
+        settings (~google.cloud.pubsub_v1.types.BatchCallbackSettings): The
+            limits of a batch.
+        schedule (Callable[[List[~.pubsub_v1.subscriber.message.Message]], None]):
+            Called with each batch of messages.
+    """
+
+    def __init__(self, settings, schedule):
+        self._settings = settings
+        self._schedule = schedule
+        self._thread = None
+        self._operational_lock = threading.Lock()
+
+        # These members are shared with the thread flushing batches on
+        # latency; only access them while holding the lock.
+        self._lock = threading.Lock()
+        self._has_deadline = threading.Condition(self._lock)
+        self._messages = []
+        self._bytes = 0
+        self._deadline = None
+        self._stopped = False
+
+    def add(self, messages):
+        """Add received messages to the current batch.
+
+        Args:
+            messages (Sequence[~.pubsub_v1.subscriber.message.Message]): The
+                messages.
+        """
+        settings = self._settings
+        batches = []
+        with self._lock:
+            for message in messages:
+                size = message.size
+                if self._messages and self._bytes + size > settings.max_bytes:
+                    batches.append(self._take())
+                self._messages.append(message)
+                self._bytes += size
+                if (
+                    len(self._messages) >= settings.max_messages
+                    or self._bytes >= settings.max_bytes
+                ):
+                    batches.append(self._take())
+
+            if self._messages and self._deadline is None:
+                self._deadline = time.time() + settings.max_latency
+                self._has_deadline.notify()
+
+        for batch in batches:
+            self._schedule(batch)
+
+    def _take(self):
+        """Start a new batch. The caller must hold the lock.
+
+        Returns:
+            List[~.pubsub_v1.subscriber.message.Message]: The messages of
+            the current batch.
+        """
+        batch = self._messages
+        self._messages = []
+        self._bytes = 0
+        self._deadline = None
+        return batch
+
+    def flush_on_latency(self):
+        """Hand over each batch once it is ``max_latency`` seconds old.
+
+        This blocks until :meth:`stop` is called.
+        """
+        while True:
+            with self._lock:
+                while not self._stopped:
+                    if self._deadline is None:
+                        self._has_deadline.wait()
+                        continue
+                    remaining = self._deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self._has_deadline.wait(remaining)
+
+                if self._stopped:
+                    break
+                batch = self._take()
+
+            self._schedule(batch)
+
+        _LOGGER.info("%s exiting.", _BATCHER_WORKER_NAME)
+
+    def start(self):
+        """Start a thread to hand over batches on latency."""
+        with self._operational_lock:
+            if self._thread is not None:
+                raise ValueError("Batcher is already running.")
+
+            with self._lock:
+                self._stopped = False
+            thread = threading.Thread(
+                name=_BATCHER_WORKER_NAME, target=self.flush_on_latency
+            )
+            thread.daemon = True
+            thread.start()
+            _LOGGER.debug("Started helper thread %s", thread.name)
+            self._thread = thread
+
+    def stop(self):
+        """Stop the thread, discarding the messages of the current batch.
+
+        Like the callbacks not yet run by the scheduler, the discarded
+        messages are redelivered once their lease expires.
+        """
+        with self._operational_lock:
+            with self._lock:
+                self._stopped = True
+                self._take()
+                self._has_deadline.notify()
+
+            if self._thread is not None:
+                self._thread.join()
+
+            self._thread = None
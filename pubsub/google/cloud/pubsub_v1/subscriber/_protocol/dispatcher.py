@@ -107,10 +107,13 @@ class Dispatcher(object):
             items(Sequence[AckRequest]): The items to acknowledge.
         """
         # If we got timing information, add it to the histogram.
+        metrics = self._manager.metrics
         for item in items:
             time_to_ack = item.time_to_ack
             if time_to_ack is not None:
                 self._manager.ack_histogram.add(time_to_ack)
+                if metrics is not None:
+                    metrics.record_ack_latency(time_to_ack)
 
         ack_ids = [item.ack_id for item in items]
         request = types.StreamingPullRequest(ack_ids=ack_ids)
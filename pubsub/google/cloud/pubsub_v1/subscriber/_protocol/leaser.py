@@ -15,13 +15,12 @@
 from __future__ import absolute_import
 
 import collections
-import copy
+import heapq
 import logging
-import random
 import threading
 import time
 
-import six
+from six.moves import range
 
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 
@@ -29,8 +28,24 @@ from google.cloud.pubsub_v1.subscriber._protocol import requests
 _LOGGER = logging.getLogger(__name__)
 _LEASE_WORKER_NAME = "Thread-LeaseMaintainer"
 
+_MIN_ACK_DEADLINE = 10
+"""int: The shortest lease, in seconds, a message can be received with.
 
-_LeasedMessage = collections.namedtuple("_LeasedMessage", ["added_time", "size"])
+Messages are leased for the current p99 ack time when they are received,
+which is never shorter than this; it is assumed for newly added messages.
+"""
+
+_MAX_MODACK_IDS = 1000
+"""int: The most ack IDs renewed by a single request, which keeps the
+requests well under the API's size limit."""
+
+_RENEWAL_WINDOW = 0.5
+"""float: The fraction of the lease left when a message's lease is renewed."""
+
+
+_LeasedMessage = collections.namedtuple(
+    "_LeasedMessage", ["added_time", "size", "expires_at"]
+)
 
 
 class Leaser(object):
@@ -39,9 +54,17 @@ class Leaser(object):
         self._operational_lock = threading.Lock()
         self._manager = manager
 
-        self._leased_messages = {}
-        """dict[str, float]: A mapping of ack IDs to the local time when the
-            ack ID was initially leased in seconds since the epoch."""
+        # These members are shared with the threads adding and removing
+        # leases; only access them while holding the lock.
+        self._lock = threading.Lock()
+        self._leased_messages = collections.OrderedDict()
+        """OrderedDict[str, _LeasedMessage]: A mapping of ack IDs to when the
+            ack ID was initially leased and when its lease expires, in
+            seconds since the epoch, in the order they were leased."""
+        self._expirations = []
+        """List[Tuple[float, str]]: A heap of ``(expires_at, ack_id)``, for
+            the leases to renew first. Entries for removed or renewed leases
+            are stale, and skipped."""
         self._bytes = 0
         """int: The total number of bytes consumed by leased messages."""
 
@@ -64,37 +87,42 @@ class Leaser(object):
 
     def add(self, items):
         """Add messages to be managed by the leaser."""
-        for item in items:
-            # Add the ack ID to the set of managed ack IDs, and increment
-            # the size counter.
-            if item.ack_id not in self._leased_messages:
-                self._leased_messages[item.ack_id] = _LeasedMessage(
-                    added_time=time.time(), size=item.byte_size
-                )
-                self._bytes += item.byte_size
-            else:
-                _LOGGER.debug("Message %s is already lease managed", item.ack_id)
+        now = time.time()
+        expires_at = now + _MIN_ACK_DEADLINE
+        with self._lock:
+            for item in items:
+                # Add the ack ID to the set of managed ack IDs, and increment
+                # the size counter.
+                if item.ack_id not in self._leased_messages:
+                    self._leased_messages[item.ack_id] = _LeasedMessage(
+                        added_time=now, size=item.byte_size, expires_at=expires_at
+                    )
+                    heapq.heappush(self._expirations, (expires_at, item.ack_id))
+                    self._bytes += item.byte_size
+                else:
+                    _LOGGER.debug("Message %s is already lease managed", item.ack_id)
 
     def remove(self, items):
         """Remove messages from lease management."""
         # Remove the ack ID from lease management, and decrement the
-        # byte counter.
-        for item in items:
-            if self._leased_messages.pop(item.ack_id, None) is not None:
-                self._bytes -= item.byte_size
-            else:
-                _LOGGER.debug("Item %s was not managed.", item.ack_id)
-
-        if self._bytes < 0:
-            _LOGGER.debug("Bytes was unexpectedly negative: %d", self._bytes)
-            self._bytes = 0
+        # byte counter. Its entry in the heap is skipped once it expires.
+        with self._lock:
+            for item in items:
+                if self._leased_messages.pop(item.ack_id, None) is not None:
+                    self._bytes -= item.byte_size
+                else:
+                    _LOGGER.debug("Item %s was not managed.", item.ack_id)
+
+            if self._bytes < 0:
+                _LOGGER.debug("Bytes was unexpectedly negative: %d", self._bytes)
+                self._bytes = 0
 
     def maintain_leases(self):
         """Maintain all of the leases being managed.
 
-        This method modifies the ack deadline for all of the managed
-        ack IDs, then waits for most of that time (but with jitter), and
-        repeats.
+        This method modifies the ack deadline of the managed ack IDs whose
+        lease is about to expire, then waits until the next ones are, and
+        repeats. Each cycle only visits the leases it drops or renews.
         """
         while self._manager.is_active and not self._stop_event.is_set():
             # Determine the appropriate duration for the lease. This is
@@ -102,62 +130,102 @@ class Leaser(object):
             # a sensible default and within the ranges allowed by Pub/Sub.
             p99 = self._manager.ack_histogram.percentile(99)
             _LOGGER.debug("The current p99 value is %d seconds.", p99)
+            window = p99 * _RENEWAL_WINDOW
 
-            # Make a copy of the leased messages. This is needed because it's
-            # possible for another thread to modify the dictionary while
-            # we're iterating over it.
-            leased_messages = copy.copy(self._leased_messages)
+            now = time.time()
+            cutoff = now - self._manager.flow_control.max_lease_duration
+            with self._lock:
+                to_drop = self._leases_to_drop(cutoff)
+                to_renew = self._leases_to_renew(now, now + window, p99, cutoff)
+                next_expiry = self._expirations[0][0] if self._expirations else None
 
             # Drop any leases that are well beyond max lease time. This
             # ensures that in the event of a badly behaving actor, we can
             # drop messages and allow Pub/Sub to resend them.
-            cutoff = time.time() - self._manager.flow_control.max_lease_duration
-            to_drop = [
-                requests.DropRequest(ack_id, item.size)
-                for ack_id, item in six.iteritems(leased_messages)
-                if item.added_time < cutoff
-            ]
-
             if to_drop:
                 _LOGGER.warning(
                     "Dropping %s items because they were leased too long.", len(to_drop)
                 )
                 self._manager.dispatcher.drop(to_drop)
 
-            # Remove dropped items from our copy of the leased messages (they
-            # have already been removed from the real one by
-            # self._manager.drop(), which calls self.remove()).
-            for item in to_drop:
-                leased_messages.pop(item.ack_id)
-
-            # Create a streaming pull request.
-            # We do not actually call `modify_ack_deadline` over and over
-            # because it is more efficient to make a single request.
-            ack_ids = leased_messages.keys()
-            if ack_ids:
-                _LOGGER.debug("Renewing lease for %d ack IDs.", len(ack_ids))
-
-                # NOTE: This may not work as expected if ``consumer.active``
-                #       has changed since we checked it. An implementation
-                #       without any sort of race condition would require a
-                #       way for ``send_request`` to fail when the consumer
-                #       is inactive.
+            if to_renew:
+                _LOGGER.debug("Renewing lease for %d ack IDs.", len(to_renew))
+
+            # NOTE: This may not work as expected if ``consumer.active``
+            #       has changed since we checked it. An implementation
+            #       without any sort of race condition would require a
+            #       way for ``send_request`` to fail when the consumer
+            #       is inactive.
+            metrics = self._manager.metrics
+            for start in range(0, len(to_renew), _MAX_MODACK_IDS):
+                chunk = to_renew[start : start + _MAX_MODACK_IDS]
                 self._manager.dispatcher.modify_ack_deadline(
-                    [requests.ModAckRequest(ack_id, p99) for ack_id in ack_ids]
+                    [requests.ModAckRequest(ack_id, p99) for ack_id in chunk]
                 )
-
-            # Now wait an appropriate period of time and do this again.
-            #
-            # We determine the appropriate period of time based on a random
-            # period between 0 seconds and 90% of the lease. This use of
-            # jitter (http://bit.ly/2s2ekL7) helps decrease contention in cases
-            # where there are many clients.
-            snooze = random.uniform(0.0, p99 * 0.9)
+                if metrics is not None:
+                    metrics.record_lease_extension(len(chunk))
+
+            # Now wait until the earliest lease is due to be renewed, but no
+            # longer than the window, so that changes to the p99 and to the
+            # max lease duration are picked up.
+            snooze = window
+            if next_expiry is not None:
+                snooze = min(max(next_expiry - window - time.time(), 0.01), window)
             _LOGGER.debug("Snoozing lease management for %f seconds.", snooze)
             self._stop_event.wait(timeout=snooze)
 
         _LOGGER.info("%s exiting.", _LEASE_WORKER_NAME)
 
+    def _leases_to_drop(self, cutoff):
+        """Find the leases held since before ``cutoff``.
+
+        The leases are in the order they were added, so only the dropped
+        ones are visited. The caller must hold the lock.
+
+        Returns:
+            List[~.requests.DropRequest]: The leases to drop.
+        """
+        to_drop = []
+        for ack_id, item in self._leased_messages.items():
+            if item.added_time >= cutoff:
+                break
+            to_drop.append(requests.DropRequest(ack_id, item.size))
+        return to_drop
+
+    def _leases_to_renew(self, now, horizon, seconds, cutoff):
+        """Renew the leases which expire by ``horizon`` in the bookkeeping.
+
+        Leases held since before ``cutoff`` are not renewed, since they are
+        dropped. The caller must hold the lock.
+
+        Returns:
+            List[str]: The ack IDs to renew the lease of by ``seconds``.
+        """
+        expirations = self._expirations
+        if len(expirations) > 2 * len(self._leased_messages) + _MAX_MODACK_IDS:
+            # Most entries are stale; rebuild the heap from the live leases.
+            expirations[:] = [
+                (item.expires_at, ack_id)
+                for ack_id, item in self._leased_messages.items()
+            ]
+            heapq.heapify(expirations)
+
+        to_renew = []
+        expires_at = now + seconds
+        while expirations and expirations[0][0] <= horizon:
+            old_expires_at, ack_id = heapq.heappop(expirations)
+            item = self._leased_messages.get(ack_id)
+            if (
+                item is None
+                or item.expires_at != old_expires_at
+                or item.added_time < cutoff
+            ):
+                continue
+            self._leased_messages[ack_id] = item._replace(expires_at=expires_at)
+            heapq.heappush(expirations, (expires_at, ack_id))
+            to_renew.append(ack_id)
+        return to_renew
+
     def start(self):
         with self._operational_lock:
             if self._thread is not None:
@@ -18,13 +18,20 @@ import collections
 import functools
 import logging
 import threading
+import time
 
 import grpc
 import six
 
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
+
 from google.api_core import bidi
 from google.api_core import exceptions
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber._protocol import callback_batcher
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import heartbeater
 from google.cloud.pubsub_v1.subscriber._protocol import histogram
@@ -51,16 +58,64 @@ def _maybe_wrap_exception(exception):
     return exception
 
 
+def _run_async_result(result, on_error):
+    """Run the coroutine returned by an async callback, if any.
+
+    The coroutine is run as a task of the current thread's event loop, as
+    provided by the
+    :class:`~google.cloud.pubsub_v1.subscriber.scheduler.AsyncioScheduler`.
+
+    Args:
+        result (Any): The value returned by the user callback.
+        on_error (Callable[[], None]): Called if the coroutine fails.
+
+    Returns:
+        Any: The task running the coroutine, or ``result`` if it is not
+        awaitable.
+    """
+    if not google.cloud.pubsub_v1.subscriber.scheduler.is_awaitable(result):
+        return result
+
+    try:
+        future = asyncio.ensure_future(result)
+    except RuntimeError:
+        if asyncio.iscoroutine(result):
+            result.close()
+        _LOGGER.error(
+            "The callback returned a coroutine, but it was not called on an "
+            "event loop. Use the AsyncioScheduler for coroutine callbacks."
+        )
+        on_error()
+        return None
+
+    def on_done(future):
+        if not future.cancelled() and future.exception() is not None:
+            _LOGGER.error(
+                "Top-level exception occurred in callback while processing messages",
+                exc_info=future.exception(),
+            )
+            on_error()
+
+    future.add_done_callback(on_done)
+    return future
+
+
 def _wrap_callback_errors(callback, message):
     """Wraps a user callback so that if an exception occurs the message is
     nacked.
 
+    If the callback returns a coroutine, it is run on the current event loop,
+    and the message is nacked if it fails.
+
     Args:
         callback (Callable[None, Message]): The user callback.
         message (~Message): The Pub/Sub message.
+
+    Returns:
+        Any: The task running the coroutine returned by the callback, if any.
     """
     try:
-        callback(message)
+        return _run_async_result(callback(message), message.nack)
     except Exception:
         # Note: the likelihood of this failing is extremely low. This just adds
         # a message to a queue, so if this doesn't work the world is in an
@@ -71,6 +126,54 @@ def _wrap_callback_errors(callback, message):
         message.nack()
 
 
+def _wrap_batch_callback_errors(callback, messages):
+    """Wraps a user batch callback so that if an exception occurs the
+    messages are nacked.
+
+    If the callback returns a coroutine, it is run on the current event loop,
+    and the messages are nacked if it fails.
+
+    Args:
+        callback (Callable[None, List[Message]]): The user batch callback.
+        messages (List[~Message]): The Pub/Sub messages.
+
+    Returns:
+        Any: The task running the coroutine returned by the callback, if any.
+    """
+    try:
+        return _run_async_result(
+            callback(messages),
+            functools.partial(
+                google.cloud.pubsub_v1.subscriber.message.nack_messages, messages
+            ),
+        )
+    except Exception:
+        _LOGGER.exception(
+            "Top-level exception occurred in callback while processing a "
+            "batch of messages"
+        )
+        google.cloud.pubsub_v1.subscriber.message.nack_messages(messages)
+
+
+def _record_scheduler_wait(metrics, callback, messages):
+    """Record how long messages waited before calling the callback with them.
+
+    Args:
+        metrics (~google.cloud.pubsub_v1.metrics.MetricsRecorder): The
+            recorder.
+        callback (Callable): The wrapped callback.
+        messages (Union[Message, List[Message]]): The message, or the batch of
+            messages, to call the callback with. The first message of a batch
+            is the oldest.
+
+    Returns:
+        Any: The result of the callback.
+    """
+    oldest = messages[0] if isinstance(messages, list) else messages
+    metrics.record_scheduler_wait(time.time() - oldest._received_timestamp)
+    return callback(messages)
+
+
 class StreamingPullManager(object):
     """The streaming pull manager coordinates pulling messages from Pub/Sub,
     leasing them, and scheduling them to be processed.
@@ -86,6 +189,14 @@ class StreamingPullManager(object):
         scheduler (~google.cloud.pubsub_v1.scheduler.Scheduler): The scheduler
             to use to process messages. If not provided, a thread pool-based
             scheduler will be used.
+        num_streams (int): The number of streaming pull streams to open for
+            the subscription. The streams share the callback, the scheduler
+            and the flow control settings. Defaults to 1.
+        batch_settings (~google.cloud.pubsub_v1.types.BatchCallbackSettings):
+            If set, the callback is called with lists of messages, bounded
+            by these settings, instead of with each message.
+        metrics (~google.cloud.pubsub_v1.metrics.MetricsRecorder): An
+            optional recorder of what the manager does.
     """
 
     _UNARY_REQUESTS = True
@@ -93,15 +204,28 @@ class StreamingPullManager(object):
     RPC instead of over the streaming RPC."""
 
     def __init__(
-        self, client, subscription, flow_control=types.FlowControl(), scheduler=None
+        self,
+        client,
+        subscription,
+        flow_control=types.FlowControl(),
+        scheduler=None,
+        num_streams=1,
+        batch_settings=None,
+        metrics=None,
     ):
+        if num_streams < 1:
+            raise ValueError("num_streams must be at least 1.")
+
         self._client = client
         self._subscription = subscription
         self._flow_control = flow_control
         self._ack_histogram = histogram.Histogram()
         self._last_histogram_size = 0
         self._ack_deadline = 10
-        self._rpc = None
+        self._num_streams = num_streams
+        self._batch_settings = batch_settings
+        self._metrics = metrics
+        self._rpcs = []
         self._callback = None
         self._closing = threading.Lock()
         self._closed = False
@@ -117,8 +241,9 @@ class StreamingPullManager(object):
         # The threads created in ``.open()``.
         self._dispatcher = None
         self._leaser = None
-        self._consumer = None
+        self._consumers = []
         self._heartbeater = None
+        self._batcher = None
 
     @property
     def is_active(self):
@@ -127,7 +252,12 @@ class StreamingPullManager(object):
         Note that ``False`` does not indicate this is complete shut down,
         just that it stopped getting new messages.
         """
-        return self._consumer is not None and self._consumer.is_active
+        return any(consumer.is_active for consumer in self._consumers)
+
+    @property
+    def num_streams(self):
+        """int: The number of streaming pull streams of the subscription."""
+        return self._num_streams
 
     @property
     def flow_control(self):
@@ -149,6 +279,13 @@ class StreamingPullManager(object):
         """
         return self._leaser
 
+    @property
+    def metrics(self):
+        """google.cloud.pubsub_v1.metrics.MetricsRecorder: The recorder of
+        what the manager does, if any.
+        """
+        return self._metrics
+
     @property
     def ack_histogram(self):
         """google.cloud.pubsub_v1.subscriber._protocol.histogram.Histogram:
@@ -208,27 +345,42 @@ class StreamingPullManager(object):
         self._close_callbacks.append(callback)
 
     def maybe_pause_consumer(self):
-        """Check the current load and pause the consumer if needed."""
+        """Check the current load and pause the consumers if needed.
+
+        The streams share the flow control settings, so they are paused
+        together.
+        """
         if self.load >= 1.0:
-            if self._consumer is not None and not self._consumer.is_paused:
+            running = [
+                consumer for consumer in self._consumers if not consumer.is_paused
+            ]
+            if running:
                 _LOGGER.debug("Message backlog over load at %.2f, pausing.", self.load)
-                self._consumer.pause()
+                if self._metrics is not None:
+                    self._metrics.record_flow_control_pause(self.load)
+            for consumer in running:
+                consumer.pause()
 
     def maybe_resume_consumer(self):
-        """Check the current load and resume the consumer if needed."""
+        """Check the current load and resume the consumers if needed."""
         # If we have been paused by flow control, check and see if we are
         # back within our limits.
         #
         # In order to not thrash too much, require us to have passed below
         # the resume threshold (80% by default) of each flow control setting
         # before restarting.
-        if self._consumer is None or not self._consumer.is_paused:
+        paused = [consumer for consumer in self._consumers if consumer.is_paused]
+        if not paused:
             return
 
-        if self.load < self.flow_control.resume_threshold:
-            self._consumer.resume()
+        load = self.load
+        if load < self.flow_control.resume_threshold:
+            if self._metrics is not None:
+                self._metrics.record_flow_control_resume(load)
+            for consumer in paused:
+                consumer.resume()
         else:
-            _LOGGER.debug("Did not resume, current load is %s", self.load)
+            _LOGGER.debug("Did not resume, current load is %s", load)
 
     def _send_unary_request(self, request):
         """Send a request using a separate unary request instead of over the
@@ -272,16 +424,19 @@ class StreamingPullManager(object):
                     exc_info=True,
                 )
         else:
-            self._rpc.send(request)
+            # Ack IDs are valid on any stream of the subscription.
+            rpc = next((rpc for rpc in self._rpcs if rpc.is_active), self._rpcs[0])
+            rpc.send(request)
 
     def heartbeat(self):
-        """Sends an empty request over the streaming pull RPC.
+        """Sends an empty request over each streaming pull RPC.
 
-        This always sends over the stream, regardless of if
+        This always sends over the streams, regardless of if
         ``self._UNARY_REQUESTS`` is set or not.
         """
-        if self._rpc is not None and self._rpc.is_active:
-            self._rpc.send(types.StreamingPullRequest())
+        for rpc in self._rpcs:
+            if rpc.is_active:
+                rpc.send(types.StreamingPullRequest())
 
     def open(self, callback):
         """Begin consuming messages.
@@ -289,7 +444,8 @@ class StreamingPullManager(object):
         Args:
             callback (Callable[None, google.cloud.pubsub_v1.message.Messages]):
                 A callback that will be called for each message received on the
-                stream.
+                stream, or for each batch of them if the manager has
+                ``batch_settings``.
         """
         if self.is_active:
             raise ValueError("This manager is already open.")
@@ -297,27 +453,50 @@ class StreamingPullManager(object):
         if self._closed:
             raise ValueError("This manager has been closed and can not be re-used.")
 
-        self._callback = functools.partial(_wrap_callback_errors, callback)
+        if self._batch_settings is not None:
+            self._callback = functools.partial(_wrap_batch_callback_errors, callback)
+        else:
+            self._callback = functools.partial(_wrap_callback_errors, callback)
+        if self._metrics is not None:
+            self._callback = functools.partial(
+                _record_scheduler_wait, self._metrics, self._callback
+            )
+        if self._batch_settings is not None:
+            self._batcher = callback_batcher.CallbackBatcher(
+                self._batch_settings,
+                functools.partial(self._scheduler.schedule, self._callback),
+            )
 
-        # Create the RPC
-        self._rpc = bidi.ResumableBidiRpc(
-            start_rpc=self._client.api.streaming_pull,
-            initial_request=self._get_initial_request,
-            should_recover=self._should_recover,
-        )
-        self._rpc.add_done_callback(self._on_rpc_done)
+        # Create the RPCs
+        self._rpcs = []
+        for _ in range(self._num_streams):
+            rpc = bidi.ResumableBidiRpc(
+                start_rpc=self._client.api.streaming_pull,
+                initial_request=self._get_initial_request,
+                should_recover=self._should_recover,
+            )
+            rpc.add_done_callback(self._on_rpc_done)
+            self._rpcs.append(rpc)
 
-        # Create references to threads
+        # Create references to threads. The streams share the dispatcher and
+        # the leaser, so that flow control spans all of them.
         self._dispatcher = dispatcher.Dispatcher(self, self._scheduler.queue)
-        self._consumer = bidi.BackgroundConsumer(self._rpc, self._on_response)
+        self._consumers = [
+            bidi.BackgroundConsumer(rpc, self._on_response) for rpc in self._rpcs
+        ]
         self._leaser = leaser.Leaser(self)
         self._heartbeater = heartbeater.Heartbeater(self)
 
         # Start the thread to pass the requests.
         self._dispatcher.start()
 
+        # Start the thread to hand over batches of messages on latency.
+        if self._batcher is not None:
+            self._batcher.start()
+
         # Start consuming messages.
-        self._consumer.start()
+        for consumer in self._consumers:
+            consumer.start()
 
         # Start the lease maintainer thread.
         self._leaser.start()
@@ -340,12 +519,17 @@ class StreamingPullManager(object):
                 return
 
             # Stop consuming messages.
-            if self.is_active:
-                _LOGGER.debug("Stopping consumer.")
-                self._consumer.stop()
-            self._consumer = None
+            for consumer in self._consumers:
+                if consumer.is_active:
+                    _LOGGER.debug("Stopping consumer.")
+                    consumer.stop()
+            self._consumers = []
 
             # Shutdown all helper threads
+            if self._batcher is not None:
+                _LOGGER.debug("Stopping batcher.")
+                self._batcher.stop()
+                self._batcher = None
             _LOGGER.debug("Stopping scheduler.")
             self._scheduler.shutdown()
             self._scheduler = None
@@ -359,7 +543,7 @@ class StreamingPullManager(object):
             self._heartbeater.stop()
             self._heartbeater = None
 
-            self._rpc = None
+            self._rpcs = []
             self._closed = True
             _LOGGER.debug("Finished stopping manager.")
 
@@ -421,12 +605,28 @@ class StreamingPullManager(object):
             for message in response.received_messages
         ]
         self._dispatcher.modify_ack_deadline(items)
-        for received_message in response.received_messages:
-            message = google.cloud.pubsub_v1.subscriber.message.Message(
+        # TODO: Immediately lease instead of using the callback queue.
+        messages = [
+            google.cloud.pubsub_v1.subscriber.message.Message(
                 received_message.message, received_message.ack_id, self._scheduler.queue
             )
-            # TODO: Immediately lease instead of using the callback queue.
-            self._scheduler.schedule(self._callback, message)
+            for received_message in response.received_messages
+        ]
+        if self._metrics is not None:
+            self._record_delivery_latency(response.received_messages)
+        if self._batcher is not None:
+            self._batcher.add(messages)
+        else:
+            for message in messages:
+                self._scheduler.schedule(self._callback, message)
+
+    def _record_delivery_latency(self, received_messages):
+        now = time.time()
+        for received_message in received_messages:
+            publish_time = received_message.message.publish_time
+            self._metrics.record_delivery_latency(
+                now - publish_time.seconds - publish_time.nanos / 1e9
+            )
 
     def _should_recover(self, exception):
         """Determine if an error on the RPC stream should be recovered.
@@ -451,7 +651,10 @@ class StreamingPullManager(object):
         return False
 
     def _on_rpc_done(self, future):
-        """Triggered whenever the underlying RPC terminates without recovery.
+        """Triggered whenever an underlying RPC terminates without recovery.
+
+        Any stream failing shuts down the whole manager, so that the error
+        is surfaced to the future.
 
         This is typically triggered from one of two threads: the background
         consumer thread (when calling ``recv()`` produces a non-recoverable
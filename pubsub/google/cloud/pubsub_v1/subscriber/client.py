@@ -48,6 +48,9 @@ class Client(object):
     get sensible defaults.
 
     Args:
+        metrics (~google.cloud.pubsub_v1.metrics.MetricsRecorder): An
+            optional recorder of the latencies, flow control pauses and lease
+            extensions of the subscriptions.
         kwargs (dict): Any additional arguments provided are sent as keyword
             keyword arguments to the underlying
             :class:`~.gapic.pubsub.v1.subscriber_client.SubscriberClient`.
@@ -55,7 +58,7 @@ class Client(object):
             arguments.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, metrics=None, **kwargs):
         # Sanity check: Is our goal to use the emulator?
         # If so, create a grpc insecure channel with the emulator host
         # as the target.
@@ -90,6 +93,7 @@ class Client(object):
         # Add the metrics headers, and instantiate the underlying GAPIC
         # client.
         self._api = subscriber_client.SubscriberClient(**kwargs)
+        self.metrics = metrics
 
     @classmethod
     def from_service_account_file(cls, filename, **kwargs):
@@ -124,7 +128,9 @@ class Client(object):
         """The underlying gapic API client."""
         return self._api
 
-    def subscribe(self, subscription, callback, flow_control=(), scheduler=None):
+    def subscribe(
+        self, subscription, callback, flow_control=(), scheduler=None, num_streams=1
+    ):
         """Asynchronously start receiving messages on a given subscription.
 
         This method starts a background thread to begin pulling messages from
@@ -146,6 +152,11 @@ class Client(object):
         settings may lead to faster throughput for messages that do not take
         a long time to process.
 
+        A single stream delivers messages at a limited rate. The
+        ``num_streams`` argument opens several streams for the subscription;
+        their messages are passed to the same ``callback``, and the
+        ``flow_control`` settings bound the messages of all of them together.
+
         This method starts the receiver in the background and returns a
         *Future* representing its execution. Waiting on the future (calling
         ``result()``) will block forever or until a non-recoverable error
@@ -196,15 +207,117 @@ class Client(object):
             scheduler (~google.cloud.pubsub_v1.subscriber.scheduler.Scheduler): An optional
                 *scheduler* to use when executing the callback. This controls
                 how callbacks are executed concurrently.
+            num_streams (int): The number of streaming pull streams to open
+                for the subscription. Defaults to 1.
+
+        Returns:
+            google.cloud.pubsub_v1.subscriber.futures.StreamingPullFuture: A
+                Future object that can be used to manage the background stream.
+        """
+        flow_control = types.FlowControl(*flow_control)
+
+        manager = streaming_pull_manager.StreamingPullManager(
+            self,
+            subscription,
+            flow_control=flow_control,
+            scheduler=scheduler,
+            num_streams=num_streams,
+            metrics=self.metrics,
+        )
+
+        future = futures.StreamingPullFuture(manager)
+
+        manager.open(callback)
+
+        return future
+
+    def subscribe_batch(
+        self,
+        subscription,
+        callback,
+        batch_settings=(),
+        flow_control=(),
+        scheduler=None,
+        num_streams=1,
+    ):
+        """Asynchronously start receiving batches of messages on a given
+        subscription.
+
+        This works like :meth:`subscribe`, except that the ``callback`` is
+        called with a list of
+        :class:`google.cloud.pubsub_v1.subscriber.message.Message` rather
+        than with each message. This is much cheaper for callbacks which
+        handle many small messages at once, such as bulk writes to a
+        database.
+
+        A batch is passed to the callback once it holds
+        ``batch_settings.max_messages`` messages or
+        ``batch_settings.max_bytes`` bytes, or ``batch_settings.max_latency``
+        seconds after its first message was received, whichever comes first.
+        The messages of a batch are leased until they are acked or nacked,
+        so batches can only be as large as the ``flow_control`` settings
+        allow.
+
+        The callback is responsible for acking or nacking every message; the
+        :func:`~.pubsub_v1.subscriber.message.ack_messages` and
+        :func:`~.pubsub_v1.subscriber.message.nack_messages` helpers do so
+        for a whole batch. If an exception occurs in the callback, the
+        exception is logged and the whole batch is nacked.
+
+        Example:
+
+        .. code-block:: python
+
+            from google.cloud import pubsub_v1
+            from google.cloud.pubsub_v1.subscriber.message import ack_messages
+
+            subscriber_client = pubsub_v1.SubscriberClient()
+
+            # existing subscription
+            subscription = subscriber_client.subscription_path(
+                'my-project-id', 'my-subscription')
+
+            def callback(messages):
+                write_rows([message.data for message in messages])
+                ack_messages(messages)
+
+            future = subscriber_client.subscribe_batch(subscription, callback)
+
+        Args:
+            subscription (str): The name of the subscription. The
+                subscription should have already been created (for example,
+                by using :meth:`create_subscription`).
+            callback (Callable[List[~google.cloud.pubsub_v1.subscriber.message.Message]]):
+                The callback function. This function receives a list of
+                messages as its only argument and will be called from a
+                different thread/process depending on the scheduling
+                strategy.
+            batch_settings (~google.cloud.pubsub_v1.types.BatchCallbackSettings):
+                The limits of a batch of messages.
+            flow_control (~google.cloud.pubsub_v1.types.FlowControl): The flow control
+                settings. Use this to prevent situations where you are
+                inundated with too many messages at once.
+            scheduler (~google.cloud.pubsub_v1.subscriber.scheduler.Scheduler): An optional
+                *scheduler* to use when executing the callback. This controls
+                how callbacks are executed concurrently.
+            num_streams (int): The number of streaming pull streams to open
+                for the subscription. Defaults to 1.
 
         Returns:
             google.cloud.pubsub_v1.subscriber.futures.StreamingPullFuture: A
                 Future object that can be used to manage the background stream.
         """
         flow_control = types.FlowControl(*flow_control)
+        batch_settings = types.BatchCallbackSettings(*batch_settings)
 
         manager = streaming_pull_manager.StreamingPullManager(
-            self, subscription, flow_control=flow_control, scheduler=scheduler
+            self,
+            subscription,
+            flow_control=flow_control,
+            scheduler=scheduler,
+            num_streams=num_streams,
+            metrics=self.metrics,
+            batch_settings=batch_settings,
         )
 
         future = futures.StreamingPullFuture(manager)
@@ -49,6 +49,28 @@ def _indent(lines, prefix="  "):
     return "\n".join(indented)
 
 
+def ack_messages(messages):
+    """Acknowledge messages, such as a batch received by a batch callback.
+
+    Args:
+        messages (Iterable[~.pubsub_v1.subscriber.message.Message]): The
+            messages to acknowledge.
+    """
+    for message in messages:
+        message.ack()
+
+
+def nack_messages(messages):
+    """Decline to acknowledge messages, so that they are re-delivered.
+
+    Args:
+        messages (Iterable[~.pubsub_v1.subscriber.message.Message]): The
+            messages to decline.
+    """
+    for message in messages:
+        message.nack()
+
+
 class Message(object):
     """A representation of a single Pub/Sub message.
 
@@ -20,11 +20,22 @@ each message.
 
 import abc
 import concurrent.futures
+import logging
 import sys
+import threading
 
 import six
 from six.moves import queue
 
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
+
+
+_LOGGER = logging.getLogger(__name__)
+_ASYNCIO_LOOP_THREAD_NAME = "Thread-AsyncioScheduler"
+
 
 @six.add_metaclass(abc.ABCMeta)
 class Scheduler(object):
@@ -121,3 +132,130 @@ class ThreadScheduler(object):
         except queue.Empty:
             pass
         self._executor.shutdown()
+
+
+def is_awaitable(result):
+    """Whether a callback returned a coroutine or an asyncio future to run.
+
+    Args:
+        result (Any): The value returned by a callback.
+
+    Returns:
+        bool: Whether ``result`` is awaitable.
+    """
+    return asyncio is not None and (
+        asyncio.iscoroutine(result) or isinstance(result, asyncio.Future)
+    )
+
+
+class AsyncioScheduler(object):
+    """An asyncio event loop-based scheduler.
+
+    This scheduler calls the callbacks on an event loop instead of threads,
+    and accepts coroutine functions as callbacks: the coroutine each call
+    returns is run as a task. This is useful when processing a message
+    mostly waits on I/O, since a task is much cheaper than a thread.
+
+    The scheduler does not bound the tasks running at once; the flow
+    control settings of the subscription do, since every message being
+    processed is leased. Raise ``max_messages`` to allow more concurrent
+    callbacks.
+
+    .. note::
+        This scheduler requires Python 3.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): An optional event loop to run the
+            callbacks on. It must be running, in another thread than the
+            subscriber's. If not specified, a new event loop is created and
+            run in a thread of its own.
+
+    Raises:
+        ImportError: If :mod:`asyncio` is not available.
+    """
+
+    def __init__(self, loop=None):
+        if asyncio is None:
+            raise ImportError("The AsyncioScheduler requires Python 3.")
+
+        self._queue = queue.Queue()
+        # Only accessed on the event loop.
+        self._tasks = set()
+        self._thread = None
+
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                name=_ASYNCIO_LOOP_THREAD_NAME, target=loop.run_forever
+            )
+            self._thread.daemon = True
+            self._thread.start()
+        self._loop = loop
+
+    @property
+    def queue(self):
+        """Queue: A thread-safe queue used for communication between callbacks
+        and the scheduling thread."""
+        return self._queue
+
+    @property
+    def loop(self):
+        """asyncio.AbstractEventLoop: The event loop running the callbacks."""
+        return self._loop
+
+    def schedule(self, callback, *args, **kwargs):
+        """Schedule the callback to be called on the event loop.
+
+        If the callback returns a coroutine, it is run as a task.
+
+        Args:
+            callback (Callable): The function to call.
+            args: Positional arguments passed to the function.
+            kwargs: Key-word arguments passed to the function.
+
+        Returns:
+            None
+        """
+        self._loop.call_soon_threadsafe(self._run, callback, args, kwargs)
+
+    def _run(self, callback, args, kwargs):
+        try:
+            result = callback(*args, **kwargs)
+        except Exception:
+            _LOGGER.exception("Top-level exception occurred in a callback.")
+            return
+
+        if asyncio.iscoroutine(result):
+            result = self._loop.create_task(result)
+        if isinstance(result, asyncio.Future):
+            self._tasks.add(result)
+            result.add_done_callback(self._tasks.discard)
+
+    def shutdown(self):
+        """Shuts down the scheduler and immediately end all pending callbacks.
+
+        This cancels the tasks still running, and stops the event loop if the
+        scheduler created it.
+        """
+        if self._thread is None:
+            # The event loop is not ours to stop.
+            self._loop.call_soon_threadsafe(self._cancel_tasks)
+        elif self._thread is threading.current_thread():
+            # Shutting down from a callback; the loop cannot be waited for.
+            self._cancel_tasks()
+            self._loop.stop()
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            tasks = self._cancel_tasks()
+            if tasks:
+                self._loop.run_until_complete(
+                    asyncio.gather(*tasks, return_exceptions=True)
+                )
+            self._loop.close()
+
+    def _cancel_tasks(self):
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        return tasks
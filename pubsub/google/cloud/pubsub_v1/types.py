@@ -14,6 +14,7 @@
 
 from __future__ import absolute_import
 import collections
+import enum
 import sys
 
 from google.api import http_pb2
@@ -71,6 +72,71 @@ FlowControl.__new__.__defaults__ = (
     2 * 60 * 60,  # max_lease_duration: 2 hours.
 )
 
+BatchCallbackSettings = collections.namedtuple(
+    "BatchCallbackSettings", ["max_messages", "max_bytes", "max_latency"]
+)
+BatchCallbackSettings.__new__.__defaults__ = (
+    100,  # max_messages: 100
+    1024 * 1024,  # max_bytes: 1 MiB
+    0.05,  # max_latency: 0.05 seconds
+)
+
+
+class LimitExceededBehavior(str, enum.Enum):
+    """The possible actions when exceeding the publish flow control limits."""
+
+    IGNORE = "ignore"
+    """Publish messages regardless of the limits."""
+    BLOCK = "block"
+    """Block :meth:`~.pubsub_v1.publisher.client.Client.publish` until
+    enough outstanding messages are published."""
+    ERROR = "error"
+    """Raise :exc:`~.pubsub_v1.publisher.exceptions.FlowControlLimitError`."""
+    DROP_OLDEST = "drop_oldest"
+    """Fail the futures of the oldest messages which are not yet being
+    published, removing them from their batches, to make room. Dropping a
+    message with an ordering key pauses the key, failing the other messages
+    of its batch and those published after it, as if its publish had
+    failed."""
+
+
+# Define the type class and default values for publisher flow control.
+#
+# This class is used when creating a publisher client, to bound the messages
+# which were published but whose futures are not yet done.
+PublishFlowControl = collections.namedtuple(
+    "PublishFlowControl", ["message_limit", "byte_limit", "limit_exceeded_behavior"]
+)
+PublishFlowControl.__new__.__defaults__ = (
+    None,  # message_limit: no limit
+    None,  # byte_limit: no limit
+    LimitExceededBehavior.IGNORE,  # limit_exceeded_behavior: ignore the limits
+)
+
+# Define the type class and default values for publisher options.
+#
+# This class is used when creating a publisher client to choose how batches
+# are committed. By default, every batch is committed on a thread of its own.
+PublisherOptions = collections.namedtuple(
+    "PublisherOptions",
+    [
+        "max_commit_workers",
+        "max_in_flight_batches",
+        "flow_control",
+        "compression",
+        "compression_min_bytes",
+        "enable_message_ordering",
+    ],
+)
+PublisherOptions.__new__.__defaults__ = (
+    None,  # max_commit_workers: a new thread per batch
+    None,  # max_in_flight_batches: no limit per topic
+    PublishFlowControl(),  # flow_control: no limits
+    None,  # compression: a grpc.Compression; none by default
+    1024,  # compression_min_bytes: 1 KiB
+    False,  # enable_message_ordering: ordering keys are not accepted
+)
+
 
 _shared_modules = [
     http_pb2,
@@ -87,7 +153,14 @@ _shared_modules = [
 _local_modules = [pubsub_pb2]
 
 
-names = ["BatchSettings", "FlowControl"]
+names = [
+    "BatchCallbackSettings",
+    "BatchSettings",
+    "FlowControl",
+    "LimitExceededBehavior",
+    "PublishFlowControl",
+    "PublisherOptions",
+]
 
 
 for module in _shared_modules:
@@ -30,6 +30,7 @@ version = '0.39.1'
 release_status = 'Development Status :: 4 - Beta'
 dependencies = [
     'google-api-core[grpc] >= 1.6.0, < 2.0.0dev',
+    'grpcio >= 1.23.0',
     'grpc-google-iam-v1 >= 0.11.4, < 0.12dev',
     'enum34; python_version < "3.4"',
 ]
@@ -19,6 +19,7 @@ import mock
 from google.auth import credentials
 from google.cloud.pubsub_v1 import publisher
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher._batch import base
 from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
 from google.cloud.pubsub_v1.publisher._batch.thread import Batch
 
@@ -76,3 +77,14 @@ def test_will_not_accept_number():
     )
     message = types.PubsubMessage(data=b"abc")
     assert batch.will_accept(message) is False
+
+
+def test_publish_fields():
+    batch = create_batch(status=BatchStatus.ACCEPTING_MESSAGES)
+    with mock.patch.object(batch, "publish") as publish:
+        future = base.Batch.publish_fields(batch, b"foo", {"bar": u"baz"}, 17)
+
+    assert future is publish.return_value
+    publish.assert_called_once_with(
+        types.PubsubMessage(data=b"foo", attributes={"bar": u"baz"})
+    )
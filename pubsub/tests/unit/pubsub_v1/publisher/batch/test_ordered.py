@@ -0,0 +1,372 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import mock
+import pytest
+
+import google.api_core.exceptions
+from google.auth import credentials
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
+from google.cloud.pubsub_v1.publisher._batch import ordered
+
+
+def create_client(**options):
+    creds = mock.Mock(spec=credentials.Credentials)
+    options.setdefault("enable_message_ordering", True)
+    return publisher.Client(
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+        credentials=creds,
+        publisher_options=types.PublisherOptions(**options),
+    )
+
+
+def create_sequencer(client=None):
+    if client is None:
+        client = create_client()
+    sequencer = ordered.Sequencer(client, "topic_name", "key")
+    # Do not actually publish; record the batches published instead.
+    sequencer._dispatch = mock.Mock(spec=())
+    return sequencer
+
+
+def publish(sequencer, data):
+    return sequencer.publish(data, {}, types.PubsubMessage(data=data).ByteSize())
+
+
+def test_publish():
+    sequencer = create_sequencer()
+    batch1, future1 = publish(sequencer, b"foo")
+    batch2, future2 = publish(sequencer, b"bar")
+
+    assert batch1 is batch2
+    assert isinstance(batch1, ordered.Batch)
+    assert batch1._futures == [future1, future2]
+    assert list(sequencer._batches) == [batch1]
+
+
+def test_publish_new_batch():
+    sequencer = create_sequencer()
+    batch1, _ = publish(sequencer, b"foo")
+    batch1.commit()
+    batch2, _ = publish(sequencer, b"bar")
+
+    assert batch2 is not batch1
+    assert list(sequencer._batches) == [batch1, batch2]
+
+
+def test_publish_stopped():
+    sequencer = create_sequencer()
+    sequencer._stopped = True
+
+    assert publish(sequencer, b"foo") is None
+
+
+def test_publish_paused():
+    sequencer = create_sequencer()
+    sequencer._paused = True
+
+    with pytest.raises(exceptions.PublishToPausedOrderingKeyException) as exc_info:
+        publish(sequencer, b"foo")
+    assert exc_info.value.ordering_key == "key"
+
+
+def test_commit_in_order():
+    sequencer = create_sequencer()
+    batch1, _ = publish(sequencer, b"foo")
+    batch1.commit()
+    batch2, _ = publish(sequencer, b"bar")
+    batch2.commit()
+    batch3, _ = publish(sequencer, b"baz")
+
+    # Only the oldest batch is published at first.
+    sequencer._dispatch.assert_called_once_with(batch1)
+    assert batch2.status == BatchStatus.STARTING
+
+    # The next batch is published once the previous one is done.
+    batch1._status = BatchStatus.SUCCESS
+    sequencer.batch_done(batch1)
+    sequencer._dispatch.assert_called_with(batch2)
+
+    # A batch still accepting messages waits for its commit.
+    batch2._status = BatchStatus.SUCCESS
+    sequencer.batch_done(batch2)
+    assert sequencer._dispatch.call_count == 2
+    batch3.commit()
+    sequencer._dispatch.assert_called_with(batch3)
+    assert sequencer._dispatch.call_count == 3
+
+
+def test_batch_done_pauses_on_error():
+    sequencer = create_sequencer()
+    batch1, _ = publish(sequencer, b"foo")
+    batch1.commit()
+    batch2, future2 = publish(sequencer, b"bar")
+    batch2.commit()
+    batch3, future3 = publish(sequencer, b"baz")
+
+    batch1._status = BatchStatus.ERROR
+    sequencer.batch_done(batch1)
+
+    # The messages after the failed batch fail, and the key is paused.
+    assert sequencer.paused
+    assert not sequencer._batches
+    assert batch2.status == BatchStatus.ERROR
+    assert batch3.status == BatchStatus.ERROR
+    for future in (future2, future3):
+        assert isinstance(
+            future.exception(), exceptions.PublishToPausedOrderingKeyException
+        )
+    sequencer._dispatch.assert_called_once_with(batch1)
+
+    # Resuming leaves the sequencer idle.
+    assert sequencer.resume()
+    assert sequencer.stopped
+
+
+def test_discard_pauses():
+    sequencer = create_sequencer()
+    batch1, future1 = publish(sequencer, b"foo")
+    _, future2 = publish(sequencer, b"bar")
+    batch1.commit()
+    batch2, future3 = publish(sequencer, b"baz")
+
+    error = exceptions.FlowControlLimitError("dropped")
+    assert batch1._discard(future1, error)
+
+    # The messages after the dropped one are not published without it.
+    assert future1.exception() is error
+    assert sequencer.paused
+    assert batch1.status == BatchStatus.ERROR
+    assert batch2.status == BatchStatus.ERROR
+    for future in (future2, future3):
+        assert isinstance(
+            future.exception(), exceptions.PublishToPausedOrderingKeyException
+        )
+
+    # The dispatched batch leaves the queue once its commit returns.
+    assert list(sequencer._batches) == [batch1]
+    sequencer.batch_done(batch1)
+    assert not sequencer._batches
+    assert sequencer.paused
+
+
+def test_discard_while_head_publishing():
+    sequencer = create_sequencer()
+    batch1, future1 = publish(sequencer, b"foo")
+    batch1.commit()
+    batch2, future2 = publish(sequencer, b"bar")
+    # The head batch is publishing, holding its lock.
+    batch1._status = BatchStatus.IN_PROGRESS
+    batch1._state_lock.acquire()
+    try:
+        assert not batch1._discard(future1, exceptions.FlowControlLimitError())
+        assert batch2._discard(future2, exceptions.FlowControlLimitError())
+    finally:
+        batch1._state_lock.release()
+
+    # The head batch is left to complete; the later ones fail.
+    assert not future1.done()
+    assert list(sequencer._batches) == [batch1]
+    assert batch2.status == BatchStatus.ERROR
+    assert sequencer.paused
+
+
+def test_discard_locked():
+    sequencer = create_sequencer()
+    batch, future = publish(sequencer, b"foo")
+
+    # Another thread holds the sequencer's lock.
+    lock_held = threading.Event()
+    release = threading.Event()
+
+    def hold_lock():
+        with sequencer._lock:
+            lock_held.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    assert lock_held.wait(5)
+    try:
+        assert not batch._discard(future, exceptions.FlowControlLimitError())
+    finally:
+        release.set()
+        holder.join()
+
+    assert not future.done()
+    assert not sequencer.paused
+
+
+def test_batch_done_stops_when_idle():
+    client = create_client()
+    sequencer = create_sequencer(client)
+    client._sequencers[("topic_name", "key")] = sequencer
+    batch, _ = publish(sequencer, b"foo")
+    batch.commit()
+
+    batch._status = BatchStatus.SUCCESS
+    sequencer.batch_done(batch)
+
+    assert sequencer.stopped
+    assert client._sequencers == {}
+
+
+def test_dispatch_thread():
+    client = create_client()
+    sequencer = ordered.Sequencer(client, "topic_name", "key")
+    batch = mock.Mock(spec=("_commit",))
+    with mock.patch.object(threading, "Thread", autospec=True) as Thread:
+        sequencer._dispatch(batch)
+
+    Thread.assert_called_once_with(
+        name="Thread-CommitBatchPublisher", target=batch._commit
+    )
+    Thread.return_value.start.assert_called_once_with()
+
+
+def test_dispatch_commit_pool():
+    client = create_client(max_commit_workers=1)
+    sequencer = ordered.Sequencer(client, "topic_name", "key")
+    batch = mock.Mock(spec=("_commit",))
+    with mock.patch.object(client._commit_pool, "submit") as submit:
+        sequencer._dispatch(batch)
+
+    submit.assert_called_once_with("topic_name", batch._commit)
+
+
+def test_batch_monitor_commits():
+    client = create_client()
+    sequencer = create_sequencer(client)
+    settings = types.BatchSettings(max_latency=0.0)
+    batch = ordered.Batch(client, "topic_name", settings, sequencer, autocommit=False)
+    sequencer._batches.append(batch)
+
+    batch.monitor()
+
+    assert batch.status == BatchStatus.STARTING
+    sequencer._dispatch.assert_called_once_with(batch)
+
+
+def test_batch__commit_notifies_sequencer():
+    client = create_client()
+    sequencer = mock.Mock(spec=("batch_done",))
+    batch = ordered.Batch(
+        client, "topic_name", client.batch_settings, sequencer, autocommit=False
+    )
+    batch.publish_fields(b"foo", {}, 5)
+
+    error = google.api_core.exceptions.InternalServerError("boom")
+    with mock.patch.object(type(client.api), "publish", side_effect=error):
+        batch._commit()
+
+    assert batch.status == BatchStatus.ERROR
+    sequencer.batch_done.assert_called_once_with(batch)
+
+
+def test_client_publish_in_order():
+    client = create_client()
+    publish_calls = []
+
+    def publish_rpc(topic, messages, **kwargs):
+        publish_calls.append([message.data for message in messages])
+        return types.PublishResponse(message_ids=[str(i) for i in range(len(messages))])
+
+    batch_settings = types.BatchSettings(max_messages=3, max_latency=float("inf"))
+    client.batch_settings = batch_settings
+    patch = mock.patch.object(type(client.api), "publish", side_effect=publish_rpc)
+    with patch:
+        futures = [
+            client.publish_ordered("topic_name", str(i).encode(), "key")
+            for i in range(5)
+        ]
+        for sequencer in list(client._sequencers.values()):
+            sequencer._batches[-1].commit()
+        for future in futures:
+            future.result(timeout=5)
+
+    assert publish_calls == [[b"0", b"1"], [b"2", b"3"], [b"4"]]
+
+
+def test_client_drop_oldest_pauses_key():
+    flow_control = types.PublishFlowControl(
+        message_limit=2, limit_exceeded_behavior=types.LimitExceededBehavior.DROP_OLDEST
+    )
+    client = create_client(flow_control=flow_control)
+    future1 = client.publish_ordered("topic_name", b"1", "key")
+    future2 = client.publish_ordered("topic_name", b"2", "key")
+
+    # Dropping the first message fails the second one rather than publish it
+    # out of order, and the key stays paused until it is resumed.
+    with pytest.raises(exceptions.PublishToPausedOrderingKeyException):
+        client.publish_ordered("topic_name", b"3", "key")
+
+    assert isinstance(future1.exception(), exceptions.FlowControlLimitError)
+    assert isinstance(
+        future2.exception(), exceptions.PublishToPausedOrderingKeyException
+    )
+    assert client.flow_controller.outstanding_messages == 0
+
+    client.resume_publish("topic_name", "key")
+    future4 = client.publish_ordered("topic_name", b"4", "key")
+    assert not future4.done()
+
+
+@pytest.mark.parametrize("max_commit_workers", [None, 2])
+def test_client_drop_oldest_while_publishing(max_commit_workers):
+    flow_control = types.PublishFlowControl(
+        message_limit=4, limit_exceeded_behavior=types.LimitExceededBehavior.DROP_OLDEST
+    )
+    client = create_client(
+        flow_control=flow_control, max_commit_workers=max_commit_workers
+    )
+    client.batch_settings = types.BatchSettings(max_messages=2, max_latency=0.01)
+    publishing = threading.Event()
+    release = threading.Event()
+
+    def publish_rpc(topic, messages, **kwargs):
+        publishing.set()
+        release.wait(5)
+        return types.PublishResponse(message_ids=[str(i) for i in range(len(messages))])
+
+    def publish_all():
+        futures = []
+        for i in range(10):
+            if i == 2:
+                # Drop messages while the key's first batch is publishing.
+                assert publishing.wait(5)
+            try:
+                futures.append(
+                    client.publish_ordered("topic_name", str(i).encode(), "k")
+                )
+            except exceptions.PublishToPausedOrderingKeyException:
+                pass
+        release.set()
+        for future in futures:
+            future.exception(timeout=5)
+
+    patch = mock.patch.object(type(client.api), "publish", side_effect=publish_rpc)
+    with patch:
+        publisher_thread = threading.Thread(target=publish_all)
+        publisher_thread.daemon = True
+        publisher_thread.start()
+        publisher_thread.join(10)
+
+    assert not publisher_thread.is_alive()
+    assert client.flow_controller.outstanding_messages == 0
+    client.stop()
@@ -0,0 +1,240 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import threading
+import weakref
+
+import mock
+import pytest
+
+from google.auth import credentials
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
+from google.cloud.pubsub_v1.publisher._batch import pooled
+
+
+def create_client(**options):
+    creds = mock.Mock(spec=credentials.Credentials)
+    options.setdefault("max_commit_workers", 2)
+    return publisher.Client(
+        credentials=creds, publisher_options=types.PublisherOptions(**options)
+    )
+
+
+def create_batch(client, autocommit=False, **batch_settings):
+    settings = types.BatchSettings(**batch_settings)
+    return pooled.Batch(client, "topic_name", settings, autocommit=autocommit)
+
+
+def test_commit_pool_invalid_in_flight():
+    with pytest.raises(ValueError):
+        pooled.CommitPool(max_workers=1, max_in_flight_per_topic=0)
+
+
+def test_commit_pool_submit():
+    pool = pooled.CommitPool(max_workers=2)
+    done = threading.Event()
+
+    pool.submit("topic", done.set)
+    assert done.wait(5)
+    pool.shutdown()
+
+    assert pool.in_flight("topic") == 0
+
+
+def test_commit_pool_submit_over_in_flight_limit():
+    pool = pooled.CommitPool(max_workers=4, max_in_flight_per_topic=1)
+    release = threading.Event()
+    order = []
+
+    def commit(name):
+        def _commit():
+            order.append(name)
+            release.wait(5)
+
+        return _commit
+
+    pool.submit("a", commit("a1"))
+    pool.submit("a", commit("a2"))
+    pool.submit("a", commit("a3"))
+    pool.submit("b", commit("b1"))
+
+    # Only one batch per topic may publish; the rest wait in order.
+    assert pool.in_flight("a") == 1
+    assert pool.pending("a") == 2
+    assert pool.in_flight("b") == 1
+    assert pool.pending("b") == 0
+
+    release.set()
+    pool.shutdown()
+
+    assert [name for name in order if name.startswith("a")] == ["a1", "a2", "a3"]
+    assert pool.in_flight("a") == 0
+    assert pool.pending("a") == 0
+
+
+@mock.patch.object(pooled, "_LOGGER")
+def test_commit_pool_submit_error(_LOGGER):
+    pool = pooled.CommitPool(max_workers=1, max_in_flight_per_topic=1)
+    done = threading.Event()
+
+    pool.submit("topic", mock.Mock(side_effect=RuntimeError, spec=()))
+    pool.submit("topic", done.set)
+    assert done.wait(5)
+    pool.shutdown()
+
+    _LOGGER.exception.assert_called_once_with("Unexpected error committing a batch.")
+
+
+def test_commit_pool_schedule_commit():
+    pool = pooled.CommitPool(max_workers=1)
+    late = mock.Mock(spec=("commit",))
+    committed = threading.Event()
+    soon = mock.Mock(spec=("commit",))
+    soon.commit.side_effect = committed.set
+
+    pool.schedule_commit(late, 60)
+    pool.schedule_commit(soon, 0.01)
+
+    # One timer thread serves every batch, waking for the earliest one.
+    assert committed.wait(5)
+    late.commit.assert_not_called()
+    assert pool._timer.name == "Thread-BatchTimerPublisher"
+
+    # Shutting down commits the batches still waiting.
+    pool.shutdown()
+    late.commit.assert_called_once_with()
+    assert not pool._timer.is_alive()
+
+    with pytest.raises(RuntimeError):
+        pool.schedule_commit(soon, 0)
+
+
+@mock.patch.object(pooled, "_TIMER_IDLE_TIMEOUT", 0.01)
+def test_commit_pool_collected_when_idle():
+    pool = pooled.CommitPool(max_workers=1)
+    committed = threading.Event()
+    batch = mock.Mock(spec=("commit",))
+    batch.commit.side_effect = committed.set
+
+    pool.schedule_commit(batch, 0)
+    assert committed.wait(5)
+    timer = pool._timer
+    pool_ref = weakref.ref(pool)
+
+    # Once no batch waits, the timer does not keep the pool alive, and it
+    # stops when the pool is collected.
+    del pool
+    gc.collect()
+    assert pool_ref() is None
+    timer.join(5)
+    assert not timer.is_alive()
+
+
+def test_commit_pool_shutdown_forgets_pool():
+    pool = pooled.CommitPool(max_workers=1)
+    assert pool in pooled._pools
+
+    pool.shutdown()
+
+    assert pool not in pooled._pools
+
+
+def test_commit_pool_submit_after_shutdown():
+    pool = pooled.CommitPool(max_workers=1)
+    pool.shutdown()
+    commit = mock.Mock(spec=())
+
+    # Once the executor refuses work, as at interpreter exit, the batch is
+    # published in the calling thread instead of being lost.
+    pool.submit("topic", commit)
+
+    commit.assert_called_once_with()
+    assert pool.in_flight("topic") == 0
+
+
+def test_commit_pool_shutdown_twice():
+    pool = pooled.CommitPool(max_workers=1)
+    batch = mock.Mock(spec=("commit",))
+    pool.schedule_commit(batch, 60)
+
+    pool.shutdown()
+    pool.shutdown()
+
+    batch.commit.assert_called_once_with()
+
+
+def test_init_schedules_commit():
+    client = create_client()
+    with mock.patch.object(client._commit_pool, "schedule_commit") as schedule:
+        batch = create_batch(client, autocommit=True, max_latency=0.5)
+
+    schedule.assert_called_once_with(batch, 0.5)
+    assert batch._thread is None
+
+
+def test_init_infinite_latency():
+    client = create_client()
+    with mock.patch.object(client._commit_pool, "schedule_commit") as schedule:
+        create_batch(client, autocommit=True, max_latency=float("inf"))
+
+    schedule.assert_not_called()
+
+
+def test_commit():
+    client = create_client()
+    batch = create_batch(client)
+    with mock.patch.object(client._commit_pool, "submit") as submit:
+        batch.commit()
+        batch.commit()
+
+    # Committing hands the batch to the pool once, without a new thread.
+    submit.assert_called_once_with("topic_name", batch._commit)
+    assert batch.status == BatchStatus.STARTING
+
+
+def test_publish_over_latency():
+    client = create_client()
+    publish_response = types.PublishResponse(message_ids=["a"])
+    patch = mock.patch.object(
+        type(client.api), "publish", return_value=publish_response
+    )
+    with patch as publish:
+        batch = create_batch(client, autocommit=True, max_latency=0.01)
+        future = batch.publish({"data": b"This is my message."})
+        assert future.result(timeout=5) == "a"
+
+    publish.assert_called_once_with(
+        "topic_name", [types.PubsubMessage(data=b"This is my message.")]
+    )
+    assert batch.status == BatchStatus.SUCCESS
+    client._commit_pool.shutdown()
+
+
+def test_publish_commit():
+    client = create_client()
+    publish_response = types.PublishResponse(message_ids=["a", "b"])
+    patch = mock.patch.object(
+        type(client.api), "publish", return_value=publish_response
+    )
+    with patch:
+        batch = create_batch(client)
+        futures = [batch.publish({"data": b"foo"}), batch.publish({"data": b"bar"})]
+        batch.commit()
+        assert [future.result(timeout=5) for future in futures] == ["a", "b"]
+
+    assert batch.status == BatchStatus.SUCCESS
+    client._commit_pool.shutdown()
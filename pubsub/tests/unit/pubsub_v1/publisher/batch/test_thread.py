@@ -15,10 +15,13 @@
 import threading
 import time
 
+import grpc
 import mock
+import pytest
 
 import google.api_core.exceptions
 from google.auth import credentials
+from google.cloud.pubsub_v1 import metrics
 from google.cloud.pubsub_v1 import publisher
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.publisher import exceptions
@@ -149,6 +152,58 @@ def test_blocking__commit():
     assert futures[1].result() == "b"
 
 
+def create_compressing_client(compression_min_bytes):
+    transport = mock.NonCallableMock(spec=["publish"])
+    transport.publish.return_value = types.PublishResponse(message_ids=["a"])
+    options = types.PublisherOptions(
+        compression=grpc.Compression.Gzip, compression_min_bytes=compression_min_bytes
+    )
+    return publisher.Client(transport=transport, publisher_options=options)
+
+
+def test_blocking__commit_compressed():
+    client = create_compressing_client(compression_min_bytes=20)
+    batch = Batch(client, "topic_name", types.BatchSettings(), autocommit=False)
+    batch.publish({"data": b"This is my message."})
+
+    with mock.patch.object(type(client.api), "publish") as publish:
+        batch._commit()
+
+    # The call compresses the request, and keeps the GAPIC defaults.
+    publish.assert_not_called()
+    transport_publish = client.api.transport.publish
+    transport_publish.assert_called_once()
+    args, kwargs = transport_publish.call_args
+    assert args == (
+        types.PublishRequest(
+            topic="topic_name",
+            messages=[types.PubsubMessage(data=b"This is my message.")],
+        ),
+    )
+    assert kwargs["compression"] == grpc.Compression.Gzip
+    assert kwargs["timeout"] is not None
+    assert batch.status == BatchStatus.SUCCESS
+
+
+def test_blocking__commit_below_compression_min_bytes():
+    client = create_compressing_client(compression_min_bytes=1024)
+    batch = Batch(client, "topic_name", types.BatchSettings(), autocommit=False)
+    batch.publish({"data": b"This is my message."})
+
+    publish_response = types.PublishResponse(message_ids=["a"])
+    patch = mock.patch.object(
+        type(batch.client.api), "publish", return_value=publish_response
+    )
+    with patch as publish:
+        batch._commit()
+
+    # Small batches are not worth compressing.
+    publish.assert_called_once_with(
+        "topic_name", [types.PubsubMessage(data=b"This is my message.")]
+    )
+    client.api.transport.publish.assert_not_called()
+
+
 @mock.patch.object(thread, "_LOGGER")
 def test_blocking__commit_starting(_LOGGER):
     batch = create_batch()
@@ -221,6 +276,41 @@ def test_block__commmit_api_error():
         assert future.exception() == error
 
 
+def test_block__commit_records_metrics():
+    batch = create_batch()
+    recorder = batch.client.metrics = mock.create_autospec(
+        metrics.MetricsRecorder, instance=True
+    )
+    batch.publish({"data": b"foo"})
+    batch.publish({"data": b"bar"})
+
+    publish_response = types.PublishResponse(message_ids=["a", "b"])
+    patch = mock.patch.object(
+        type(batch.client.api), "publish", return_value=publish_response
+    )
+    with patch:
+        batch._commit()
+
+    recorder.record_publish_batch.assert_called_once_with(2, batch.size)
+    recorder.record_publish_latency.assert_called_once_with(mock.ANY)
+
+
+def test_block__commit_api_error_records_latency():
+    batch = create_batch()
+    recorder = batch.client.metrics = mock.create_autospec(
+        metrics.MetricsRecorder, instance=True
+    )
+    batch.publish({"data": b"foo"})
+
+    error = google.api_core.exceptions.InternalServerError("uh oh")
+    patch = mock.patch.object(type(batch.client.api), "publish", side_effect=error)
+    with patch:
+        batch._commit()
+
+    recorder.record_publish_batch.assert_called_once_with(1, batch.size)
+    recorder.record_publish_latency.assert_called_once_with(mock.ANY)
+
+
 def test_block__commmit_retry_error():
     batch = create_batch()
     futures = (
@@ -340,3 +430,59 @@ def test_publish_dict():
     )
     assert batch.messages == [expected_message]
     assert batch._futures == [future]
+
+
+def test_publish_fields():
+    batch = create_batch()
+    future = batch.publish_fields(b"foobarbaz", {"spam": u"eggs"}, 27)
+
+    # The protobuf is only built when the messages are read.
+    assert batch._messages == [(b"foobarbaz", {"spam": u"eggs"}, 27)]
+    assert batch.messages == [
+        types.PubsubMessage(data=b"foobarbaz", attributes={"spam": u"eggs"})
+    ]
+    assert len(batch) == 1
+    assert batch.size == 27
+    assert batch._futures == [future]
+
+
+def test_publish_fields_not_accepting():
+    batch = create_batch()
+    batch._status = BatchStatus.STARTING
+
+    assert batch.publish_fields(b"foo", {}, 5) is None
+    assert len(batch) == 0
+
+
+def test__discard():
+    batch = create_batch()
+    future1 = batch.publish({"data": b"foo"})
+    future2 = batch.publish({"data": b"bar"})
+    exc = ValueError()
+
+    assert batch._discard(future1, exc)
+    assert future1.exception() is exc
+    assert batch.messages == [types.PubsubMessage(data=b"bar")]
+    assert batch._futures == [future2]
+    assert batch.size == types.PubsubMessage(data=b"bar").ByteSize()
+
+    # A message can only be discarded once.
+    assert not batch._discard(future1, exc)
+
+
+def test__discard_in_progress():
+    batch = create_batch()
+    future = batch.publish({"data": b"foo"})
+    batch._status = BatchStatus.IN_PROGRESS
+
+    assert not batch._discard(future, ValueError())
+    assert not future.done()
+
+
+def test__discard_lock_held():
+    batch = create_batch()
+    future = batch.publish({"data": b"foo"})
+
+    with batch._state_lock:
+        assert not batch._discard(future, ValueError())
+    assert not future.done()
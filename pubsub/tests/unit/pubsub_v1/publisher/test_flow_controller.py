@@ -0,0 +1,189 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import mock
+import pytest
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import flow_controller
+from google.cloud.pubsub_v1.publisher import futures
+from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
+from google.cloud.pubsub_v1.publisher._batch import thread
+
+
+def make_controller(behavior, message_limit=None, byte_limit=None):
+    settings = types.PublishFlowControl(
+        message_limit=message_limit,
+        byte_limit=byte_limit,
+        limit_exceeded_behavior=behavior,
+    )
+    return flow_controller.FlowController(settings)
+
+
+def make_batch():
+    client = mock.Mock(spec=["api"])
+    return thread.Batch(client, "topic_name", types.BatchSettings(), autocommit=False)
+
+
+def publish(controller, batch, data):
+    message = types.PubsubMessage(data=data)
+    controller.add(message.ByteSize())
+    future = batch.publish(message)
+    controller.track(batch, future, message.ByteSize())
+    return future
+
+
+def test_defaults():
+    controller = flow_controller.FlowController(types.PublishFlowControl())
+    future = mock.create_autospec(futures.Future, instance=True)
+
+    for _ in range(5):
+        controller.add(1000)
+    controller.track(mock.sentinel.batch, future, 1000)
+    controller.release(1000)
+
+    # Without flow control, nothing is tracked.
+    assert controller.outstanding_messages == 0
+    assert controller.outstanding_bytes == 0
+    assert controller.load == 0.0
+    future.add_done_callback.assert_not_called()
+
+
+def test_load():
+    controller = make_controller(
+        types.LimitExceededBehavior.ERROR, message_limit=10, byte_limit=100
+    )
+    controller.add(10)
+    assert controller.load == 0.1
+    controller.add(40)
+    assert controller.load == 0.5
+
+
+def test_release():
+    controller = make_controller(types.LimitExceededBehavior.ERROR, message_limit=1)
+    controller.add(10)
+    controller.release(10)
+
+    assert controller.outstanding_messages == 0
+    assert controller.outstanding_bytes == 0
+
+
+def test_track():
+    controller = make_controller(types.LimitExceededBehavior.ERROR, byte_limit=10)
+    future = futures.Future()
+    controller.add(10)
+    controller.track(mock.sentinel.batch, future, 10)
+    assert controller.outstanding_bytes == 10
+
+    future.set_exception(ValueError())
+    assert controller.outstanding_messages == 0
+    assert controller.outstanding_bytes == 0
+
+
+def test_error():
+    controller = make_controller(
+        types.LimitExceededBehavior.ERROR, message_limit=2, byte_limit=100
+    )
+    controller.add(60)
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.add(60)
+    controller.add(40)
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.add(0)
+
+    assert controller.outstanding_messages == 2
+    assert controller.outstanding_bytes == 100
+
+
+@pytest.mark.parametrize(
+    "behavior",
+    [
+        types.LimitExceededBehavior.BLOCK,
+        types.LimitExceededBehavior.ERROR,
+        types.LimitExceededBehavior.DROP_OLDEST,
+    ],
+)
+def test_message_too_large(behavior):
+    controller = make_controller(behavior, byte_limit=100)
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.add(101)
+    assert controller.outstanding_bytes == 0
+
+
+def test_block():
+    controller = make_controller(types.LimitExceededBehavior.BLOCK, message_limit=1)
+    controller.add(10)
+    added = threading.Event()
+
+    def add():
+        controller.add(20)
+        added.set()
+
+    adder = threading.Thread(target=add)
+    adder.start()
+    assert not added.wait(0.1)
+
+    controller.release(10)
+    assert added.wait(5)
+    adder.join()
+    assert controller.outstanding_bytes == 20
+
+
+def test_drop_oldest():
+    controller = make_controller(
+        types.LimitExceededBehavior.DROP_OLDEST, message_limit=2
+    )
+    batch = make_batch()
+    future1 = publish(controller, batch, b"foo")
+    future2 = publish(controller, batch, b"bar")
+    future3 = publish(controller, batch, b"baz")
+
+    # The oldest message made room for the newest one.
+    assert isinstance(future1.exception(), exceptions.FlowControlLimitError)
+    assert not future2.done()
+    assert not future3.done()
+    assert batch.messages == [
+        types.PubsubMessage(data=b"bar"),
+        types.PubsubMessage(data=b"baz"),
+    ]
+    assert batch.size == 10
+    assert controller.outstanding_messages == 2
+
+
+def test_drop_oldest_in_progress():
+    controller = make_controller(
+        types.LimitExceededBehavior.DROP_OLDEST, message_limit=2
+    )
+    in_progress = make_batch()
+    future1 = publish(controller, in_progress, b"foo")
+    in_progress._status = BatchStatus.IN_PROGRESS
+    batch = make_batch()
+    future2 = publish(controller, batch, b"bar")
+    publish(controller, batch, b"baz")
+
+    # Messages already being published are not dropped.
+    assert not future1.done()
+    assert future2.done()
+    assert len(in_progress.messages) == 1
+    assert list(controller._droppable) == [id(batch._futures[0])]
+
+    # If no message can be dropped, the new one is not published.
+    batch._status = BatchStatus.IN_PROGRESS
+    with pytest.raises(exceptions.FlowControlLimitError):
+        publish(controller, make_batch(), b"foo")
+    assert controller.outstanding_messages == 2
+    assert not controller._droppable
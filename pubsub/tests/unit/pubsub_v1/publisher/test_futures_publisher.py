@@ -0,0 +1,81 @@
+# Copyright 2019, Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import pytest
+
+from google.cloud.pubsub_v1.publisher import futures
+
+requires_asyncio = pytest.mark.skipif(
+    futures.asyncio is None, reason="asyncio requires Python 3"
+)
+
+
+@requires_asyncio
+def test_to_asyncio_future_result():
+    loop = futures.asyncio.new_event_loop()
+    future = futures.Future()
+    async_future = futures.to_asyncio_future(future, loop=loop)
+
+    # The publish future is done on another thread.
+    threading.Thread(target=future.set_result, args=("message_id",)).start()
+
+    assert loop.run_until_complete(async_future) == "message_id"
+    loop.close()
+
+
+@requires_asyncio
+def test_to_asyncio_future_exception():
+    loop = futures.asyncio.new_event_loop()
+    future = futures.Future()
+    async_future = futures.to_asyncio_future(future, loop=loop)
+    error = ValueError("meep")
+
+    future.set_exception(error)
+
+    with pytest.raises(ValueError):
+        loop.run_until_complete(async_future)
+    loop.close()
+
+
+@requires_asyncio
+def test_to_asyncio_future_cancelled():
+    loop = futures.asyncio.new_event_loop()
+    future = futures.Future()
+    async_future = futures.to_asyncio_future(future, loop=loop)
+    async_future.cancel()
+
+    future.set_result("message_id")
+    loop.run_until_complete(futures.asyncio.sleep(0))
+
+    assert async_future.cancelled()
+    loop.close()
+
+
+@requires_asyncio
+def test_to_asyncio_future_closed_loop():
+    loop = futures.asyncio.new_event_loop()
+    future = futures.Future()
+    futures.to_asyncio_future(future, loop=loop)
+    loop.close()
+
+    future.set_result("message_id")  # no raise
+
+
+def test_to_asyncio_future_wo_asyncio(monkeypatch):
+    monkeypatch.setattr(futures, "asyncio", None)
+
+    with pytest.raises(ImportError):
+        futures.to_asyncio_future(futures.Future())
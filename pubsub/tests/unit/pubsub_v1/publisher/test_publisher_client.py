@@ -20,8 +20,15 @@ import mock
 import pytest
 
 from google.cloud.pubsub_v1.gapic import publisher_client
+from google.cloud.pubsub_v1 import metrics
 from google.cloud.pubsub_v1 import publisher
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import client as client_module
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import futures
+from google.cloud.pubsub_v1.publisher._batch import ordered
+from google.cloud.pubsub_v1.publisher._batch import pooled
+from google.cloud.pubsub_v1.publisher._batch import thread
 
 
 def test_init():
@@ -35,6 +42,81 @@ def test_init():
     assert client.batch_settings.max_latency == 0.05
     assert client.batch_settings.max_messages == 1000
 
+    # Batches commit on threads of their own by default.
+    assert client.publisher_options.max_commit_workers is None
+    assert client._batch_class is thread.Batch
+    assert client._commit_pool is None
+    assert client.metrics is None
+
+
+def test_init_w_metrics():
+    creds = mock.Mock(spec=credentials.Credentials)
+    recorder = metrics.InMemoryMetrics()
+    client = publisher.Client(credentials=creds, metrics=recorder)
+
+    assert client.metrics is recorder
+
+
+def test_init_w_commit_workers():
+    creds = mock.Mock(spec=credentials.Credentials)
+    options = types.PublisherOptions(max_commit_workers=4, max_in_flight_batches=2)
+    client = publisher.Client(credentials=creds, publisher_options=options)
+
+    assert client.publisher_options == options
+    assert client._batch_class is pooled.Batch
+    assert client._commit_pool._executor._max_workers == 4
+    assert client._commit_pool._max_in_flight == 2
+
+    batch = client._batch("topic/path", autocommit=False)
+    assert isinstance(batch, pooled.Batch)
+
+
+def test_init_w_in_flight_batches_without_commit_workers():
+    creds = mock.Mock(spec=credentials.Credentials)
+    options = types.PublisherOptions(max_in_flight_batches=2)
+    with pytest.raises(ValueError):
+        publisher.Client(credentials=creds, publisher_options=options)
+
+
+def test_init_w_commit_workers_shuts_down_at_exit():
+    creds = mock.Mock(spec=credentials.Credentials)
+    options = types.PublisherOptions(max_commit_workers=1)
+    client = publisher.Client(credentials=creds, publisher_options=options)
+
+    assert client._commit_pool in pooled._pools
+    with mock.patch.object(client._commit_pool, "shutdown") as shutdown:
+        pooled._shutdown_pools()
+    shutdown.assert_called_once_with()
+
+
+def test_stop():
+    creds = mock.Mock(spec=credentials.Credentials)
+    options = types.PublisherOptions(max_commit_workers=1)
+    client = publisher.Client(credentials=creds, publisher_options=options)
+    batch = mock.Mock(spec=("commit",))
+    client._commit_pool.schedule_commit(batch, 60)
+
+    client.stop()
+
+    # The batch waiting for its latency is published at once.
+    batch.commit.assert_called_once_with()
+    with pytest.raises(RuntimeError):
+        client.publish("topic", b"data")
+
+
+def test_stop_without_commit_workers():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+
+    client.stop()
+
+
+def test_init_w_unknown_compression():
+    creds = mock.Mock(spec=credentials.Credentials)
+    options = types.PublisherOptions(compression="zstd")
+    with pytest.raises(ValueError):
+        publisher.Client(credentials=creds, publisher_options=options)
+
 
 def test_init_w_custom_transport():
     transport = object()
@@ -86,6 +168,18 @@ def test_batch_exists():
     assert client._batches == {topic: batch}
 
 
+def test_batch_exists_without_lock():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+    client._batch_lock = mock.Mock(spec=())
+
+    topic = "topic/path"
+    client._batches[topic] = mock.sentinel.batch
+
+    # Looking up an existing batch does not take the lock.
+    assert client._batch(topic) is mock.sentinel.batch
+
+
 def test_batch_create_and_exists():
     creds = mock.Mock(spec=credentials.Credentials)
     client = publisher.Client(credentials=creds)
@@ -107,23 +201,25 @@ def test_publish():
     batch = mock.Mock(spec=client._batch_class)
     # Set the mock up to claim indiscriminately that it accepts all messages.
     batch.will_accept.return_value = True
-    batch.publish.side_effect = (mock.sentinel.future1, mock.sentinel.future2)
+    future1 = mock.Mock(spec=futures.Future)
+    future2 = mock.Mock(spec=futures.Future)
+    batch.publish_fields.side_effect = (future1, future2)
 
     topic = "topic/path"
     client._batches[topic] = batch
 
     # Begin publishing.
-    future1 = client.publish(topic, b"spam")
-    future2 = client.publish(topic, b"foo", bar="baz")
-
-    assert future1 is mock.sentinel.future1
-    assert future2 is mock.sentinel.future2
-
-    # Check mock.
-    batch.publish.assert_has_calls(
+    assert client.publish(topic, b"spam") is future1
+    assert client.publish(topic, b"foo", bar="baz") is future2
+
+    # Check mock. The protobuf messages are not built yet, but their sizes
+    # are known.
+    message1 = types.PubsubMessage(data=b"spam")
+    message2 = types.PubsubMessage(data=b"foo", attributes={"bar": "baz"})
+    batch.publish_fields.assert_has_calls(
         [
-            mock.call(types.PubsubMessage(data=b"spam")),
-            mock.call(types.PubsubMessage(data=b"foo", attributes={"bar": "baz"})),
+            mock.call(b"spam", {}, message1.ByteSize()),
+            mock.call(b"foo", {"bar": "baz"}, message2.ByteSize()),
         ]
     )
 
@@ -153,12 +249,10 @@ def test_publish_attrs_bytestring():
     # Begin publishing.
     future = client.publish(topic, b"foo", bar=b"baz")
 
-    assert future is batch.publish.return_value
+    assert future is batch.publish_fields.return_value
 
     # The attributes should have been sent as text.
-    batch.publish.assert_called_once_with(
-        types.PubsubMessage(data=b"foo", attributes={"bar": u"baz"})
-    )
+    batch.publish_fields.assert_called_once_with(b"foo", {"bar": u"baz"}, 17)
 
 
 def test_publish_new_batch_needed():
@@ -170,8 +264,9 @@ def test_publish_new_batch_needed():
     batch2 = mock.Mock(spec=client._batch_class)
     # Set the first mock up to claim indiscriminately that it rejects all
     # messages and the second accepts all.
-    batch1.publish.return_value = None
-    batch2.publish.return_value = mock.sentinel.future
+    batch1.publish_fields.return_value = None
+    future = mock.Mock(spec=futures.Future)
+    batch2.publish_fields.return_value = future
 
     topic = "topic/path"
     client._batches[topic] = batch1
@@ -181,16 +276,164 @@ def test_publish_new_batch_needed():
     client._batch_class = batch_class
 
     # Publish a message.
-    future = client.publish(topic, b"foo", bar=b"baz")
-    assert future is mock.sentinel.future
+    assert client.publish(topic, b"foo", bar=b"baz") is future
 
     # Check the mocks.
     batch_class.assert_called_once_with(
         autocommit=True, client=client, settings=client.batch_settings, topic=topic
     )
-    message_pb = types.PubsubMessage(data=b"foo", attributes={"bar": u"baz"})
-    batch1.publish.assert_called_once_with(message_pb)
-    batch2.publish.assert_called_once_with(message_pb)
+    batch1.publish_fields.assert_called_once_with(b"foo", {"bar": u"baz"}, 17)
+    batch2.publish_fields.assert_called_once_with(b"foo", {"bar": u"baz"}, 17)
+
+
+def test_publish_flow_control():
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        message_limit=1, limit_exceeded_behavior=types.LimitExceededBehavior.ERROR
+    )
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=types.PublisherOptions(flow_control=flow_control),
+    )
+    topic = "topic/path"
+    batch = client._batch(topic, autocommit=False)
+
+    future = client.publish(topic, b"foo")
+    assert client.flow_controller.outstanding_messages == 1
+    assert client.flow_controller.outstanding_bytes == 5
+    with pytest.raises(exceptions.FlowControlLimitError):
+        client.publish(topic, b"bar")
+    assert len(batch.messages) == 1
+
+    # Once the first message is done, there is room for another.
+    future.set_result("a")
+    assert client.flow_controller.outstanding_messages == 0
+    client.publish(topic, b"bar")
+    assert client.flow_controller.outstanding_messages == 1
+
+
+def test_publish_flow_control_batch_error():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+    batch = mock.Mock(spec=client._batch_class)
+    batch.publish_fields.side_effect = ValueError
+    topic = "topic/path"
+    client._batches[topic] = batch
+
+    with pytest.raises(ValueError):
+        client.publish(topic, b"foo")
+
+    assert client.flow_controller.outstanding_messages == 0
+    assert client.flow_controller.outstanding_bytes == 0
+
+
+@pytest.mark.parametrize(
+    "data,attrs",
+    [
+        (b"", {}),
+        (b"foo", {}),
+        (b"x" * 300, {}),
+        (b"", {"": ""}),
+        (b"foo", {"key": u"value", u"\u00e9t\u00e9": u"\u2603"}),
+        (b"x" * 20000, {"k" * 200: u"v" * 70000}),
+    ],
+)
+def test__message_size(data, attrs):
+    expected = types.PubsubMessage(data=data, attributes=attrs)
+    assert client_module._message_size(data, attrs) == expected.ByteSize()
+
+
+def test_publish_ordering_key_not_enabled():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+
+    with pytest.raises(ValueError):
+        client.publish_ordered("topic/path", b"foo", "key")
+
+
+def test_publish_ordering_key_attribute():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+    batch = mock.Mock(spec=client._batch_class)
+    future = mock.Mock(spec=futures.Future)
+    batch.publish_fields.return_value = future
+    topic = "topic/path"
+    client._batches[topic] = batch
+
+    # Without ``publish_ordered``, the keyword is an attribute like any other.
+    assert client.publish(topic, b"foo", ordering_key="key") is future
+
+    batch.publish_fields.assert_called_once_with(
+        b"foo", {"ordering_key": "key"}, mock.ANY
+    )
+    assert client._sequencers == {}
+
+
+def test_publish_ordering_key():
+    creds = mock.Mock(spec=credentials.Credentials)
+    options = types.PublisherOptions(enable_message_ordering=True)
+    client = publisher.Client(credentials=creds, publisher_options=options)
+    sequencer = mock.Mock(spec=ordered.Sequencer, stopped=False)
+    future = mock.Mock(spec=futures.Future)
+    sequencer.publish.return_value = (mock.sentinel.batch, future)
+    topic = "topic/path"
+    client._sequencers[(topic, "key")] = sequencer
+
+    assert client.publish_ordered(topic, b"foo", "key", bar="baz") is future
+
+    sequencer.publish.assert_called_once_with(b"foo", {"bar": "baz"}, 17)
+    assert client._batches == {}
+
+
+def test_publish_ordering_key_paused():
+    creds = mock.Mock(spec=credentials.Credentials)
+    options = types.PublisherOptions(enable_message_ordering=True)
+    client = publisher.Client(credentials=creds, publisher_options=options)
+    topic = "topic/path"
+    sequencer = client._sequencer(topic, "key")
+    sequencer._paused = True
+
+    with pytest.raises(exceptions.PublishToPausedOrderingKeyException):
+        client.publish_ordered(topic, b"foo", "key")
+    assert client.flow_controller.outstanding_messages == 0
+
+    client.resume_publish(topic, "key")
+    assert sequencer.stopped
+    assert client._sequencers == {}
+
+
+def test_sequencer_replaces_stopped():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+    topic = "topic/path"
+
+    sequencer = client._sequencer(topic, "key")
+    assert client._sequencer(topic, "key") is sequencer
+    assert client._sequencer(topic, "other") is not sequencer
+
+    sequencer._stopped = True
+    replacement = client._sequencer(topic, "key")
+    assert replacement is not sequencer
+    assert client._sequencers[(topic, "key")] is replacement
+
+    # A stopped sequencer which was replaced is not discarded.
+    client._discard_sequencer(topic, "key", sequencer)
+    assert client._sequencers[(topic, "key")] is replacement
+
+
+def test_publish_async():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+    future = mock.Mock(spec=futures.Future)
+    publish = mock.patch.object(client, "publish", return_value=future)
+    to_asyncio = mock.patch.object(futures, "to_asyncio_future", autospec=True)
+
+    with publish as publish_, to_asyncio as to_asyncio_future:
+        async_future = client.publish_async("topic", b"foo", a="b")
+
+    publish_.assert_called_once_with("topic", b"foo", a="b")
+    to_asyncio_future.assert_called_once_with(future)
+    assert async_future is to_asyncio_future.return_value
 
 
 def test_publish_attrs_type_error():
@@ -0,0 +1,115 @@
+# Copyright 2019, Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import mock
+import pytest
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import message
+from google.cloud.pubsub_v1.subscriber._protocol import callback_batcher
+
+
+def make_messages(*sizes):
+    msgs = []
+    for size in sizes:
+        msg = mock.create_autospec(message.Message, instance=True)
+        msg.size = size
+        msgs.append(msg)
+    return msgs
+
+
+def make_batcher(**settings):
+    settings.setdefault("max_latency", float("inf"))
+    schedule = mock.Mock(spec=())
+    batcher = callback_batcher.CallbackBatcher(
+        types.BatchCallbackSettings(**settings), schedule
+    )
+    return batcher, schedule
+
+
+def test_add_max_messages():
+    batcher, schedule = make_batcher(max_messages=2)
+    msgs = make_messages(1, 1, 1)
+
+    batcher.add(msgs)
+
+    schedule.assert_called_once_with(msgs[:2])
+    assert batcher._messages == msgs[2:]
+
+
+def test_add_max_bytes():
+    batcher, schedule = make_batcher(max_bytes=10)
+    msgs = make_messages(4, 4, 4, 12)
+
+    batcher.add(msgs)
+
+    # A message which does not fit starts a new batch, and a message over
+    # the limit makes a batch of its own.
+    assert schedule.mock_calls == [
+        mock.call(msgs[:2]),
+        mock.call(msgs[2:3]),
+        mock.call(msgs[3:]),
+    ]
+    assert batcher._messages == []
+    assert batcher._deadline is None
+
+
+def test_add_across_calls():
+    batcher, schedule = make_batcher(max_messages=3)
+    msgs = make_messages(1, 1, 1)
+
+    batcher.add(msgs[:2])
+    schedule.assert_not_called()
+    batcher.add(msgs[2:])
+
+    schedule.assert_called_once_with(msgs)
+
+
+def test_flush_on_latency():
+    batcher, schedule = make_batcher(max_latency=0.01)
+    scheduled = threading.Event()
+    schedule.side_effect = lambda batch: scheduled.set()
+    msgs = make_messages(1, 1)
+
+    batcher.start()
+    batcher.add(msgs)
+    assert scheduled.wait(5)
+    batcher.stop()
+
+    schedule.assert_called_once_with(msgs)
+
+
+def test_stop_discards_batch():
+    batcher, schedule = make_batcher(max_latency=60)
+    batcher.start()
+    batcher.add(make_messages(1))
+
+    batcher.stop()
+
+    schedule.assert_not_called()
+    assert batcher._messages == []
+    assert batcher._thread is None
+
+
+@mock.patch("threading.Thread", autospec=True)
+def test_start_already_started(thread):
+    batcher, _ = make_batcher()
+    batcher._thread = mock.sentinel.thread
+
+    with pytest.raises(ValueError):
+        batcher.start()
+
+    thread.assert_not_called()
@@ -14,6 +14,7 @@
 
 import threading
 
+from google.cloud.pubsub_v1 import metrics
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import helper_threads
@@ -79,6 +80,22 @@ def test_ack():
     manager.ack_histogram.add.assert_called_once_with(20)
 
 
+def test_ack_records_latency():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    manager.metrics = mock.create_autospec(metrics.MetricsRecorder, instance=True)
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    items = [
+        requests.AckRequest(ack_id="ack1", byte_size=0, time_to_ack=20),
+        requests.AckRequest(ack_id="ack2", byte_size=0, time_to_ack=None),
+    ]
+    dispatcher_.ack(items)
+
+    manager.metrics.record_ack_latency.assert_called_once_with(20)
+
+
 def test_ack_no_time():
     manager = mock.create_autospec(
         streaming_pull_manager.StreamingPullManager, instance=True
@@ -15,6 +15,7 @@
 import logging
 import threading
 
+from google.cloud.pubsub_v1 import metrics
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import histogram
@@ -121,17 +122,104 @@ def make_sleep_mark_manager_as_inactive(leaser):
     leaser._stop_event.wait = trigger_inactive
 
 
-def test_maintain_leases_ack_ids():
+@mock.patch("time.time", autospec=True)
+def test_maintain_leases_ack_ids(time):
     manager = create_manager()
     leaser_ = leaser.Leaser(manager)
     make_sleep_mark_manager_as_inactive(leaser_)
+    time.return_value = 0
     leaser_.add([requests.LeaseRequest(ack_id="my ack id", byte_size=50)])
 
+    # The lease is renewed once it is about to expire.
+    time.return_value = 6
     leaser_.maintain_leases()
 
     manager.dispatcher.modify_ack_deadline.assert_called_once_with(
         [requests.ModAckRequest(ack_id="my ack id", seconds=10)]
     )
+    assert leaser_._leased_messages["my ack id"].expires_at == 16
+
+
+@mock.patch("time.time", autospec=True)
+def test_maintain_leases_not_expiring(time):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    time.return_value = 0
+    leaser_.add([requests.LeaseRequest(ack_id="my ack id", byte_size=50)])
+
+    def trigger_inactive(timeout):
+        # Sleep until the lease is about to expire.
+        assert timeout == 4
+        manager.is_active = False
+
+    leaser_._stop_event.wait = trigger_inactive
+    time.return_value = 1
+    leaser_.maintain_leases()
+
+    manager.dispatcher.modify_ack_deadline.assert_not_called()
+
+
+@mock.patch("time.time", autospec=True)
+def test_maintain_leases_skips_stale_expirations(time):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    make_sleep_mark_manager_as_inactive(leaser_)
+    time.return_value = 0
+    leaser_.add([requests.LeaseRequest(ack_id="ack1", byte_size=50)])
+    leaser_.add([requests.LeaseRequest(ack_id="ack2", byte_size=50)])
+    leaser_.remove([requests.DropRequest(ack_id="ack1", byte_size=50)])
+
+    time.return_value = 6
+    leaser_.maintain_leases()
+
+    manager.dispatcher.modify_ack_deadline.assert_called_once_with(
+        [requests.ModAckRequest(ack_id="ack2", seconds=10)]
+    )
+    assert leaser_._expirations == [(16, "ack2")]
+
+
+@mock.patch("time.time", autospec=True)
+def test_maintain_leases_in_chunks(time):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    make_sleep_mark_manager_as_inactive(leaser_)
+    time.return_value = 0
+    ack_ids = ["ack{}".format(i) for i in range(leaser._MAX_MODACK_IDS + 1)]
+    leaser_.add(
+        [requests.LeaseRequest(ack_id=ack_id, byte_size=1) for ack_id in ack_ids]
+    )
+
+    time.return_value = 6
+    leaser_.maintain_leases()
+
+    calls = manager.dispatcher.modify_ack_deadline.call_args_list
+    assert [len(call[0][0]) for call in calls] == [leaser._MAX_MODACK_IDS, 1]
+    assert sorted(item.ack_id for call in calls for item in call[0][0]) == sorted(
+        ack_ids
+    )
+
+
+@mock.patch("time.time", autospec=True)
+def test_maintain_leases_records_extensions(time):
+    manager = create_manager()
+    manager.metrics = mock.create_autospec(metrics.MetricsRecorder, instance=True)
+    leaser_ = leaser.Leaser(manager)
+    make_sleep_mark_manager_as_inactive(leaser_)
+    time.return_value = 0
+    leaser_.add(
+        [
+            requests.LeaseRequest(ack_id="ack{}".format(i), byte_size=1)
+            for i in range(leaser._MAX_MODACK_IDS + 1)
+        ]
+    )
+
+    time.return_value = 6
+    leaser_.maintain_leases()
+
+    assert manager.metrics.record_lease_extension.mock_calls == [
+        mock.call(leaser._MAX_MODACK_IDS),
+        mock.call(1),
+    ]
 
 
 def test_maintain_leases_no_ack_ids():
@@ -155,7 +243,7 @@ def test_maintain_leases_outdated_items(time):
     leaser_.add([requests.LeaseRequest(ack_id="ack1", byte_size=50)])
 
     # Add another item at towards end of the timeline
-    time.return_value = manager.flow_control.max_lease_duration - 1
+    time.return_value = manager.flow_control.max_lease_duration - 6
     leaser_.add([requests.LeaseRequest(ack_id="ack2", byte_size=50)])
 
     # Now make sure time reports that we are at the end of our timeline.
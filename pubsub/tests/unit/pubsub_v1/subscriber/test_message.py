@@ -154,6 +154,28 @@ def test_nack():
         check_call_types(put, requests.NackRequest)
 
 
+def test_ack_messages():
+    msgs = [
+        create_message(b"foo", ack_id="ack1"),
+        create_message(b"bar", ack_id="ack2"),
+    ]
+    with mock.patch.object(message.Message, "ack", autospec=True) as ack:
+        message.ack_messages(msgs)
+
+    assert ack.mock_calls == [mock.call(msgs[0]), mock.call(msgs[1])]
+
+
+def test_nack_messages():
+    msgs = [
+        create_message(b"foo", ack_id="ack1"),
+        create_message(b"bar", ack_id="ack2"),
+    ]
+    with mock.patch.object(message.Message, "nack", autospec=True) as nack:
+        message.nack_messages(msgs)
+
+    assert nack.mock_calls == [mock.call(msgs[0]), mock.call(msgs[1])]
+
+
 def test_repr():
     data = b"foo"
     msg = create_message(data, snow="cones", orange="juice")
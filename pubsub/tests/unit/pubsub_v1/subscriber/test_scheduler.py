@@ -16,6 +16,7 @@ import concurrent.futures
 import threading
 
 import mock
+import pytest
 from six.moves import queue
 
 from google.cloud.pubsub_v1.subscriber import scheduler
@@ -50,3 +51,107 @@ def test_schedule():
     scheduler_.shutdown()
 
     assert called_with == [(("arg1",), {"kwarg1": "meep"})]
+
+
+requires_asyncio = pytest.mark.skipif(
+    scheduler.asyncio is None, reason="asyncio requires Python 3"
+)
+
+
+@requires_asyncio
+def test_is_awaitable():
+    loop = scheduler.asyncio.new_event_loop()
+    coroutine = scheduler.asyncio.sleep(0)
+
+    assert scheduler.is_awaitable(coroutine)
+    assert scheduler.is_awaitable(loop.create_future())
+    assert not scheduler.is_awaitable(None)
+    assert not scheduler.is_awaitable(mock.Mock())
+
+    coroutine.close()
+    loop.close()
+
+
+def test_asyncio_scheduler_wo_asyncio(monkeypatch):
+    monkeypatch.setattr(scheduler, "asyncio", None)
+
+    with pytest.raises(ImportError):
+        scheduler.AsyncioScheduler()
+
+
+@requires_asyncio
+def test_asyncio_schedule():
+    called_with = []
+    called = threading.Event()
+
+    def callback(*args, **kwargs):
+        called_with.append((args, kwargs))
+        called.set()
+
+    scheduler_ = scheduler.AsyncioScheduler()
+    assert isinstance(scheduler_.queue, queue.Queue)
+
+    scheduler_.schedule(callback, "arg1", kwarg1="meep")
+
+    assert called.wait(5)
+    scheduler_.shutdown()
+
+    assert called_with == [(("arg1",), {"kwarg1": "meep"})]
+    assert scheduler_._thread.name == "Thread-AsyncioScheduler"
+    assert not scheduler_._thread.is_alive()
+    assert scheduler_.loop.is_closed()
+
+
+@requires_asyncio
+def test_asyncio_schedule_coroutine():
+    scheduler_ = scheduler.AsyncioScheduler()
+    tasks = []
+    scheduled = threading.Event()
+
+    def record_tasks():
+        tasks.extend(scheduler_._tasks)
+        scheduled.set()
+
+    # The coroutine returned by the callback runs as a task.
+    scheduler_.schedule(scheduler.asyncio.sleep, 60)
+    scheduler_.schedule(record_tasks)
+    assert scheduled.wait(5)
+    assert len(tasks) == 1
+    assert not tasks[0].done()
+
+    # Shutting down cancels it.
+    scheduler_.shutdown()
+    assert tasks[0].cancelled()
+    assert not scheduler_._tasks
+
+
+@requires_asyncio
+def test_asyncio_schedule_error(caplog):
+    scheduler_ = scheduler.AsyncioScheduler()
+    called = threading.Event()
+
+    scheduler_.schedule(mock.Mock(side_effect=ValueError("meep"), spec=()))
+    scheduler_.schedule(called.set)
+
+    assert called.wait(5)
+    scheduler_.shutdown()
+    assert "exception occurred in a callback" in caplog.text
+
+
+@requires_asyncio
+def test_asyncio_shutdown_external_loop():
+    loop = scheduler.asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    scheduler_ = scheduler.AsyncioScheduler(loop=loop)
+    called = threading.Event()
+
+    scheduler_.schedule(called.set)
+    assert called.wait(5)
+    scheduler_.shutdown()
+
+    # The event loop belongs to the caller, and keeps running.
+    assert loop.is_running()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
@@ -13,23 +13,27 @@
 # limitations under the License.
 
 import logging
+import threading
 
 import mock
 import pytest
 
 from google.api_core import bidi
 from google.api_core import exceptions
+from google.cloud.pubsub_v1 import metrics
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.gapic import subscriber_client_config
 from google.cloud.pubsub_v1.subscriber import client
 from google.cloud.pubsub_v1.subscriber import message
 from google.cloud.pubsub_v1.subscriber import scheduler
+from google.cloud.pubsub_v1.subscriber._protocol import callback_batcher
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import heartbeater
 from google.cloud.pubsub_v1.subscriber._protocol import leaser
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
 import grpc
+from google.protobuf import timestamp_pb2
 
 
 @pytest.mark.parametrize(
@@ -67,6 +71,112 @@ def test__wrap_callback_errors_error():
     msg.nack.assert_called_once()
 
 
+def test__wrap_batch_callback_errors_no_error():
+    msgs = [mock.create_autospec(message.Message, instance=True)]
+    callback = mock.Mock()
+
+    streaming_pull_manager._wrap_batch_callback_errors(callback, msgs)
+
+    callback.assert_called_once_with(msgs)
+    msgs[0].nack.assert_not_called()
+
+
+def test__wrap_batch_callback_errors_error():
+    msgs = [mock.create_autospec(message.Message, instance=True) for _ in range(2)]
+    callback = mock.Mock(side_effect=ValueError("meep"))
+
+    streaming_pull_manager._wrap_batch_callback_errors(callback, msgs)
+
+    for msg in msgs:
+        msg.nack.assert_called_once()
+
+
+requires_asyncio = pytest.mark.skipif(
+    streaming_pull_manager.asyncio is None, reason="asyncio requires Python 3"
+)
+
+
+def run_on_loop(loop, func, *args):
+    results = []
+    loop.call_soon(lambda: results.append(func(*args)))
+    loop.call_soon(loop.stop)
+    loop.run_forever()
+    return results[0]
+
+
+@requires_asyncio
+def test__wrap_callback_errors_coroutine():
+    loop = streaming_pull_manager.asyncio.new_event_loop()
+    msg = mock.create_autospec(message.Message, instance=True)
+    callback = mock.Mock(
+        side_effect=lambda msg: streaming_pull_manager.asyncio.sleep(0)
+    )
+
+    task = run_on_loop(
+        loop, streaming_pull_manager._wrap_callback_errors, callback, msg
+    )
+    loop.run_until_complete(task)
+
+    callback.assert_called_once_with(msg)
+    msg.nack.assert_not_called()
+    loop.close()
+
+
+@requires_asyncio
+def test__wrap_callback_errors_coroutine_error():
+    loop = streaming_pull_manager.asyncio.new_event_loop()
+    msg = mock.create_autospec(message.Message, instance=True)
+
+    def callback(msg):
+        future = loop.create_future()
+        future.set_exception(ValueError("meep"))
+        return future
+
+    run_on_loop(loop, streaming_pull_manager._wrap_callback_errors, callback, msg)
+    loop.run_until_complete(streaming_pull_manager.asyncio.sleep(0))
+
+    msg.nack.assert_called_once()
+    loop.close()
+
+
+@requires_asyncio
+def test__wrap_batch_callback_errors_coroutine_error():
+    loop = streaming_pull_manager.asyncio.new_event_loop()
+    msgs = [mock.create_autospec(message.Message, instance=True) for _ in range(2)]
+
+    def callback(msgs):
+        future = loop.create_future()
+        future.set_exception(ValueError("meep"))
+        return future
+
+    run_on_loop(
+        loop, streaming_pull_manager._wrap_batch_callback_errors, callback, msgs
+    )
+    loop.run_until_complete(streaming_pull_manager.asyncio.sleep(0))
+
+    for msg in msgs:
+        msg.nack.assert_called_once()
+    loop.close()
+
+
+@requires_asyncio
+def test__wrap_callback_errors_coroutine_without_loop(caplog):
+    msg = mock.create_autospec(message.Message, instance=True)
+    callback = mock.Mock(
+        side_effect=lambda msg: streaming_pull_manager.asyncio.sleep(0)
+    )
+
+    # Like the ThreadScheduler, call it from a thread without an event loop.
+    thread = threading.Thread(
+        target=streaming_pull_manager._wrap_callback_errors, args=(callback, msg)
+    )
+    thread.start()
+    thread.join()
+
+    msg.nack.assert_called_once()
+    assert "Use the AsyncioScheduler" in caplog.text
+
+
 def test_constructor_and_default_state():
     manager = streaming_pull_manager.StreamingPullManager(
         mock.sentinel.client, mock.sentinel.subscription
@@ -80,6 +190,7 @@ def test_constructor_and_default_state():
     assert manager.ack_histogram is not None
     assert manager.ack_deadline == 10
     assert manager.load == 0
+    assert manager.num_streams == 1
 
     # Private state
     assert manager._client == mock.sentinel.client
@@ -99,6 +210,13 @@ def test_constructor_with_options():
     assert manager._scheduler == mock.sentinel.scheduler
 
 
+def test_constructor_invalid_num_streams():
+    with pytest.raises(ValueError):
+        streaming_pull_manager.StreamingPullManager(
+            mock.sentinel.client, mock.sentinel.subscription, num_streams=0
+        )
+
+
 def make_manager(**kwargs):
     client_ = mock.create_autospec(client.Client, instance=True)
     scheduler_ = mock.create_autospec(scheduler.Scheduler, instance=True)
@@ -116,6 +234,94 @@ def test_ack_deadline():
     assert manager.ack_deadline == 20
 
 
+def make_consumers(manager, count, is_paused=False):
+    consumers = []
+    for _ in range(count):
+        consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+        consumer.is_paused = is_paused
+        consumers.append(consumer)
+    manager._consumers = consumers
+    return consumers
+
+
+def test_maybe_pause_consumer_all_streams():
+    manager = make_manager(
+        num_streams=2, flow_control=types.FlowControl(max_messages=1)
+    )
+    consumers = make_consumers(manager, 2)
+    manager._leaser = leaser.Leaser(manager)
+    manager.leaser.add([requests.LeaseRequest(ack_id="one", byte_size=10)])
+
+    manager.maybe_pause_consumer()
+
+    # The streams share the flow control budget, so all of them pause.
+    for consumer in consumers:
+        consumer.pause.assert_called_once_with()
+
+
+def test_maybe_resume_consumer_all_streams():
+    manager = make_manager(num_streams=2)
+    consumers = make_consumers(manager, 2, is_paused=True)
+    consumers[1].is_paused = False
+    manager._leaser = leaser.Leaser(manager)
+
+    manager.maybe_resume_consumer()
+
+    consumers[0].resume.assert_called_once_with()
+    consumers[1].resume.assert_not_called()
+
+
+def test_maybe_pause_and_resume_records_metrics():
+    recorder = mock.create_autospec(metrics.MetricsRecorder, instance=True)
+    manager = make_manager(
+        flow_control=types.FlowControl(max_messages=1), metrics=recorder
+    )
+    make_consumers(manager, 2)
+    manager._leaser = leaser.Leaser(manager)
+    manager.leaser.add([requests.LeaseRequest(ack_id="one", byte_size=10)])
+
+    manager.maybe_pause_consumer()
+
+    # One pause is recorded for all the streams.
+    recorder.record_flow_control_pause.assert_called_once_with(1.0)
+
+    for consumer in manager._consumers:
+        consumer.is_paused = True
+    manager.leaser.remove([requests.DropRequest(ack_id="one", byte_size=10)])
+    manager.maybe_resume_consumer()
+
+    recorder.record_flow_control_resume.assert_called_once_with(0.0)
+
+
+def test__record_scheduler_wait():
+    recorder = mock.create_autospec(metrics.MetricsRecorder, instance=True)
+    msg = mock.create_autospec(message.Message, instance=True)
+    msg._received_timestamp = 10
+    callback = mock.Mock()
+
+    with mock.patch("time.time", return_value=12.5):
+        result = streaming_pull_manager._record_scheduler_wait(recorder, callback, msg)
+
+    assert result is callback.return_value
+    callback.assert_called_once_with(msg)
+    recorder.record_scheduler_wait.assert_called_once_with(2.5)
+
+
+def test__record_scheduler_wait_batch():
+    recorder = mock.create_autospec(metrics.MetricsRecorder, instance=True)
+    msgs = [mock.create_autospec(message.Message, instance=True) for _ in range(2)]
+    msgs[0]._received_timestamp = 10
+    msgs[1]._received_timestamp = 11
+    callback = mock.Mock()
+
+    with mock.patch("time.time", return_value=12.5):
+        streaming_pull_manager._record_scheduler_wait(recorder, callback, msgs)
+
+    # The wait of the oldest message is recorded.
+    callback.assert_called_once_with(msgs)
+    recorder.record_scheduler_wait.assert_called_once_with(2.5)
+
+
 def test_maybe_pause_consumer_wo_consumer_set():
     manager = make_manager(
         flow_control=types.FlowControl(max_messages=10, max_bytes=1000)
@@ -133,8 +339,9 @@ def test_lease_load_and_pause():
         flow_control=types.FlowControl(max_messages=10, max_bytes=1000)
     )
     manager._leaser = leaser.Leaser(manager)
-    manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
-    manager._consumer.is_paused = False
+    consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    manager._consumers = [consumer]
+    consumer.is_paused = False
 
     # This should mean that our messages count is at 10%, and our bytes
     # are at 15%; load should return the higher (0.15), and shouldn't cause
@@ -142,7 +349,7 @@ def test_lease_load_and_pause():
     manager.leaser.add([requests.LeaseRequest(ack_id="one", byte_size=150)])
     assert manager.load == 0.15
     manager.maybe_pause_consumer()
-    manager._consumer.pause.assert_not_called()
+    consumer.pause.assert_not_called()
 
     # After this message is added, the messages should be higher at 20%
     # (versus 16% for bytes).
@@ -153,7 +360,7 @@ def test_lease_load_and_pause():
     manager.leaser.add([requests.LeaseRequest(ack_id="three", byte_size=1000)])
     assert manager.load == 1.16
     manager.maybe_pause_consumer()
-    manager._consumer.pause.assert_called_once()
+    consumer.pause.assert_called_once()
 
 
 def test_drop_and_resume():
@@ -161,8 +368,9 @@ def test_drop_and_resume():
         flow_control=types.FlowControl(max_messages=10, max_bytes=1000)
     )
     manager._leaser = leaser.Leaser(manager)
-    manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
-    manager._consumer.is_paused = True
+    consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    manager._consumers = [consumer]
+    consumer.is_paused = True
 
     # Add several messages until we're over the load threshold.
     manager.leaser.add(
@@ -176,23 +384,24 @@ def test_drop_and_resume():
 
     # Trying to resume now should have no effect as we're over the threshold.
     manager.maybe_resume_consumer()
-    manager._consumer.resume.assert_not_called()
+    consumer.resume.assert_not_called()
 
     # Drop the 200 byte message, which should put us under the resume
     # threshold.
     manager.leaser.remove([requests.DropRequest(ack_id="two", byte_size=250)])
     manager.maybe_resume_consumer()
-    manager._consumer.resume.assert_called_once()
+    consumer.resume.assert_called_once()
 
 
 def test_resume_not_paused():
     manager = make_manager()
-    manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
-    manager._consumer.is_paused = False
+    consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    manager._consumers = [consumer]
+    consumer.is_paused = False
 
     # Resuming should have no effect is the consumer is not actually paused.
     manager.maybe_resume_consumer()
-    manager._consumer.resume.assert_not_called()
+    consumer.resume.assert_not_called()
 
 
 def test_maybe_resume_consumer_wo_consumer_set():
@@ -262,31 +471,62 @@ def test_send_unary_error(caplog):
 def test_send_streaming():
     manager = make_manager()
     manager._UNARY_REQUESTS = False
-    manager._rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
+    rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
+    manager._rpcs = [rpc]
 
     manager.send(mock.sentinel.request)
 
-    manager._rpc.send.assert_called_once_with(mock.sentinel.request)
+    rpc.send.assert_called_once_with(mock.sentinel.request)
 
 
 def test_heartbeat():
     manager = make_manager()
-    manager._rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
-    manager._rpc.is_active = True
+    rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
+    manager._rpcs = [rpc]
+    rpc.is_active = True
+
+    manager.heartbeat()
+
+    rpc.send.assert_called_once_with(types.StreamingPullRequest())
+
+
+def test_send_streaming_num_streams():
+    manager = make_manager(num_streams=2)
+    manager._UNARY_REQUESTS = False
+    inactive = mock.create_autospec(bidi.BidiRpc, instance=True)
+    inactive.is_active = False
+    active = mock.create_autospec(bidi.BidiRpc, instance=True)
+    active.is_active = True
+    manager._rpcs = [inactive, active]
+
+    manager.send(mock.sentinel.request)
+
+    inactive.send.assert_not_called()
+    active.send.assert_called_once_with(mock.sentinel.request)
+
+
+def test_heartbeat_num_streams():
+    manager = make_manager(num_streams=2)
+    rpcs = [mock.create_autospec(bidi.BidiRpc, instance=True) for _ in range(2)]
+    for rpc in rpcs:
+        rpc.is_active = True
+    manager._rpcs = rpcs
 
     manager.heartbeat()
 
-    manager._rpc.send.assert_called_once_with(types.StreamingPullRequest())
+    for rpc in rpcs:
+        rpc.send.assert_called_once_with(types.StreamingPullRequest())
 
 
 def test_heartbeat_inactive():
     manager = make_manager()
-    manager._rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
-    manager._rpc.is_active = False
+    rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
+    manager._rpcs = [rpc]
+    rpc.is_active = False
 
     manager.heartbeat()
 
-    manager._rpc.send.assert_not_called()
+    rpc.send.assert_not_called()
 
 
 @mock.patch("google.api_core.bidi.ResumableBidiRpc", autospec=True)
@@ -315,9 +555,11 @@ def test_open(heartbeater, dispatcher, leaser, background_consumer, resumable_bi
     leaser.return_value.start.assert_called_once()
     assert manager.leaser == leaser.return_value
 
-    background_consumer.assert_called_once_with(manager._rpc, manager._on_response)
+    background_consumer.assert_called_once_with(
+        resumable_bidi_rpc.return_value, manager._on_response
+    )
     background_consumer.return_value.start.assert_called_once()
-    assert manager._consumer == background_consumer.return_value
+    assert manager._consumers == [background_consumer.return_value]
 
     resumable_bidi_rpc.assert_called_once_with(
         start_rpc=manager._client.api.streaming_pull,
@@ -327,16 +569,139 @@ def test_open(heartbeater, dispatcher, leaser, background_consumer, resumable_bi
     resumable_bidi_rpc.return_value.add_done_callback.assert_called_once_with(
         manager._on_rpc_done
     )
-    assert manager._rpc == resumable_bidi_rpc.return_value
+    assert manager._rpcs == [resumable_bidi_rpc.return_value]
 
-    manager._consumer.is_active = True
+    background_consumer.return_value.is_active = True
     assert manager.is_active is True
 
 
+@mock.patch("google.api_core.bidi.ResumableBidiRpc", autospec=True)
+@mock.patch("google.api_core.bidi.BackgroundConsumer", autospec=True)
+@mock.patch("google.cloud.pubsub_v1.subscriber._protocol.leaser.Leaser", autospec=True)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.heartbeater.Heartbeater", autospec=True
+)
+def test_open_num_streams(
+    heartbeater, dispatcher, leaser, background_consumer, resumable_bidi_rpc
+):
+    manager = make_manager(num_streams=3)
+
+    manager.open(mock.sentinel.callback)
+
+    # Every stream has its own RPC and consumer, and they share the rest.
+    assert resumable_bidi_rpc.call_count == 3
+    assert background_consumer.call_count == 3
+    assert background_consumer.return_value.start.call_count == 3
+    assert len(manager._rpcs) == 3
+    assert len(manager._consumers) == 3
+    dispatcher.assert_called_once_with(manager, manager._scheduler.queue)
+    leaser.assert_called_once_with(manager)
+    heartbeater.assert_called_once_with(manager)
+
+
+@mock.patch("google.api_core.bidi.ResumableBidiRpc", autospec=True)
+@mock.patch("google.api_core.bidi.BackgroundConsumer", autospec=True)
+@mock.patch("google.cloud.pubsub_v1.subscriber._protocol.leaser.Leaser", autospec=True)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.heartbeater.Heartbeater", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.callback_batcher.CallbackBatcher",
+    autospec=True,
+)
+def test_open_batch_settings(batcher, *unused_mocks):
+    settings = types.BatchCallbackSettings()
+    manager = make_manager(batch_settings=settings)
+
+    manager.open(mock.sentinel.callback)
+
+    batcher.assert_called_once_with(settings, mock.ANY)
+    batcher.return_value.start.assert_called_once_with()
+    assert manager._batcher == batcher.return_value
+
+    # Batches are scheduled with the wrapped batch callback.
+    schedule = batcher.call_args[0][1]
+    schedule(mock.sentinel.messages)
+    manager._scheduler.schedule.assert_called_once_with(
+        manager._callback, mock.sentinel.messages
+    )
+    assert manager._callback.func is streaming_pull_manager._wrap_batch_callback_errors
+
+
+@mock.patch("google.api_core.bidi.ResumableBidiRpc", autospec=True)
+@mock.patch("google.api_core.bidi.BackgroundConsumer", autospec=True)
+@mock.patch("google.cloud.pubsub_v1.subscriber._protocol.leaser.Leaser", autospec=True)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.heartbeater.Heartbeater", autospec=True
+)
+def test_open_metrics(*unused_mocks):
+    recorder = mock.create_autospec(metrics.MetricsRecorder, instance=True)
+    manager = make_manager(metrics=recorder)
+
+    manager.open(mock.sentinel.callback)
+
+    # The callback records how long the messages waited for it.
+    assert manager.metrics is recorder
+    assert manager._callback.func is streaming_pull_manager._record_scheduler_wait
+    assert manager._callback.args[0] is recorder
+    assert (
+        manager._callback.args[1].func is streaming_pull_manager._wrap_callback_errors
+    )
+
+
+@mock.patch("google.api_core.bidi.ResumableBidiRpc", autospec=True)
+@mock.patch("google.api_core.bidi.BackgroundConsumer", autospec=True)
+@mock.patch("google.cloud.pubsub_v1.subscriber._protocol.leaser.Leaser", autospec=True)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.heartbeater.Heartbeater", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.callback_batcher.CallbackBatcher",
+    autospec=True,
+)
+def test_open_batch_settings_metrics(batcher, *unused_mocks):
+    recorder = mock.create_autospec(metrics.MetricsRecorder, instance=True)
+    manager = make_manager(
+        batch_settings=types.BatchCallbackSettings(), metrics=recorder
+    )
+    callback = mock.Mock(spec=())
+
+    manager.open(callback)
+
+    # Batches are scheduled with the callback recording the scheduler wait.
+    schedule = batcher.call_args[0][1]
+    schedule(mock.sentinel.messages)
+    manager._scheduler.schedule.assert_called_once_with(
+        manager._callback, mock.sentinel.messages
+    )
+    assert manager._callback.func is streaming_pull_manager._record_scheduler_wait
+
+    oldest = mock.Mock(spec=("_received_timestamp",), _received_timestamp=10.0)
+    messages = [oldest, mock.sentinel.message]
+    with mock.patch("time.time", return_value=12.5):
+        manager._callback(messages)
+
+    recorder.record_scheduler_wait.assert_called_once_with(2.5)
+    callback.assert_called_once_with(messages)
+
+
 def test_open_already_active():
     manager = make_manager()
-    manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
-    manager._consumer.is_active = True
+    consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    manager._consumers = [consumer]
+    consumer.is_active = True
 
     with pytest.raises(ValueError, match="already open"):
         manager.open(mock.sentinel.callback)
@@ -352,15 +717,16 @@ def test_open_has_been_closed():
 
 def make_running_manager():
     manager = make_manager()
-    manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
-    manager._consumer.is_active = True
+    consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    manager._consumers = [consumer]
+    consumer.is_active = True
     manager._dispatcher = mock.create_autospec(dispatcher.Dispatcher, instance=True)
     manager._leaser = mock.create_autospec(leaser.Leaser, instance=True)
     manager._heartbeater = mock.create_autospec(heartbeater.Heartbeater, instance=True)
 
     return (
         manager,
-        manager._consumer,
+        consumer,
         manager._dispatcher,
         manager._leaser,
         manager._heartbeater,
@@ -384,6 +750,18 @@ def test_close():
     assert manager.is_active is False
 
 
+def test_close_batcher():
+    manager, _, _, _, _, _ = make_running_manager()
+    batcher = manager._batcher = mock.create_autospec(
+        callback_batcher.CallbackBatcher, instance=True
+    )
+
+    manager.close()
+
+    batcher.stop.assert_called_once_with()
+    assert manager._batcher is None
+
+
 def test_close_inactive_consumer():
     manager, consumer, dispatcher, leaser, heartbeater, scheduler = (
         make_running_manager()
@@ -477,6 +855,60 @@ def test_on_response():
         assert isinstance(call[1][1], message.Message)
 
 
+def test_on_response_batcher():
+    manager, _, dispatcher, _, _, scheduler = make_running_manager()
+    manager._callback = mock.sentinel.callback
+    batcher = manager._batcher = mock.create_autospec(
+        callback_batcher.CallbackBatcher, instance=True
+    )
+
+    response = types.StreamingPullResponse(
+        received_messages=[
+            types.ReceivedMessage(
+                ack_id="fack", message=types.PubsubMessage(data=b"foo", message_id="1")
+            ),
+            types.ReceivedMessage(
+                ack_id="back", message=types.PubsubMessage(data=b"bar", message_id="2")
+            ),
+        ]
+    )
+
+    manager._on_response(response)
+
+    # The messages are handed to the batcher rather than scheduled one by one.
+    scheduler.schedule.assert_not_called()
+    batcher.add.assert_called_once()
+    msgs = batcher.add.call_args[0][0]
+    assert [msg.ack_id for msg in msgs] == ["fack", "back"]
+
+
+def test_on_response_records_delivery_latency():
+    manager, _, _, _, _, scheduler = make_running_manager()
+    manager._callback = mock.sentinel.callback
+    recorder = manager._metrics = mock.create_autospec(
+        metrics.MetricsRecorder, instance=True
+    )
+
+    response = types.StreamingPullResponse(
+        received_messages=[
+            types.ReceivedMessage(
+                ack_id="fack",
+                message=types.PubsubMessage(
+                    data=b"foo",
+                    message_id="1",
+                    publish_time=timestamp_pb2.Timestamp(seconds=10, nanos=500000000),
+                ),
+            )
+        ]
+    )
+
+    with mock.patch("time.time", return_value=12):
+        manager._on_response(response)
+
+    recorder.record_delivery_latency.assert_called_once_with(1.5)
+    scheduler.schedule.assert_called_once()
+
+
 def test_retryable_stream_errors():
     # Make sure the config matches our hard-coded tuple of exceptions.
     interfaces = subscriber_client_config.config["interfaces"]
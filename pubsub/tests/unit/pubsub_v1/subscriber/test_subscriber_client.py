@@ -15,6 +15,7 @@
 from google.auth import credentials
 import mock
 
+from google.cloud.pubsub_v1 import metrics
 from google.cloud.pubsub_v1 import subscriber
 from google.cloud.pubsub_v1.gapic import subscriber_client
 from google.cloud.pubsub_v1 import types
@@ -25,6 +26,26 @@ def test_init():
     creds = mock.Mock(spec=credentials.Credentials)
     client = subscriber.Client(credentials=creds)
     assert isinstance(client.api, subscriber_client.SubscriberClient)
+    assert client.metrics is None
+
+
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager."
+    "StreamingPullManager.open",
+    autospec=True,
+)
+def test_init_w_metrics(manager_open):
+    creds = mock.Mock(spec=credentials.Credentials)
+    recorder = metrics.InMemoryMetrics()
+    client = subscriber.Client(credentials=creds, metrics=recorder)
+
+    future = client.subscribe("sub_name_a", callback=mock.sentinel.callback)
+    batch_future = client.subscribe_batch("sub_name_a", callback=mock.sentinel.callback)
+
+    # The subscriptions record into the client's recorder.
+    assert client.metrics is recorder
+    assert future._manager.metrics is recorder
+    assert batch_future._manager.metrics is recorder
 
 
 def test_init_w_custom_transport():
@@ -91,10 +112,33 @@ def test_subscribe_options(manager_open):
         callback=mock.sentinel.callback,
         flow_control=flow_control,
         scheduler=scheduler,
+        num_streams=3,
     )
     assert isinstance(future, futures.StreamingPullFuture)
 
     assert future._manager._subscription == "sub_name_a"
     assert future._manager.flow_control == flow_control
     assert future._manager._scheduler == scheduler
+    assert future._manager.num_streams == 3
+    manager_open.assert_called_once_with(mock.ANY, mock.sentinel.callback)
+
+
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager."
+    "StreamingPullManager.open",
+    autospec=True,
+)
+def test_subscribe_batch(manager_open):
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds)
+
+    future = client.subscribe_batch(
+        "sub_name_a", callback=mock.sentinel.callback, batch_settings=(10,)
+    )
+    assert isinstance(future, futures.StreamingPullFuture)
+
+    assert future._manager._subscription == "sub_name_a"
+    assert future._manager._batch_settings == types.BatchCallbackSettings(
+        max_messages=10
+    )
     manager_open.assert_called_once_with(mock.ANY, mock.sentinel.callback)
@@ -32,9 +32,30 @@ def test_constructor_defaults():
     assert future._result == futures.Future._SENTINEL
     assert future._exception == futures.Future._SENTINEL
     assert future._callbacks == []
-    assert future._completed is Event.return_value
+    assert future._completed is None
 
-    Event.assert_called_once_with()
+    # The event is only created once something waits for the future.
+    Event.assert_not_called()
+
+
+def test_exception_creates_event():
+    future = _future()
+
+    with pytest.raises(exceptions.TimeoutError):
+        future.exception(timeout=0)
+
+    assert isinstance(future._completed, threading.Event)
+    assert not future._completed.is_set()
+    future.set_result("12345")
+    assert future._completed.is_set()
+
+
+def test_exception_creates_event_when_done():
+    future = _future()
+    future.set_result("12345")
+
+    assert future.exception(timeout=0) is None
+    assert future._completed.is_set()
 
 
 def test_constructor_explicit_completed():
@@ -0,0 +1,75 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.cloud.pubsub_v1 import metrics
+
+
+def test_recorder_does_nothing():
+    recorder = metrics.MetricsRecorder()
+
+    recorder.record_delivery_latency(1.0)
+    recorder.record_scheduler_wait(1.0)
+    recorder.record_ack_latency(1)
+    recorder.record_flow_control_pause(1.0)
+    recorder.record_flow_control_resume(0.5)
+    recorder.record_lease_extension(10)
+    recorder.record_publish_batch(10, 100)
+    recorder.record_publish_latency(1.0)
+
+
+def test_distribution_empty():
+    distribution = metrics.Distribution()
+
+    assert distribution.count == 0
+    assert distribution.total == 0
+    assert distribution.mean is None
+    assert distribution.min is None
+    assert distribution.max is None
+
+
+def test_distribution():
+    distribution = metrics.Distribution()
+    for value in (3, 1, 2):
+        distribution.add(value)
+
+    assert distribution.count == 3
+    assert distribution.total == 6
+    assert distribution.mean == 2.0
+    assert distribution.min == 1
+    assert distribution.max == 3
+    assert repr(distribution) == "Distribution(count=3, mean=2.0, min=1, max=3)"
+
+
+def test_in_memory_metrics():
+    recorder = metrics.InMemoryMetrics()
+
+    recorder.record_delivery_latency(0.5)
+    recorder.record_scheduler_wait(0.25)
+    recorder.record_ack_latency(2)
+    recorder.record_flow_control_pause(1.0)
+    recorder.record_flow_control_pause(1.2)
+    recorder.record_flow_control_resume(0.5)
+    recorder.record_lease_extension(10)
+    recorder.record_publish_batch(10, 100)
+    recorder.record_publish_latency(0.1)
+
+    assert recorder.delivery_latency.total == 0.5
+    assert recorder.scheduler_wait.total == 0.25
+    assert recorder.ack_latency.total == 2
+    assert recorder.flow_control_pauses == 2
+    assert recorder.flow_control_resumes == 1
+    assert recorder.lease_extensions.total == 10
+    assert recorder.publish_batch_messages.total == 10
+    assert recorder.publish_batch_bytes.total == 100
+    assert recorder.publish_latency.count == 1
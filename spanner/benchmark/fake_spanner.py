@@ -0,0 +1,266 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An in-process fake Cloud Spanner backend for the YCSB client.
+
+The fake serves the Spanner gRPC API from a local server, so that the
+benchmark exercises the real client library (session pool, protobuf
+encoding, streaming result sets) without network access or a Cloud
+project.  Data lives in memory; the server can add a seeded, exponentially
+distributed service delay to each call to model backend latency.
+
+Only the subset of the API used by ``ycsb.py`` is implemented.
+"""
+
+import bisect
+import random
+import re
+import string
+import threading
+import time
+import uuid
+
+from concurrent import futures
+
+import grpc
+
+from google.auth.credentials import AnonymousCredentials
+from google.protobuf import empty_pb2
+from google.protobuf import struct_pb2
+from google.protobuf import timestamp_pb2
+
+from google.cloud import spanner
+from google.cloud.spanner_v1.gapic.spanner_client import SpannerClient
+from google.cloud.spanner_v1.proto import result_set_pb2
+from google.cloud.spanner_v1.proto import spanner_pb2
+from google.cloud.spanner_v1.proto import spanner_pb2_grpc
+from google.cloud.spanner_v1.proto import type_pb2
+
+
+NUM_FIELD = 10
+FIELD_LENGTH = 100
+
+_SELECT_KEYS = re.compile(r'^SELECT u\.id FROM (\w+) u$')
+_SELECT_ROW = re.compile(r'^SELECT u\.\* FROM (\w+) u WHERE u\.id="(.*)"$')
+
+
+def _random_value(rng):
+    return ''.join(rng.choice(string.ascii_letters)
+                   for _ in range(FIELD_LENGTH))
+
+
+class FakeSpanner(spanner_pb2_grpc.SpannerServicer):
+    """In-memory servicer for a single YCSB ``usertable``.
+
+    :type table: str
+    :param table: the name of the table served.
+
+    :type record_count: int
+    :param record_count: number of rows to preload, keyed ``user<N>``.
+
+    :type latency_ms: float
+    :param latency_ms: mean of the exponentially distributed delay added to
+                       each data call;  zero disables the delay.
+
+    :type seed: int
+    :param seed: seed for the preloaded data and the latency distribution.
+    """
+
+    def __init__(self, table, record_count, latency_ms=0.0, seed=0):
+        self._table = table
+        self._latency_ms = latency_ms
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._columns = ['id'] + ['field%d' % i for i in range(NUM_FIELD)]
+        self._rows = {}
+        for i in range(record_count):
+            key = 'user%d' % i
+            self._rows[key] = [key] + [
+                _random_value(self._rng) for _ in range(NUM_FIELD)]
+        self._keys = sorted(self._rows)
+
+    def _delay(self):
+        if self._latency_ms <= 0.0:
+            return
+        with self._lock:
+            delay_ms = self._rng.expovariate(1.0 / self._latency_ms)
+        time.sleep(delay_ms / 1000.0)
+
+    def _check_table(self, table, context):
+        if table != self._table:
+            context.abort(grpc.StatusCode.NOT_FOUND,
+                          'Table not found: %s' % table)
+
+    def _result_set(self, columns, rows):
+        string_type = type_pb2.Type(code=type_pb2.STRING)
+        fields = [type_pb2.StructType.Field(name=name, type=string_type)
+                  for name in columns]
+        metadata = result_set_pb2.ResultSetMetadata(
+            row_type=type_pb2.StructType(fields=fields))
+        indexes = [self._columns.index(name) for name in columns]
+        values = [struct_pb2.Value(string_value=row[index])
+                  for row in rows for index in indexes]
+        return result_set_pb2.PartialResultSet(
+            metadata=metadata, values=values)
+
+    def CreateSession(self, request, context):
+        return spanner_pb2.Session(
+            name='%s/sessions/%s' % (request.database, uuid.uuid4().hex))
+
+    def GetSession(self, request, context):
+        return spanner_pb2.Session(name=request.name)
+
+    def DeleteSession(self, request, context):
+        return empty_pb2.Empty()
+
+    def ExecuteStreamingSql(self, request, context):
+        self._delay()
+        match = _SELECT_KEYS.match(request.sql)
+        if match is not None:
+            self._check_table(match.group(1), context)
+            with self._lock:
+                rows = [self._rows[key] for key in self._keys]
+            yield self._result_set(['id'], rows)
+            return
+
+        match = _SELECT_ROW.match(request.sql)
+        if match is not None:
+            self._check_table(match.group(1), context)
+            with self._lock:
+                row = self._rows.get(match.group(2))
+            rows = [] if row is None else [list(row)]
+            yield self._result_set(self._columns, rows)
+            return
+
+        context.abort(grpc.StatusCode.INVALID_ARGUMENT,
+                      'Unsupported query: %s' % request.sql)
+
+    def StreamingRead(self, request, context):
+        self._delay()
+        self._check_table(request.table, context)
+        key_set = request.key_set
+        with self._lock:
+            if key_set.all:
+                keys = list(self._keys)
+            else:
+                keys = [value.values[0].string_value
+                        for value in key_set.keys]
+                for key_range in key_set.ranges:
+                    keys.extend(self._keys_in_range(key_range))
+            rows = [list(self._rows[key]) for key in keys
+                    if key in self._rows]
+        if request.limit:
+            rows = rows[:request.limit]
+        yield self._result_set(list(request.columns), rows)
+
+    def _keys_in_range(self, key_range):
+        # An empty key is a prefix of every key, so it leaves that end open.
+        start, end = 0, len(self._keys)
+        start_key = self._range_key(key_range, 'start_key_type')
+        if start_key is not None:
+            bound, key = start_key
+            bisect_start = (bisect.bisect_left if bound == 'start_closed'
+                            else bisect.bisect_right)
+            start = bisect_start(self._keys, key)
+        end_key = self._range_key(key_range, 'end_key_type')
+        if end_key is not None:
+            bound, key = end_key
+            bisect_end = (bisect.bisect_right if bound == 'end_closed'
+                          else bisect.bisect_left)
+            end = bisect_end(self._keys, key)
+        return self._keys[start:end]
+
+    @staticmethod
+    def _range_key(key_range, oneof):
+        bound = key_range.WhichOneof(oneof)
+        if bound is None or not getattr(key_range, bound).values:
+            return None
+        return bound, getattr(key_range, bound).values[0].string_value
+
+    def Commit(self, request, context):
+        self._delay()
+        with self._lock:
+            for mutation in request.mutations:
+                kind = mutation.WhichOneof('operation')
+                if kind == 'delete':
+                    context.abort(grpc.StatusCode.UNIMPLEMENTED,
+                                  'Deletes are not supported.')
+                write = getattr(mutation, kind)
+                self._check_table(write.table, context)
+                self._apply(kind, write, context)
+        commit_timestamp = timestamp_pb2.Timestamp()
+        commit_timestamp.GetCurrentTime()
+        return spanner_pb2.CommitResponse(commit_timestamp=commit_timestamp)
+
+    def _apply(self, kind, write, context):
+        indexes = [self._columns.index(name) for name in write.columns]
+        for list_value in write.values:
+            values = [value.string_value for value in list_value.values]
+            key = values[indexes.index(0)]
+            row = self._rows.get(key)
+            if kind == 'insert' and row is not None:
+                context.abort(grpc.StatusCode.ALREADY_EXISTS,
+                              'Row already exists: %s' % key)
+            if kind == 'update' and row is None:
+                context.abort(grpc.StatusCode.NOT_FOUND,
+                              'Row not found: %s' % key)
+            if row is None or kind == 'replace':
+                row = [key] + [''] * NUM_FIELD
+                if key not in self._rows:
+                    bisect.insort(self._keys, key)
+                self._rows[key] = row
+            for index, value in zip(indexes, values):
+                row[index] = value
+
+
+def start_server(servicer, max_workers=10):
+    """Serves ``servicer`` on an ephemeral local port.
+
+    :rtype: tuple
+    :returns: the started :class:`grpc.Server` and its ``host:port``.
+    """
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    spanner_pb2_grpc.add_SpannerServicer_to_server(servicer, server)
+    port = server.add_insecure_port('localhost:0')
+    server.start()
+    return server, 'localhost:%d' % port
+
+
+def open_database(parameters):
+    """Opens a database backed by a freshly started fake server.
+
+    Recognizes the ``recordcount``, ``fake.latency_ms`` and ``seed``
+    parameters in addition to those used by ``ycsb.open_database``.
+
+    :rtype: tuple
+    :returns: the database and the server, which the caller must stop.
+    """
+    num_worker = int(parameters['num_worker'])
+    servicer = FakeSpanner(
+        parameters['table'],
+        int(parameters.get('recordcount', 1000)),
+        latency_ms=float(parameters.get('fake.latency_ms', 0.0)),
+        seed=int(parameters.get('seed', 0)))
+    server, address = start_server(servicer, max_workers=num_worker + 2)
+
+    client = spanner.Client(
+        project='fake-project', credentials=AnonymousCredentials())
+    instance = client.instance(
+        parameters.get('cloudspanner.instance', 'fake-instance'))
+    pool = spanner.BurstyPool(num_worker)
+    database = instance.database(
+        parameters.get('cloudspanner.database', 'fake-database'), pool=pool)
+    database._spanner_api = SpannerClient(
+        channel=grpc.insecure_channel(address))
+    return database, server
@@ -28,24 +28,55 @@ Usage:
     -p recordcount=5000 -p operationcount=100 -p cloudspanner.database=ycsb \
     -p num_worker=1
 
+  # Run at a fixed rate of 500 ops/sec after a 10 second warm-up, against
+  # an in-process fake backend with a mean service time of 2ms.
+  $ python spanner/benchmark/ycsb.py run cloud_spanner -P pkb/workloada \
+    -p table=usertable -p recordcount=5000 -p operationcount=20000 \
+    -p num_worker=16 -p target=500 -p warmuptime=10 \
+    -p cloudspanner.fake=true -p fake.latency_ms=2 -p seed=42
+
   # To make a package so it can work with PerfKitBenchmarker.
   $ cd spanner; tar -cvzf ycsb-python.0.0.5.tar.gz benchmark/*
 
+Parameters (``-p key=value``, overriding the workload file):
+
+  operationcount     Number of measured operations, across all workers.
+  num_worker         Number of worker threads.
+  target             Target throughput in ops/sec across all workers.  When
+                     set, operations are issued on a fixed schedule and the
+                     latency from each operation's *intended* start time is
+                     reported as ``[Intended-<OP>]``, which corrects for
+                     coordinated omission.  When unset, workers run closed
+                     loop as fast as they can.
+  warmuptime         Seconds to run before measurement starts (default 0).
+  maxexecutiontime   Stop measuring after this many seconds.
+  maxscanlength      Maximum number of rows returned by a scan (default 100).
+  seed               Seed for the operation mix and key choice.
+  hdrhistogram.output.path
+                     If set, write each histogram's percentile distribution
+                     to ``<path><OP>.hdr``.
+  cloudspanner.fake  If ``true``, run against an in-process fake backend
+                     (see ``fake_spanner.py``) instead of Cloud Spanner.
+
 """
 
+from google.api_core.exceptions import GoogleAPICallError
 from google.cloud import spanner
 
 import argparse
-import numpy
+import math
 import random
 import string
 import threading
+import time
 import timeit
 
 
 OPERATIONS = ['readproportion', 'updateproportion', 'scanproportion',
               'insertproportion']
 NUM_FIELD = 10
+DEFAULT_MAX_SCAN_LENGTH = 100
+REPORTED_PERCENTILES = (50.0, 95.0, 99.0, 99.9, 99.99)
 
 
 def parse_options():
@@ -67,16 +98,18 @@ def parse_options():
     parameters['command'] = args.command
     parameters['num_bucket'] = args.num_bucket
 
-    for parameter in args.parameters:
-        parts = parameter.strip().split('=')
-        parameters[parts[0]] = parts[1]
+    if args.workload:
+        with open(args.workload, 'r') as f:
+            for line in f.readlines():
+                line = line.strip()
+                if not line or line.startswith('#') or '=' not in line:
+                    continue
+                key, value = line.split('=', 1)
+                parameters[key.strip()] = value.strip()
 
-    with open(args.workload, 'r') as f:
-        for line in f.readlines():
-            parts = line.split('=')
-            key = parts[0].strip()
-            if key in OPERATIONS:
-                parameters[key] = parts[1].strip()
+    for parameter in args.parameters:
+        key, value = parameter.strip().split('=', 1)
+        parameters[key] = value
 
     return parameters
 
@@ -100,8 +133,8 @@ def load_keys(database, parameters):
         results = snapshot.execute_sql(
             'SELECT u.id FROM %s u' % parameters['table'])
 
-    for row in results:
-        keys.append(row[0])
+        for row in results:
+            keys.append(row[0])
 
     return keys
 
@@ -113,79 +146,322 @@ def read(database, table, key):
                                       (table, key))
         for row in result:
             key = row[0]
-        for i in range(NUM_FIELD):
-            field = row[i + 1]
+            for i in range(NUM_FIELD):
+                field = row[i + 1]
 
 
-def update(database, table, key):
+def update(database, table, key, rng):
     """Does a single update operation."""
-    field = random.randrange(10)
-    value = ''.join(random.choice(string.printable) for i in range(100))
+    field = rng.randrange(NUM_FIELD)
+    value = ''.join(rng.choice(string.printable) for i in range(100))
     with database.batch() as batch:
         batch.update(table=table, columns=('id', 'field%d' % field),
                      values=[(key, value)])
 
 
-def do_operation(database, keys, table, operation, latencies_ms):
-    """Does a single operation and records latency."""
-    key = random.choice(keys)
-    start = timeit.default_timer()
-    if operation == 'read':
-        read(database, table, key)
-    elif operation == 'update':
-        update(database, table,  key)
-    else:
-        raise ValueError('Unknown operation: %s' % operation)
-    end = timeit.default_timer()
-    latencies_ms[operation].append((end - start) * 1000)
+def scan(database, table, key, rng, max_scan_length):
+    """Does a single scan operation, starting at ``key``."""
+    columns = ['id'] + ['field%d' % i for i in range(NUM_FIELD)]
+    key_set = spanner.KeySet(ranges=[spanner.KeyRange(start_closed=[key])])
+    limit = rng.randint(1, max_scan_length)
+    with database.snapshot() as snapshot:
+        for row in snapshot.read(table, columns, key_set, limit=limit):
+            key = row[0]
 
 
-def aggregate_metrics(latencies_ms, duration_ms, num_bucket):
-    """Aggregates metrics."""
-    overall_op_count = 0
-    op_counts = {operation : len(latency) for operation,
-                 latency in latencies_ms.iteritems()}
-    overall_op_count = sum([op_count for op_count in op_counts.itervalues()])
-
-    print('[OVERALL], RunTime(ms), %f' % duration_ms)
-    print('[OVERALL], Throughput(ops/sec), %f' % (float(overall_op_count) /
-                                                duration_ms * 1000.0))
-
-    for operation in op_counts.keys():
-        operation_upper = operation.upper()
-        print('[%s], Operations, %d' % (operation_upper, op_counts[operation]))
-        print('[%s], AverageLatency(us), %f' % (
-            operation_upper, numpy.average(latencies_ms[operation]) * 1000.0))
-        print('[%s], LatencyVariance(us), %f' % (
-            operation_upper, numpy.var(latencies_ms[operation]) * 1000.0))
-        print('[%s], MinLatency(us), %f' % (
-            operation_upper, min(latencies_ms[operation]) * 1000.0))
-        print('[%s], MaxLatency(us), %f' % (
-            operation_upper, max(latencies_ms[operation]) * 1000.0))
-        print('[%s], 95thPercentileLatency(us), %f' % (
-            operation_upper,
-            numpy.percentile(latencies_ms[operation], 95.0) * 1000.0))
-        print('[%s], 99thPercentileLatency(us), %f' % (
-            operation_upper,
-            numpy.percentile(latencies_ms[operation], 99.0) * 1000.0))
-        print('[%s], 99.9thPercentileLatency(us), %f' % (
-            operation_upper,
-            numpy.percentile(latencies_ms[operation], 99.9) * 1000.0))
-        print('[%s], Return=OK, %d' % (operation_upper, op_counts[operation]))
-        latency_array = numpy.array(latencies_ms[operation])
-        for j in range(num_bucket):
-            print('[%s], %d, %d' % (
-                operation_upper, j,
-                ((j <= latency_array) & (latency_array < (j + 1))).sum()))
-        print('[%s], >%d, %d' % (operation_upper, num_bucket,
-                                 (num_bucket <= latency_array).sum()))
+def insert(database, table, key, rng):
+    """Does a single insert operation."""
+    columns = ['id'] + ['field%d' % i for i in range(NUM_FIELD)]
+    values = [key] + [
+        ''.join(rng.choice(string.printable) for i in range(100))
+        for _ in range(NUM_FIELD)]
+    with database.batch() as batch:
+        batch.insert(table=table, columns=columns, values=[values])
+
+
+class HdrHistogram(object):
+    """A High Dynamic Range histogram of integer values.
+
+    Values are counted in log-linear buckets:  each power-of-two range is
+    split into enough linear sub-buckets that any recorded value can be
+    reported to within ``significant_figures`` decimal digits, using a
+    fixed amount of memory however many values are recorded.  The exact
+    minimum, maximum, mean and variance are tracked alongside.
+
+    :type highest_trackable_value: int
+    :param highest_trackable_value: largest value which can be recorded;
+                                    larger values are clamped to it.
+
+    :type significant_figures: int
+    :param significant_figures: number of significant decimal digits to
+                                which values are kept, between 1 and 5.
+    """
+
+    def __init__(self, highest_trackable_value=3600 * 1000 * 1000,
+                 significant_figures=3):
+        if not 1 <= significant_figures <= 5:
+            raise ValueError('significant_figures must be between 1 and 5')
+        self.highest_trackable_value = highest_trackable_value
+        self.significant_figures = significant_figures
+
+        largest_single_unit = 2 * 10 ** significant_figures
+        magnitude = int(math.ceil(math.log(largest_single_unit, 2)))
+        self._sub_bucket_half_count_magnitude = magnitude - 1
+        self._sub_bucket_count = 1 << magnitude
+        self._sub_bucket_half_count = self._sub_bucket_count // 2
+        self._sub_bucket_mask = self._sub_bucket_count - 1
+
+        smallest_untrackable = self._sub_bucket_count
+        bucket_count = 1
+        while smallest_untrackable <= highest_trackable_value:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+        self._counts = [0] * ((bucket_count + 1) * self._sub_bucket_half_count)
+
+        self.total_count = 0
+        self.min_value = None
+        self.max_value = None
+        self._sum = 0
+        self._sum_of_squares = 0
+
+    def _bucket_indexes(self, value):
+        pow2_ceiling = (value | self._sub_bucket_mask).bit_length()
+        bucket_index = pow2_ceiling - self._sub_bucket_half_count_magnitude - 1
+        return bucket_index, value >> bucket_index
+
+    def _counts_index(self, value):
+        bucket_index, sub_bucket_index = self._bucket_indexes(value)
+        return (((bucket_index + 1) << self._sub_bucket_half_count_magnitude) +
+                sub_bucket_index - self._sub_bucket_half_count)
+
+    def _value_range(self, counts_index):
+        """Returns the lowest and highest values counted at an index."""
+        bucket_index = (
+            (counts_index >> self._sub_bucket_half_count_magnitude) - 1)
+        sub_bucket_index = (
+            (counts_index & (self._sub_bucket_half_count - 1)) +
+            self._sub_bucket_half_count)
+        if bucket_index < 0:
+            sub_bucket_index -= self._sub_bucket_half_count
+            bucket_index = 0
+        lowest = sub_bucket_index << bucket_index
+        return lowest, lowest + (1 << bucket_index) - 1
+
+    def record_value(self, value, count=1):
+        """Records ``count`` occurrences of ``value``.
+
+        :type value: int
+        :param value: non-negative value to record.
+
+        :type count: int
+        :param count: number of occurrences to record.
+        """
+        if value < 0:
+            raise ValueError('Cannot record negative value: %r' % (value,))
+        value = min(int(value), self.highest_trackable_value)
+        self._counts[self._counts_index(value)] += count
+        self.total_count += count
+        self._sum += value * count
+        self._sum_of_squares += value * value * count
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if self.max_value is None or value > self.max_value:
+            self.max_value = value
+
+    def add(self, other):
+        """Adds all values recorded in ``other`` to this histogram.
+
+        :type other: :class:`HdrHistogram`
+        :param other: a histogram with the same configuration.
+        """
+        if len(other._counts) != len(self._counts):
+            raise ValueError('Histograms have different configurations.')
+        if not other.total_count:
+            return
+        for index, count in enumerate(other._counts):
+            if count:
+                self._counts[index] += count
+        self.total_count += other.total_count
+        self._sum += other._sum
+        self._sum_of_squares += other._sum_of_squares
+        if self.min_value is None or other.min_value < self.min_value:
+            self.min_value = other.min_value
+        if self.max_value is None or other.max_value > self.max_value:
+            self.max_value = other.max_value
+
+    def mean(self):
+        """The exact mean of recorded values, or zero if there are none."""
+        if not self.total_count:
+            return 0.0
+        return float(self._sum) / self.total_count
+
+    def variance(self):
+        """The exact population variance of recorded values."""
+        if not self.total_count:
+            return 0.0
+        mean = self.mean()
+        return max(
+            float(self._sum_of_squares) / self.total_count - mean * mean, 0.0)
+
+    def iter_recorded(self):
+        """Yields ``(lowest, highest, count)`` for each non-empty bucket."""
+        for index, count in enumerate(self._counts):
+            if count:
+                lowest, highest = self._value_range(index)
+                yield lowest, highest, count
+
+    def value_at_percentile(self, percentile):
+        """Returns the value below which ``percentile`` of values fall.
+
+        The result is the highest value equivalent to the bucket holding
+        the requested rank, bounded by the exact maximum.
+
+        :type percentile: float
+        :param percentile: percentile between 0 and 100.
+
+        :rtype: int
+        :returns: the value at the percentile, or zero if empty.
+        """
+        if not self.total_count:
+            return 0
+        percentile = min(max(percentile, 0.0), 100.0)
+        rank = max(int(math.ceil(percentile / 100.0 * self.total_count)), 1)
+        seen = 0
+        for _, highest, count in self.iter_recorded():
+            seen += count
+            if seen >= rank:
+                return min(highest, self.max_value)
+        return self.max_value
+
+    def percentile_distribution(self, ticks_per_half_distance=5):
+        """Yields ``(value, percentile, total_count)`` report lines.
+
+        Percentiles are stepped as in HdrHistogram's percentile output:
+        ``ticks_per_half_distance`` steps between 0 and 50%, as many again
+        between 50% and 75%, and so on, ending at 100%.
+        """
+        if not self.total_count:
+            return
+        half_distances = 0
+        while True:
+            for tick in range(ticks_per_half_distance):
+                remaining = 0.5 ** half_distances * (
+                    1.0 - float(tick) / (2 * ticks_per_half_distance))
+                percentile = 100.0 * (1.0 - remaining)
+                rank = int(math.ceil(percentile / 100.0 * self.total_count))
+                if rank >= self.total_count:
+                    yield self.max_value, 100.0, self.total_count
+                    return
+                yield (self.value_at_percentile(percentile), percentile,
+                       max(rank, 1))
+            half_distances += 1
+
+    def output_percentile_distribution(self, out, scale=1.0):
+        """Writes the distribution in HdrHistogram's text report format.
+
+        :type out: file
+        :param out: writable text file.
+
+        :type scale: float
+        :param scale: divisor applied to values before they are written.
+        """
+        out.write('%12s %14s %10s %14s\n\n' % (
+            'Value', 'Percentile', 'TotalCount', '1/(1-Percentile)'))
+        for value, percentile, total in self.percentile_distribution():
+            fraction = percentile / 100.0
+            if fraction < 1.0:
+                out.write('%12.3f %2.12f %10d %14.2f\n' % (
+                    value / scale, fraction, total, 1.0 / (1.0 - fraction)))
+            else:
+                out.write('%12.3f %2.12f %10d\n' % (
+                    value / scale, fraction, total))
+        out.write('#[Mean    = %12.3f, StdDeviation   = %12.3f]\n' % (
+            self.mean() / scale, math.sqrt(self.variance()) / scale))
+        out.write('#[Max     = %12.3f, Total count    = %12d]\n' % (
+            (self.max_value or 0) / scale, self.total_count))
+
+
+class OperationStats(object):
+    """Latencies and outcomes recorded for one operation type."""
+
+    def __init__(self):
+        self.latencies_us = HdrHistogram()
+        self.intended_latencies_us = HdrHistogram()
+        self.ok = 0
+        self.errors = 0
+
+    def add(self, other):
+        """Adds the results recorded in ``other``."""
+        self.latencies_us.add(other.latencies_us)
+        self.intended_latencies_us.add(other.intended_latencies_us)
+        self.ok += other.ok
+        self.errors += other.errors
+
+
+class Schedule(object):
+    """Hands out operation start times to the worker threads.
+
+    With a ``target`` throughput, the n-th operation is due at
+    ``start + n / target`` whether or not earlier operations have
+    completed, so a stall in the backend shows up as queueing delay in the
+    intended latencies instead of silently lowering the offered load.
+    Operations due before the warm-up ends are run but not measured.
+
+    :type target: float
+    :param target: operations per second, or zero to run closed loop.
+
+    :type warmup_s: float
+    :param warmup_s: seconds before measurement starts.
+
+    :type operation_count: int
+    :param operation_count: number of operations to measure.
+
+    :type max_execution_s: float
+    :param max_execution_s: seconds after the warm-up to stop issuing
+                            measured operations, or zero for no limit.
+    """
+
+    def __init__(self, target, warmup_s, operation_count, max_execution_s=0):
+        self._lock = threading.Lock()
+        self._interval = 1.0 / target if target > 0 else 0.0
+        self._operation_count = operation_count
+        self._issued = 0
+        self._measured = 0
+        self.start = timeit.default_timer()
+        self.measure_start = self.start + warmup_s
+        self._deadline = None
+        if max_execution_s > 0:
+            self._deadline = self.measure_start + max_execution_s
+
+    def next(self):
+        """Claims the next operation.
+
+        :rtype: tuple
+        :returns: ``(intended_start, measured)``, or None once all measured
+                  operations have been handed out.
+        """
+        with self._lock:
+            if self._interval:
+                intended = self.start + self._issued * self._interval
+            else:
+                intended = timeit.default_timer()
+            if intended < self.measure_start:
+                self._issued += 1
+                return intended, False
+            if self._measured >= self._operation_count:
+                return None
+            if self._deadline is not None and intended >= self._deadline:
+                return None
+            self._issued += 1
+            self._measured += 1
+            return intended, True
 
 
 class WorkloadThread(threading.Thread):
     """A single thread running workload."""
 
     def __init__(self, database, keys, parameters, total_weight, weights,
-                 operations):
+                 operations, schedule, rng, insert_keys):
         threading.Thread.__init__(self)
         self._database = database
         self._keys = keys
@@ -193,27 +469,146 @@ class WorkloadThread(threading.Thread):
         self._total_weight = total_weight
         self._weights = weights
         self._operations = operations
-        self._latencies_ms = {}
+        self._schedule = schedule
+        self._rng = rng
+        self._insert_keys = insert_keys
+        self._max_scan_length = int(
+            parameters.get('maxscanlength', DEFAULT_MAX_SCAN_LENGTH))
+        self._stats = {}
         for operation in self._operations:
-            self._latencies_ms[operation] = []
+            self._stats[operation] = OperationStats()
+        self.end = None
+
+    def _choose_operation(self):
+        weight = self._rng.uniform(0, self._total_weight)
+        for j in range(len(self._weights)):
+            if weight <= self._weights[j]:
+                return self._operations[j]
+        return self._operations[-1]
+
+    def _do_operation(self, operation):
+        table = self._parameters['table']
+        if operation == 'read':
+            read(self._database, table, self._rng.choice(self._keys))
+        elif operation == 'update':
+            update(self._database, table, self._rng.choice(self._keys),
+                   self._rng)
+        elif operation == 'scan':
+            scan(self._database, table, self._rng.choice(self._keys),
+                 self._rng, self._max_scan_length)
+        elif operation == 'insert':
+            insert(self._database, table, next(self._insert_keys), self._rng)
+        else:
+            raise ValueError('Unknown operation: %s' % operation)
 
     def run(self):
         """Run a single thread of the workload."""
-        i = 0
-        operation_count = int(self._parameters['operationcount'])
-        while i < operation_count:
-            i += 1
-            weight = random.uniform(0, self._total_weight)
-            for j in range(len(self._weights)):
-                if weight <= self._weights[j]:
-                    do_operation(self._database, self._keys,
-                                 self._parameters['table'],
-                                 self._operations[j], self._latencies_ms)
-                    break
-
-    def latencies_ms(self):
-        """Returns the latencies."""
-        return self._latencies_ms
+        while True:
+            slot = self._schedule.next()
+            if slot is None:
+                break
+            intended, measured = slot
+            delay = intended - timeit.default_timer()
+            if delay > 0:
+                time.sleep(delay)
+
+            operation = self._choose_operation()
+            start = timeit.default_timer()
+            try:
+                self._do_operation(operation)
+            except GoogleAPICallError:
+                succeeded = False
+            else:
+                succeeded = True
+            end = timeit.default_timer()
+
+            if not measured:
+                continue
+            stats = self._stats[operation]
+            if succeeded:
+                stats.ok += 1
+            else:
+                stats.errors += 1
+            stats.latencies_us.record_value(int((end - start) * 1e6))
+            stats.intended_latencies_us.record_value(
+                int((end - min(intended, start)) * 1e6))
+            self.end = end
+
+    def stats(self):
+        """Returns the per-operation statistics."""
+        return self._stats
+
+
+class _InsertKeys(object):
+    """Thread-safe generator of keys for new rows."""
+
+    def __init__(self, first):
+        self._lock = threading.Lock()
+        self._next = first
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with self._lock:
+            key = 'user%d' % self._next
+            self._next += 1
+        return key
+
+    next = __next__
+
+
+def print_histogram(label, histogram, num_bucket):
+    """Prints YCSB-style summary lines for one histogram."""
+    print('[%s], Operations, %d' % (label, histogram.total_count))
+    print('[%s], AverageLatency(us), %f' % (label, histogram.mean()))
+    print('[%s], LatencyVariance(us), %f' % (label, histogram.variance()))
+    print('[%s], MinLatency(us), %f' % (label, histogram.min_value or 0))
+    print('[%s], MaxLatency(us), %f' % (label, histogram.max_value or 0))
+    for percentile in REPORTED_PERCENTILES:
+        print('[%s], %gthPercentileLatency(us), %f' % (
+            label, percentile, histogram.value_at_percentile(percentile)))
+
+    buckets = [0] * (num_bucket + 1)
+    for lowest, highest, count in histogram.iter_recorded():
+        buckets[min((lowest + highest) // 2000, num_bucket)] += count
+    for j in range(num_bucket):
+        print('[%s], %d, %d' % (label, j, buckets[j]))
+    print('[%s], >%d, %d' % (label, num_bucket, buckets[num_bucket]))
+
+
+def aggregate_metrics(stats, duration_ms, num_bucket, target=0.0,
+                      output_path=None):
+    """Aggregates metrics."""
+    overall_op_count = sum(
+        operation_stats.latencies_us.total_count
+        for operation_stats in stats.values())
+
+    print('[OVERALL], RunTime(ms), %f' % duration_ms)
+    throughput = 0.0
+    if duration_ms > 0:
+        throughput = float(overall_op_count) / duration_ms * 1000.0
+    print('[OVERALL], Throughput(ops/sec), %f' % throughput)
+    if target:
+        print('[OVERALL], TargetThroughput(ops/sec), %f' % target)
+
+    for operation in sorted(stats):
+        operation_stats = stats[operation]
+        operation_upper = operation.upper()
+        histograms = [(operation_upper, operation_stats.latencies_us)]
+        if target:
+            histograms.append(('Intended-%s' % operation_upper,
+                               operation_stats.intended_latencies_us))
+        for label, histogram in histograms:
+            print_histogram(label, histogram, num_bucket)
+            print('[%s], Return=OK, %d' % (label, operation_stats.ok))
+            if operation_stats.errors:
+                print('[%s], Return=ERROR, %d' % (
+                    label, operation_stats.errors))
+            if output_path:
+                with open('%s%s.hdr' % (output_path, label), 'w') as out:
+                    histogram.output_percentile_distribution(
+                        out, scale=1000.0)
 
 
 def run_workload(database, keys, parameters):
@@ -221,46 +616,68 @@ def run_workload(database, keys, parameters):
     total_weight = 0.0
     weights = []
     operations = []
-    latencies_ms = {}
     for operation in OPERATIONS:
-        weight = float(parameters[operation])
+        weight = float(parameters.get(operation, 0.0))
         if weight <= 0.0:
             continue
         total_weight += weight
         op_code = operation.split('proportion')[0]
         operations.append(op_code)
         weights.append(total_weight)
-        latencies_ms[op_code] = []
+
+    target = float(parameters.get('target', 0.0))
+    schedule = Schedule(target,
+                        float(parameters.get('warmuptime', 0.0)),
+                        int(parameters['operationcount']),
+                        float(parameters.get('maxexecutiontime', 0.0)))
+    seed = parameters.get('seed')
+    insert_keys = _InsertKeys(
+        int(parameters.get('insertstart', parameters.get(
+            'recordcount', len(keys)))))
 
     threads = []
-    start = timeit.default_timer()
     for i in range(int(parameters['num_worker'])):
+        rng = random.Random(None if seed is None else int(seed) + i)
         thread = WorkloadThread(database, keys, parameters, total_weight,
-                                weights, operations)
+                                weights, operations, schedule, rng,
+                                insert_keys)
         thread.start()
         threads.append(thread)
 
+    stats = {}
+    for operation in operations:
+        stats[operation] = OperationStats()
+    end = schedule.measure_start
     for thread in threads:
         thread.join()
-        end = timeit.default_timer()
-
-    for thread in threads:
-        thread_latencies_ms = thread.latencies_ms()
-        for key in latencies_ms.keys():
-            latencies_ms[key].extend(thread_latencies_ms[key])
+        if thread.end is not None:
+            end = max(end, thread.end)
+        thread_stats = thread.stats()
+        for operation in operations:
+            stats[operation].add(thread_stats[operation])
 
-    aggregate_metrics(latencies_ms, (end - start) * 1000.0,
-                      parameters['num_bucket'])
+    aggregate_metrics(stats, (end - schedule.measure_start) * 1000.0,
+                      int(parameters['num_bucket']), target,
+                      parameters.get('hdrhistogram.output.path'))
 
 
 if __name__ == '__main__':
     parameters = parse_options()
     if parameters['command'] == 'run':
         if 'cloudspanner.channels' in parameters:
-            assert parameters['cloudspanner.channels'] == 1, (
+            assert int(parameters['cloudspanner.channels']) == 1, (
                 'Python doesn\'t support channels > 1.')
-        database = open_database(parameters)
-        keys = load_keys(database, parameters)
-        run_workload(database, keys, parameters)
+        server = None
+        if parameters.get('cloudspanner.fake') == 'true':
+            import fake_spanner
+            database, server = fake_spanner.open_database(parameters)
+        else:
+            database = open_database(parameters)
+        try:
+            keys = load_keys(database, parameters)
+            run_workload(database, keys, parameters)
+        finally:
+            if server is not None:
+                server.stop(None)
     else:
         raise ValueError('Unknown command %s.' % parameters['command'])
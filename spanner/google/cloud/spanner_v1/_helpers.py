@@ -19,6 +19,16 @@ import math
 
 import six
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
 from google.protobuf.struct_pb2 import ListValue
 from google.protobuf.struct_pb2 import Value
 
@@ -106,16 +116,313 @@ def _make_list_value_pb(values):
     return ListValue(values=[_make_value_pb(value) for value in values])
 
 
-def _make_list_value_pbs(values):
+def _append_value_pb(values_pb, value):
+    """Append a value of any supported type to a ``ListValue.values``."""
+    values_pb.add().CopyFrom(_make_value_pb(value))
+
+
+def _append_bool(values_pb, value):
+    """Helper for :func:`_value_pb_appender`."""
+    values_pb.add(bool_value=value)
+
+
+def _append_int(values_pb, value):
+    """Helper for :func:`_value_pb_appender`."""
+    values_pb.add(string_value=str(value))
+
+
+def _append_float(values_pb, value):
+    """Helper for :func:`_value_pb_appender`."""
+    if value - value == 0:  # Neither NaN nor +/-Infinity
+        values_pb.add(number_value=value)
+    else:
+        _append_value_pb(values_pb, value)
+
+
+def _append_text(values_pb, value):
+    """Helper for :func:`_value_pb_appender`."""
+    values_pb.add(string_value=value)
+
+
+def _append_bytes(values_pb, value):
+    """Helper for :func:`_value_pb_appender`."""
+    values_pb.add(string_value=_try_to_coerce_bytes(value))
+
+
+def _append_timestamp_w_nanos(values_pb, value):
+    """Helper for :func:`_value_pb_appender`."""
+    values_pb.add(string_value=value.rfc3339())
+
+
+def _append_datetime(values_pb, value):
+    """Helper for :func:`_value_pb_appender`."""
+    values_pb.add(string_value=_datetime_to_rfc3339(value))
+
+
+def _append_date(values_pb, value):
+    """Helper for :func:`_value_pb_appender`."""
+    values_pb.add(string_value=value.isoformat())
+
+
+_APPENDERS_BY_TYPE = {
+    bool: _append_bool,
+    float: _append_float,
+    six.binary_type: _append_bytes,
+    six.text_type: _append_text,
+    datetime_helpers.DatetimeWithNanoseconds: _append_timestamp_w_nanos,
+    datetime.datetime: _append_datetime,
+    datetime.date: _append_date,
+}
+_APPENDERS_BY_TYPE.update(
+    (integer_type, _append_int) for integer_type in six.integer_types
+)
+
+
+def _value_pb_appender(sample):
+    """Choose how to append the cells of a column to row protobufs.
+
+    The choice is made once per column, from the type of a sample cell;
+    cells of any other type fall back to :func:`_make_value_pb`.
+
+    :type sample: scalar value
+    :param sample: a (non-null) cell of the column, or None if all cells
+                   are null.
+
+    :rtype: callable
+    :returns: function taking a ``ListValue.values`` container and a cell.
+    """
+    sample_type = type(sample)
+    append = _APPENDERS_BY_TYPE.get(sample_type)
+    if append is None:
+        return _append_value_pb
+
+    def appender(values_pb, value):
+        if type(value) is sample_type:  # pylint: disable=unidiomatic-typecheck
+            append(values_pb, value)
+        else:
+            _append_value_pb(values_pb, value)
+
+    return appender
+
+
+def _column_samples(rows, width):
+    """Find the first non-null cell of each column, if any."""
+    samples = [None] * width
+    missing = set(range(width))
+    for row in rows:
+        if len(row) != width:
+            continue
+        for index in list(missing):
+            if row[index] is not None:
+                samples[index] = row[index]
+                missing.discard(index)
+        if not missing:
+            break
+    return samples
+
+
+def _make_list_value_pbs(values, columns=None):
     """Construct a sequence of ListValue protobufs.
 
-    :type values: list of list of scalar
-    :param values: Row data
+    Conversion functions are chosen once per column, from the type of its
+    first non-null cell, rather than once per cell.
+
+    :type values: list of list of scalar, :class:`numpy.ndarray`, or
+                  :class:`pandas.DataFrame`
+    :param values: Row data.  Two-dimensional arrays and data frames are
+                   converted a column at a time.
+
+    :type columns: list of str
+    :param columns: (Optional) names of the columns to select from a
+                    data frame passed as ``values``.
+
+    :rtype: list of :class:`~google.protobuf.struct_pb2.ListValue`
+    :returns: sequence of protobufs
+    """
+    if _is_columnar(values):
+        return _make_list_value_pbs_from_columns(_array_columns(values, columns))
+
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    if not values:
+        return []
+    width = len(values[0])
+    appenders = [
+        _value_pb_appender(sample) for sample in _column_samples(values, width)
+    ]
+
+    result = []
+    for row in values:
+        if len(row) != width:
+            result.append(_make_list_value_pb(row))
+            continue
+        row_pb = ListValue()
+        values_pb = row_pb.values
+        for append, value in zip(appenders, row):
+            append(values_pb, value)
+        result.append(row_pb)
+    return result
+
+
+def _is_columnar(values):
+    """Helper for :func:`_make_list_value_pbs`."""
+    if pandas is not None and isinstance(values, pandas.DataFrame):
+        return True
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+def _array_columns(values, columns=None):
+    """Split a data frame / 2-D array into one array per column.
+
+    :type values: :class:`numpy.ndarray` or :class:`pandas.DataFrame`
+    :param values: Row data.  Structured arrays and data frames keep the
+                   type of each column;  plain arrays must not have a float
+                   dtype, into which :mod:`numpy` casts integers mixed with
+                   floats, so that ``INT64`` columns could not be told apart.
+
+    :type columns: list of str
+    :param columns: (Optional) names of the columns to select from a
+                    data frame or structured array.
+
+    :rtype: list of :class:`numpy.ndarray`
+    :returns: cells of each column.  Timezone-aware timestamps from data
+              frames are converted to UTC.
+    :raises ValueError: if ``columns`` names a column missing from a data
+                        frame or structured array, or does not match the
+                        width of a plain array, or if a plain array has a
+                        float dtype.
+    """
+    if isinstance(values, numpy.ndarray):
+        if values.dtype.names is not None:
+            names = _select_columns(values.dtype.names, columns)
+            return [values[name] for name in names]
+        if values.ndim != 2:
+            raise ValueError("Expected a two-dimensional array of row data.")
+        if values.dtype.kind == "f":
+            raise ValueError(
+                "Cannot tell the column types of a float array of row data;  "
+                "pass a data frame, a structured array or an object array."
+            )
+        if columns is not None and len(columns) != values.shape[1]:
+            raise ValueError(
+                "Expected %d columns of row data, got %d."
+                % (len(columns), values.shape[1])
+            )
+        return [values[:, index] for index in range(values.shape[1])]
+
+    if columns is not None:
+        values = values[_select_columns(values.columns, columns)]
+    return [
+        _frame_column_array(values.iloc[:, index]) for index in range(values.shape[1])
+    ]
+
+
+def _frame_column_array(series):
+    """Helper for :func:`_array_columns`:  convert a data frame column.
+
+    Nullable :mod:`pandas` dtypes (``Int64``, ``boolean``, ``string``, ...)
+    are converted to object arrays holding ``pandas.NA``, rather than cast
+    to float when they hold missing values.
+
+    :type series: :class:`pandas.Series`
+    :param series: cells of one column
+
+    :rtype: :class:`numpy.ndarray`
+    :returns: cells of the column
+    """
+    pandas_na = getattr(pandas, "NA", None)
+    if pandas_na is not None and getattr(series.dtype, "na_value", None) is pandas_na:
+        return series.to_numpy(dtype=object)
+    return numpy.asarray(series.values)
+
+
+def _select_columns(names, columns):
+    """Helper for :func:`_array_columns`:  check the selected columns exist.
+
+    :type names: sequence of str
+    :param names: names of the columns of the row data
+
+    :type columns: list of str
+    :param columns: names of the columns to select, or None for all
+
+    :rtype: list of str
+    :returns: names of the columns to select
+    :raises ValueError: if a column to select is missing
+    """
+    if columns is None:
+        return list(names)
+    missing = [column for column in columns if column not in names]
+    if missing:
+        raise ValueError("Columns missing from the row data: %s" % (missing,))
+    return list(columns)
+
+
+def _missing_cells():
+    """Helper for :func:`_column_cells`:  ids of :mod:`pandas` null markers."""
+    if pandas is None:
+        return frozenset()
+    return frozenset(
+        id(marker)
+        for marker in (getattr(pandas, "NA", None), pandas.NaT)
+        if marker is not None
+    )
+
+
+def _column_cells(column):
+    """Convert an array column into Python cells, vectorized where possible.
+
+    :type column: :class:`numpy.ndarray`
+    :param column: cells of one column
+
+    :rtype: tuple
+    :returns: ``(cells, appender)``;  see :func:`_value_pb_appender`.
+    """
+    kind = column.dtype.kind
+    if kind in "iu":
+        # Spanner encodes INT64 as strings:  let numpy format them in bulk.
+        return column.astype(six.text_type).tolist(), _append_text
+    if kind == "M":
+        unit = "D" if column.dtype == numpy.dtype("datetime64[D]") else "ns"
+        timezone = "naive" if unit == "D" else "UTC"
+        cells = numpy.datetime_as_string(column, unit=unit, timezone=timezone)
+        cells = cells.astype(object)
+        cells[numpy.isnat(column)] = None
+        return cells.tolist(), _value_pb_appender(u"")
+    cells = column.tolist()
+    if kind == "O":
+        # Nullable ``pandas`` dtypes mark missing values with ``pandas.NA``.
+        missing = _missing_cells()
+        if missing:
+            cells = [None if id(cell) in missing else cell for cell in cells]
+    (sample,) = _column_samples([[cell] for cell in cells], 1)
+    if kind == "O" and not isinstance(sample, float):
+        # Data frames mark missing values in non-float columns with NaN.
+        cells = [
+            None if isinstance(cell, float) and cell != cell else cell for cell in cells
+        ]
+        (sample,) = _column_samples([[cell] for cell in cells], 1)
+    return cells, _value_pb_appender(sample)
+
+
+def _make_list_value_pbs_from_columns(columns):
+    """Helper for :func:`_make_list_value_pbs`:  build rows from columns.
+
+    :type columns: list of :class:`numpy.ndarray`
+    :param columns: cells of each column
 
     :rtype: list of :class:`~google.protobuf.struct_pb2.ListValue`
     :returns: sequence of protobufs
     """
-    return [_make_list_value_pb(row) for row in values]
+    converted = [_column_cells(column) for column in columns]
+    appenders = [appender for _, appender in converted]
+    result = []
+    for row in zip(*[cells for cells, _ in converted]):
+        row_pb = ListValue()
+        values_pb = row_pb.values
+        for append, value in zip(appenders, row):
+            append(values_pb, value)
+        result.append(row_pb)
+    return result
 
 
 # pylint: disable=too-many-branches
@@ -191,6 +498,115 @@ def _parse_list_value_pbs(rows, row_type):
     return result
 
 
+def _column_nulls(value_pbs):
+    """Helper for column decoders:  mask of ``NULL`` cells in a column."""
+    return numpy.fromiter(
+        (value_pb.HasField("null_value") for value_pb in value_pbs),
+        dtype=numpy.bool_,
+        count=len(value_pbs),
+    )
+
+
+def _column_strings(value_pbs, nulls, fill):
+    """Helper for column decoders:  fixed-width string array for a column."""
+    strings = numpy.array([value_pb.string_value for value_pb in value_pbs])
+    if nulls.any():
+        strings = strings.astype(numpy.result_type(strings, numpy.array(fill)))
+        strings[nulls] = fill
+    return strings
+
+
+def _parse_int64_column(value_pbs, nulls):
+    """Helper for :func:`_parse_column_value_pbs`."""
+    if not value_pbs:
+        return numpy.array([], dtype=numpy.int64)
+    return _column_strings(value_pbs, nulls, "0").astype(numpy.int64)
+
+
+def _parse_float64_column(value_pbs, nulls):
+    """Helper for :func:`_parse_column_value_pbs`."""
+    result = numpy.fromiter(
+        (value_pb.number_value for value_pb in value_pbs),
+        dtype=numpy.float64,
+        count=len(value_pbs),
+    )
+    # NaN and +/-Infinity are transmitted as strings.
+    for index, value_pb in enumerate(value_pbs):
+        if value_pb.HasField("string_value"):
+            result[index] = float(value_pb.string_value)
+    result[nulls] = numpy.nan
+    return result
+
+
+def _parse_bool_column(value_pbs, nulls):
+    """Helper for :func:`_parse_column_value_pbs`."""
+    return numpy.fromiter(
+        (value_pb.bool_value for value_pb in value_pbs),
+        dtype=numpy.bool_,
+        count=len(value_pbs),
+    )
+
+
+def _parse_date_column(value_pbs, nulls):
+    """Helper for :func:`_parse_column_value_pbs`."""
+    if not value_pbs:
+        return numpy.array([], dtype="datetime64[D]")
+    return _column_strings(value_pbs, nulls, "NaT").astype("datetime64[D]")
+
+
+def _parse_timestamp_column(value_pbs, nulls):
+    """Helper for :func:`_parse_column_value_pbs`."""
+    if not value_pbs:
+        return numpy.array([], dtype="datetime64[us]")
+    # Spanner always sends UTC timestamps, with a trailing 'Z', which numpy
+    # refuses to parse silently.
+    strings = numpy.char.rstrip(_column_strings(value_pbs, nulls, "NaT"), "Z")
+    # Nanoseconds only span the years 1678 to 2261, and numpy wraps around
+    # silently outside of them;  microseconds cover every Spanner timestamp.
+    return strings.astype("datetime64[us]")
+
+
+_COLUMN_PARSERS = {
+    type_pb2.BOOL: _parse_bool_column,
+    type_pb2.DATE: _parse_date_column,
+    type_pb2.FLOAT64: _parse_float64_column,
+    type_pb2.INT64: _parse_int64_column,
+    type_pb2.TIMESTAMP: _parse_timestamp_column,
+}
+
+
+def _parse_column_value_pbs(value_pbs, field_type):
+    """Convert a column of Value protobufs into a typed array.
+
+    ``INT64``, ``FLOAT64``, ``BOOL``, ``DATE`` and ``TIMESTAMP`` columns are
+    decoded in bulk into ``int64``, ``float64``, ``bool``, ``datetime64[D]``
+    and ``datetime64[us]`` arrays, respectively;  other columns are decoded
+    cell-by-cell via :func:`_parse_value_pb` into an ``object`` array.
+    Timestamps are truncated to microseconds, the finest unit able to hold
+    the years 0001 to 9999.
+
+    :type value_pbs: list of :class:`~google.protobuf.struct_pb2.Value`
+    :param value_pbs: cells of a single column
+
+    :type field_type: :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+    :param field_type: type code for the column
+
+    :rtype: tuple
+    :returns: ``(values, nulls)``, where ``values`` is a :class:`numpy.ndarray`
+              of decoded cells and ``nulls`` a boolean array marking ``NULL``
+              cells.  Entries of ``values`` at ``NULL`` positions are
+              placeholders (zero, ``False``, ``NaN`` or ``NaT``).
+    """
+    nulls = _column_nulls(value_pbs)
+    parser = _COLUMN_PARSERS.get(field_type.code)
+    if parser is not None:
+        return parser(value_pbs, nulls), nulls
+    values = numpy.empty(len(value_pbs), dtype=object)
+    for index, value_pb in enumerate(value_pbs):
+        values[index] = _parse_value_pb(value_pb, field_type)
+    return values, nulls
+
+
 class _SessionWrapper(object):
     """Base class for objects wrapping a session.
 
@@ -14,18 +14,65 @@
 
 """Context manager for Cloud Spanner batched writes."""
 
+import collections
+import concurrent.futures
+import threading
+import time
+
+from google.api_core.exceptions import GoogleAPIError
 from google.cloud.spanner_v1.proto.mutation_pb2 import Mutation
 from google.cloud.spanner_v1.proto.transaction_pb2 import TransactionOptions
 
 # pylint: disable=ungrouped-imports
 from google.cloud._helpers import _pb_timestamp_to_datetime
 from google.cloud.spanner_v1._helpers import _SessionWrapper
+from google.cloud.spanner_v1._helpers import _make_list_value_pb
 from google.cloud.spanner_v1._helpers import _make_list_value_pbs
 from google.cloud.spanner_v1._helpers import _metadata_with_prefix
+from google.cloud.spanner_v1.pool import SessionCheckout
 
 # pylint: enable=ungrouped-imports
 
 
+MAX_MUTATIONS_PER_COMMIT = 20000
+"""Maximum number of mutations Cloud Spanner accepts in a single commit.
+
+Each column value inserted / updated counts as one mutation.
+"""
+
+DEFAULT_MAX_COMMIT_BYTES = 4 * 1024 * 1024
+"""Default size limit for commits made by :class:`BulkWriter`."""
+
+BulkWriteFailure = collections.namedtuple(
+    "BulkWriteFailure", ["mutations", "row_count", "exception"]
+)
+"""A commit made by :class:`BulkWriter` which failed.
+
+``mutations`` holds the
+:class:`~google.cloud.spanner_v1.proto.mutation_pb2.Mutation` protobufs sent
+in the commit, ``row_count`` the number of rows they contain, and
+``exception`` the error raised by the commit.
+"""
+
+BulkWriterStats = collections.namedtuple(
+    "BulkWriterStats",
+    [
+        "rows",
+        "mutations",
+        "bytes",
+        "commits",
+        "failed_rows",
+        "failed_commits",
+        "elapsed_seconds",
+    ],
+)
+"""Progress of a :class:`BulkWriter`.
+
+Counts cover completed commits only.  ``elapsed_seconds`` is the time since
+the first row was written (until the writer was closed, if it has been).
+"""
+
+
 class _BatchBase(_SessionWrapper):
     """Accumulate mutations for transmission during :meth:`commit`.
 
@@ -56,7 +103,8 @@ class _BatchBase(_SessionWrapper):
         :type columns: list of str
         :param columns: Name of the table columns to be modified.
 
-        :type values: list of lists
+        :type values: list of lists, :class:`numpy.ndarray` or
+                      :class:`pandas.DataFrame`
         :param values: Values to be modified.
         """
         self._mutations.append(Mutation(insert=_make_write_pb(table, columns, values)))
@@ -70,7 +118,8 @@ class _BatchBase(_SessionWrapper):
         :type columns: list of str
         :param columns: Name of the table columns to be modified.
 
-        :type values: list of lists
+        :type values: list of lists, :class:`numpy.ndarray` or
+                      :class:`pandas.DataFrame`
         :param values: Values to be modified.
         """
         self._mutations.append(Mutation(update=_make_write_pb(table, columns, values)))
@@ -84,7 +133,8 @@ class _BatchBase(_SessionWrapper):
         :type columns: list of str
         :param columns: Name of the table columns to be modified.
 
-        :type values: list of lists
+        :type values: list of lists, :class:`numpy.ndarray` or
+                      :class:`pandas.DataFrame`
         :param values: Values to be modified.
         """
         self._mutations.append(
@@ -100,7 +150,8 @@ class _BatchBase(_SessionWrapper):
         :type columns: list of str
         :param columns: Name of the table columns to be modified.
 
-        :type values: list of lists
+        :type values: list of lists, :class:`numpy.ndarray` or
+                      :class:`pandas.DataFrame`
         :param values: Values to be modified.
         """
         self._mutations.append(Mutation(replace=_make_write_pb(table, columns, values)))
@@ -168,6 +219,277 @@ class Batch(_BatchBase):
             self.commit()
 
 
+class BulkWriter(object):
+    """Write unbounded streams of rows in concurrent, size-limited commits.
+
+    Rows passed to :meth:`insert` et aliae are buffered, and committed in
+    batches holding at most ``max_mutations`` mutations and
+    ``max_commit_bytes`` bytes of row data.  Batches are committed
+    concurrently, each in its own single-use transaction, on at most
+    ``max_sessions`` sessions checked out from the database's pool.  Writers
+    block once ``2 * max_sessions`` batches are awaiting commit.
+
+    Because each batch is committed independently, a failure leaves the
+    rows of other batches committed.  Failed commits are recorded in
+    ``failures`` (a list of :class:`BulkWriteFailure`), rather than raised.
+
+    Instances are not safe for use by concurrent writers.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: database to write to
+
+    :type max_mutations: int
+    :param max_mutations: (Optional) maximum number of mutations per commit.
+
+    :type max_commit_bytes: int
+    :param max_commit_bytes: (Optional) maximum size of row data per commit.
+
+    :type max_sessions: int
+    :param max_sessions: (Optional) maximum number of concurrent commits.
+    """
+
+    def __init__(
+        self,
+        database,
+        max_mutations=MAX_MUTATIONS_PER_COMMIT,
+        max_commit_bytes=DEFAULT_MAX_COMMIT_BYTES,
+        max_sessions=4,
+    ):
+        self._database = database
+        self._max_mutations = max_mutations
+        self._max_commit_bytes = max_commit_bytes
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_sessions)
+        self._slots = threading.BoundedSemaphore(2 * max_sessions)
+        self._lock = threading.Lock()
+        self._futures = set()
+        self._writes = []  # (operation, table, columns, row_pbs)
+        self._row_count = 0
+        self._mutation_count = 0
+        self._byte_count = 0
+        self._closed = False
+        self._started = None
+        self._finished = None
+        self._stats = collections.Counter()
+        self.failures = []  # One BulkWriteFailure per failed commit
+
+    @property
+    def stats(self):
+        """Progress of the writer.
+
+        :rtype: :class:`BulkWriterStats`
+        :returns: counts of committed / failed rows, and time elapsed.
+        """
+        if self._started is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished or time.time()) - self._started
+        with self._lock:
+            stats = self._stats.copy()
+        return BulkWriterStats(
+            rows=stats["rows"],
+            mutations=stats["mutations"],
+            bytes=stats["bytes"],
+            commits=stats["commits"],
+            failed_rows=stats["failed_rows"],
+            failed_commits=stats["failed_commits"],
+            elapsed_seconds=elapsed,
+        )
+
+    def insert(self, table, columns, values):
+        """Insert new table rows.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type values: iterable of lists
+        :param values: Values to be modified.  May be a generator.
+        """
+        self._write("insert", table, columns, values)
+
+    def update(self, table, columns, values):
+        """Update existing table rows.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type values: iterable of lists
+        :param values: Values to be modified.  May be a generator.
+        """
+        self._write("update", table, columns, values)
+
+    def insert_or_update(self, table, columns, values):
+        """Insert/update table rows.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type values: iterable of lists
+        :param values: Values to be modified.  May be a generator.
+        """
+        self._write("insert_or_update", table, columns, values)
+
+    def replace(self, table, columns, values):
+        """Replace table rows.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type values: iterable of lists
+        :param values: Values to be modified.  May be a generator.
+        """
+        self._write("replace", table, columns, values)
+
+    def _write(self, operation, table, columns, values):
+        """Buffer rows, submitting batches as they reach the size limits.
+
+        :raises: :exc:`ValueError` if the writer has been closed.
+        """
+        if self._closed:
+            raise ValueError("Bulk writer already closed")
+        if self._started is None:
+            self._started = time.time()
+
+        columns = list(columns)
+        row_mutations = len(columns)
+        row_pbs = None
+        for row in values:
+            row_pb = _make_list_value_pb(row)
+            row_bytes = row_pb.ByteSize()
+            too_big = (
+                self._mutation_count + row_mutations > self._max_mutations
+                or self._byte_count + row_bytes > self._max_commit_bytes
+            )
+            if self._writes and too_big:
+                self._submit()
+                row_pbs = None
+            if row_pbs is None:
+                row_pbs = []
+                self._writes.append((operation, table, columns, row_pbs))
+            row_pbs.append(row_pb)
+            self._row_count += 1
+            self._mutation_count += row_mutations
+            self._byte_count += row_bytes
+
+    def _submit(self):
+        """Hand buffered rows off to be committed on a worker thread.
+
+        Blocks while too many batches are already awaiting commit.
+        """
+        mutations = [
+            Mutation(
+                **{
+                    operation: Mutation.Write(
+                        table=table, columns=columns, values=row_pbs
+                    )
+                }
+            )
+            for operation, table, columns, row_pbs in self._writes
+        ]
+        counts = (self._row_count, self._mutation_count, self._byte_count)
+        self._writes = []
+        self._row_count = self._mutation_count = self._byte_count = 0
+
+        self._slots.acquire()
+        future = self._executor.submit(self._commit, mutations, *counts)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._discard_future)
+
+    def _discard_future(self, future):
+        """Forget a completed commit, unless it raised an unexpected error."""
+        if future.exception() is None:
+            with self._lock:
+                self._futures.discard(future)
+
+    def _commit(self, mutations, row_count, mutation_count, byte_count):
+        """Commit one batch, recording the outcome.  Runs on a worker thread.
+
+        :type mutations: list of
+            :class:`~google.cloud.spanner_v1.proto.mutation_pb2.Mutation`
+        :param mutations: the batch to commit
+
+        :type row_count: int
+        :param row_count: number of rows in the batch
+
+        :type mutation_count: int
+        :param mutation_count: number of mutations in the batch
+
+        :type byte_count: int
+        :param byte_count: size of row data in the batch
+        """
+        try:
+            with SessionCheckout(self._database._pool) as session:
+                batch = Batch(session)
+                batch._mutations.extend(mutations)
+                batch.commit()
+        except GoogleAPIError as exc:
+            with self._lock:
+                self.failures.append(BulkWriteFailure(mutations, row_count, exc))
+                self._stats["failed_rows"] += row_count
+                self._stats["failed_commits"] += 1
+        else:
+            with self._lock:
+                self._stats["rows"] += row_count
+                self._stats["mutations"] += mutation_count
+                self._stats["bytes"] += byte_count
+                self._stats["commits"] += 1
+        finally:
+            self._slots.release()
+
+    def flush(self):
+        """Commit all buffered rows, and wait for outstanding commits.
+
+        :raises: any unexpected (non-API) error raised by a commit.
+        """
+        if self._writes:
+            self._submit()
+
+        with self._lock:
+            futures = list(self._futures)
+        concurrent.futures.wait(futures)
+        with self._lock:
+            self._futures.difference_update(futures)
+        for future in futures:
+            future.result()
+
+    def close(self):
+        """Flush the writer, and release its worker threads."""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown()
+            self._closed = True
+            if self._started is not None:
+                self._finished = time.time()
+
+    def __enter__(self):
+        """Begin ``with`` block."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """End ``with`` block:  flush unless an exception was raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self._writes = []
+            self._executor.shutdown()
+            self._closed = True
+
+
 def _make_write_pb(table, columns, values):
     """Helper for :meth:`Batch.insert` et aliae.
 
@@ -177,12 +499,15 @@ def _make_write_pb(table, columns, values):
     :type columns: list of str
     :param columns: Name of the table columns to be modified.
 
-    :type values: list of lists
-    :param values: Values to be modified.
+    :type values: list of lists, :class:`numpy.ndarray` or
+                  :class:`pandas.DataFrame`
+    :param values: Values to be modified.  Columns of a data frame or
+                   structured array are selected by name;  a plain array
+                   must not have a float dtype.
 
     :rtype: :class:`google.cloud.spanner_v1.proto.mutation_pb2.Mutation.Write`
     :returns: Write protobuf
     """
     return Mutation.Write(
-        table=table, columns=columns, values=_make_list_value_pbs(values)
+        table=table, columns=columns, values=_make_list_value_pbs(values, columns)
     )
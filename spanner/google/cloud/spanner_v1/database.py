@@ -14,12 +14,17 @@
 
 """User friendly container for Cloud Spanner Database."""
 
+import concurrent.futures
 import copy
 import functools
+import itertools
+import multiprocessing
 import re
 import threading
 
+from google.api_core import exceptions
 from google.api_core.gapic_v1 import client_info
+from google.api_core.retry import Retry
 import google.auth.credentials
 from google.protobuf.struct_pb2 import Struct
 from google.cloud.exceptions import NotFound
@@ -30,6 +35,7 @@ from google.cloud.spanner_v1 import __version__
 from google.cloud.spanner_v1._helpers import _make_value_pb
 from google.cloud.spanner_v1._helpers import _metadata_with_prefix
 from google.cloud.spanner_v1.batch import Batch
+from google.cloud.spanner_v1.batch import BulkWriter
 from google.cloud.spanner_v1.gapic.spanner_client import SpannerClient
 from google.cloud.spanner_v1.keyset import KeySet
 from google.cloud.spanner_v1.pool import BurstyPool
@@ -50,6 +56,27 @@ _CLIENT_INFO = client_info.ClientInfo(client_library_version=__version__)
 SPANNER_DATA_SCOPE = "https://www.googleapis.com/auth/spanner.data"
 
 
+_PARTITION_RETRYABLE_ERRORS = (
+    exceptions.Aborted,
+    exceptions.DeadlineExceeded,
+    exceptions.InternalServerError,
+    exceptions.ServiceUnavailable,
+)
+
+
+def _is_retryable_partition_error(exc):
+    """Predicate for :data:`DEFAULT_PARTITION_RETRY`.
+
+    Defined at module scope (rather than via
+    :func:`google.api_core.retry.if_exception_type`) so that the default
+    retry remains picklable, for use with process pools.
+    """
+    return isinstance(exc, _PARTITION_RETRYABLE_ERRORS)
+
+
+DEFAULT_PARTITION_RETRY = Retry(predicate=_is_retryable_partition_error)
+"""Retry applied to each partition by :meth:`BatchSnapshot.process_batches`."""
+
 _DATABASE_NAME_RE = re.compile(
     r"^projects/(?P<project>[^/]+)/"
     r"instances/(?P<instance_id>[a-z][-a-z0-9]*)/"
@@ -389,6 +416,24 @@ class Database(object):
         """
         return BatchCheckout(self)
 
+    def bulk_writer(self, **kw):
+        """Return a writer for streaming rows in concurrent, size-limited batches.
+
+        Unlike :meth:`batch`, rows are split across as many commits as needed
+        to stay within the per-commit mutation and size limits, and those
+        commits are made concurrently.
+
+        :type kw: dict
+        :param kw:
+            Passed through to
+            :class:`~google.cloud.spanner_v1.batch.BulkWriter` constructor.
+
+        :rtype: :class:`~google.cloud.spanner_v1.batch.BulkWriter`
+        :returns: new writer, which should be closed when done (or used
+                  as a context manager).
+        """
+        return BulkWriter(self, **kw)
+
     def batch_snapshot(self, read_timestamp=None, exact_staleness=None):
         """Return an object which wraps a batch read / query.
 
@@ -773,6 +818,206 @@ class BatchSnapshot(object):
             return self.process_read_batch(batch)
         raise ValueError("Invalid batch")
 
+    def process_batches(
+        self,
+        batches,
+        max_workers=None,
+        use_processes=False,
+        retry=DEFAULT_PARTITION_RETRY,
+        max_buffered_partitions=None,
+    ):
+        """Process partitioned queries / reads concurrently.
+
+        Each partition is consumed on a worker from a thread pool or, if
+        ``use_processes`` is set, from a process pool.  Process workers
+        reconstitute the snapshot via :meth:`to_dict` / :meth:`from_dict`
+        and connect using a new
+        :class:`~google.cloud.spanner_v1.client.Client` for the same project,
+        with default credentials.
+
+        A partition's rows are yielded once the whole partition has been
+        read, so that a failed partition can be retried from scratch without
+        duplicating rows.  Partitions are yielded in completion order.
+
+        Every partition being read or waiting to be yielded is held in
+        memory in full.  By default, up to twice ``max_workers`` partitions
+        are submitted to the workers at once, so that every worker stays
+        busy.  To bound memory use instead, pass ``max_buffered_partitions``:
+        at most that many partitions are then submitted at once, which also
+        limits how many are read concurrently.
+
+        :type batches: iterable of mapping
+        :param batches:
+            mappings returned from earlier calls to
+            :meth:`generate_query_batches` / :meth:`generate_read_batches`.
+
+        :type max_workers: int
+        :param max_workers:
+            (Optional) maximum number of partitions processed concurrently.
+            Defaults to the number of CPUs for processes, and five times that
+            number for threads.
+
+        :type use_processes: bool
+        :param use_processes:
+            (Optional) process partitions in a process pool, rather than a
+            thread pool.  Batches, rows and ``retry`` must be picklable.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry:
+            (Optional) retry applied to each partition.  Pass ``None`` to
+            disable retries.
+
+        :type max_buffered_partitions: int
+        :param max_buffered_partitions:
+            (Optional) maximum number of partitions being read or waiting to
+            be yielded at once.  Defaults to twice ``max_workers``.
+
+        :rtype: iterable of list
+        :returns: rows from all the partitions.
+        :raises: :exc:`ValueError`: If ``max_buffered_partitions`` is not
+            positive.
+        """
+        if max_buffered_partitions is not None and max_buffered_partitions < 1:
+            raise ValueError(
+                "max_buffered_partitions must be positive, got %r"
+                % (max_buffered_partitions,)
+            )
+        if max_workers is None:
+            max_workers = multiprocessing.cpu_count()
+            if not use_processes:
+                max_workers *= 5
+        if max_buffered_partitions is None:
+            max_buffered_partitions = 2 * max_workers
+
+        if use_processes:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+            database = self._database
+            database_info = (
+                database._instance._client.project,
+                database._instance.instance_id,
+                database.database_id,
+            )
+            worker = functools.partial(
+                _process_batch_in_subprocess, database_info, self.to_dict(), retry
+            )
+        else:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+            self._get_snapshot()  # Begin the transaction before fanning out.
+            worker = functools.partial(_process_batch, self, retry)
+
+        return _merge_partition_results(
+            executor, worker, batches, max_buffered_partitions
+        )
+
+    def run_partitioned_query(
+        self,
+        sql,
+        params=None,
+        param_types=None,
+        partition_size_bytes=None,
+        max_partitions=None,
+        **kw
+    ):
+        """Partition a query and process all the partitions concurrently.
+
+        See :meth:`generate_query_batches` and :meth:`process_batches`.
+
+        :type sql: str
+        :param sql: SQL query statement
+
+        :type params: dict, {str -> column value}
+        :param params: values for parameter replacement.  Keys must match
+                       the names used in ``sql``.
+
+        :type param_types: dict[str -> Union[dict, .types.Type]]
+        :param param_types:
+            (Optional) maps explicit types for one or more param values;
+            required if parameters are passed.
+
+        :type partition_size_bytes: int
+        :param partition_size_bytes:
+            (Optional) desired size for each partition generated.  The service
+            uses this as a hint, the actual partition size may differ.
+
+        :type max_partitions: int
+        :param max_partitions:
+            (Optional) desired maximum number of partitions generated. The
+            service uses this as a hint, the actual number of partitions may
+            differ.
+
+        :type kw: dict
+        :param kw: passed through to :meth:`process_batches`.
+
+        :rtype: iterable of list
+        :returns: rows from all the partitions.
+        """
+        batches = list(
+            self.generate_query_batches(
+                sql,
+                params=params,
+                param_types=param_types,
+                partition_size_bytes=partition_size_bytes,
+                max_partitions=max_partitions,
+            )
+        )
+        return self.process_batches(batches, **kw)
+
+    def run_partitioned_read(
+        self,
+        table,
+        columns,
+        keyset,
+        index="",
+        partition_size_bytes=None,
+        max_partitions=None,
+        **kw
+    ):
+        """Partition a read and process all the partitions concurrently.
+
+        See :meth:`generate_read_batches` and :meth:`process_batches`.
+
+        :type table: str
+        :param table: name of the table from which to fetch data
+
+        :type columns: list of str
+        :param columns: names of columns to be retrieved
+
+        :type keyset: :class:`~google.cloud.spanner_v1.keyset.KeySet`
+        :param keyset: keys / ranges identifying rows to be retrieved
+
+        :type index: str
+        :param index: (Optional) name of index to use, rather than the
+                      table's primary key
+
+        :type partition_size_bytes: int
+        :param partition_size_bytes:
+            (Optional) desired size for each partition generated.  The service
+            uses this as a hint, the actual partition size may differ.
+
+        :type max_partitions: int
+        :param max_partitions:
+            (Optional) desired maximum number of partitions generated. The
+            service uses this as a hint, the actual number of partitions may
+            differ.
+
+        :type kw: dict
+        :param kw: passed through to :meth:`process_batches`.
+
+        :rtype: iterable of list
+        :returns: rows from all the partitions.
+        """
+        batches = list(
+            self.generate_read_batches(
+                table,
+                columns,
+                keyset,
+                index=index,
+                partition_size_bytes=partition_size_bytes,
+                max_partitions=max_partitions,
+            )
+        )
+        return self.process_batches(batches, **kw)
+
     def close(self):
         """Clean up underlying session.
 
@@ -787,6 +1032,118 @@ class BatchSnapshot(object):
             self._session.delete()
 
 
+def _consume_batch(batch_snapshot, batch):
+    """Helper for :func:`_process_batch`."""
+    return list(batch_snapshot.process(batch))
+
+
+def _process_batch(batch_snapshot, retry, batch):
+    """Read all rows of a partition, retrying the partition as needed.
+
+    :type batch_snapshot: :class:`BatchSnapshot`
+    :param batch_snapshot: snapshot used to process the partition
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: retry applied to the partition, or None
+
+    :type batch: mapping
+    :param batch: one of the mappings returned from
+                  :meth:`BatchSnapshot.generate_query_batches` /
+                  :meth:`BatchSnapshot.generate_read_batches`.
+
+    :rtype: list of list
+    :returns: the partition's rows
+    """
+    consume = functools.partial(_consume_batch, batch_snapshot, batch)
+    if retry is not None:
+        consume = retry(consume)
+    return consume()
+
+
+_SUBPROCESS_DATABASES = {}
+
+
+def _process_batch_in_subprocess(database_info, snapshot_state, retry, batch):
+    """Helper for :meth:`BatchSnapshot.process_batches` using processes.
+
+    The database (and its client / channel) are created once per process.
+    The snapshot is reconstituted for each partition:  those created via
+    :meth:`BatchSnapshot.from_dict` are single-use.
+
+    :type database_info: tuple
+    :param database_info: project, instance ID and database ID
+
+    :type snapshot_state: dict
+    :param snapshot_state: state returned from :meth:`BatchSnapshot.to_dict`
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: retry applied to the partition, or None
+
+    :type batch: mapping
+    :param batch: partition to process
+
+    :rtype: list of list
+    :returns: the partition's rows
+    """
+    database = _SUBPROCESS_DATABASES.get(database_info)
+    if database is None:
+        from google.cloud.spanner_v1.client import Client
+
+        project, instance_id, database_id = database_info
+        instance = Client(project=project).instance(instance_id)
+        database = _SUBPROCESS_DATABASES[database_info] = instance.database(database_id)
+
+    def consume():
+        batch_snapshot = BatchSnapshot.from_dict(database, snapshot_state)
+        return _consume_batch(batch_snapshot, batch)
+
+    if retry is not None:
+        consume = retry(consume)
+    return consume()
+
+
+def _merge_partition_results(executor, worker, batches, max_pending):
+    """Run ``worker`` for each batch on ``executor``, merging the results.
+
+    :type executor: :class:`concurrent.futures.Executor`
+    :param executor: executor running the workers;  shut down when done
+
+    :type worker: callable
+    :param worker: takes a batch, returns a list of rows
+
+    :type batches: iterable of mapping
+    :param batches: partitions to process
+
+    :type max_pending: int
+    :param max_pending: maximum number of partitions submitted, but not yet
+                        fully yielded, at once
+
+    :rtype: iterable of list
+    :returns: rows from all partitions, in order of partition completion
+    """
+    batches = iter(batches)
+    pending = set()
+    try:
+        for batch in itertools.islice(batches, max_pending):
+            pending.add(executor.submit(worker, batch))
+
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                for row in future.result():
+                    yield row
+                # Only replace the partition once its rows are consumed, so
+                # that at most ``max_pending`` are held in memory.
+                for batch in itertools.islice(batches, 1):
+                    pending.add(executor.submit(worker, batch))
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown()
+
+
 def _check_ddl_statements(value):
     """Validate DDL Statements used to define database schema.
 
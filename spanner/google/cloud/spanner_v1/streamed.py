@@ -14,18 +14,47 @@
 
 """Wrapper for streaming results."""
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 from google.protobuf.struct_pb2 import ListValue
 from google.protobuf.struct_pb2 import Value
 from google.cloud import exceptions
 from google.cloud.spanner_v1.proto import type_pb2
+import pytz
 import six
 
 # pylint: disable=ungrouped-imports
+from google.cloud.spanner_v1._helpers import _parse_column_value_pbs
 from google.cloud.spanner_v1._helpers import _parse_value_pb
 
 # pylint: enable=ungrouped-imports
 
 
+_NO_PANDAS_ERROR = (
+    "The pandas library is not installed, please install "
+    "pandas to use the to_dataframe() function."
+)
+_NO_PYARROW_ERROR = (
+    "The pyarrow library is not installed, please install "
+    "pyarrow to use the to_arrow() function."
+)
+DEFAULT_CHUNK_SIZE = 10000
+"""Default number of rows decoded at once by the columnar conversions."""
+
+
 class StreamedResultSet(object):
     """Process a sequence of partial result sets into a single set of row data.
 
@@ -113,6 +142,17 @@ class StreamedResultSet(object):
 
         Parse the result set into new/existing rows in :attr:`_rows`
         """
+        self._merge_values(self._next_values())
+
+    def _next_values(self):
+        """Fetch the next partial result set from the stream.
+
+        Records metadata / stats, and merges any chunked value left pending
+        by the previous partial result set.
+
+        :rtype: list of :class:`~google.protobuf.struct_pb2.Value`
+        :returns: complete, still-unparsed values from the result set.
+        """
         response = six.next(self._response_iterator)
         self._counter += 1
 
@@ -133,7 +173,7 @@ class StreamedResultSet(object):
         if response.chunked_value:
             self._pending_chunk = values.pop()
 
-        self._merge_values(values)
+        return values
 
     def __iter__(self):
         iter_rows, self._rows[:] = self._rows[:], ()
@@ -191,6 +231,278 @@ class StreamedResultSet(object):
         except StopIteration:
             return answer
 
+    def _iter_column_chunks(self, chunk_size):
+        """Consume the stream as column-major chunks of unparsed values.
+
+        :type chunk_size: int
+        :param chunk_size: maximum number of rows in each chunk.
+
+        :rtype: iterable of list
+        :returns: one list of :class:`~google.protobuf.struct_pb2.Value` per
+                  field, for each chunk.  At least one (possibly empty) chunk
+                  is returned once the result set metadata has been received.
+        :raises: :exc:`ValueError`: If ``chunk_size`` is not positive.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive, got %r" % (chunk_size,))
+        if self._metadata is not None:
+            raise RuntimeError(
+                "Can not convert results to columns after "
+                "stream consumption has already started."
+            )
+
+        columns = None
+        num_rows = 0
+        yielded = False
+        pending = []  # Values for rows not yet complete / not yet chunked
+        while True:
+            try:
+                pending.extend(self._next_values())
+            except StopIteration:
+                break
+
+            width = len(self.fields)
+            if columns is None:
+                columns = [[] for _ in range(width)]
+            if not width:
+                continue
+
+            start = 0
+            while len(pending) - start >= width:
+                taken = min((len(pending) - start) // width, chunk_size - num_rows)
+                stop = start + taken * width
+                for index, column in enumerate(columns):
+                    column.extend(pending[start + index : stop : width])
+                num_rows += taken
+                start = stop
+                if num_rows == chunk_size:
+                    yield columns
+                    yielded = True
+                    columns = [[] for _ in range(width)]
+                    num_rows = 0
+            del pending[:start]
+
+        if columns is not None and (num_rows or not yielded):
+            yield columns
+
+    def _iter_decoded_chunks(self, chunk_size):
+        """Consume the stream as chunks of typed columns.
+
+        :type chunk_size: int
+        :param chunk_size: maximum number of rows in each chunk.
+
+        :rtype: iterable of list
+        :returns: one ``(field, values, nulls)`` tuple per field, for each
+                  chunk;  see
+                  :func:`~google.cloud.spanner_v1._helpers._parse_column_value_pbs`.
+        """
+        for columns in self._iter_column_chunks(chunk_size):
+            yield [
+                (field,) + _parse_column_value_pbs(column, field.type)
+                for field, column in zip(self.fields, columns)
+            ]
+
+    def to_arrow_iterable(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Consume the results as a stream of :class:`pyarrow.RecordBatch`.
+
+        ``INT64``, ``FLOAT64``, ``BOOL``, ``DATE`` and ``TIMESTAMP`` columns
+        are decoded straight into typed arrays, without creating a Python
+        object per cell.  At most ``chunk_size`` rows are buffered at once.
+        ``TIMESTAMP`` columns are truncated to microseconds.
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) maximum number of rows in each batch.
+
+        :rtype: iterable of :class:`pyarrow.RecordBatch`
+        :returns: record batches holding the rows, in order.
+        :raises: :exc:`ValueError`: If the :mod:`pyarrow` library cannot be
+            imported, or if ``chunk_size`` is not positive.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+
+        for decoded in self._iter_decoded_chunks(chunk_size):
+            arrays = [
+                _arrow_array(values, nulls, field.type)
+                for field, values, nulls in decoded
+            ]
+            names = [field.name for field, _, _ in decoded]
+            yield pyarrow.RecordBatch.from_arrays(arrays, names)
+
+    def to_arrow(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Consume the results into a :class:`pyarrow.Table`.
+
+        See :meth:`to_arrow_iterable`.
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) maximum number of rows decoded at once.
+
+        :rtype: :class:`pyarrow.Table`
+        :returns: a table holding all rows.
+        :raises: :exc:`ValueError`: If the :mod:`pyarrow` library cannot be
+            imported, or if ``chunk_size`` is not positive.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        batches = list(self.to_arrow_iterable(chunk_size=chunk_size))
+        if not batches:
+            return pyarrow.Table.from_batches([], schema=pyarrow.schema([]))
+        return pyarrow.Table.from_batches(batches)
+
+    def to_dataframe_iterable(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Consume the results as a stream of :class:`pandas.DataFrame`.
+
+        ``INT64``, ``FLOAT64``, ``BOOL``, ``DATE`` and ``TIMESTAMP`` columns
+        are decoded straight into typed arrays, without creating a Python
+        object per cell.  At most ``chunk_size`` rows are buffered at once.
+
+        ``INT64`` columns containing ``NULL`` are returned as ``float64``
+        (with ``NaN``), and ``BOOL`` columns containing ``NULL`` as
+        ``object``.  ``TIMESTAMP`` columns are timezone-aware (UTC), and
+        truncated to microseconds;  with :mod:`pandas` older than 2.0,
+        those holding years before 1677 or after 2262 are returned as
+        ``object`` columns of :class:`datetime.datetime`.
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) maximum number of rows in each frame.
+
+        :rtype: iterable of :class:`pandas.DataFrame`
+        :returns: frames holding the rows, in order.
+        :raises: :exc:`ValueError`: If the :mod:`pandas` library cannot be
+            imported, or if ``chunk_size`` is not positive.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+
+        for decoded in self._iter_decoded_chunks(chunk_size):
+            frame = pandas.DataFrame(
+                {
+                    index: _pandas_series(values, nulls, field.type)
+                    for index, (field, values, nulls) in enumerate(decoded)
+                },
+                columns=range(len(decoded)),
+            )
+            # Assign names afterwards:  query results may repeat names.
+            frame.columns = [field.name for field, _, _ in decoded]
+            yield frame
+
+    def to_dataframe(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Consume the results into a :class:`pandas.DataFrame`.
+
+        See :meth:`to_dataframe_iterable`.
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) maximum number of rows decoded at once.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: a frame holding all rows, with columns named after
+                  :attr:`fields`.
+        :raises: :exc:`ValueError`: If the :mod:`pandas` library cannot be
+            imported, or if ``chunk_size`` is not positive.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        frames = list(self.to_dataframe_iterable(chunk_size=chunk_size))
+        if not frames:
+            return pandas.DataFrame()
+        if len(frames) == 1:
+            return frames[0]
+        return pandas.concat(frames, ignore_index=True)
+
+
+def _arrow_type(field_type):  # pylint: disable=too-many-return-statements
+    """Helper for :meth:`StreamedResultSet.to_arrow_iterable`.
+
+    :rtype: :class:`pyarrow.DataType`
+    :returns: the Arrow type corresponding to the field type.
+    """
+    code = field_type.code
+    if code == type_pb2.ARRAY:
+        return pyarrow.list_(_arrow_type(field_type.array_element_type))
+    if code == type_pb2.STRUCT:
+        return pyarrow.struct(
+            [
+                (field.name, _arrow_type(field.type))
+                for field in field_type.struct_type.fields
+            ]
+        )
+    if code == type_pb2.BOOL:
+        return pyarrow.bool_()
+    if code == type_pb2.BYTES:
+        return pyarrow.binary()
+    if code == type_pb2.DATE:
+        return pyarrow.date32()
+    if code == type_pb2.FLOAT64:
+        return pyarrow.float64()
+    if code == type_pb2.INT64:
+        return pyarrow.int64()
+    if code == type_pb2.STRING:
+        return pyarrow.string()
+    if code == type_pb2.TIMESTAMP:
+        return pyarrow.timestamp("us", tz="UTC")
+    raise ValueError("Unknown type: %s" % (field_type,))
+
+
+def _arrow_value(value, field_type):
+    """Helper for :func:`_arrow_array`:  pyarrow wants structs as tuples."""
+    if value is None:
+        return None
+    if field_type.code == type_pb2.ARRAY:
+        element_type = field_type.array_element_type
+        return [_arrow_value(item, element_type) for item in value]
+    if field_type.code == type_pb2.STRUCT:
+        return tuple(
+            _arrow_value(item, field.type)
+            for item, field in zip(value, field_type.struct_type.fields)
+        )
+    return value
+
+
+def _arrow_array(values, nulls, field_type):
+    """Helper for :meth:`StreamedResultSet.to_arrow_iterable`."""
+    if field_type.code in (type_pb2.ARRAY, type_pb2.STRUCT):
+        values = [_arrow_value(value, field_type) for value in values]
+    return pyarrow.array(values, mask=nulls, type=_arrow_type(field_type))
+
+
+def _pandas_series(values, nulls, field_type):
+    """Helper for :meth:`StreamedResultSet.to_dataframe_iterable`."""
+    code = field_type.code
+    if nulls.any():
+        if code == type_pb2.INT64:
+            values = values.astype(numpy.float64)
+            values[nulls] = numpy.nan
+        elif code == type_pb2.BOOL:
+            values = values.astype(object)
+            values[nulls] = None
+    if code == type_pb2.TIMESTAMP:
+        return _pandas_timestamp_series(values)
+    return pandas.Series(values)
+
+
+def _pandas_timestamp_series(values):
+    """Helper for :func:`_pandas_series`.
+
+    Before 2.0, :mod:`pandas` stores timestamps in nanoseconds, which cannot
+    represent years before 1677 or after 2262:  columns holding such values
+    fall back to ``object`` series of :class:`datetime.datetime`.
+    """
+    try:
+        series = pandas.Series(values)
+    except ValueError:  # ``OutOfBoundsDatetime`` is a ``ValueError``.
+        cells = values.astype(object)
+        return pandas.Series(
+            [None if cell is None else cell.replace(tzinfo=pytz.UTC) for cell in cells],
+            dtype=object,
+        )
+    return series.dt.tz_localize("UTC")
+
 
 class Unmergeable(ValueError):
     """Unable to merge two values.
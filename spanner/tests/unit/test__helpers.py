@@ -15,6 +15,16 @@
 
 import unittest
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
 
 class Test_make_value_pb(unittest.TestCase):
     def _callFUT(self, *args, **kw):
@@ -225,6 +235,185 @@ class Test_make_list_value_pbs(unittest.TestCase):
             self.assertEqual(found.values[0].string_value, str(expected[0]))
             self.assertEqual(found.values[1].string_value, expected[1])
 
+    def _assert_matches_per_cell(self, values, result):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        self.assertEqual(result, [_make_list_value_pb(row) for row in values])
+
+    def test_w_all_scalar_types(self):
+        import datetime
+        import pytz
+        from google.api_core import datetime_helpers
+
+        stamp = datetime_helpers.DatetimeWithNanoseconds(
+            2016, 12, 20, 21, 13, 47, nanosecond=123456789, tzinfo=pytz.UTC
+        )
+        row = [
+            True,
+            42,
+            3.5,
+            u"text",
+            b"Ynl0ZXM=",
+            stamp,
+            datetime.datetime(2016, 12, 20, 21, 13, 47, tzinfo=pytz.UTC),
+            datetime.date(2016, 12, 20),
+            [1, 2],
+            None,
+        ]
+        values = [row, list(row)]
+        self._assert_matches_per_cell(values, self._callFUT(values))
+
+    def test_w_mixed_types_in_column(self):
+        values = [
+            [None, 1, 1.5, u"A"],
+            [u"X", None, float("nan"), 2],
+            [u"Y", u"2", float("-inf"), None],
+            [u"Z", 3, float("inf"), u"B"],
+        ]
+        self._assert_matches_per_cell(values, self._callFUT(values))
+
+    def test_w_ragged_rows(self):
+        values = [[0, u"A"], [1], [2, u"C"]]
+        self._assert_matches_per_cell(values, self._callFUT(values))
+
+    def test_w_generator(self):
+        values = [[0, u"A"], [1, u"B"]]
+        result = self._callFUT(row for row in values)
+        self._assert_matches_per_cell(values, result)
+
+    def test_w_invalid_bytes(self):
+        with self.assertRaises(ValueError):
+            self._callFUT([[b"\xff\xfe\x03&"]])
+
+    @unittest.skipIf(numpy is None, "Requires `numpy`")
+    def test_w_numpy_array(self):
+        values = numpy.array([[1, 2], [3, -4]], dtype=numpy.int64)
+        result = self._callFUT(values)
+        self._assert_matches_per_cell([[1, 2], [3, -4]], result)
+
+    @unittest.skipIf(numpy is None, "Requires `numpy`")
+    def test_w_numpy_array_of_dates(self):
+        import datetime
+
+        values = numpy.array([["2016-12-20"], ["NaT"]], dtype="datetime64[D]")
+        result = self._callFUT(values)
+        self._assert_matches_per_cell([[datetime.date(2016, 12, 20)], [None]], result)
+
+    @unittest.skipIf(numpy is None, "Requires `numpy`")
+    def test_w_numpy_array_not_2d(self):
+        with self.assertRaises(ValueError):
+            self._callFUT(numpy.array([1, 2]))
+
+    @unittest.skipIf(numpy is None, "Requires `numpy`")
+    def test_w_numpy_array_of_floats(self):
+        # numpy casts the integers to floats, which INT64 columns reject.
+        values = numpy.array([[1, 2.5], [3, 4.5]])
+        with self.assertRaises(ValueError):
+            self._callFUT(values, columns=["id", "score"])
+
+    @unittest.skipIf(numpy is None, "Requires `numpy`")
+    def test_w_numpy_array_of_objects(self):
+        values = numpy.array([[1, 2.5], [3, None]], dtype=object)
+        result = self._callFUT(values, columns=["id", "score"])
+        self._assert_matches_per_cell([[1, 2.5], [3, None]], result)
+
+    @unittest.skipIf(numpy is None, "Requires `numpy`")
+    def test_w_numpy_array_w_wrong_width(self):
+        values = numpy.array([[1, 2], [3, 4]], dtype=numpy.int64)
+        with self.assertRaises(ValueError):
+            self._callFUT(values, columns=["a", "b", "c"])
+
+    @unittest.skipIf(numpy is None, "Requires `numpy`")
+    def test_w_numpy_structured_array(self):
+        values = numpy.array(
+            [(1, 2.5), (3, 4.5)], dtype=[("id", numpy.int64), ("score", numpy.float64)]
+        )
+
+        by_name = self._callFUT(values, columns=["score", "id"])
+        in_order = self._callFUT(values)
+
+        self._assert_matches_per_cell([[2.5, 1], [4.5, 3]], by_name)
+        self._assert_matches_per_cell([[1, 2.5], [3, 4.5]], in_order)
+        with self.assertRaises(ValueError):
+            self._callFUT(values, columns=["id", "name"])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_w_dataframe(self):
+        import datetime
+        import pytz
+        from google.api_core import datetime_helpers
+
+        frame = pandas.DataFrame(
+            {
+                "name": [u"Phred", None, u"Wylma"],
+                "age": [32, 31, 30],
+                "score": [1.5, float("nan"), 2.5],
+                "married": [True, False, True],
+                "when": pandas.to_datetime(
+                    [
+                        "2016-12-20T21:13:47.123456789Z",
+                        None,
+                        "2016-12-21T00:00:00.987654321Z",
+                    ]
+                ),
+                "day": [datetime.date(2016, 12, 20), None, datetime.date(2016, 12, 22)],
+            }
+        )
+
+        result = self._callFUT(frame)
+
+        stamp = datetime_helpers.DatetimeWithNanoseconds(
+            2016, 12, 20, 21, 13, 47, nanosecond=123456789, tzinfo=pytz.UTC
+        )
+        expected = [
+            [u"Phred", 32, 1.5, True, stamp, datetime.date(2016, 12, 20)],
+            [None, 31, float("nan"), False, None, None],
+            [
+                u"Wylma",
+                30,
+                2.5,
+                True,
+                datetime_helpers.DatetimeWithNanoseconds(
+                    2016, 12, 21, nanosecond=987654321, tzinfo=pytz.UTC
+                ),
+                datetime.date(2016, 12, 22),
+            ],
+        ]
+        self._assert_matches_per_cell(expected, result)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_w_dataframe_w_columns(self):
+        frame = pandas.DataFrame({"a": [1, 2], "b": [u"x", u"y"], "c": [0.5, 1.5]})
+
+        by_name = self._callFUT(frame, columns=["c", "a"])
+        in_order = self._callFUT(frame)
+
+        self._assert_matches_per_cell([[0.5, 1], [1.5, 2]], by_name)
+        self._assert_matches_per_cell([[1, u"x", 0.5], [2, u"y", 1.5]], in_order)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_w_dataframe_w_missing_columns(self):
+        frame = pandas.DataFrame({"a": [1, 2], "b": [u"x", u"y"]})
+
+        with self.assertRaises(ValueError):
+            self._callFUT(frame, columns=["a", "c"])
+
+    @unittest.skipIf(
+        pandas is None or not hasattr(pandas, "NA"), "Requires `pandas.NA`"
+    )
+    def test_w_dataframe_w_nullable_dtypes(self):
+        frame = pandas.DataFrame(
+            {
+                "id": pandas.array([1, None], dtype="Int64"),
+                "married": pandas.array([None, True], dtype="boolean"),
+                "name": pandas.array([u"x", None], dtype="string"),
+            }
+        )
+
+        result = self._callFUT(frame, columns=["id", "married", "name"])
+
+        self._assert_matches_per_cell([[1, None, u"x"], [None, True, None]], result)
+
 
 class Test_parse_value_pb(unittest.TestCase):
     def _callFUT(self, *args, **kw):
@@ -426,6 +615,142 @@ class Test_parse_list_value_pbs(unittest.TestCase):
         )
 
 
+@unittest.skipIf(numpy is None, "Requires `numpy`")
+class Test_parse_column_value_pbs(unittest.TestCase):
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._helpers import _parse_column_value_pbs
+
+        return _parse_column_value_pbs(*args, **kw)
+
+    @staticmethod
+    def _make_value_pbs(values):
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        return [_make_value_pb(value) for value in values]
+
+    def test_w_int(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, INT64
+
+        value_pbs = self._make_value_pbs([1, None, -(2 ** 62)])
+
+        values, nulls = self._callFUT(value_pbs, Type(code=INT64))
+
+        self.assertEqual(values.dtype, numpy.int64)
+        self.assertEqual(values.tolist(), [1, 0, -(2 ** 62)])
+        self.assertEqual(nulls.tolist(), [False, True, False])
+
+    def test_w_int_empty(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, INT64
+
+        values, nulls = self._callFUT([], Type(code=INT64))
+
+        self.assertEqual(values.dtype, numpy.int64)
+        self.assertEqual(len(values), 0)
+        self.assertEqual(len(nulls), 0)
+
+    def test_w_float(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, FLOAT64
+
+        value_pbs = self._make_value_pbs(
+            [3.5, None, float("nan"), float("inf"), float("-inf")]
+        )
+
+        values, nulls = self._callFUT(value_pbs, Type(code=FLOAT64))
+
+        self.assertEqual(values.dtype, numpy.float64)
+        self.assertEqual(values[0], 3.5)
+        self.assertTrue(numpy.isnan(values[1]))
+        self.assertTrue(numpy.isnan(values[2]))
+        self.assertEqual(values[3], float("inf"))
+        self.assertEqual(values[4], float("-inf"))
+        self.assertEqual(nulls.tolist(), [False, True, False, False, False])
+
+    def test_w_bool(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, BOOL
+
+        value_pbs = self._make_value_pbs([True, None, False])
+
+        values, nulls = self._callFUT(value_pbs, Type(code=BOOL))
+
+        self.assertEqual(values.dtype, numpy.bool_)
+        self.assertEqual(values.tolist(), [True, False, False])
+        self.assertEqual(nulls.tolist(), [False, True, False])
+
+    def test_w_date(self):
+        import datetime
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, DATE
+
+        value_pbs = self._make_value_pbs([datetime.date(2019, 2, 28), None])
+
+        values, nulls = self._callFUT(value_pbs, Type(code=DATE))
+
+        self.assertEqual(values.dtype, numpy.dtype("datetime64[D]"))
+        self.assertEqual(values[0], numpy.datetime64("2019-02-28"))
+        self.assertTrue(numpy.isnat(values[1]))
+        self.assertEqual(nulls.tolist(), [False, True])
+
+    def test_w_date_empty(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, DATE
+
+        values, nulls = self._callFUT([], Type(code=DATE))
+
+        self.assertEqual(values.dtype, numpy.dtype("datetime64[D]"))
+        self.assertEqual(len(values), 0)
+
+    def test_w_timestamp(self):
+        import pytz
+        from google.api_core import datetime_helpers
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, TIMESTAMP
+
+        value = datetime_helpers.DatetimeWithNanoseconds(
+            2016, 12, 20, 21, 13, 47, nanosecond=123456789, tzinfo=pytz.UTC
+        )
+        value_pbs = self._make_value_pbs([value, None])
+
+        values, nulls = self._callFUT(value_pbs, Type(code=TIMESTAMP))
+
+        self.assertEqual(values.dtype, numpy.dtype("datetime64[us]"))
+        self.assertEqual(values[0], numpy.datetime64("2016-12-20T21:13:47.123456"))
+        self.assertTrue(numpy.isnat(values[1]))
+        self.assertEqual(nulls.tolist(), [False, True])
+
+    def test_w_timestamp_outside_nanosecond_range(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, TIMESTAMP
+
+        value_pbs = [
+            Value(string_value=u"0001-01-01T00:00:00Z"),
+            Value(string_value=u"9999-12-31T23:59:59.999999999Z"),
+        ]
+
+        values, nulls = self._callFUT(value_pbs, Type(code=TIMESTAMP))
+
+        self.assertEqual(values.dtype, numpy.dtype("datetime64[us]"))
+        self.assertEqual(values[0], numpy.datetime64("0001-01-01T00:00:00"))
+        self.assertEqual(values[1], numpy.datetime64("9999-12-31T23:59:59.999999"))
+        self.assertEqual(nulls.tolist(), [False, False])
+
+    def test_w_timestamp_empty(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, TIMESTAMP
+
+        values, nulls = self._callFUT([], Type(code=TIMESTAMP))
+
+        self.assertEqual(values.dtype, numpy.dtype("datetime64[us]"))
+        self.assertEqual(len(values), 0)
+
+    def test_w_array(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, ARRAY, INT64
+
+        value_pbs = self._make_value_pbs([[1, 2], None, []])
+        field_type = Type(code=ARRAY, array_element_type=Type(code=INT64))
+
+        values, nulls = self._callFUT(value_pbs, field_type)
+
+        self.assertEqual(values.dtype, object)
+        self.assertEqual(values.tolist(), [[1, 2], None, []])
+        self.assertEqual(nulls.tolist(), [False, True, False])
+
+
 class Test_SessionWrapper(unittest.TestCase):
     def _getTargetClass(self):
         from google.cloud.spanner_v1._helpers import _SessionWrapper
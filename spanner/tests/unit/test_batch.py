@@ -303,6 +303,172 @@ class TestBatch(_BaseTest):
         self.assertEqual(len(batch._mutations), 1)
 
 
+class TestBulkWriter(_BaseTest):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.batch import BulkWriter
+
+        return BulkWriter
+
+    def _make_database(self, **kw):
+        import datetime
+        from google.cloud.spanner_v1.proto.spanner_pb2 import CommitResponse
+        from google.cloud._helpers import UTC
+        from google.cloud._helpers import _datetime_to_pb_timestamp
+
+        now = datetime.datetime.utcnow().replace(tzinfo=UTC)
+        response = CommitResponse(commit_timestamp=_datetime_to_pb_timestamp(now))
+        database = _Database()
+        database.spanner_api = _FauxSpannerAPI(_commit_response=response, **kw)
+        database._pool = _Pool(database)
+        return database
+
+    def test_ctor(self):
+        from google.cloud.spanner_v1.batch import DEFAULT_MAX_COMMIT_BYTES
+        from google.cloud.spanner_v1.batch import MAX_MUTATIONS_PER_COMMIT
+
+        database = self._make_database()
+        writer = self._make_one(database)
+        self.assertIs(writer._database, database)
+        self.assertEqual(writer._max_mutations, MAX_MUTATIONS_PER_COMMIT)
+        self.assertEqual(writer._max_commit_bytes, DEFAULT_MAX_COMMIT_BYTES)
+        self.assertEqual(writer.failures, [])
+        self.assertEqual(writer.stats.rows, 0)
+        self.assertEqual(writer.stats.elapsed_seconds, 0.0)
+
+    def test_write_splits_by_mutation_count(self):
+        database = self._make_database()
+        writer = self._make_one(database, max_mutations=10, max_sessions=2)
+
+        with writer:
+            writer.insert(TABLE_NAME, COLUMNS, (list(row) for row in VALUES * 3))
+
+        # Four columns per row:  two rows per commit.
+        api = database.spanner_api
+        self.assertEqual(len(api._commits), 3)
+        for session, mutations, single_use_txn, metadata in api._commits:
+            self.assertEqual(session, self.SESSION_NAME)
+            self.assertTrue(single_use_txn.HasField("read_write"))
+            self.assertEqual(len(mutations), 1)
+            write = mutations[0].insert
+            self.assertEqual(write.table, TABLE_NAME)
+            self.assertEqual(write.columns, COLUMNS)
+            self.assertEqual(len(write.values), 2)
+
+        stats = writer.stats
+        self.assertEqual(stats.rows, 6)
+        self.assertEqual(stats.mutations, 24)
+        self.assertEqual(stats.commits, 3)
+        self.assertEqual(stats.failed_rows, 0)
+        self.assertGreater(stats.bytes, 0)
+        self.assertGreaterEqual(stats.elapsed_seconds, 0.0)
+        self.assertEqual(database._pool._sessions_out, 0)
+
+    def test_write_splits_by_bytes(self):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        row_bytes = _make_list_value_pb(VALUES[0]).ByteSize()
+        database = self._make_database()
+        writer = self._make_one(database, max_commit_bytes=row_bytes)
+
+        writer.update(TABLE_NAME, COLUMNS, [VALUES[0], VALUES[0]])
+        writer.close()
+
+        commits = database.spanner_api._commits
+        self.assertEqual(len(commits), 2)
+        for _, mutations, _, _ in commits:
+            self.assertEqual(len(mutations[0].update.values), 1)
+        self.assertEqual(writer.stats.bytes, 2 * row_bytes)
+
+    def test_write_combines_operations_in_one_commit(self):
+        database = self._make_database()
+        writer = self._make_one(database)
+
+        writer.insert(TABLE_NAME, COLUMNS, VALUES[:1])
+        writer.insert_or_update(TABLE_NAME, COLUMNS, VALUES[1:])
+        writer.replace(TABLE_NAME, COLUMNS, VALUES[1:])
+        writer.flush()
+
+        (commit,) = database.spanner_api._commits
+        mutations = commit[1]
+        self.assertEqual(
+            [mutation.WhichOneof("operation") for mutation in mutations],
+            ["insert", "insert_or_update", "replace"],
+        )
+        writer.close()
+        writer.close()  # no-op
+
+    def test_write_after_close(self):
+        database = self._make_database()
+        writer = self._make_one(database)
+        writer.close()
+
+        with self.assertRaises(ValueError):
+            writer.insert(TABLE_NAME, COLUMNS, VALUES)
+
+    def test_commit_failure_recorded(self):
+        from google.api_core.exceptions import Unknown
+
+        database = self._make_database(_rpc_error=True)
+        writer = self._make_one(database, max_mutations=4)
+
+        with writer:
+            writer.insert(TABLE_NAME, COLUMNS, VALUES)
+
+        self.assertEqual(len(writer.failures), 2)
+        for failure in writer.failures:
+            self.assertEqual(failure.row_count, 1)
+            self.assertEqual(len(failure.mutations), 1)
+            self.assertIsInstance(failure.exception, Unknown)
+        stats = writer.stats
+        self.assertEqual(stats.rows, 0)
+        self.assertEqual(stats.failed_rows, 2)
+        self.assertEqual(stats.failed_commits, 2)
+
+    def test_unexpected_error_raised_by_flush(self):
+        database = self._make_database(_unexpected_error=True)
+        writer = self._make_one(database)
+        writer.insert(TABLE_NAME, COLUMNS, VALUES)
+
+        with self.assertRaises(RuntimeError):
+            writer.flush()
+
+        writer.flush()  # error is only raised once
+
+    def test_context_mgr_failure_discards_buffered_rows(self):
+        database = self._make_database()
+        writer = self._make_one(database)
+
+        class _BailOut(Exception):
+            pass
+
+        with self.assertRaises(_BailOut):
+            with writer:
+                writer.insert(TABLE_NAME, COLUMNS, VALUES)
+                raise _BailOut()
+
+        self.assertEqual(database.spanner_api._commits, [])
+        with self.assertRaises(ValueError):
+            writer.insert(TABLE_NAME, COLUMNS, VALUES)
+
+
+class _Pool(object):
+    def __init__(self, database):
+        import threading
+
+        self._database = database
+        self._lock = threading.Lock()
+        self._sessions_out = 0
+
+    def get(self):
+        with self._lock:
+            self._sessions_out += 1
+        return _Session(self._database)
+
+    def put(self, session):
+        with self._lock:
+            self._sessions_out -= 1
+
+
 class _Session(object):
     def __init__(self, database=None, name=TestBatch.SESSION_NAME):
         self._database = database
@@ -319,8 +485,10 @@ class _FauxSpannerAPI:
     _instance_not_found = False
     _committed = None
     _rpc_error = False
+    _unexpected_error = False
 
     def __init__(self, **kwargs):
+        self._commits = []
         self.__dict__.update(**kwargs)
 
     def commit(
@@ -335,6 +503,9 @@ class _FauxSpannerAPI:
 
         assert transaction_id == ""
         self._committed = (session, mutations, single_use_transaction, metadata)
+        self._commits.append(self._committed)
+        if self._unexpected_error:
+            raise RuntimeError("error")
         if self._rpc_error:
             raise Unknown("error")
         return self._commit_response
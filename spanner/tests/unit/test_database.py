@@ -815,6 +815,21 @@ class TestDatabase(_BaseTest):
         self.assertIsInstance(checkout, BatchCheckout)
         self.assertIs(checkout._database, database)
 
+    def test_bulk_writer(self):
+        from google.cloud.spanner_v1.batch import BulkWriter
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        database = self._make_one(self.DATABASE_ID, instance, pool=pool)
+
+        writer = database.bulk_writer(max_mutations=100, max_sessions=2)
+
+        self.assertIsInstance(writer, BulkWriter)
+        self.assertIs(writer._database, database)
+        self.assertEqual(writer._max_mutations, 100)
+        writer.close()
+
     def test_batch_snapshot(self):
         from google.cloud.spanner_v1.database import BatchSnapshot
 
@@ -1510,6 +1525,380 @@ class TestBatchSnapshot(_BaseTest):
             sql=sql, params=params, param_types=param_types, partition=token
         )
 
+    @staticmethod
+    def _make_retry():
+        from google.cloud.spanner_v1.database import DEFAULT_PARTITION_RETRY
+
+        return DEFAULT_PARTITION_RETRY.with_delay(
+            initial=0.0, maximum=0.0, multiplier=1.0
+        )
+
+    def _make_query_batches(self, count):
+        sql = "SELECT first_name, last_name FROM citizens"
+        return [
+            {"partition": b"TOKEN%d" % (index,), "query": {"sql": sql}}
+            for index in range(count)
+        ]
+
+    def test_process_batches_w_threads(self):
+        batches = self._make_query_batches(3)
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot()
+        partition_rows = {
+            b"TOKEN0": [[u"Phred", u"Phlyntstone"], [u"Bharney", u"Rhubble"]],
+            b"TOKEN1": [],
+            b"TOKEN2": [[u"Wylma", u"Phlyntstone"]],
+        }
+        snapshot.execute_sql.side_effect = lambda partition, **kw: iter(
+            partition_rows[partition]
+        )
+
+        found = list(batch_txn.process_batches(batches, max_workers=2))
+
+        self.assertEqual(sorted(found), sorted(sum(partition_rows.values(), [])))
+        self.assertEqual(snapshot.execute_sql.call_count, 3)
+
+    def test_process_batches_w_max_buffered_partitions(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        batches = self._make_query_batches(5)
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot()
+        snapshot.execute_sql.side_effect = lambda partition, **kw: iter([[partition]])
+
+        submitted = []
+        submit = ThreadPoolExecutor.submit
+
+        def _submit(executor, fn, batch):
+            submitted.append(batch)
+            return submit(executor, fn, batch)
+
+        with mock.patch.object(ThreadPoolExecutor, "submit", new=_submit):
+            found = []
+            for row in batch_txn.process_batches(
+                batches, max_workers=4, max_buffered_partitions=2
+            ):
+                # The partition being yielded, and at most one more, are
+                # held, although more workers are available.
+                self.assertLessEqual(len(submitted) - len(found), 2)
+                found.append(row)
+
+        self.assertEqual(sorted(found), [[b"TOKEN%d" % index] for index in range(5)])
+
+    def test_process_batches_wo_max_buffered_partitions(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        batches = self._make_query_batches(6)
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot()
+        snapshot.execute_sql.side_effect = lambda partition, **kw: iter([[partition]])
+
+        submitted = []
+        submit = ThreadPoolExecutor.submit
+
+        def _submit(executor, fn, batch):
+            submitted.append(batch)
+            return submit(executor, fn, batch)
+
+        with mock.patch.object(ThreadPoolExecutor, "submit", new=_submit):
+            rows = batch_txn.process_batches(batches, max_workers=2)
+            found = [next(rows)]
+            # Twice ``max_workers`` partitions are submitted up front.
+            self.assertEqual(len(submitted), 4)
+            found.extend(rows)
+
+        self.assertEqual(sorted(found), [[b"TOKEN%d" % index] for index in range(6)])
+
+    def test_process_batches_w_invalid_max_buffered_partitions(self):
+        batches = self._make_query_batches(1)
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+
+        with self.assertRaises(ValueError):
+            batch_txn.process_batches(batches, max_buffered_partitions=0)
+
+    def test_process_batches_w_retryable_error(self):
+        from google.api_core.exceptions import InternalServerError
+
+        batches = self._make_query_batches(1)
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot()
+
+        def _execute_sql(partition, **kw):
+            if snapshot.execute_sql.call_count == 1:
+                return _FailingIterator([u"Phred"], InternalServerError("testing"))
+            return iter([[u"Phred"], [u"Bharney"]])
+
+        snapshot.execute_sql.side_effect = _execute_sql
+
+        found = list(
+            batch_txn.process_batches(batches, max_workers=1, retry=self._make_retry())
+        )
+
+        # Rows from the failed attempt are not duplicated.
+        self.assertEqual(found, [[u"Phred"], [u"Bharney"]])
+        self.assertEqual(snapshot.execute_sql.call_count, 2)
+
+    def test_process_batches_w_non_retryable_error(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        batches = self._make_query_batches(4)
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot()
+        snapshot.execute_sql.side_effect = InvalidArgument("testing")
+
+        with self.assertRaises(InvalidArgument):
+            list(
+                batch_txn.process_batches(
+                    batches, max_workers=1, retry=self._make_retry()
+                )
+            )
+
+    def test_process_batches_wo_retry(self):
+        from google.api_core.exceptions import InternalServerError
+
+        batches = self._make_query_batches(1)
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot()
+        snapshot.execute_sql.side_effect = InternalServerError("testing")
+
+        with self.assertRaises(InternalServerError):
+            list(batch_txn.process_batches(batches, retry=None))
+
+        snapshot.execute_sql.assert_called_once()
+
+    def test_process_batches_w_processes(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        batches = self._make_query_batches(2)
+        client = _Client(self.PROJECT_ID)
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        database = _Database(self.DATABASE_NAME, instance=instance)
+        batch_txn = self._make_one(database)
+        batch_txn._session = self._make_session(_session_id=self.SESSION_ID)
+        batch_txn._snapshot = self._make_snapshot(transaction_id=self.TRANSACTION_ID)
+        retry = self._make_retry()
+        worker_calls = []
+
+        def _worker(database_info, snapshot_state, retry, batch):
+            worker_calls.append((database_info, snapshot_state, retry, batch))
+            return [[batch["partition"]]]
+
+        executor_patch = mock.patch(
+            "concurrent.futures.ProcessPoolExecutor", new=ThreadPoolExecutor
+        )
+        worker_patch = mock.patch(
+            "google.cloud.spanner_v1.database._process_batch_in_subprocess", new=_worker
+        )
+        with executor_patch, worker_patch:
+            found = list(
+                batch_txn.process_batches(
+                    batches, max_workers=1, use_processes=True, retry=retry
+                )
+            )
+
+        self.assertEqual(found, [[b"TOKEN0"], [b"TOKEN1"]])
+        database_info = (self.PROJECT_ID, self.INSTANCE_ID, self.DATABASE_ID)
+        snapshot_state = {
+            "session_id": self.SESSION_ID,
+            "transaction_id": self.TRANSACTION_ID,
+        }
+        self.assertEqual(
+            worker_calls,
+            [
+                (database_info, snapshot_state, retry, batches[0]),
+                (database_info, snapshot_state, retry, batches[1]),
+            ],
+        )
+
+    def test_run_partitioned_query(self):
+        sql = "SELECT first_name, last_name FROM citizens"
+        params = {"max_age": 30}
+        param_types = {"max_age": "INT64"}
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        batches = self._make_query_batches(2)
+        expected = object()
+
+        with mock.patch.object(
+            batch_txn, "generate_query_batches", return_value=iter(batches)
+        ) as generate, mock.patch.object(
+            batch_txn, "process_batches", return_value=expected
+        ) as process:
+            found = batch_txn.run_partitioned_query(
+                sql,
+                params=params,
+                param_types=param_types,
+                max_partitions=4,
+                max_workers=3,
+            )
+
+        self.assertIs(found, expected)
+        generate.assert_called_once_with(
+            sql,
+            params=params,
+            param_types=param_types,
+            partition_size_bytes=None,
+            max_partitions=4,
+        )
+        process.assert_called_once_with(batches, max_workers=3)
+
+    def test_run_partitioned_read(self):
+        keyset = self._make_keyset()
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        batches = [{"partition": b"TOKEN", "read": {}}]
+        expected = object()
+
+        with mock.patch.object(
+            batch_txn, "generate_read_batches", return_value=iter(batches)
+        ) as generate, mock.patch.object(
+            batch_txn, "process_batches", return_value=expected
+        ) as process:
+            found = batch_txn.run_partitioned_read(
+                self.TABLE,
+                self.COLUMNS,
+                keyset,
+                partition_size_bytes=1024,
+                use_processes=True,
+            )
+
+        self.assertIs(found, expected)
+        generate.assert_called_once_with(
+            self.TABLE,
+            self.COLUMNS,
+            keyset,
+            index="",
+            partition_size_bytes=1024,
+            max_partitions=None,
+        )
+        process.assert_called_once_with(batches, use_processes=True)
+
+
+class Test_process_batch_in_subprocess(_BaseTest):
+    def _call_fut(self, *args, **kw):
+        from google.cloud.spanner_v1.database import _process_batch_in_subprocess
+
+        return _process_batch_in_subprocess(*args, **kw)
+
+    def setUp(self):
+        from google.cloud.spanner_v1 import database
+
+        patch = mock.patch.object(database, "_SUBPROCESS_DATABASES", new={})
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_it(self):
+        from google.cloud.spanner_v1 import database
+
+        database_info = (self.PROJECT_ID, self.INSTANCE_ID, self.DATABASE_ID)
+        snapshot_state = {
+            "session_id": self.SESSION_ID,
+            "transaction_id": self.TRANSACTION_ID,
+        }
+        batch = {"partition": b"TOKEN", "query": {"sql": "SELECT 1"}}
+        client = mock.Mock(spec=["instance"])
+        db = client.instance.return_value.database.return_value
+        batch_snapshot = mock.Mock(spec=["process"])
+        batch_snapshot.process.side_effect = [iter([[1]]), iter([[2]])]
+
+        with mock.patch(
+            "google.cloud.spanner_v1.client.Client", return_value=client
+        ) as client_klass, mock.patch.object(
+            database.BatchSnapshot, "from_dict", return_value=batch_snapshot
+        ) as from_dict:
+            first = self._call_fut(database_info, snapshot_state, None, batch)
+            second = self._call_fut(database_info, snapshot_state, None, batch)
+
+        self.assertEqual(first, [[1]])
+        self.assertEqual(second, [[2]])
+        # The database is created once per process, the snapshot per batch.
+        client_klass.assert_called_once_with(project=self.PROJECT_ID)
+        client.instance.assert_called_once_with(self.INSTANCE_ID)
+        client.instance.return_value.database.assert_called_once_with(self.DATABASE_ID)
+        self.assertEqual(
+            from_dict.mock_calls,
+            [mock.call(db, snapshot_state), mock.call(db, snapshot_state)],
+        )
+
+    def test_w_retry(self):
+        from google.api_core.exceptions import Aborted
+        from google.cloud.spanner_v1 import database
+        from google.cloud.spanner_v1.database import DEFAULT_PARTITION_RETRY
+
+        database_info = (self.PROJECT_ID, self.INSTANCE_ID, self.DATABASE_ID)
+        batch = {"partition": b"TOKEN", "query": {"sql": "SELECT 1"}}
+        db = database._SUBPROCESS_DATABASES[database_info] = object()
+        batch_snapshot = mock.Mock(spec=["process"])
+        batch_snapshot.process.side_effect = [Aborted("testing"), iter([[1]])]
+        retry = DEFAULT_PARTITION_RETRY.with_delay(
+            initial=0.0, maximum=0.0, multiplier=1.0
+        )
+
+        with mock.patch.object(
+            database.BatchSnapshot, "from_dict", return_value=batch_snapshot
+        ) as from_dict:
+            found = self._call_fut(database_info, {}, retry, batch)
+
+        self.assertEqual(found, [[1]])
+        self.assertEqual(from_dict.mock_calls, [mock.call(db, {})] * 2)
+
+    def test_default_retry_is_picklable(self):
+        import pickle
+        from google.api_core.exceptions import Aborted
+        from google.api_core.exceptions import NotFound
+        from google.cloud.spanner_v1.database import DEFAULT_PARTITION_RETRY
+
+        retry = pickle.loads(pickle.dumps(DEFAULT_PARTITION_RETRY))
+
+        self.assertTrue(retry._predicate(Aborted("testing")))
+        self.assertFalse(retry._predicate(NotFound("testing")))
+
+
+class Test_merge_partition_results(unittest.TestCase):
+    def _call_fut(self, *args, **kw):
+        from google.cloud.spanner_v1.database import _merge_partition_results
+
+        return _merge_partition_results(*args, **kw)
+
+    def test_bounded_window(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.submit = mock.Mock(wraps=executor.submit)
+
+        def _worker(batch):
+            return [[batch, index] for index in range(2)]
+
+        merged = self._call_fut(executor, _worker, range(3), 1)
+
+        self.assertEqual(next(merged), [0, 0])
+        # The next partition is only submitted once the first is drained.
+        submitted = [call[0][1] for call in executor.submit.call_args_list]
+        self.assertEqual(submitted, [0])
+        self.assertEqual(list(merged), [[0, 1], [1, 0], [1, 1], [2, 0], [2, 1]])
+
+    def test_close_cancels_pending(self):
+        executor = mock.Mock(spec=["submit", "shutdown"])
+        futures = [mock.Mock(spec=["cancel"]) for _ in range(2)]
+        executor.submit.side_effect = futures
+        wait_results = [(set(), set(futures)), KeyboardInterrupt()]
+
+        merged = self._call_fut(executor, None, range(5), 2)
+        with mock.patch("concurrent.futures.wait", side_effect=wait_results):
+            with self.assertRaises(KeyboardInterrupt):
+                next(merged)
+
+        for future in futures:
+            future.cancel.assert_called_once_with()
+        executor.shutdown.assert_called_once_with()
+
 
 class _Client(object):
     def __init__(self, project=TestDatabase.PROJECT_ID):
@@ -1581,3 +1970,19 @@ class _MockIterator(object):
             raise
 
     next = __next__
+
+
+class _FailingIterator(object):
+    def __init__(self, values, exc):
+        self._iter_values = iter(values)
+        self._exc = exc
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        for value in self._iter_values:
+            return [value]
+        raise self._exc
+
+    next = __next__
@@ -17,6 +17,16 @@ import unittest
 
 import mock
 
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 
 class TestStreamedResultSet(unittest.TestCase):
     def _getTargetClass(self):
@@ -821,6 +831,337 @@ class TestStreamedResultSet(unittest.TestCase):
         self.assertEqual(streamed._current_row, [])
         self.assertIsNone(streamed._pending_chunk)
 
+    def _make_typed_result_sets(self):
+        import datetime
+        import pytz
+
+        element_type = self._make_struct_type([("x", "INT64"), ("y", "STRING")])
+        FIELDS = [
+            self._make_scalar_field("id", "INT64"),
+            self._make_scalar_field("score", "FLOAT64"),
+            self._make_scalar_field("when", "TIMESTAMP"),
+            self._make_scalar_field("day", "DATE"),
+            self._make_scalar_field("married", "BOOL"),
+            self._make_scalar_field("name", "STRING"),
+            self._make_array_field("pairs", element_type=element_type),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        when = datetime.datetime(2016, 12, 20, 21, 13, 47, tzinfo=pytz.UTC)
+        BARE = [
+            1,
+            1.5,
+            when,
+            datetime.date(2016, 12, 20),
+            True,
+            u"Phred",
+            [[1, u"a"]],
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            3,
+            float("inf"),
+            when,
+            datetime.date(2016, 12, 21),
+            False,
+            u"Wylma",
+            [],
+        ]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        chunked = self._make_value(u"Bharn")
+        result_sets = [
+            self._make_partial_result_set(VALUES[:5], metadata=metadata),
+            self._make_partial_result_set(VALUES[5:12] + [chunked], chunked_value=True),
+            self._make_partial_result_set([self._make_value(u"ey")] + VALUES[13:]),
+        ]
+        # The 'name' of the second row is split across two result sets.
+        BARE[12] = u"Bharney"
+        return result_sets, BARE
+
+    def test__iter_column_chunks_after_consumption_started(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+        streamed._metadata = self._make_result_set_metadata()
+        with self.assertRaises(RuntimeError):
+            list(streamed._iter_column_chunks(10))
+
+    def test__iter_column_chunks_w_invalid_chunk_size(self):
+        result_sets, _ = self._make_typed_result_sets()
+        for chunk_size in (0, -1):
+            iterator = _MockCancellableIterator(*result_sets)
+            streamed = self._make_one(iterator)
+            with self.assertRaises(ValueError):
+                list(streamed._iter_column_chunks(chunk_size))
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_invalid_chunk_size(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+        with self.assertRaises(ValueError):
+            streamed.to_dataframe(chunk_size=0)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_w_invalid_chunk_size(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+        with self.assertRaises(ValueError):
+            streamed.to_arrow(chunk_size=0)
+
+    def test__iter_column_chunks_empty(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+        self.assertEqual(list(streamed._iter_column_chunks(10)), [])
+
+    def test__iter_column_chunks_metadata_only(self):
+        FIELDS = [
+            self._make_scalar_field("full_name", "STRING"),
+            self._make_scalar_field("age", "INT64"),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        result_set = self._make_partial_result_set([], metadata=metadata)
+        iterator = _MockCancellableIterator(result_set)
+        streamed = self._make_one(iterator)
+        self.assertEqual(list(streamed._iter_column_chunks(10)), [[[], []]])
+
+    def test__iter_column_chunks_wo_fields(self):
+        metadata = self._make_result_set_metadata()
+        result_set = self._make_partial_result_set([], metadata=metadata)
+        iterator = _MockCancellableIterator(result_set)
+        streamed = self._make_one(iterator)
+        self.assertEqual(list(streamed._iter_column_chunks(10)), [[]])
+
+    def test__iter_column_chunks_w_chunk_size(self):
+        FIELDS = [
+            self._make_scalar_field("full_name", "STRING"),
+            self._make_scalar_field("age", "INT64"),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = [u"Phred", 42, u"Bharney", 39, u"Wylma", 41, u"Betty", 40, u"Dino", 4]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_set1 = self._make_partial_result_set(VALUES[:3], metadata=metadata)
+        result_set2 = self._make_partial_result_set(VALUES[3:9])
+        result_set3 = self._make_partial_result_set(VALUES[9:])
+        iterator = _MockCancellableIterator(result_set1, result_set2, result_set3)
+        streamed = self._make_one(iterator)
+
+        chunks = list(streamed._iter_column_chunks(2))
+
+        self.assertEqual(
+            chunks,
+            [
+                [VALUES[0:4:2], VALUES[1:4:2]],
+                [VALUES[4:8:2], VALUES[5:8:2]],
+                [VALUES[8:10:2], VALUES[9:10:2]],
+            ],
+        )
+
+    def test__iter_column_chunks_w_exact_chunk_size(self):
+        FIELDS = [
+            self._make_scalar_field("full_name", "STRING"),
+            self._make_scalar_field("age", "INT64"),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = [u"Phred", 42, u"Bharney", 39]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_set = self._make_partial_result_set(VALUES, metadata=metadata)
+        iterator = _MockCancellableIterator(result_set)
+        streamed = self._make_one(iterator)
+
+        chunks = list(streamed._iter_column_chunks(2))
+
+        self.assertEqual(chunks, [[VALUES[0::2], VALUES[1::2]]])
+
+    @mock.patch("google.cloud.spanner_v1.streamed.pandas", new=None)
+    def test_to_dataframe_error_if_pandas_is_none(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+        with self.assertRaises(ValueError):
+            streamed.to_dataframe()
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_empty(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+
+        df = streamed.to_dataframe()
+
+        self.assertIsInstance(df, pandas.DataFrame)
+        self.assertEqual(len(df), 0)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe(self):
+        result_sets, BARE = self._make_typed_result_sets()
+        iterator = _MockCancellableIterator(*result_sets)
+        streamed = self._make_one(iterator)
+
+        df = streamed.to_dataframe()
+
+        self.assertIsInstance(df, pandas.DataFrame)
+        self.assertEqual(
+            list(df.columns), ["id", "score", "when", "day", "married", "name", "pairs"]
+        )
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df["id"].dtype.name, "float64")  # NULL -> NaN
+        self.assertEqual(df["score"].dtype.name, "float64")
+        self.assertEqual(df["when"].dtype.kind, "M")
+        self.assertEqual(str(df["when"].dt.tz), "UTC")
+        self.assertEqual(df["day"].dtype.kind, "M")
+        self.assertEqual(df["married"].dtype.name, "object")
+        self.assertEqual(list(df["id"][[0, 2]]), [1.0, 3.0])
+        self.assertEqual(df["when"][0], pandas.Timestamp(BARE[2]))
+        self.assertTrue(pandas.isnull(df["when"][1]))
+        self.assertEqual(list(df["married"]), [True, None, False])
+        self.assertEqual(list(df["name"]), [u"Phred", u"Bharney", u"Wylma"])
+        self.assertEqual(list(df["pairs"]), [[[1, u"a"]], None, []])
+
+    def _make_out_of_range_timestamp_result_set(self):
+        import datetime
+        import pytz
+
+        FIELDS = [self._make_scalar_field("when", "TIMESTAMP")]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = [
+            datetime.datetime(1, 1, 1, tzinfo=pytz.UTC),
+            None,
+            datetime.datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=pytz.UTC),
+        ]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_set = self._make_partial_result_set(VALUES, metadata=metadata)
+        return result_set, BARE
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_out_of_range_timestamps(self):
+        result_set, BARE = self._make_out_of_range_timestamp_result_set()
+        iterator = _MockCancellableIterator(result_set)
+        streamed = self._make_one(iterator)
+
+        df = streamed.to_dataframe()
+
+        # ``pandas.Timestamp`` is a ``datetime.datetime`` subclass, so this
+        # holds both for ``datetime64[us, UTC]`` and ``object`` columns.
+        self.assertEqual(df["when"][0], BARE[0])
+        self.assertTrue(pandas.isnull(df["when"][1]))
+        self.assertEqual(df["when"][2], BARE[2])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(
+        pandas is not None and int(pandas.__version__.split(".")[0]) >= 2,
+        "Requires `pandas` older than 2.0",
+    )
+    def test_to_dataframe_w_out_of_range_timestamps_wo_microsecond_unit(self):
+        import datetime
+
+        result_set, BARE = self._make_out_of_range_timestamp_result_set()
+        iterator = _MockCancellableIterator(result_set)
+        streamed = self._make_one(iterator)
+
+        df = streamed.to_dataframe()
+
+        self.assertEqual(df["when"].dtype.name, "object")
+        self.assertIsInstance(df["when"][0], datetime.datetime)
+        self.assertEqual(df["when"][0], BARE[0])
+        self.assertIsNone(df["when"][1])
+        self.assertEqual(df["when"][2], BARE[2])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_chunk_size(self):
+        result_sets, _ = self._make_typed_result_sets()
+        iterator = _MockCancellableIterator(*result_sets)
+        streamed = self._make_one(iterator)
+
+        df = streamed.to_dataframe(chunk_size=1)
+
+        self.assertEqual(list(df.index), [0, 1, 2])
+        self.assertEqual(list(df["name"]), [u"Phred", u"Bharney", u"Wylma"])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_iterable_wo_nulls(self):
+        FIELDS = [
+            self._make_scalar_field("age", "INT64"),
+            self._make_scalar_field("married", "BOOL"),
+            self._make_scalar_field("age", "INT64"),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = [42, True, 43, 39, False, 40]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_set = self._make_partial_result_set(VALUES, metadata=metadata)
+        iterator = _MockCancellableIterator(result_set)
+        streamed = self._make_one(iterator)
+
+        frames = list(streamed.to_dataframe_iterable(chunk_size=1))
+
+        self.assertEqual(len(frames), 2)
+        df = frames[1]
+        self.assertEqual(list(df.columns), ["age", "married", "age"])
+        self.assertEqual(df.iloc[:, 0].dtype.name, "int64")
+        self.assertEqual(df.iloc[:, 1].dtype.name, "bool")
+        self.assertEqual(df.iloc[0].tolist(), [39, False, 40])
+
+    @mock.patch("google.cloud.spanner_v1.streamed.pyarrow", new=None)
+    def test_to_arrow_error_if_pyarrow_is_none(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+        with self.assertRaises(ValueError):
+            streamed.to_arrow()
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_empty(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+
+        table = streamed.to_arrow()
+
+        self.assertIsInstance(table, pyarrow.Table)
+        self.assertEqual(table.num_rows, 0)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow(self):
+        result_sets, BARE = self._make_typed_result_sets()
+        iterator = _MockCancellableIterator(*result_sets)
+        streamed = self._make_one(iterator)
+
+        table = streamed.to_arrow(chunk_size=2)
+
+        self.assertIsInstance(table, pyarrow.Table)
+        self.assertEqual(table.num_rows, 3)
+        schema = table.schema
+        self.assertEqual(schema.field("id").type, pyarrow.int64())
+        self.assertEqual(schema.field("score").type, pyarrow.float64())
+        self.assertEqual(schema.field("when").type, pyarrow.timestamp("us", tz="UTC"))
+        self.assertEqual(schema.field("day").type, pyarrow.date32())
+        self.assertEqual(schema.field("married").type, pyarrow.bool_())
+        self.assertEqual(schema.field("name").type, pyarrow.string())
+        self.assertEqual(
+            schema.field("pairs").type,
+            pyarrow.list_(
+                pyarrow.struct([("x", pyarrow.int64()), ("y", pyarrow.string())])
+            ),
+        )
+        data = table.to_pydict()
+        self.assertEqual(data["id"], [1, None, 3])
+        self.assertEqual(data["day"], [BARE[3], None, BARE[17]])
+        self.assertEqual(data["married"], [True, None, False])
+        self.assertEqual(data["name"], [u"Phred", u"Bharney", u"Wylma"])
+        self.assertEqual(data["pairs"], [[{"x": 1, "y": u"a"}], None, []])
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_iterable_w_bytes(self):
+        FIELDS = [self._make_scalar_field("image", "BYTES")]
+        metadata = self._make_result_set_metadata(FIELDS)
+        VALUES = [self._make_value(b"REVBREJFRUY="), self._make_value(None)]
+        result_set = self._make_partial_result_set(VALUES, metadata=metadata)
+        iterator = _MockCancellableIterator(result_set)
+        streamed = self._make_one(iterator)
+
+        batches = list(streamed.to_arrow_iterable())
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0].schema.field("image").type, pyarrow.binary())
+        self.assertEqual(batches[0].column(0).to_pylist(), [b"REVBREJFRUY=", None])
+
 
 class _MockCancellableIterator(object):
 